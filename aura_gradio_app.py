@@ -16,8 +16,10 @@ import logging
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import all A.U.R.A components
-from src.dashboard.utils.data_loader import DashboardDataLoader
+from src.dashboard.utils.data_loader import DashboardDataLoader, DASHBOARD_CUSTOMER_COLUMNS
 from src.dashboard.utils.plot_utils import DashboardPlotUtils
+from src.dashboard.utils.customer_index import CustomerIndex
+from src.dashboard.utils.metrics_snapshot import compute_metrics_snapshot
 from src.data_pipeline.orchestrator import DataPipelineOrchestrator
 from src.models.forecasting.prophet_model import ProphetForecastingModel
 from src.models.decision_engine.rules_engine import RuleBasedDecisionEngine
@@ -37,17 +39,26 @@ decision_engine = RuleBasedDecisionEngine()
 
 # Global variables for data storage
 customer_data = pd.DataFrame()
+customer_index = CustomerIndex(customer_data)
+metrics_snapshot = compute_metrics_snapshot(customer_data)
 data_loaded = False
 
+def set_customer_data(df):
+    """Publish newly loaded customer data together with its customer index and metrics snapshot."""
+    global customer_data, customer_index, metrics_snapshot, data_loaded
+    
+    customer_data = df
+    customer_index = CustomerIndex(df)
+    metrics_snapshot = compute_metrics_snapshot(df)
+    data_loaded = True
+
 def load_aura_data():
     """Load A.U.R.A data from pipeline or generate sample data."""
-    global customer_data, data_loaded
-    
     try:
         # Try to load from Gold layer first
-        customer_data = data_loader.load_customer_360_data()
-        if not customer_data.empty:
-            data_loaded = True
+        pipeline_data = data_loader.load_customer_360_data(columns=DASHBOARD_CUSTOMER_COLUMNS)
+        if not pipeline_data.empty:
+            set_customer_data(pipeline_data)
             return "✅ Data loaded from A.U.R.A pipeline successfully!"
     except Exception as e:
         logger.warning(f"Pipeline data not available: {e}")
@@ -56,7 +67,7 @@ def load_aura_data():
     np.random.seed(42)
     n_customers = 500
     
-    customer_data = pd.DataFrame({
+    sample_data = pd.DataFrame({
         'customer_id': [f'CUST_{i:04d}' for i in range(1, n_customers + 1)],
         'name': [f'Customer {i}' for i in range(1, n_customers + 1)],
         'segment': np.random.choice(['SMB', 'Medium-Value', 'High-Value'], n_customers, p=[0.5, 0.3, 0.2]),
@@ -69,13 +80,11 @@ def load_aura_data():
         'total_support_tickets_lifetime': np.random.poisson(3, n_customers)
     })
     
-    data_loaded = True
+    set_customer_data(sample_data)
     return "✅ Sample data generated successfully!"
 
 def upload_and_process_csv(csv_files):
     """Upload and process multiple CSV files through A.U.R.A pipeline."""
-    global customer_data, data_loaded
-    
     if not csv_files:
         return "❌ No files uploaded. Please select CSV files."
     
@@ -109,8 +118,7 @@ def upload_and_process_csv(csv_files):
             combined_data = pd.concat(all_processed_data, ignore_index=True)
             
             # Update global data
-            customer_data = combined_data
-            data_loaded = True
+            set_customer_data(combined_data)
             
             return f"✅ All CSV files processed successfully!\n\n**Summary:**\n- Files processed: {len(processed_files)}\n- Total records: {total_records:,}\n- Combined columns: {len(combined_data.columns)}\n\n**Files:**\n{chr(10).join([f'- {file}' for file in processed_files])}\n\n**Next steps:**\n- Explore the Dashboard tab to see your data\n- Use Customer Analysis for individual insights\n- Generate AI strategies in Retention Strategies tab"
         else:
@@ -332,12 +340,10 @@ def analyze_customer_risk(customer_id):
     
     try:
         # Find customer
-        customer = customer_data[customer_data['customer_id'] == customer_id]
-        if customer.empty:
+        customer_info = customer_index.get_customer(customer_id)
+        if customer_info is None:
             return f"Customer {customer_id} not found."
         
-        customer_info = customer.iloc[0]
-        
         # Analyze risk using decision engine
         risk_analysis = decision_engine.analyze_customer_risk(customer_info)
         
@@ -413,16 +419,11 @@ def get_metrics():
     if not data_loaded or customer_data.empty:
         return "No data loaded", "No data loaded", "No data loaded", "No data loaded"
     
-    total_customers = len(customer_data)
-    high_risk = len(customer_data[customer_data.get('churn_risk_level', '') == 'High'])
-    avg_health = customer_data.get('current_health_score', pd.Series([0])).mean()
-    total_revenue = customer_data.get('total_lifetime_revenue', pd.Series([0])).sum()
-    
     return (
-        f"{total_customers:,}",
-        f"{high_risk:,}",
-        f"{avg_health:.1f}",
-        f"${total_revenue:,.0f}"
+        f"{metrics_snapshot['total_customers']:,}",
+        f"{metrics_snapshot['high_risk_count']:,}",
+        f"{metrics_snapshot['avg_health']:.1f}",
+        f"${metrics_snapshot['total_revenue']:,.0f}"
     )
 
 def create_risk_distribution_chart():
@@ -509,12 +510,10 @@ def analyze_customer(customer_id):
         return "Please enter a customer ID."
     
     # Find customer
-    customer = customer_data[customer_data['customer_id'] == customer_id]
-    if customer.empty:
+    customer_info = customer_index.get_customer(customer_id)
+    if customer_info is None:
         return f"Customer {customer_id} not found."
     
-    customer_info = customer.iloc[0]
-    
     # Create analysis
     analysis = f"""
     ## Customer Analysis: {customer_info['name']}
@@ -587,10 +586,10 @@ def get_retention_strategies():
 - **Success Metrics:** Track retention rates, revenue impact, and customer satisfaction
 - **Follow-up:** Regular monitoring and adjustment of retention tactics
     """.format(
-        high_risk_count=len(customer_data[customer_data.get('churn_risk_level', '') == 'High']),
-        low_health_count=len(customer_data[customer_data.get('current_health_score', 100) < 50]),
-        low_engagement_count=len(customer_data[customer_data.get('days_since_last_engagement', 0) > 30]),
-        upsell_candidates=len(customer_data[customer_data.get('current_health_score', 0) > 80])
+        high_risk_count=metrics_snapshot['high_risk_count'],
+        low_health_count=metrics_snapshot['low_health_count'],
+        low_engagement_count=metrics_snapshot['low_engagement_count'],
+        upsell_candidates=metrics_snapshot['high_health_count']
     )
     
     return strategies
@@ -615,9 +614,9 @@ def chat_with_aura(message, history):
             
             if customer_id and data_loaded and not customer_data.empty:
                 # Find customer data
-                customer = customer_data[customer_data['customer_id'] == customer_id]
-                if not customer.empty:
-                    customer_info = customer.iloc[0].to_dict()
+                customer = customer_index.get_customer(customer_id)
+                if customer is not None:
+                    customer_info = customer.to_dict()
                     
                     # Get AI insights for this customer
                     ai_insights = aura_ai_model.get_ai_insights(customer_info)
@@ -631,9 +630,9 @@ def chat_with_aura(message, history):
         elif "churn" in message_lower or "retention" in message_lower:
             if data_loaded and not customer_data.empty:
                 # Analyze overall churn risk
-                high_risk_count = len(customer_data[customer_data.get('churn_risk_level', '') == 'High'])
-                total_customers = len(customer_data)
-                churn_rate = (high_risk_count / total_customers) * 100
+                high_risk_count = metrics_snapshot['high_risk_count']
+                total_customers = metrics_snapshot['total_customers']
+                churn_rate = metrics_snapshot['churn_rate']
                 
                 response = f"""🤖 **AI Churn Analysis:**
 
@@ -658,8 +657,8 @@ def chat_with_aura(message, history):
         # AI-powered health score analysis
         elif "health" in message_lower or "score" in message_lower:
             if data_loaded and not customer_data.empty:
-                avg_health = customer_data.get('current_health_score', pd.Series([0])).mean()
-                low_health_count = len(customer_data[customer_data.get('current_health_score', 100) < 50])
+                avg_health = metrics_snapshot['avg_health']
+                low_health_count = metrics_snapshot['low_health_count']
                 
                 response = f"""🤖 **AI Health Score Analysis:**
 
@@ -684,8 +683,8 @@ def chat_with_aura(message, history):
         # AI-powered revenue optimization
         elif "revenue" in message_lower or "upsell" in message_lower:
             if data_loaded and not customer_data.empty:
-                total_revenue = customer_data.get('total_lifetime_revenue', pd.Series([0])).sum()
-                high_value_count = len(customer_data[customer_data.get('current_health_score', 0) > 80])
+                total_revenue = metrics_snapshot['total_revenue']
+                high_value_count = metrics_snapshot['high_health_count']
                 
                 response = f"""🤖 **AI Revenue Optimization Analysis:**
 
@@ -711,8 +710,8 @@ def chat_with_aura(message, history):
         # AI-powered engagement analysis
         elif "engagement" in message_lower:
             if data_loaded and not customer_data.empty:
-                avg_engagement = customer_data.get('engagement_score', pd.Series([0])).mean()
-                low_engagement_count = len(customer_data[customer_data.get('days_since_last_engagement', 0) > 30])
+                avg_engagement = metrics_snapshot['avg_engagement']
+                low_engagement_count = metrics_snapshot['low_engagement_count']
                 
                 response = f"""🤖 **AI Engagement Analysis:**
 
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+A.U.R.A Pipeline Benchmark
+==========================
+
+This script benchmarks the Medallion pipeline stages at several data scales.
+For every scale it generates a synthetic Bronze dataset with MockDataGenerator,
+then runs Bronze ingestion, Silver transformation and Gold aggregation one
+after another in a fresh process and records wall time, CPU time, row counts,
+throughput and peak memory of each stage.
+
+Results are written to benchmarks/results/ and compared against a stored
+baseline (benchmarks/baseline.json); stages whose throughput dropped or whose
+peak memory grew by more than the tolerance are reported as regressions. The
+scaling exponent between consecutive scales shows whether a stage grows
+linearly with the data (an exponent close to 1).
+
+Usage:
+    python benchmark_pipeline.py --scales 10k 100k
+    python benchmark_pipeline.py --scales 10k 100k 1m --update-baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+REPO_ROOT = Path(__file__).resolve().parent
+BENCHMARK_DIR = REPO_ROOT / "benchmarks"
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+
+# Scale suffixes accepted on the command line
+SCALE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+# Pipeline stages in execution order
+BENCHMARK_STAGES = ['bronze_ingestion', 'silver_transformation', 'gold_aggregation']
+
+def parse_scale(value: str) -> int:
+    """Parse a customer count such as 10000, 10k or 1m."""
+    value = value.strip().lower()
+    if value and value[-1] in SCALE_SUFFIXES:
+        return int(float(value[:-1]) * SCALE_SUFFIXES[value[-1]])
+    return int(value)
+
+def format_scale(customers: int) -> str:
+    """Format a customer count as 10k, 1m, ..."""
+    for suffix, factor in sorted(SCALE_SUFFIXES.items(), key=lambda item: -item[1]):
+        if customers >= factor and customers % factor == 0:
+            return f"{customers // factor}{suffix}"
+    return str(customers)
+
+def _reset_peak_rss() -> bool:
+    """Reset the peak resident set size of the process (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of the process in megabytes."""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def _count_rows(data: Dict[str, pd.DataFrame]) -> int:
+    """Count the rows of every table of a layer."""
+    return int(sum(len(df) for df in data.values()))
+
+def run_scale(customers: int, work_dir: Path) -> Dict[str, Any]:
+    """
+    Generate the Bronze data of one scale and benchmark every stage.
+    
+    Runs inside a dedicated process whose working directory is work_dir, so
+    the pipeline's relative data paths point at the benchmark dataset and the
+    memory peaks belong to this scale only.
+    
+    Args:
+        customers: Number of customers to generate
+        work_dir: Working directory of this scale
+    
+    Returns:
+        Dict[str, Any]: Generation time and per-stage measurements
+    """
+    os.chdir(work_dir)
+    sys.path.insert(0, str(REPO_ROOT))
+    
+    import logging
+    logging.disable(logging.INFO)
+    
+    from generate_mock_data import MockDataGenerator
+    from src.data_pipeline.ingest import DataIngestion
+    from src.data_pipeline.silver_transform import SilverTransform
+    from src.data_pipeline.gold_agg import GoldAggregation
+    
+    result = {'customers': customers, 'stages': {}}
+    
+    # Generated data is reused by later benchmarks of the same scale
+    bronze_dir = work_dir / "data" / "bronze"
+    marker = bronze_dir / ".generated"
+    if not marker.exists():
+        start = time.perf_counter()
+        MockDataGenerator(customer_count=customers, data_dir=bronze_dir).generate_all_data()
+        result['generation_seconds'] = round(time.perf_counter() - start, 3)
+        marker.write_text(str(customers))
+    
+    stages = [
+        ('bronze_ingestion', lambda data: DataIngestion().load_bronze_data()),
+        ('silver_transformation', lambda data: SilverTransform().transform_bronze_to_silver(data)),
+        ('gold_aggregation', lambda data: GoldAggregation().aggregate_silver_to_gold(data))
+    ]
+    
+    data: Dict[str, pd.DataFrame] = {}
+    for stage, run_stage in stages:
+        rows_in = _count_rows(data)
+        per_stage_peak = _reset_peak_rss()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        
+        data = run_stage(data)
+        
+        wall_seconds = time.perf_counter() - wall_start
+        rows_out = _count_rows(data)
+        
+        # Ingestion is measured by the rows it produces, later stages by the rows they consume
+        rows = rows_in if rows_in else rows_out
+        result['stages'][stage] = {
+            'wall_seconds': round(wall_seconds, 3),
+            'cpu_seconds': round(time.process_time() - cpu_start, 3),
+            'rows_in': rows_in,
+            'rows_out': rows_out,
+            'throughput_rows_per_second': round(rows / wall_seconds, 1) if wall_seconds > 0 else None,
+            'peak_rss_mb': _peak_rss_mb(),
+            'peak_rss_is_per_stage': per_stage_peak
+        }
+    
+    return result
+
+def add_scaling_exponents(scales: List[Dict[str, Any]]) -> None:
+    """
+    Add the scaling exponent of every stage between consecutive scales.
+    
+    The exponent k solves wall_time ~ customers ** k, so 1 means linear
+    growth and values clearly above 1 mean the stage scales super-linearly.
+    """
+    for previous, current in zip(scales, scales[1:]):
+        ratio = current['customers'] / previous['customers']
+        for stage, measurement in current['stages'].items():
+            before = previous['stages'].get(stage, {}).get('wall_seconds')
+            after = measurement['wall_seconds']
+            if before and after and ratio > 1:
+                measurement['scaling_exponent'] = round(math.log(after / before) / math.log(ratio), 3)
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare benchmark results with a baseline.
+    
+    Args:
+        results: Current benchmark results
+        baseline: Baseline benchmark results
+        tolerance: Allowed relative throughput drop or peak memory growth
+    
+    Returns:
+        List[str]: Regression messages (empty when nothing regressed)
+    """
+    baseline_scales = {scale['customers']: scale for scale in baseline.get('scales', [])}
+    regressions = []
+    
+    for scale in results['scales']:
+        reference = baseline_scales.get(scale['customers'])
+        if reference is None:
+            continue
+        
+        for stage, measurement in scale['stages'].items():
+            expected = reference['stages'].get(stage)
+            if expected is None:
+                continue
+            
+            label = f"{format_scale(scale['customers'])} {stage}"
+            throughput, expected_throughput = measurement['throughput_rows_per_second'], expected['throughput_rows_per_second']
+            if throughput and expected_throughput and throughput < expected_throughput * (1 - tolerance):
+                regressions.append(
+                    f"{label}: throughput {throughput:,.0f} rows/s vs baseline {expected_throughput:,.0f} rows/s"
+                )
+            
+            peak, expected_peak = measurement['peak_rss_mb'], expected['peak_rss_mb']
+            if peak and expected_peak and peak > expected_peak * (1 + tolerance):
+                regressions.append(f"{label}: peak memory {peak:,.1f} MB vs baseline {expected_peak:,.1f} MB")
+    
+    return regressions
+
+def run_benchmark(scales: List[int], work_dir: Path, baseline_path: Path,
+                  tolerance: float, update_baseline: bool) -> int:
+    """
+    Benchmark every scale in its own process and report the results.
+    
+    Returns:
+        int: Process exit code (1 when regressions were found)
+    """
+    results = {
+        'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'machine': {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__
+        },
+        'scales': []
+    }
+    
+    for customers in sorted(scales):
+        scale_dir = work_dir / format_scale(customers)
+        scale_dir.mkdir(parents=True, exist_ok=True)
+        output_path = scale_dir / "result.json"
+        
+        print(f"Benchmarking {format_scale(customers)} customers...")
+        subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--run-scale', str(customers),
+             '--work-dir', str(scale_dir), '--output', str(output_path)],
+            check=True
+        )
+        with open(output_path, 'r') as f:
+            results['scales'].append(json.load(f))
+    
+    add_scaling_exponents(results['scales'])
+    
+    results_dir = BENCHMARK_DIR / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    results_path = results_dir / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(results_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    
+    # Print summary
+    print("\n" + "=" * 96)
+    print("A.U.R.A PIPELINE BENCHMARK")
+    print("=" * 96)
+    print(f"{'Scale':>6}  {'Stage':<22}{'Rows in':>12}{'Rows out':>12}{'Wall s':>9}{'Rows/s':>12}{'Peak MB':>10}{'Exp.':>7}")
+    for scale in results['scales']:
+        for stage in BENCHMARK_STAGES:
+            m = scale['stages'][stage]
+            exponent = m.get('scaling_exponent')
+            print(f"{format_scale(scale['customers']):>6}  {stage:<22}{m['rows_in']:>12,}{m['rows_out']:>12,}"
+                  f"{m['wall_seconds']:>9.2f}{(m['throughput_rows_per_second'] or 0):>12,.0f}"
+                  f"{(m['peak_rss_mb'] or 0):>10,.1f}{(f'{exponent:.2f}' if exponent is not None else '-'):>7}")
+    print(f"\nResults written to {results_path}")
+    
+    exit_code = 0
+    if baseline_path.exists():
+        with open(baseline_path, 'r') as f:
+            regressions = compare_with_baseline(results, json.load(f), tolerance)
+        if regressions:
+            print(f"\nRegressions against {baseline_path} (tolerance {tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            exit_code = 1
+        else:
+            print(f"\nNo regressions against {baseline_path}")
+    else:
+        print(f"\nNo baseline found at {baseline_path}")
+    
+    if update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {baseline_path}")
+    
+    return exit_code
+
+def main():
+    """Main function to benchmark the A.U.R.A pipeline."""
+    parser = argparse.ArgumentParser(description="Benchmark the A.U.R.A pipeline at several data scales")
+    parser.add_argument('--scales', nargs='+', default=['10k', '100k'],
+                        help="Customer counts to benchmark, e.g. 10k 100k 1m 10m")
+    parser.add_argument('--work-dir', type=Path, default=BENCHMARK_DIR / "work",
+                        help="Directory holding the generated datasets")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE_PATH,
+                        help="Baseline results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed relative throughput drop or peak memory growth")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Store these results as the new baseline")
+    parser.add_argument('--run-scale', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--output', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.run_scale is not None:
+        # Worker process benchmarking a single scale
+        result = run_scale(args.run_scale, args.work_dir.resolve())
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        return
+    
+    sys.exit(run_benchmark([parse_scale(scale) for scale in args.scales], args.work_dir.resolve(),
+                           args.baseline, args.tolerance, args.update_baseline))
+
+if __name__ == "__main__":
+    main()
@@ -9,19 +9,192 @@ client base with various engagement patterns, revenue levels, and risk profiles.
 
 The generated data follows the Medallion architecture Bronze layer schema and
 includes all required entities for the A.U.R.A platform.
+
+Generation is vectorized with a seeded NumPy Generator and split into shards of
+customers. Every shard draws from its own random stream derived from the seed,
+so the output depends only on the seed and the shard size, shards can be
+generated in parallel processes, and each shard is appended to the CSV or
+parquet output as soon as it is ready. Memory is bounded by the shard size
+rather than by the total number of rows.
 """
 
+import argparse
+import time
 import pandas as pd
 import numpy as np
-import random
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import os
+from typing import List, Dict, Any, Optional, Iterator
 from pathlib import Path
 
-# Set random seed for reproducible data
-np.random.seed(42)
-random.seed(42)
+# Default seed for reproducible data
+DEFAULT_SEED = 42
+
+# Customers generated together in one shard
+DEFAULT_SHARD_SIZE = 10000
+
+# Record ids of shard n start at n * SHARD_ID_STRIDE, so ids are unique across
+# shards and the first shard keeps the zero-padded ids of a single-shard run
+SHARD_ID_STRIDE = 10 ** 9
+
+# Supported output formats and the file suffix they are written with
+OUTPUT_FORMATS = {'csv': 'csv', 'parquet': 'parquet'}
+
+# Bronze sources emitted by the event stream
+STREAM_SOURCES = ['engagement', 'transactions', 'support']
+
+# Mixed into the seed of the event stream so it draws independently of the shards
+STREAM_SEED_KEY = 1
+
+# Streamed record ids start at the stream start time times this factor, so a
+# restarted stream never reuses the ids of an earlier stream or batch run
+STREAM_IDS_PER_SECOND = 10 ** 6
+
+# Bronze files written per dataset
+OUTPUT_FILES = {
+    'customers': 'raw_customer_demographics',
+    'transactions': 'raw_transactions',
+    'engagement': 'raw_engagement_logs',
+    'support': 'raw_support_interactions',
+    'surveys': 'raw_feedback_surveys'
+}
+
+# Customer attributes
+FIRST_NAMES = ["John", "Jane", "Michael", "Sarah", "David", "Lisa", "Robert", "Emily",
+               "James", "Jessica", "William", "Ashley", "Richard", "Amanda", "Charles"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+              "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson"]
+GENDERS = ["Male", "Female", "Other"]
+CITIES = {
+    "United States": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"],
+    "Canada": ["Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa"],
+    "United Kingdom": ["London", "Manchester", "Birmingham", "Leeds", "Glasgow"],
+    "Germany": ["Berlin", "Munich", "Hamburg", "Cologne", "Frankfurt"],
+    "France": ["Paris", "Lyon", "Marseille", "Toulouse", "Nice"],
+    "Australia": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
+    "Japan": ["Tokyo", "Osaka", "Yokohama", "Nagoya", "Sapporo"]
+}
+COUNTRIES = list(CITIES)
+EMAIL_DOMAINS = ['company.com', 'business.org', 'enterprise.net']
+CUSTOMER_SOURCES = ["CRM_Salesforce", "Customer_Portal", "Marketing_Automation", "Sales_Team"]
+
+# Customer status and subscription codes used by the vectorized rules below
+STATUSES = ["Active", "At-Risk", "Inactive", "Churned"]
+ACTIVE, AT_RISK = 0, 1
+SUBSCRIPTION_TYPES = ["Enterprise", "Premium", "Standard", "Basic"]
+ENTERPRISE, PREMIUM, STANDARD, BASIC = 0, 1, 2, 3
+CLIENT_TIERS = ["Enterprise", "SMB"]
+
+# Transaction attributes
+PAYMENT_METHODS = ["Credit Card", "Bank Transfer", "Invoice", "PayPal"]
+ENTERPRISE_PAYMENT_WEIGHTS = {"Credit Card": 0.4, "Bank Transfer": 0.4, "Invoice": 0.2}
+STANDARD_PAYMENT_WEIGHTS = {"Credit Card": 0.6, "PayPal": 0.3, "Bank Transfer": 0.1}
+PRODUCTS = ["Software License", "Support Package", "Training", "Consulting", "Add-on Module"]
+TRANSACTION_TYPES = ["Purchase", "Subscription Payment", "Refund", "Upgrade"]
+TRANSACTION_TYPE_WEIGHTS = [0.7, 0.2, 0.05, 0.05]
+TRANSACTION_SOURCES = ["Billing_Platform", "ECommerce_API", "Sales_System"]
+
+# Engagement attributes
+HIGH_ENGAGEMENT_EVENTS = ["feature_usage", "dashboard_view", "report_generation", "api_call"]
+MEDIUM_ENGAGEMENT_EVENTS = ["page_view", "button_click", "form_submission", "search"]
+LOW_ENGAGEMENT_EVENTS = ["login", "logout", "page_view"]
+EVENT_TYPES = list(dict.fromkeys(HIGH_ENGAGEMENT_EVENTS + MEDIUM_ENGAGEMENT_EVENTS + LOW_ENGAGEMENT_EVENTS))
+HIGH_ENGAGEMENT, MEDIUM_ENGAGEMENT, LOW_ENGAGEMENT = 0, 1, 2
+DEVICES = ["Desktop", "Mobile", "Tablet"]
+BROWSERS = ["Chrome", "Safari", "Firefox", "Edge"]
+OPERATING_SYSTEMS = ["Windows", "macOS", "iOS", "Android", "Linux"]
+PAGES = ["/dashboard", "/reports", "/settings", "/help", "/billing", "/profile"]
+FEATURES = ["analytics", "export", "filter", "search", "notification", "integration"]
+ENGAGEMENT_SOURCES = ["Web_Analytics", "App_Telemetry", "User_Tracking"]
+
+# Support attributes
+INTERACTION_TYPES = ["Chat", "Email", "Call", "Self-service"]
+ISSUE_TYPES = ["Bug Report", "Feature Request", "Billing Inquiry", "Technical Support", "Account Issue"]
+TICKET_STATUSES = ["Resolved", "Open", "In Progress"]
+TRANSCRIPT_SAMPLES = [
+    "Customer reported issue with login functionality. Provided troubleshooting steps.",
+    "Billing inquiry regarding recent charges. Explained pricing structure.",
+    "Feature request for additional reporting capabilities. Escalated to product team.",
+    "Technical support for integration issues. Provided API documentation.",
+    "Account access problem. Reset password and verified account status."
+]
+SUPPORT_SOURCES = ["Zendesk", "Intercom", "LiveChat", "Support_System"]
+
+# Survey attributes; comments and response texts are grouped by NPS band
+# (promoters 9-10, passives 7-8, detractors 0-6)
+SURVEY_TYPES = ["NPS", "Product Feedback", "Onboarding Survey", "Support Satisfaction"]
+SURVEY_COMMENTS = [
+    ["Excellent product, very satisfied with the service.",
+     "Great experience, would definitely recommend.",
+     "Outstanding support and features.",
+     "Love the platform, very user-friendly."],
+    ["Good product overall, some areas for improvement.",
+     "Satisfied with most features, minor issues.",
+     "Generally happy with the service.",
+     "Good platform with room for enhancement."],
+    ["Experiencing some issues with the platform.",
+     "Not fully satisfied with the current features.",
+     "Having trouble with support response times.",
+     "Product needs improvement in several areas."]
+]
+SURVEY_QUESTIONS = [
+    "How likely are you to recommend our product?",
+    "What is your overall satisfaction with our service?",
+    "How would you rate our customer support?",
+    "What features would you like to see improved?"
+]
+SURVEY_RESPONSES = ["Very likely to recommend", "Somewhat likely to recommend", "Not likely to recommend"]
+SURVEY_SOURCES = ["SurveyMonkey", "Qualtrics", "InApp_Survey", "Email_Survey"]
+
+def _dictionary(indices: np.ndarray, values: List[str], mask: Optional[np.ndarray] = None) -> pa.DictionaryArray:
+    """Build a dictionary-encoded string column from value indices."""
+    return pa.DictionaryArray.from_arrays(pa.array(indices.astype(np.int32), mask=mask), pa.array(values))
+
+def _weighted_choice(rng: np.random.Generator, size: int, weights: List[float]) -> np.ndarray:
+    """Draw indices into a list of options with the given weights."""
+    cumulative = np.cumsum(weights)
+    return np.searchsorted(cumulative / cumulative[-1], rng.random(size), side='right')
+
+def _format_ids(prefix: str, numbers: np.ndarray, width: int) -> pa.Array:
+    """Format record numbers as zero-padded ids, e.g. TXN_000001."""
+    digits = pc.utf8_lpad(pc.cast(pa.array(numbers), pa.string()), width, '0')
+    return pc.binary_join_element_wise(prefix, digits, '')
+
+def _concat(*parts: Any) -> pa.Array:
+    """Concatenate string arrays and literals element-wise."""
+    return pc.binary_join_element_wise(*parts, '')
+
+def _event_type_probabilities() -> np.ndarray:
+    """
+    Get the event type probabilities per engagement level.
+    
+    Highly engaged customers draw from every event list, medium engagement
+    from the medium and low lists and low engagement from the low list only.
+    Events that appear in several lists add up their weights.
+    
+    Returns:
+        np.ndarray: Probability of each of EVENT_TYPES, one row per engagement level
+    """
+    level_weights = [
+        [(HIGH_ENGAGEMENT_EVENTS, 0.4), (MEDIUM_ENGAGEMENT_EVENTS, 0.4), (LOW_ENGAGEMENT_EVENTS, 0.2)],
+        [(MEDIUM_ENGAGEMENT_EVENTS, 0.6), (LOW_ENGAGEMENT_EVENTS, 0.4)],
+        [(LOW_ENGAGEMENT_EVENTS, 1.0)]
+    ]
+    probabilities = np.zeros((len(level_weights), len(EVENT_TYPES)))
+    for level, lists in enumerate(level_weights):
+        for events, weight in lists:
+            for event in events:
+                probabilities[level, EVENT_TYPES.index(event)] += weight
+    
+    return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+def _generate_shard_worker(generator: 'MockDataGenerator', shard_index: int) -> Dict[str, pa.Table]:
+    """Generate one shard in a worker process."""
+    return generator.generate_shard(shard_index)
 
 class MockDataGenerator:
     """
@@ -31,23 +204,114 @@ class MockDataGenerator:
     patterns, including churn signals, engagement trends, and business metrics.
     The data is designed to test the complete A.U.R.A pipeline from Bronze
     through Gold layers.
+    
+    Customers are generated in shards of shard_size customers. Each shard
+    builds its customer profiles and then every event of those customers with
+    array operations, using a random stream derived from the seed and the
+    shard index. Shards are written to the output files in order, so the
+    generated files are identical for any number of worker processes.
     """
     
-    def __init__(self):
-        """Initialize the mock data generator with base parameters."""
-        self.start_date = datetime.now() - timedelta(days=365)  # 1 year of data
-        self.end_date = datetime.now()
-        self.customer_count = 500
-        self.transaction_count = 2000
-        self.engagement_events = 5000
-        self.support_tickets = 300
-        self.survey_responses = 200
+    def __init__(self, customer_count: int = 500, data_dir: Optional[Path] = None,
+                 seed: int = DEFAULT_SEED, output_format: str = 'csv',
+                 shard_size: int = DEFAULT_SHARD_SIZE, workers: int = 1):
+        """
+        Initialize the mock data generator with base parameters.
+        
+        Args:
+            customer_count: Number of customers to generate; event volumes scale with it
+            data_dir: Directory the Bronze files are written to (defaults to data/bronze)
+            seed: Seed of the random streams; the same seed and shard size give the same data
+            output_format: Output file format, 'csv' or 'parquet'
+            shard_size: Customers generated and written together
+            workers: Processes generating shards in parallel
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output_format: {output_format}. Must be one of {list(OUTPUT_FORMATS)}")
+        
+        # Timestamps are written with second precision
+        self.end_date = datetime.now().replace(microsecond=0)
+        self.start_date = self.end_date - timedelta(days=365)  # 1 year of data
+        self.customer_count = customer_count
+        self.seed = seed
+        self.output_format = output_format
+        self.shard_size = max(1, shard_size)
+        self.workers = max(1, workers)
+        
+        # Date lookups indexed by days before the end date
+        self._end_timestamp = np.datetime64(self.end_date, 's')
+        self._session_dates = pa.array([
+            (self.end_date - timedelta(days=days)).strftime('%Y%m%d') for days in range(366)
+        ])
+        self._event_type_probabilities = _event_type_probabilities()
+        
+        # Status distribution accumulated while shards are generated
+        self.status_counts = np.zeros(len(STATUSES), dtype=np.int64)
         
         # Create data directory if it doesn't exist
-        self.data_dir = Path("data/bronze")
+        self.data_dir = Path(data_dir) if data_dir is not None else Path("data/bronze")
         self.data_dir.mkdir(parents=True, exist_ok=True)
     
-    def generate_customer_demographics(self) -> pd.DataFrame:
+    @property
+    def shard_count(self) -> int:
+        """Number of customer shards."""
+        return max(1, -(-self.customer_count // self.shard_size))
+    
+    def get_output_path(self, dataset: str) -> Path:
+        """
+        Get the Bronze file a dataset is written to.
+        
+        Args:
+            dataset: Dataset name ('customers', 'transactions', 'engagement', 'support', 'surveys')
+        
+        Returns:
+            Path: Output file path
+        """
+        return self.data_dir / f"{OUTPUT_FILES[dataset]}.{OUTPUT_FORMATS[self.output_format]}"
+    
+    def _shard_rng(self, shard_index: int) -> np.random.Generator:
+        """Create the independent random stream of a shard."""
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(shard_index,)))
+    
+    def _timestamps(self, days_ago: np.ndarray) -> pa.Array:
+        """Convert days before the end date into second-precision timestamps."""
+        return pa.array(self._event_times(days_ago), type=pa.timestamp('s'))
+    
+    def _event_times(self, days_ago: np.ndarray) -> np.ndarray:
+        """Convert days before the end date into second-precision datetimes."""
+        return self._end_timestamp - days_ago.astype('timedelta64[D]')
+    
+    def _constant_timestamps(self, size: int, value: Optional[np.datetime64] = None) -> pa.Array:
+        """Ingestion timestamp column: the given time (the end date by default) on every row."""
+        value = self._end_timestamp if value is None else value
+        return pa.array(np.full(size, value, dtype='datetime64[s]'), type=pa.timestamp('s'))
+    
+    def generate_shard(self, shard_index: int) -> Dict[str, pa.Table]:
+        """
+        Generate every dataset for one shard of customers.
+        
+        Args:
+            shard_index: Index of the shard, from 0 to shard_count - 1
+        
+        Returns:
+            Dict[str, pa.Table]: Arrow tables keyed by dataset name
+        """
+        rng = self._shard_rng(shard_index)
+        first_customer = shard_index * self.shard_size
+        size = max(0, min(self.shard_size, self.customer_count - first_customer))
+        id_offset = shard_index * SHARD_ID_STRIDE
+        
+        customers, profile = self.generate_customer_demographics(rng, first_customer, size)
+        return {
+            'customers': customers,
+            'transactions': self.generate_transactions(rng, profile, id_offset),
+            'engagement': self.generate_engagement_logs(rng, profile, id_offset),
+            'support': self.generate_support_interactions(rng, profile, id_offset),
+            'surveys': self.generate_feedback_surveys(rng, profile, id_offset)
+        }
+    
+    def generate_customer_demographics(self, rng: np.random.Generator, first_customer: int,
+                                       size: int) -> tuple:
         """
         Generate customer demographics data.
         
@@ -55,118 +319,98 @@ class MockDataGenerator:
         and account information. Includes correlation between customer attributes
         and churn risk factors.
         
+        Args:
+            rng: Random stream of the shard
+            first_customer: Zero-based number of the first customer of the shard
+            size: Number of customers in the shard
+        
         Returns:
-            pd.DataFrame: Customer demographics with churn risk indicators
+            tuple: Customer demographics table and the customer profile arrays
+            (customer_id, status, subscription and days_since_creation) used
+            to generate the correlated events
         """
-        print("Generating customer demographics...")
-        
-        # Base customer data
-        customer_ids = [f"CUST_{i:04d}" for i in range(1, self.customer_count + 1)]
+        customer_ids = _format_ids('CUST_', np.arange(first_customer + 1, first_customer + size + 1), 4)
         
         # Generate correlated data for realistic churn patterns
         # High-value customers tend to have better engagement and lower churn
-        customer_values = np.random.lognormal(8, 1.5, self.customer_count)  # Revenue potential
+        customer_values = rng.lognormal(8, 1.5, size)  # Revenue potential
         customer_values = np.clip(customer_values, 100, 50000)  # Realistic range
         
-        # Generate correlated attributes
-        data = []
-        for i, customer_id in enumerate(customer_ids):
-            # Correlate subscription type with value
-            if customer_values[i] > 10000:
-                subscription_type = random.choices(
-                    ["Enterprise", "Premium"], 
-                    weights=[0.7, 0.3]
-                )[0]
-                client_tier = "Enterprise"
-            elif customer_values[i] > 3000:
-                subscription_type = random.choices(
-                    ["Premium", "Standard"], 
-                    weights=[0.6, 0.4]
-                )[0]
-                client_tier = "SMB"
-            else:
-                subscription_type = random.choices(
-                    ["Standard", "Basic"], 
-                    weights=[0.7, 0.3]
-                )[0]
-                client_tier = "SMB"
-            
-            # Generate names
-            first_names = ["John", "Jane", "Michael", "Sarah", "David", "Lisa", "Robert", "Emily", 
-                          "James", "Jessica", "William", "Ashley", "Richard", "Amanda", "Charles"]
-            last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", 
-                         "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson"]
-            
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            
-            # Generate demographics
-            age = random.randint(25, 65)
-            gender = random.choice(["Male", "Female", "Other"])
-            
-            # Generate location data
-            countries = ["United States", "Canada", "United Kingdom", "Germany", "France", "Australia", "Japan"]
-            country = random.choice(countries)
-            
-            cities = {
-                "United States": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"],
-                "Canada": ["Toronto", "Vancouver", "Montreal", "Calgary", "Ottawa"],
-                "United Kingdom": ["London", "Manchester", "Birmingham", "Leeds", "Glasgow"],
-                "Germany": ["Berlin", "Munich", "Hamburg", "Cologne", "Frankfurt"],
-                "France": ["Paris", "Lyon", "Marseille", "Toulouse", "Nice"],
-                "Australia": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
-                "Japan": ["Tokyo", "Osaka", "Yokohama", "Nagoya", "Sapporo"]
-            }
-            city = random.choice(cities[country])
-            
-            # Generate account creation date (correlated with churn risk)
-            # Older accounts tend to have lower churn risk
-            days_ago = random.randint(30, 365)
-            account_creation_date = self.end_date - timedelta(days=days_ago)
-            
-            # Generate status (correlated with engagement and value)
-            # High-value, engaged customers are more likely to be active
-            if customer_values[i] > 15000 and random.random() > 0.1:
-                status = "Active"
-            elif customer_values[i] > 5000 and random.random() > 0.3:
-                status = "Active"
-            elif random.random() > 0.6:
-                status = "Active"
-            else:
-                status = random.choice(["At-Risk", "Inactive", "Churned"])
-            
-            # Generate contact information
-            email = f"{first_name.lower()}.{last_name.lower()}@{random.choice(['company.com', 'business.org', 'enterprise.net'])}"
-            phone = f"+1-{random.randint(200, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
-            
-            # Generate source system
-            source_system = random.choice(["CRM_Salesforce", "Customer_Portal", "Marketing_Automation", "Sales_Team"])
-            
-            data.append({
-                'customer_id': customer_id,
-                'source_system_customer_id': f"SRC_{customer_id}",
-                'first_name': first_name,
-                'last_name': last_name,
-                'email': email,
-                'phone_number': phone,
-                'age': age,
-                'gender': gender,
-                'country': country,
-                'city': city,
-                'subscription_type': subscription_type,
-                'account_creation_date': account_creation_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'status': status,
-                'source_system': source_system,
-                'ingestion_timestamp': self.end_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'raw_json_payload': f'{{"customer_value": {customer_values[i]:.2f}, "client_tier": "{client_tier}"}}'
-            })
-        
-        df = pd.DataFrame(data)
-        df.to_csv(self.data_dir / "raw_customer_demographics.csv", index=False)
-        print(f"Generated {len(df)} customer records")
-        return df
-    
-    def generate_transactions(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+        # Correlate subscription type with value
+        draw = rng.random(size)
+        subscription = np.select(
+            [customer_values > 10000, customer_values > 3000],
+            [np.where(draw < 0.7, ENTERPRISE, PREMIUM), np.where(draw < 0.6, PREMIUM, STANDARD)],
+            np.where(draw < 0.7, STANDARD, BASIC)
+        )
+        client_tier = np.where(customer_values > 10000, 0, 1)
+        
+        # Generate names, demographics and location
+        first_names = rng.integers(0, len(FIRST_NAMES), size)
+        last_names = rng.integers(0, len(LAST_NAMES), size)
+        age = rng.integers(25, 66, size)
+        gender = rng.integers(0, len(GENDERS), size)
+        country = rng.integers(0, len(COUNTRIES), size)
+        city = country * 5 + rng.integers(0, 5, size)
+        
+        # Generate account creation date (correlated with churn risk)
+        # Older accounts tend to have lower churn risk
+        days_since_creation = rng.integers(30, 366, size)
+        
+        # Generate status (correlated with engagement and value)
+        # High-value, engaged customers are more likely to be active
+        draws = rng.random((3, size))
+        active = (((customer_values > 15000) & (draws[0] > 0.1))
+                  | ((customer_values > 5000) & (draws[1] > 0.3))
+                  | (draws[2] > 0.6))
+        status = np.where(active, ACTIVE, 1 + rng.integers(0, 3, size))
+        self.status_counts += np.bincount(status, minlength=len(STATUSES))
+        
+        # Generate contact information
+        domain = rng.integers(0, len(EMAIL_DOMAINS), size)
+        emails = [f"{first.lower()}.{last.lower()}@{domain_name}"
+                  for first in FIRST_NAMES for last in LAST_NAMES for domain_name in EMAIL_DOMAINS]
+        email = (first_names * len(LAST_NAMES) + last_names) * len(EMAIL_DOMAINS) + domain
+        phone_parts = [pc.cast(pa.array(rng.integers(low, high + 1, size)), pa.string())
+                       for low, high in [(200, 999), (100, 999), (1000, 9999)]]
+        source_system = rng.integers(0, len(CUSTOMER_SOURCES), size)
+        
+        cents = np.round(customer_values * 100).astype(np.int64)
+        raw_json_payload = _concat(
+            '{"customer_value": ', pc.cast(pa.array(cents // 100), pa.string()), '.',
+            pc.utf8_lpad(pc.cast(pa.array(cents % 100), pa.string()), 2, '0'),
+            ', "client_tier": "', pc.take(pa.array(CLIENT_TIERS), pa.array(client_tier)), '"}'
+        )
+        
+        table = pa.table({
+            'customer_id': customer_ids,
+            'source_system_customer_id': _concat('SRC_', customer_ids),
+            'first_name': _dictionary(first_names, FIRST_NAMES),
+            'last_name': _dictionary(last_names, LAST_NAMES),
+            'email': _dictionary(email, emails),
+            'phone_number': pc.binary_join_element_wise('+1', *phone_parts, '-'),
+            'age': pa.array(age),
+            'gender': _dictionary(gender, GENDERS),
+            'country': _dictionary(country, COUNTRIES),
+            'city': _dictionary(city, [name for country_name in COUNTRIES for name in CITIES[country_name]]),
+            'subscription_type': _dictionary(subscription, SUBSCRIPTION_TYPES),
+            'account_creation_date': self._timestamps(days_since_creation),
+            'status': _dictionary(status, STATUSES),
+            'source_system': _dictionary(source_system, CUSTOMER_SOURCES),
+            'ingestion_timestamp': self._constant_timestamps(size),
+            'raw_json_payload': raw_json_payload
+        })
+        
+        profile = {
+            'customer_id': customer_ids,
+            'status': status,
+            'subscription': subscription,
+            'days_since_creation': days_since_creation
+        }
+        return table, profile
+    
+    def generate_transactions(self, rng: np.random.Generator, profile: Dict[str, Any],
+                              id_offset: int = 0) -> pa.Table:
         """
         Generate transaction data correlated with customer profiles.
         
@@ -175,97 +419,89 @@ class MockDataGenerator:
         show declining transaction patterns.
         
         Args:
-            customers_df: Customer demographics DataFrame
-            
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            id_offset: Number added to the transaction ids of the shard
+        
         Returns:
-            pd.DataFrame: Transaction data with realistic patterns
-        """
-        print("Generating transaction data...")
-        
-        transactions = []
-        customer_data = customers_df.set_index('customer_id')
-        
-        for customer_id, customer in customer_data.iterrows():
-            # Determine transaction frequency based on customer value and status
-            if customer['status'] == 'Active':
-                if customer['subscription_type'] == 'Enterprise':
-                    num_transactions = random.randint(20, 50)
-                    avg_amount = random.uniform(2000, 8000)
-                elif customer['subscription_type'] == 'Premium':
-                    num_transactions = random.randint(10, 30)
-                    avg_amount = random.uniform(500, 2000)
-                else:
-                    num_transactions = random.randint(5, 20)
-                    avg_amount = random.uniform(100, 800)
-            elif customer['status'] == 'At-Risk':
-                num_transactions = random.randint(1, 8)
-                avg_amount = random.uniform(50, 500)
-            else:  # Inactive or Churned
-                num_transactions = random.randint(0, 3)
-                avg_amount = random.uniform(20, 200)
-            
-            # Generate transactions over time
-            account_creation = datetime.strptime(customer['account_creation_date'], '%Y-%m-%d %H:%M:%S')
-            days_since_creation = (self.end_date - account_creation).days
-            
-            for _ in range(num_transactions):
-                # Transaction date (more recent for active customers)
-                if customer['status'] == 'Active':
-                    days_ago = random.randint(0, min(90, days_since_creation))
-                elif customer['status'] == 'At-Risk':
-                    days_ago = random.randint(30, min(180, days_since_creation))
-                else:
-                    days_ago = random.randint(min(60, days_since_creation), days_since_creation)
-                
-                transaction_date = self.end_date - timedelta(days=days_ago)
-                
-                # Transaction amount with some variation
-                amount = max(0, np.random.normal(avg_amount, avg_amount * 0.3))
-                
-                # Payment method (correlated with customer tier)
-                if customer['subscription_type'] == 'Enterprise':
-                    payment_method = random.choices(
-                        ["Credit Card", "Bank Transfer", "Invoice"], 
-                        weights=[0.4, 0.4, 0.2]
-                    )[0]
-                else:
-                    payment_method = random.choices(
-                        ["Credit Card", "PayPal", "Bank Transfer"], 
-                        weights=[0.6, 0.3, 0.1]
-                    )[0]
-                
-                # Product information
-                products = ["Software License", "Support Package", "Training", "Consulting", "Add-on Module"]
-                product = random.choice(products)
-                quantity = random.randint(1, 5)
-                
-                # Transaction type
-                transaction_type = random.choices(
-                    ["Purchase", "Subscription Payment", "Refund", "Upgrade"], 
-                    weights=[0.7, 0.2, 0.05, 0.05]
-                )[0]
-                
-                transactions.append({
-                    'transaction_id': f"TXN_{len(transactions)+1:06d}",
-                    'customer_id': customer_id,
-                    'transaction_date': transaction_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'amount': round(amount, 2),
-                    'currency': 'USD',
-                    'payment_method': payment_method,
-                    'product_id': f"PROD_{random.randint(1000, 9999)}",
-                    'product_name': product,
-                    'quantity': quantity,
-                    'transaction_type': transaction_type,
-                    'source_system': random.choice(["Billing_Platform", "ECommerce_API", "Sales_System"]),
-                    'ingestion_timestamp': self.end_date.strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        df = pd.DataFrame(transactions)
-        df.to_csv(self.data_dir / "raw_transactions.csv", index=False)
-        print(f"Generated {len(df)} transaction records")
-        return df
-    
-    def generate_engagement_logs(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+            pa.Table: Transaction data with realistic patterns
+        """
+        num_transactions, avg_amount = self._transaction_volumes(rng, profile)
+        rows = np.repeat(np.arange(len(num_transactions)), num_transactions)
+        
+        # Transaction date (more recent for active customers)
+        days_ago = self._draw_days_ago(rng, profile['status'][rows], profile['days_since_creation'][rows],
+                                       recent_days=90, at_risk_range=(30, 180), inactive_min_days=60)
+        
+        return self._build_transactions(rng, profile, rows, self._event_times(days_ago), avg_amount[rows], id_offset)
+    
+    def _transaction_volumes(self, rng: np.random.Generator, profile: Dict[str, Any]) -> tuple:
+        """
+        Draw the number of transactions and the average amount of every customer.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+        
+        Returns:
+            tuple: Transaction counts and average amounts per customer
+        """
+        status, subscription = profile['status'], profile['subscription']
+        active, at_risk = status == ACTIVE, status == AT_RISK
+        
+        # Determine transaction frequency and amount based on customer value and status
+        tiers = [active & (subscription == ENTERPRISE), active & (subscription == PREMIUM), active, at_risk]
+        num_transactions = rng.integers(np.select(tiers, [20, 10, 5, 1], 0), np.select(tiers, [50, 30, 20, 8], 3) + 1)
+        avg_amount = rng.uniform(np.select(tiers, [2000, 500, 100, 50], 20), np.select(tiers, [8000, 2000, 800, 500], 200))
+        return num_transactions, avg_amount
+    
+    def _build_transactions(self, rng: np.random.Generator, profile: Dict[str, Any], rows: np.ndarray,
+                            event_times: np.ndarray, row_amount: np.ndarray, id_offset: int,
+                            ingested_at: Optional[np.datetime64] = None) -> pa.Table:
+        """
+        Build transaction rows for the given customers and times.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            rows: Profile index of the customer of every transaction
+            event_times: Transaction datetimes
+            row_amount: Average amount of the customer of every transaction
+            id_offset: Number added to the transaction ids
+            ingested_at: Ingestion timestamp of the rows (defaults to the end date)
+        
+        Returns:
+            pa.Table: Transaction rows
+        """
+        size = len(rows)
+        
+        # Transaction amount with some variation
+        amount = np.round(np.maximum(0, rng.normal(row_amount, row_amount * 0.3)), 2)
+        
+        # Payment method (correlated with customer tier)
+        enterprise = profile['subscription'][rows] == ENTERPRISE
+        payment_method = np.empty(size, dtype=np.int64)
+        for mask, weights in [(enterprise, ENTERPRISE_PAYMENT_WEIGHTS), (~enterprise, STANDARD_PAYMENT_WEIGHTS)]:
+            options = np.array([PAYMENT_METHODS.index(method) for method in weights])
+            payment_method[mask] = options[_weighted_choice(rng, int(mask.sum()), list(weights.values()))]
+        
+        return pa.table({
+            'transaction_id': _format_ids('TXN_', id_offset + np.arange(1, size + 1), 6),
+            'customer_id': pc.take(profile['customer_id'], pa.array(rows)),
+            'transaction_date': pa.array(event_times, type=pa.timestamp('s')),
+            'amount': pa.array(amount),
+            'currency': _dictionary(np.zeros(size, dtype=np.int64), ['USD']),
+            'payment_method': _dictionary(payment_method, PAYMENT_METHODS),
+            'product_id': _concat('PROD_', pc.cast(pa.array(rng.integers(1000, 10000, size)), pa.string())),
+            'product_name': _dictionary(rng.integers(0, len(PRODUCTS), size), PRODUCTS),
+            'quantity': pa.array(rng.integers(1, 6, size)),
+            'transaction_type': _dictionary(_weighted_choice(rng, size, TRANSACTION_TYPE_WEIGHTS), TRANSACTION_TYPES),
+            'source_system': _dictionary(rng.integers(0, len(TRANSACTION_SOURCES), size), TRANSACTION_SOURCES),
+            'ingestion_timestamp': self._constant_timestamps(size, ingested_at)
+        })
+    
+    def generate_engagement_logs(self, rng: np.random.Generator, profile: Dict[str, Any],
+                                 id_offset: int = 0) -> pa.Table:
         """
         Generate engagement event logs with realistic patterns.
         
@@ -274,119 +510,109 @@ class MockDataGenerator:
         customers show declining engagement patterns.
         
         Args:
-            customers_df: Customer demographics DataFrame
-            
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            id_offset: Number added to the event ids of the shard
+        
         Returns:
-            pd.DataFrame: Engagement event logs with realistic patterns
-        """
-        print("Generating engagement logs...")
-        
-        events = []
-        customer_data = customers_df.set_index('customer_id')
-        
-        # Event types with different engagement levels
-        high_engagement_events = ["feature_usage", "dashboard_view", "report_generation", "api_call"]
-        medium_engagement_events = ["page_view", "button_click", "form_submission", "search"]
-        low_engagement_events = ["login", "logout", "page_view"]
-        
-        for customer_id, customer in customer_data.iterrows():
-            # Determine engagement level based on customer status
-            if customer['status'] == 'Active':
-                if customer['subscription_type'] == 'Enterprise':
-                    num_events = random.randint(100, 300)
-                    engagement_level = "high"
-                elif customer['subscription_type'] == 'Premium':
-                    num_events = random.randint(50, 150)
-                    engagement_level = "medium"
-                else:
-                    num_events = random.randint(20, 80)
-                    engagement_level = "low"
-            elif customer['status'] == 'At-Risk':
-                num_events = random.randint(5, 30)
-                engagement_level = "low"
-            else:  # Inactive or Churned
-                num_events = random.randint(0, 10)
-                engagement_level = "low"
-            
-            # Generate events over time
-            account_creation = datetime.strptime(customer['account_creation_date'], '%Y-%m-%d %H:%M:%S')
-            days_since_creation = (self.end_date - account_creation).days
-            
-            for _ in range(num_events):
-                # Event date (more recent for active customers)
-                if customer['status'] == 'Active':
-                    days_ago = random.randint(0, min(30, days_since_creation))
-                elif customer['status'] == 'At-Risk':
-                    days_ago = random.randint(15, min(90, days_since_creation))
-                else:
-                    days_ago = random.randint(min(30, days_since_creation), days_since_creation)
-                
-                event_date = self.end_date - timedelta(days=days_ago)
-                
-                # Select event type based on engagement level
-                if engagement_level == "high":
-                    all_events = high_engagement_events + medium_engagement_events + low_engagement_events
-                    event_type = random.choices(
-                        all_events,
-                        weights=[0.4] * len(high_engagement_events) + [0.4] * len(medium_engagement_events) + [0.2] * len(low_engagement_events)
-                    )[0]
-                elif engagement_level == "medium":
-                    medium_low_events = medium_engagement_events + low_engagement_events
-                    event_type = random.choices(
-                        medium_low_events,
-                        weights=[0.6] * len(medium_engagement_events) + [0.4] * len(low_engagement_events)
-                    )[0]
-                else:
-                    event_type = random.choice(low_engagement_events)
-                
-                # Device and browser information
-                devices = ["Desktop", "Mobile", "Tablet"]
-                browsers = ["Chrome", "Safari", "Firefox", "Edge"]
-                operating_systems = ["Windows", "macOS", "iOS", "Android", "Linux"]
-                
-                device_type = random.choice(devices)
-                browser = random.choice(browsers)
-                os = random.choice(operating_systems)
-                
-                # Generate session ID (same for events within a day)
-                session_id = f"SESS_{customer_id}_{event_date.strftime('%Y%m%d')}"
-                
-                # Page URL and feature usage
-                pages = ["/dashboard", "/reports", "/settings", "/help", "/billing", "/profile"]
-                features = ["analytics", "export", "filter", "search", "notification", "integration"]
-                
-                page_url = random.choice(pages)
-                feature_used = random.choice(features) if event_type == "feature_usage" else None
-                
-                # Event data JSON
-                event_data = {
-                    "session_duration": random.randint(30, 1800),  # 30 seconds to 30 minutes
-                    "page_load_time": random.uniform(0.5, 5.0),
-                    "user_agent": f"Mozilla/5.0 ({os}) {browser}/91.0"
-                }
-                
-                events.append({
-                    'event_id': f"EVT_{len(events)+1:08d}",
-                    'customer_id': customer_id,
-                    'session_id': session_id,
-                    'event_type': event_type,
-                    'event_timestamp': event_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'device_type': device_type,
-                    'browser': browser,
-                    'operating_system': os,
-                    'page_url': page_url,
-                    'feature_used': feature_used,
-                    'event_data_json': str(event_data),
-                    'source_system': random.choice(["Web_Analytics", "App_Telemetry", "User_Tracking"]),
-                    'ingestion_timestamp': self.end_date.strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        df = pd.DataFrame(events)
-        df.to_csv(self.data_dir / "raw_engagement_logs.csv", index=False)
-        print(f"Generated {len(df)} engagement events")
-        return df
-    
-    def generate_support_interactions(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+            pa.Table: Engagement event logs with realistic patterns
+        """
+        num_events, engagement_level = self._engagement_volumes(rng, profile)
+        rows = np.repeat(np.arange(len(num_events)), num_events)
+        
+        # Event date (more recent for active customers)
+        days_ago = self._draw_days_ago(rng, profile['status'][rows], profile['days_since_creation'][rows],
+                                       recent_days=30, at_risk_range=(15, 90), inactive_min_days=30)
+        
+        return self._build_engagement_logs(rng, profile, rows, engagement_level[rows], self._event_times(days_ago),
+                                           pc.take(self._session_dates, pa.array(days_ago)), id_offset)
+    
+    def _engagement_volumes(self, rng: np.random.Generator, profile: Dict[str, Any]) -> tuple:
+        """
+        Draw the number of engagement events and the engagement level of every customer.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+        
+        Returns:
+            tuple: Event counts and engagement levels per customer
+        """
+        status, subscription = profile['status'], profile['subscription']
+        active, at_risk = status == ACTIVE, status == AT_RISK
+        
+        # Determine engagement level based on customer status
+        tiers = [active & (subscription == ENTERPRISE), active & (subscription == PREMIUM), active, at_risk]
+        num_events = rng.integers(np.select(tiers, [100, 50, 20, 5], 0), np.select(tiers, [300, 150, 80, 30], 10) + 1)
+        engagement_level = np.select(tiers[:2], [HIGH_ENGAGEMENT, MEDIUM_ENGAGEMENT], LOW_ENGAGEMENT)
+        return num_events, engagement_level
+    
+    def _build_engagement_logs(self, rng: np.random.Generator, profile: Dict[str, Any], rows: np.ndarray,
+                               row_level: np.ndarray, event_times: np.ndarray, session_dates: pa.Array,
+                               id_offset: int, ingested_at: Optional[np.datetime64] = None) -> pa.Table:
+        """
+        Build engagement event rows for the given customers and times.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            rows: Profile index of the customer of every event
+            row_level: Engagement level of the customer of every event
+            event_times: Event datetimes
+            session_dates: Event dates formatted as YYYYMMDD for the session ids
+            id_offset: Number added to the event ids
+            ingested_at: Ingestion timestamp of the rows (defaults to the end date)
+        
+        Returns:
+            pa.Table: Engagement event rows
+        """
+        size = len(rows)
+        
+        # Select event type based on engagement level
+        event_type = np.empty(size, dtype=np.int64)
+        for level, probabilities in enumerate(self._event_type_probabilities):
+            mask = row_level == level
+            event_type[mask] = _weighted_choice(rng, int(mask.sum()), probabilities)
+        
+        # Device and browser information
+        device_type = rng.integers(0, len(DEVICES), size)
+        browser = rng.integers(0, len(BROWSERS), size)
+        operating_system = rng.integers(0, len(OPERATING_SYSTEMS), size)
+        
+        # Generate session ID (same for events within a day)
+        customer_id = pc.take(profile['customer_id'], pa.array(rows))
+        session_id = _concat('SESS_', customer_id, '_', session_dates)
+        
+        # Page URL and feature usage
+        page_url = rng.integers(0, len(PAGES), size)
+        feature_used = rng.integers(0, len(FEATURES), size)
+        
+        # Event data JSON
+        event_data_json = _concat(
+            "{'session_duration': ", pc.cast(pa.array(rng.integers(30, 1801, size)), pa.string()),
+            ", 'page_load_time': ", pc.cast(pa.array(rng.uniform(0.5, 5.0, size)), pa.string()),
+            ", 'user_agent': 'Mozilla/5.0 (", pc.take(pa.array(OPERATING_SYSTEMS), pa.array(operating_system)),
+            ") ", pc.take(pa.array(BROWSERS), pa.array(browser)), "/91.0'}"
+        )
+        
+        return pa.table({
+            'event_id': _format_ids('EVT_', id_offset + np.arange(1, size + 1), 8),
+            'customer_id': customer_id,
+            'session_id': session_id,
+            'event_type': _dictionary(event_type, EVENT_TYPES),
+            'event_timestamp': pa.array(event_times, type=pa.timestamp('s')),
+            'device_type': _dictionary(device_type, DEVICES),
+            'browser': _dictionary(browser, BROWSERS),
+            'operating_system': _dictionary(operating_system, OPERATING_SYSTEMS),
+            'page_url': _dictionary(page_url, PAGES),
+            'feature_used': _dictionary(feature_used, FEATURES, mask=event_type != EVENT_TYPES.index("feature_usage")),
+            'event_data_json': event_data_json,
+            'source_system': _dictionary(rng.integers(0, len(ENGAGEMENT_SOURCES), size), ENGAGEMENT_SOURCES),
+            'ingestion_timestamp': self._constant_timestamps(size, ingested_at)
+        })
+    
+    def generate_support_interactions(self, rng: np.random.Generator, profile: Dict[str, Any],
+                                      id_offset: int = 0) -> pa.Table:
         """
         Generate support interaction data with realistic patterns.
         
@@ -395,89 +621,87 @@ class MockDataGenerator:
         have fewer but higher-quality support interactions.
         
         Args:
-            customers_df: Customer demographics DataFrame
-            
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            id_offset: Number added to the ticket ids of the shard
+        
         Returns:
-            pd.DataFrame: Support interaction data with realistic patterns
+            pa.Table: Support interaction data with realistic patterns
         """
-        print("Generating support interactions...")
+        num_tickets = self._support_volumes(rng, profile)
+        rows = np.repeat(np.arange(len(num_tickets)), num_tickets)
         
-        interactions = []
-        customer_data = customers_df.set_index('customer_id')
+        # Ticket creation date
+        days_ago = rng.integers(0, 181, len(rows))
         
-        for customer_id, customer in customer_data.iterrows():
-            # Determine support ticket frequency based on customer status
-            if customer['status'] == 'Active':
-                num_tickets = random.randint(0, 5)
-            elif customer['status'] == 'At-Risk':
-                num_tickets = random.randint(2, 10)
-            else:  # Inactive or Churned
-                num_tickets = random.randint(1, 8)
-            
-            # Generate support tickets
-            for _ in range(num_tickets):
-                # Ticket creation date
-                days_ago = random.randint(0, 180)
-                created_at = self.end_date - timedelta(days=days_ago)
-                
-                # Interaction type and issue
-                interaction_types = ["Chat", "Email", "Call", "Self-service"]
-                issue_types = ["Bug Report", "Feature Request", "Billing Inquiry", "Technical Support", "Account Issue"]
-                
-                interaction_type = random.choice(interaction_types)
-                issue_type = random.choice(issue_types)
-                
-                # Status and resolution
-                if random.random() > 0.1:  # 90% resolved
-                    status = "Resolved"
-                    resolution_days = random.randint(1, 14)
-                    resolved_at = created_at + timedelta(days=resolution_days)
-                else:
-                    status = random.choice(["Open", "In Progress"])
-                    resolved_at = None
-                
-                # Satisfaction score (correlated with resolution and customer health)
-                if status == "Resolved" and customer['status'] == 'Active':
-                    satisfaction_score = random.choices([4, 5], weights=[0.3, 0.7])[0]
-                elif status == "Resolved":
-                    satisfaction_score = random.choices([3, 4, 5], weights=[0.4, 0.4, 0.2])[0]
-                else:
-                    satisfaction_score = random.choices([1, 2, 3], weights=[0.3, 0.4, 0.3])[0]
-                
-                # Agent ID
-                agent_id = f"AGENT_{random.randint(100, 999)}"
-                
-                # Transcript text (simplified)
-                transcript_samples = [
-                    "Customer reported issue with login functionality. Provided troubleshooting steps.",
-                    "Billing inquiry regarding recent charges. Explained pricing structure.",
-                    "Feature request for additional reporting capabilities. Escalated to product team.",
-                    "Technical support for integration issues. Provided API documentation.",
-                    "Account access problem. Reset password and verified account status."
-                ]
-                transcript_text = random.choice(transcript_samples)
-                
-                interactions.append({
-                    'ticket_id': f"TICKET_{len(interactions)+1:06d}",
-                    'customer_id': customer_id,
-                    'interaction_type': interaction_type,
-                    'issue_type': issue_type,
-                    'status': status,
-                    'created_at': created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    'resolved_at': resolved_at.strftime('%Y-%m-%d %H:%M:%S') if resolved_at else None,
-                    'agent_id': agent_id,
-                    'satisfaction_score': satisfaction_score,
-                    'transcript_text': transcript_text,
-                    'source_system': random.choice(["Zendesk", "Intercom", "LiveChat", "Support_System"]),
-                    'ingestion_timestamp': self.end_date.strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        df = pd.DataFrame(interactions)
-        df.to_csv(self.data_dir / "raw_support_interactions.csv", index=False)
-        print(f"Generated {len(df)} support interactions")
-        return df
-    
-    def generate_feedback_surveys(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+        return self._build_support_interactions(rng, profile, rows, self._event_times(days_ago), id_offset)
+    
+    def _support_volumes(self, rng: np.random.Generator, profile: Dict[str, Any]) -> np.ndarray:
+        """
+        Draw the number of support tickets of every customer.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+        
+        Returns:
+            np.ndarray: Ticket counts per customer
+        """
+        status = profile['status']
+        
+        # Determine support ticket frequency based on customer status
+        tiers = [status == ACTIVE, status == AT_RISK]
+        return rng.integers(np.select(tiers, [0, 2], 1), np.select(tiers, [5, 10], 8) + 1)
+    
+    def _build_support_interactions(self, rng: np.random.Generator, profile: Dict[str, Any], rows: np.ndarray,
+                                    event_times: np.ndarray, id_offset: int,
+                                    ingested_at: Optional[np.datetime64] = None) -> pa.Table:
+        """
+        Build support ticket rows for the given customers and creation times.
+        
+        Args:
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            rows: Profile index of the customer of every ticket
+            event_times: Ticket creation datetimes
+            id_offset: Number added to the ticket ids
+            ingested_at: Ingestion timestamp of the rows (defaults to the end date)
+        
+        Returns:
+            pa.Table: Support ticket rows
+        """
+        size = len(rows)
+        
+        # Status and resolution: 90% of tickets are resolved
+        resolved = rng.random(size) > 0.1
+        ticket_status = np.where(resolved, 0, 1 + rng.integers(0, 2, size))
+        resolved_at = event_times + rng.integers(1, 15, size).astype('timedelta64[D]')
+        
+        # Satisfaction score (correlated with resolution and customer health)
+        resolved_active = resolved & (profile['status'][rows] == ACTIVE)
+        satisfaction_score = np.empty(size, dtype=np.int64)
+        for mask, scores, weights in [(resolved_active, [4, 5], [0.3, 0.7]),
+                                      (resolved & ~resolved_active, [3, 4, 5], [0.4, 0.4, 0.2]),
+                                      (~resolved, [1, 2, 3], [0.3, 0.4, 0.3])]:
+            satisfaction_score[mask] = np.array(scores)[_weighted_choice(rng, int(mask.sum()), weights)]
+        
+        return pa.table({
+            'ticket_id': _format_ids('TICKET_', id_offset + np.arange(1, size + 1), 6),
+            'customer_id': pc.take(profile['customer_id'], pa.array(rows)),
+            'interaction_type': _dictionary(rng.integers(0, len(INTERACTION_TYPES), size), INTERACTION_TYPES),
+            'issue_type': _dictionary(rng.integers(0, len(ISSUE_TYPES), size), ISSUE_TYPES),
+            'status': _dictionary(ticket_status, TICKET_STATUSES),
+            'created_at': pa.array(event_times, type=pa.timestamp('s')),
+            'resolved_at': pa.array(resolved_at, type=pa.timestamp('s'), mask=~resolved),
+            'agent_id': _concat('AGENT_', pc.cast(pa.array(rng.integers(100, 1000, size)), pa.string())),
+            'satisfaction_score': pa.array(satisfaction_score),
+            'transcript_text': _dictionary(rng.integers(0, len(TRANSCRIPT_SAMPLES), size), TRANSCRIPT_SAMPLES),
+            'source_system': _dictionary(rng.integers(0, len(SUPPORT_SOURCES), size), SUPPORT_SOURCES),
+            'ingestion_timestamp': self._constant_timestamps(size, ingested_at)
+        })
+    
+    def generate_feedback_surveys(self, rng: np.random.Generator, profile: Dict[str, Any],
+                                  id_offset: int = 0) -> pa.Table:
         """
         Generate survey feedback data with realistic NPS patterns.
         
@@ -486,159 +710,420 @@ class MockDataGenerator:
         have higher churn risk.
         
         Args:
-            customers_df: Customer demographics DataFrame
-            
+            rng: Random stream of the shard
+            profile: Customer profile arrays from generate_customer_demographics
+            id_offset: Number added to the survey response ids of the shard
+        
         Returns:
-            pd.DataFrame: Survey feedback data with realistic NPS patterns
+            pa.Table: Survey feedback data with realistic NPS patterns
         """
-        print("Generating feedback surveys...")
+        status = profile['status']
         
-        surveys = []
-        customer_data = customers_df.set_index('customer_id')
+        # Determine survey frequency based on customer status
+        tiers = [status == ACTIVE, status == AT_RISK]
+        num_surveys = rng.integers(np.select(tiers, [1, 1], 0), np.select(tiers, [3, 2], 2) + 1)
         
-        for customer_id, customer in customer_data.iterrows():
-            # Determine survey frequency based on customer status
-            if customer['status'] == 'Active':
-                num_surveys = random.randint(1, 3)
-            elif customer['status'] == 'At-Risk':
-                num_surveys = random.randint(1, 2)
-            else:  # Inactive or Churned
-                num_surveys = random.randint(0, 2)
-            
-            # Generate survey responses
-            for _ in range(num_surveys):
-                # Survey date
-                days_ago = random.randint(0, 90)
-                response_date = self.end_date - timedelta(days=days_ago)
-                
-                # NPS score (correlated with customer status and satisfaction)
-                if customer['status'] == 'Active':
-                    nps_score = random.choices([9, 10, 8, 7], weights=[0.3, 0.3, 0.2, 0.2])[0]
-                elif customer['status'] == 'At-Risk':
-                    nps_score = random.choices([6, 7, 5, 4], weights=[0.3, 0.3, 0.2, 0.2])[0]
-                else:  # Inactive or Churned
-                    nps_score = random.choices([3, 4, 5, 2, 1], weights=[0.2, 0.2, 0.2, 0.2, 0.2])[0]
-                
-                # Survey type and questions
-                survey_types = ["NPS", "Product Feedback", "Onboarding Survey", "Support Satisfaction"]
-                survey_type = random.choice(survey_types)
-                
-                # Comments (correlated with NPS score)
-                if nps_score >= 9:
-                    comments = [
-                        "Excellent product, very satisfied with the service.",
-                        "Great experience, would definitely recommend.",
-                        "Outstanding support and features.",
-                        "Love the platform, very user-friendly."
-                    ]
-                elif nps_score >= 7:
-                    comments = [
-                        "Good product overall, some areas for improvement.",
-                        "Satisfied with most features, minor issues.",
-                        "Generally happy with the service.",
-                        "Good platform with room for enhancement."
-                    ]
-                else:
-                    comments = [
-                        "Experiencing some issues with the platform.",
-                        "Not fully satisfied with the current features.",
-                        "Having trouble with support response times.",
-                        "Product needs improvement in several areas."
-                    ]
-                
-                comment = random.choice(comments)
-                
-                # Question details
-                questions = [
-                    "How likely are you to recommend our product?",
-                    "What is your overall satisfaction with our service?",
-                    "How would you rate our customer support?",
-                    "What features would you like to see improved?"
-                ]
-                question_text = random.choice(questions)
+        rows = np.repeat(np.arange(len(status)), num_surveys)
+        size = len(rows)
+        
+        # Survey date
+        days_ago = rng.integers(0, 91, size)
+        
+        # NPS score (correlated with customer status and satisfaction)
+        row_status = status[rows]
+        nps_score = np.empty(size, dtype=np.int64)
+        for mask, scores, weights in [(row_status == ACTIVE, [9, 10, 8, 7], [0.3, 0.3, 0.2, 0.2]),
+                                      (row_status == AT_RISK, [6, 7, 5, 4], [0.3, 0.3, 0.2, 0.2]),
+                                      (row_status > AT_RISK, [3, 4, 5, 2, 1], [0.2] * 5)]:
+            nps_score[mask] = np.array(scores)[_weighted_choice(rng, int(mask.sum()), weights)]
+        
+        # Comments and response text (correlated with NPS score)
+        nps_band = np.select([nps_score >= 9, nps_score >= 7], [0, 1], 2)
+        comment = nps_band * 4 + rng.integers(0, 4, size)
+        
+        return pa.table({
+            'survey_response_id': _format_ids('SURVEY_', id_offset + np.arange(1, size + 1), 6),
+            'customer_id': pc.take(profile['customer_id'], pa.array(rows)),
+            'response_date': self._timestamps(days_ago),
+            'nps_score': pa.array(nps_score),
+            'comments': _dictionary(comment, [text for band in SURVEY_COMMENTS for text in band]),
+            'question_id': _dictionary(rng.integers(0, 10, size), [f"Q_{number}" for number in range(1, 11)]),
+            'question_text': _dictionary(rng.integers(0, len(SURVEY_QUESTIONS), size), SURVEY_QUESTIONS),
+            'response_text': _dictionary(nps_band, SURVEY_RESPONSES),
+            'survey_type': _dictionary(rng.integers(0, len(SURVEY_TYPES), size), SURVEY_TYPES),
+            'source_system': _dictionary(rng.integers(0, len(SURVEY_SOURCES), size), SURVEY_SOURCES),
+            'ingestion_timestamp': self._constant_timestamps(size)
+        })
+    
+    def _draw_days_ago(self, rng: np.random.Generator, status: np.ndarray, days_since_creation: np.ndarray,
+                       recent_days: int, at_risk_range: tuple, inactive_min_days: int) -> np.ndarray:
+        """
+        Draw event ages in days, more recent for active customers.
+        
+        Active customers get events within recent_days, at-risk customers within
+        at_risk_range and inactive or churned customers from inactive_min_days
+        onwards, never before the account was created.
+        
+        Returns:
+            np.ndarray: Days before the end date of each event
+        """
+        active, at_risk = status == ACTIVE, status == AT_RISK
+        low = np.select([active, at_risk], [0, at_risk_range[0]], np.minimum(inactive_min_days, days_since_creation))
+        high = np.select([active, at_risk],
+                         [np.minimum(recent_days, days_since_creation), np.minimum(at_risk_range[1], days_since_creation)],
+                         days_since_creation)
+        return rng.integers(low, high + 1)
+    
+    def iter_shards(self) -> Iterator[Dict[str, pa.Table]]:
+        """
+        Generate the shards in order, in parallel when workers > 1.
+        
+        At most two shards per worker are generated ahead of the one being
+        consumed, which bounds the memory held by finished shards.
+        
+        Yields:
+            Dict[str, pa.Table]: Arrow tables of each shard, keyed by dataset name
+        """
+        if self.workers == 1 or self.shard_count == 1:
+            for shard_index in range(self.shard_count):
+                yield self.generate_shard(shard_index)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = []
+            next_shard = 0
+            while next_shard < self.shard_count or pending:
+                while next_shard < self.shard_count and len(pending) < 2 * self.workers:
+                    pending.append(executor.submit(_generate_shard_worker, self, next_shard))
+                    next_shard += 1
                 
-                # Response text
-                if nps_score >= 9:
-                    response_text = "Very likely to recommend"
-                elif nps_score >= 7:
-                    response_text = "Somewhat likely to recommend"
-                else:
-                    response_text = "Not likely to recommend"
+                shard = pending.pop(0).result()
+                self.status_counts += self._count_statuses(shard['customers'])
+                yield shard
+    
+    def _count_statuses(self, customers: pa.Table) -> np.ndarray:
+        """Count the customers of a shard generated in another process per status."""
+        indices = customers.column('status').combine_chunks().indices.to_numpy(zero_copy_only=False)
+        return np.bincount(indices, minlength=len(STATUSES))
+    
+    def write_all_data(self) -> Dict[str, int]:
+        """
+        Generate all datasets and write them to the Bronze files shard by shard.
+        
+        Returns:
+            Dict[str, int]: Rows written per dataset
+        """
+        print("Starting A.U.R.A mock data generation...")
+        print("=" * 50)
+        
+        self.status_counts[:] = 0
+        writers: Dict[str, Any] = {}
+        row_counts = {dataset: 0 for dataset in OUTPUT_FILES}
+        
+        try:
+            for shard_index, shard in enumerate(self.iter_shards()):
+                for dataset, table in shard.items():
+                    if dataset not in writers:
+                        writers[dataset] = self._open_writer(dataset, table.schema)
+                    writers[dataset].write_table(table)
+                    row_counts[dataset] += table.num_rows
                 
-                surveys.append({
-                    'survey_response_id': f"SURVEY_{len(surveys)+1:06d}",
-                    'customer_id': customer_id,
-                    'response_date': response_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'nps_score': nps_score,
-                    'comments': comment,
-                    'question_id': f"Q_{random.randint(1, 10)}",
-                    'question_text': question_text,
-                    'response_text': response_text,
-                    'survey_type': survey_type,
-                    'source_system': random.choice(["SurveyMonkey", "Qualtrics", "InApp_Survey", "Email_Survey"]),
-                    'ingestion_timestamp': self.end_date.strftime('%Y-%m-%d %H:%M:%S')
-                })
-        
-        df = pd.DataFrame(surveys)
-        df.to_csv(self.data_dir / "raw_feedback_surveys.csv", index=False)
-        print(f"Generated {len(df)} survey responses")
-        return df
+                print(f"Generated shard {shard_index + 1}/{self.shard_count}: "
+                      f"{row_counts['customers']} customers, {row_counts['engagement']} engagement events")
+        finally:
+            for writer in writers.values():
+                writer.close()
+        
+        print("=" * 50)
+        print("Mock data generation completed!")
+        print(f"Generated files in {self.data_dir}:")
+        for dataset in OUTPUT_FILES:
+            print(f"- {self.get_output_path(dataset).name}")
+        
+        return row_counts
+    
+    def _open_writer(self, dataset: str, schema: pa.Schema) -> Any:
+        """Open the CSV or parquet writer of a dataset."""
+        if self.output_format == 'parquet':
+            return pq.ParquetWriter(self.get_output_path(dataset), schema)
+        return pa_csv.CSVWriter(self.get_output_path(dataset), schema)
     
     def generate_all_data(self) -> Dict[str, pd.DataFrame]:
         """
         Generate all mock data for the A.U.R.A platform.
         
         Creates a complete dataset with correlated signals for testing the
-        entire A.U.R.A pipeline from Bronze through Gold layers.
+        entire A.U.R.A pipeline from Bronze through Gold layers, writes it to
+        the Bronze files and reads it back. Use write_all_data for datasets
+        that do not fit in memory.
         
         Returns:
             Dict[str, pd.DataFrame]: Dictionary containing all generated datasets
         """
-        print("Starting A.U.R.A mock data generation...")
-        print("=" * 50)
+        self.write_all_data()
         
-        # Generate all datasets
-        customers = self.generate_customer_demographics()
-        transactions = self.generate_transactions(customers)
-        engagement = self.generate_engagement_logs(customers)
-        support = self.generate_support_interactions(customers)
-        surveys = self.generate_feedback_surveys(customers)
+        data = {}
+        for dataset in OUTPUT_FILES:
+            path = self.get_output_path(dataset)
+            data[dataset] = pd.read_parquet(path) if self.output_format == 'parquet' else pd.read_csv(path)
+        return data
+    
+    def print_summary(self, row_counts: Dict[str, int]) -> None:
+        """
+        Print row counts and the customer status distribution.
         
-        print("=" * 50)
-        print("Mock data generation completed!")
-        print(f"Generated files in {self.data_dir}:")
-        print("- raw_customer_demographics.csv")
-        print("- raw_transactions.csv")
-        print("- raw_engagement_logs.csv")
-        print("- raw_support_interactions.csv")
-        print("- raw_feedback_surveys.csv")
+        Args:
+            row_counts: Rows written per dataset
+        """
+        print("\nData Summary:")
+        print(f"Customers: {row_counts['customers']}")
+        print(f"Transactions: {row_counts['transactions']}")
+        print(f"Engagement Events: {row_counts['engagement']}")
+        print(f"Support Tickets: {row_counts['support']}")
+        print(f"Survey Responses: {row_counts['surveys']}")
+        
+        # Print customer status distribution
+        print("\nCustomer Status Distribution:")
+        total = max(1, int(self.status_counts.sum()))
+        for status, count in sorted(zip(STATUSES, self.status_counts), key=lambda item: -item[1]):
+            print(f"  {status}: {count} ({count/total*100:.1f}%)")
+
+class MockEventStream:
+    """
+    Emits engagement, transaction and support events continuously.
+    
+    Events are drawn for the customer population of a MockDataGenerator with
+    the same correlated distributions as batch generation: a customer's share
+    of a source's events is its batch event count, and every event follows the
+    customer's status and subscription. Each tick emits a Poisson number of
+    events stamped within the tick, so no event is older than the events of
+    an earlier tick.
+    
+    Events are appended to rolling CSV files partitioned by event hour, the
+    layout upstream exporters drop files in and incremental ingestion reads:
+        
+        <data_dir>/raw_engagement_logs/date=2024-01-01/hour=13/raw_engagement_logs_20240101T130500.csv
+    
+    A file is written under a .partial name and published by renaming it when
+    it rolls (after roll_seconds of events or at the end of the hour), so
+    readers only ever see complete files.
+    """
+    
+    def __init__(self, generator: MockDataGenerator, events_per_second: float = 1000.0,
+                 roll_seconds: int = 60, tick_seconds: int = 1):
+        """
+        Initialize the event stream.
+        
+        Args:
+            generator: Generator whose seed, customer population and data_dir are used
+            events_per_second: Average events emitted per second across all streamed sources
+            roll_seconds: Seconds of events per file before it is published
+            tick_seconds: Seconds between batches of events
+        """
+        self.generator = generator
+        self.data_dir = generator.data_dir
+        self.events_per_second = events_per_second
+        self.roll_seconds = max(1, roll_seconds)
+        self.tick_seconds = max(1, tick_seconds)
+        self.rng = np.random.default_rng([generator.seed, STREAM_SEED_KEY])
+        
+        # Open files per source and the counters reported by run
+        self._open_files: Dict[str, Dict[str, Any]] = {}
+        self.event_counts = {source: 0 for source in STREAM_SOURCES}
+        self.files_published = 0
+        self._id_offset = 0
+        
+        self._load_population()
+    
+    def _load_population(self) -> None:
+        """Generate the customer profiles and the event volumes that weight each customer."""
+        customers_path = self.data_dir / f"{OUTPUT_FILES['customers']}.csv"
+        write_customers = not customers_path.exists()
+        writer = None
+        profiles = []
         
+        try:
+            for shard_index in range(self.generator.shard_count):
+                first_customer = shard_index * self.generator.shard_size
+                size = min(self.generator.shard_size, self.generator.customer_count - first_customer)
+                customers, profile = self.generator.generate_customer_demographics(
+                    self.generator._shard_rng(shard_index), first_customer, size
+                )
+                profiles.append(profile)
+                
+                # Write the customers when no customer file exists, so the events can be joined
+                if write_customers:
+                    if writer is None:
+                        writer = pa_csv.CSVWriter(customers_path, customers.schema)
+                    writer.write_table(customers)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        self.profile = {
+            'customer_id': pa.concat_arrays([profile['customer_id'] for profile in profiles]),
+            **{key: np.concatenate([profile[key] for profile in profiles])
+               for key in ['status', 'subscription', 'days_since_creation']}
+        }
+        
+        num_transactions, self.avg_amount = self.generator._transaction_volumes(self.rng, self.profile)
+        num_events, self.engagement_level = self.generator._engagement_volumes(self.rng, self.profile)
+        num_tickets = self.generator._support_volumes(self.rng, self.profile)
+        
+        volumes = {'engagement': num_events, 'transactions': num_transactions, 'support': num_tickets}
+        totals = np.array([volumes[source].sum() for source in STREAM_SOURCES], dtype=float)
+        self.source_shares = totals / totals.sum()
+        self.customer_cdfs = {source: np.cumsum(volumes[source]) / max(1, volumes[source].sum())
+                              for source in STREAM_SOURCES}
+    
+    def run(self, duration_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Emit events until the duration has passed or the stream is interrupted.
+        
+        Args:
+            duration_seconds: Seconds to run for (runs until interrupted when None)
+        
+        Returns:
+            Dict[str, Any]: Events per source, files published, elapsed seconds and achieved rate
+        """
+        start = time.time()
+        self._id_offset = int(start) * STREAM_IDS_PER_SECOND
+        next_tick = int(start) + self.tick_seconds
+        print(f"Streaming {self.events_per_second:g} events/s to {self.data_dir} (Ctrl+C to stop)...")
+        
+        try:
+            while duration_seconds is None or next_tick - start <= duration_seconds:
+                delay = next_tick - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                elif -delay > self.tick_seconds:
+                    print(f"Stream is {-delay:.1f}s behind schedule")
+                
+                self._emit_tick(next_tick)
+                next_tick += self.tick_seconds
+        except KeyboardInterrupt:
+            print("Stopping event stream...")
+        finally:
+            for source in list(self._open_files):
+                self._publish(source)
+        
+        elapsed = time.time() - start
+        total_events = sum(self.event_counts.values())
         return {
-            'customers': customers,
-            'transactions': transactions,
-            'engagement': engagement,
-            'support': support,
-            'surveys': surveys
+            'events': dict(self.event_counts),
+            'files_published': self.files_published,
+            'elapsed_seconds': round(elapsed, 1),
+            'events_per_second': round(total_events / elapsed, 1) if elapsed > 0 else 0.0
         }
+    
+    def _emit_tick(self, tick_end: int) -> None:
+        """
+        Generate and write the events of the tick ending at a Unix time.
+        
+        Args:
+            tick_end: Unix time (seconds) the tick ends at
+        """
+        tick_time = np.datetime64(datetime.fromtimestamp(tick_end), 's')
+        total = self.rng.poisson(self.events_per_second * self.tick_seconds)
+        
+        for source, size in zip(STREAM_SOURCES, self.rng.multinomial(total, self.source_shares)):
+            if size == 0:
+                continue
+            
+            rows = np.searchsorted(self.customer_cdfs[source], self.rng.random(size), side='right')
+            offsets = self.rng.integers(0, self.tick_seconds, size).astype('timedelta64[s]')
+            event_times = np.sort(tick_time - offsets)
+            id_offset = self._id_offset + self.event_counts[source]
+            
+            if source == 'transactions':
+                table = self.generator._build_transactions(
+                    self.rng, self.profile, rows, event_times, self.avg_amount[rows], id_offset, tick_time
+                )
+            elif source == 'engagement':
+                session_dates = pc.replace_substring(
+                    pa.array(np.datetime_as_string(event_times, unit='D')), '-', ''
+                )
+                table = self.generator._build_engagement_logs(
+                    self.rng, self.profile, rows, self.engagement_level[rows], event_times,
+                    session_dates, id_offset, tick_time
+                )
+            else:
+                table = self.generator._build_support_interactions(
+                    self.rng, self.profile, rows, event_times, id_offset, tick_time
+                )
+            
+            # Rows of a tick that crosses an hour boundary go to both partitions
+            hours = event_times.astype('datetime64[h]')
+            for hour in np.unique(hours):
+                self._write(source, hour, event_times[hours == hour][0], table.filter(pa.array(hours == hour)))
+            self.event_counts[source] += size
+    
+    def _write(self, source: str, hour: np.datetime64, first_event: np.datetime64, table: pa.Table) -> None:
+        """Append rows to the open file of a source, rolling it first if needed."""
+        open_file = self._open_files.get(source)
+        if open_file is not None and (open_file['hour'] != hour
+                                      or first_event - open_file['first_event'] >= np.timedelta64(self.roll_seconds, 's')):
+            self._publish(source)
+            open_file = None
+        
+        if open_file is None:
+            stem = OUTPUT_FILES[source]
+            first = first_event.astype(datetime)
+            partition_dir = self.data_dir / stem / f"date={first:%Y-%m-%d}" / f"hour={first:%H}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            path = partition_dir / f"{stem}_{first:%Y%m%dT%H%M%S}.csv"
+            open_file = {
+                'hour': hour,
+                'first_event': first_event,
+                'path': path,
+                'partial_path': path.with_name(f"{path.name}.partial"),
+                'rows': 0
+            }
+            open_file['writer'] = pa_csv.CSVWriter(open_file['partial_path'], table.schema)
+            self._open_files[source] = open_file
+        
+        open_file['writer'].write_table(table)
+        open_file['rows'] += table.num_rows
+    
+    def _publish(self, source: str) -> None:
+        """Close the open file of a source and publish it under its final name."""
+        open_file = self._open_files.pop(source)
+        open_file['writer'].close()
+        open_file['partial_path'].replace(open_file['path'])
+        self.files_published += 1
+        print(f"Published {open_file['path']} ({open_file['rows']} rows)")
 
 def main():
     """Main function to generate mock data for A.U.R.A platform."""
-    generator = MockDataGenerator()
-    data = generator.generate_all_data()
-    
-    # Print summary statistics
-    print("\nData Summary:")
-    print(f"Customers: {len(data['customers'])}")
-    print(f"Transactions: {len(data['transactions'])}")
-    print(f"Engagement Events: {len(data['engagement'])}")
-    print(f"Support Tickets: {len(data['support'])}")
-    print(f"Survey Responses: {len(data['surveys'])}")
-    
-    # Print customer status distribution
-    print("\nCustomer Status Distribution:")
-    status_counts = data['customers']['status'].value_counts()
-    for status, count in status_counts.items():
-        print(f"  {status}: {count} ({count/len(data['customers'])*100:.1f}%)")
+    parser = argparse.ArgumentParser(description="Generate A.U.R.A mock Bronze data")
+    parser.add_argument("--customers", type=int, default=500, help="Number of customers to generate")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--format", choices=list(OUTPUT_FORMATS), default='csv', help="Output file format")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="Customers generated per shard")
+    parser.add_argument("--workers", type=int, default=1, help="Processes generating shards in parallel")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Output directory (defaults to data/bronze)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Emit engagement, transaction and support events continuously to rolling partitioned CSV files")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Streamed events per second")
+    parser.add_argument("--roll-seconds", type=int, default=60, help="Seconds of streamed events per published file")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to stream for (default: until interrupted)")
+    args = parser.parse_args()
+    
+    generator = MockDataGenerator(customer_count=args.customers, data_dir=args.output_dir, seed=args.seed,
+                                  output_format=args.format, shard_size=args.shard_size, workers=args.workers)
+    
+    if args.stream:
+        stream = MockEventStream(generator, events_per_second=args.rate, roll_seconds=args.roll_seconds)
+        summary = stream.run(args.duration)
+        print("\nStream Summary:")
+        for source, count in summary['events'].items():
+            print(f"{source}: {count}")
+        print(f"Files published: {summary['files_published']}")
+        print(f"Achieved rate: {summary['events_per_second']} events/s over {summary['elapsed_seconds']}s")
+        return
+    
+    row_counts = generator.write_all_data()
+    generator.print_summary(row_counts)
 
 if __name__ == "__main__":
     main()
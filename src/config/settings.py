@@ -4,7 +4,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, List, Any
 try:
     from pydantic_settings import BaseSettings
 except ImportError:
@@ -34,6 +34,10 @@ class Settings(BaseSettings):
     # These paths define where data is stored at each layer of the Medallion architecture
     data_root: Path = Path("data")
     bronze_path: Path = data_root / "bronze"  # Raw data landing zone
+    bronze_staging_path: Path = bronze_path / "staging"  # Parquet staging for streamed Bronze files
+    bronze_manifest_path: Path = data_root / "bronze_manifest.json"  # Fingerprints of processed Bronze files
+    incremental_state_path: Path = data_root / "incremental"  # Watermarks and per-customer aggregates
+    pipeline_checkpoint_path: Path = data_root / "checkpoints"  # Stage outputs of pipeline executions
     silver_path: Path = data_root / "silver"   # Cleaned and enriched data
     gold_path: Path = data_root / "gold"       # Business-ready aggregated data
     temp_path: Path = data_root / "temp"       # Temporary processing files
@@ -104,6 +108,71 @@ class Settings(BaseSettings):
     max_workers: int = Field(default=4, description="Maximum number of worker processes")
     batch_size: int = Field(default=1000, description="Batch size for data processing")
     
+    # Typed ingestion settings
+    # Bronze files are parsed by the Arrow CSV reader into the column types of the
+    # Bronze schema registry, so dates and amounts are converted once at ingestion
+    typed_ingestion_enabled: bool = Field(default=True, description="Parse Bronze CSV files into typed columns using the schema registry")
+    
+    # Unchanged source skipping
+    # Bronze files whose fingerprint matches the manifest reuse their Silver parquet
+    skip_unchanged_sources: bool = Field(default=True, description="Reuse Silver data for Bronze sources that have not changed")
+    
+    # Incremental pipeline settings
+    # Distinct counts are folded through per-customer K-minimum-values sketches,
+    # which are exact up to this many distinct values per customer
+    incremental_sketch_size: int = Field(default=64, description="Distinct values kept per customer sketch for incremental runs")
+    
+    # Windowed feature settings
+    # Gold AI model features count transactions, engagement events and support
+    # tickets within each of these trailing windows ending at the snapshot time
+    feature_window_days: List[int] = Field(default=[30, 60, 90], description="Trailing window lengths in days for AI model features")
+    
+    # Streaming ingestion settings
+    # Bronze exports are validated and profiled in bounded chunks and staged to
+    # parquet with fixed column types. Row hashes for duplicate detection are
+    # spilled to hash bucket files and counted one bucket at a time, so that
+    # step holds about row count / ingestion_hash_buckets hashes. The Silver
+    # layer still loads each staged table in full, so this does not lower the
+    # peak memory of a pipeline run
+    streaming_ingestion_enabled: bool = Field(default=False, description="Validate and stage Bronze CSV files to parquet chunk by chunk")
+    ingestion_chunk_size: int = Field(default=100000, description="Rows per chunk for streaming Bronze ingestion")
+    ingestion_hash_buckets: int = Field(default=256, description="Hash bucket files used to count duplicate rows during streaming ingestion")
+    
+    # Chatbot context settings
+    # Chatbot context is computed on demand per customer and memoized; the full
+    # Gold chatbot context table is only written when the export is enabled, and
+    # a previously exported table is removed by runs that do not refresh it
+    chatbot_context_export_enabled: bool = Field(default=False, description="Write the full Gold chatbot context table on every aggregation")
+    chatbot_context_cache_size: int = Field(default=1024, description="Customers whose chatbot context is kept in the on-demand cache")
+    
+    # Pipeline checkpoint settings
+    # Each completed stage of a full pipeline run is stored under the execution id
+    # so that a failed run can be resumed from the first incomplete stage
+    pipeline_checkpoints_enabled: bool = Field(default=True, description="Persist the output of each completed pipeline stage")
+    pipeline_checkpoint_retention: int = Field(default=3, description="Number of most recent executions whose checkpoints are kept")
+    
+    # Pipeline profiling settings
+    # Wall time, CPU time, peak memory and row counts of every pipeline step are
+    # written to logs/pipeline_profile_<execution_id>.json; a cProfile or
+    # pyinstrument capture of the DAG nodes can be written alongside
+    pipeline_profiling_enabled: bool = Field(default=True, description="Write a profile report for every pipeline execution")
+    pipeline_profiler: str = Field(default="", description="Profiler capture of pipeline steps: '', 'cprofile' or 'pyinstrument'")
+    
+    # Parquet layout settings
+    # Silver event tables are written with row groups following event days and the
+    # Gold customer 360 view with row groups following risk level and segment, so
+    # filtered reads only touch the matching row groups. Incremental runs write
+    # their rows as increment files next to the tables, which are compacted into
+    # the table once there are more than parquet_max_increment_files of them
+    parquet_row_group_size: int = Field(default=131072, description="Maximum rows per parquet row group of Silver and Gold tables")
+    parquet_max_increment_files: int = Field(default=24, description="Increment files kept next to a Silver or Gold table before they are compacted")
+    
+    # Table cache settings
+    # Gold and Silver tables read by the dashboards are kept in process memory
+    # until the pipeline rewrites their files; least recently used tables are
+    # evicted once the cache exceeds this memory cap
+    table_cache_max_memory_mb: int = Field(default=512, description="Memory cap in MB of the process-level Gold/Silver table cache")
+    
     # External service configuration (for future integrations)
     # These settings will be used when integrating with external services
     openai_api_key: str = Field(default="", description="OpenAI API key for advanced NLP")
@@ -0,0 +1,75 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Customer Index
+# This module maps customer ids to row positions of the loaded customer data
+# so that the dashboards look up a customer without scanning the frame
+
+import pandas as pd
+from typing import Dict, Optional, Any
+import logging
+
+# Configure logging for the customer index
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class CustomerIndex:
+    """
+    Customer id to row position index of a customer DataFrame.
+    
+    The index is built once when customer data is loaded or uploaded, and
+    every lookup afterwards is a single hash lookup instead of a boolean
+    scan of the whole frame. When an id occurs more than once, the first
+    row is returned, as the scans it replaces did.
+    """
+    
+    def __init__(self, customer_data: pd.DataFrame, id_column: str = 'customer_id'):
+        """
+        Build the customer index.
+        
+        Args:
+            customer_data: Loaded customer data
+            id_column: Column holding the customer id
+        """
+        self.customer_data = customer_data
+        self.id_column = id_column
+        self._positions: Dict[Any, int] = {}
+        
+        if id_column in customer_data.columns:
+            ids = customer_data[id_column].tolist()
+            # Assign in reverse so the first occurrence of an id wins
+            self._positions = dict(zip(reversed(ids), range(len(ids) - 1, -1, -1)))
+        
+        logger.info(f"Customer index built: {len(self._positions)} customers")
+    
+    def __len__(self) -> int:
+        """Get the number of indexed customers."""
+        return len(self._positions)
+    
+    def __contains__(self, customer_id: Any) -> bool:
+        """Check whether a customer id is indexed."""
+        return customer_id in self._positions
+    
+    def get_position(self, customer_id: Any) -> Optional[int]:
+        """
+        Get the row position of a customer.
+        
+        Args:
+            customer_id: Customer id
+        
+        Returns:
+            Optional[int]: Row position, or None for unknown customers
+        """
+        return self._positions.get(customer_id)
+    
+    def get_customer(self, customer_id: Any) -> Optional[pd.Series]:
+        """
+        Get the row of a customer.
+        
+        Args:
+            customer_id: Customer id
+        
+        Returns:
+            Optional[pd.Series]: Customer row, or None for unknown customers
+        """
+        position = self._positions.get(customer_id)
+        if position is None:
+            return None
+        return self.customer_data.iloc[position]
@@ -6,16 +6,115 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import logging
-import streamlit as st
+import csv
+import threading
+import pyarrow as pa
+import pyarrow.parquet as pq
 from src.config.settings import settings
 from src.config.constants import Colors, TimePeriods
+from src.data_pipeline.table_cache import table_cache
+from src.data_pipeline.parquet_layout import get_table_files, read_parquet_table
+from src.data_pipeline.gold_agg import GoldAggregation, CHATBOT_CONTEXT_SOURCE_COLUMNS
+from src.data_pipeline.chatbot_context import ChatbotContextProvider
 
 # Configure logging for data loader
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Dashboard list filters and the customer 360 columns they select on
+CUSTOMER_FILTER_COLUMNS = {
+    'risk_level': 'churn_risk_level',
+    'client_segment': 'client_segment',
+    'subscription_plan': 'current_subscription_plan'
+}
+
+# Customer 360 columns read by the dashboard views, the decision engine and
+# the customer insights; the apps load only these columns of the Gold view
+DASHBOARD_CUSTOMER_COLUMNS = [
+    'customer_pk', 'current_subscription_plan', 'client_segment', 'current_health_score',
+    'churn_risk_level', 'recommended_action', 'total_lifetime_revenue', 'engagement_score',
+    'days_since_last_engagement', 'total_support_tickets_lifetime', 'most_recent_nps_score'
+]
+
+# Block size used when counting the lines of Bronze CSV files
+LINE_COUNT_BLOCK_SIZE = 1024 * 1024
+
+# Record and column counts of CSV files keyed by path, with the modification
+# time and size they were counted at
+_csv_summary_cache: Dict[str, Tuple[int, int, Dict[str, int]]] = {}
+_csv_summary_lock = threading.Lock()
+
+def _read_parquet_summary(file_path: Path) -> Dict[str, int]:
+    """Get the record and column counts of a parquet table from its footer."""
+    parquet_file = pq.ParquetFile(file_path)
+    schema = parquet_file.schema_arrow
+    
+    # Stored index columns are not DataFrame columns
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = [column for column in pandas_metadata.get('index_columns', []) if isinstance(column, str)]
+    columns = [name for name in schema.names if name not in index_columns]
+    
+    # Rows of increment files may replace stored rows, so they are counted by reading one column
+    records = parquet_file.metadata.num_rows
+    if len(get_table_files(file_path)) > 1:
+        records = len(read_parquet_table(file_path, columns=columns[:1]))
+    
+    return {
+        'records': records,
+        'columns': len(columns)
+    }
+
+def _count_csv_records(file_path: Path) -> Dict[str, int]:
+    """Count the records (lines after the header) and header columns of a CSV file."""
+    lines = 0
+    last_block = b''
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        f.seek(0)
+        while True:
+            block = f.read(LINE_COUNT_BLOCK_SIZE)
+            if not block:
+                break
+            lines += block.count(b'\n')
+            last_block = block
+    
+    # A last line without a trailing newline is still a record
+    if last_block and not last_block.endswith(b'\n'):
+        lines += 1
+    
+    columns = len(next(csv.reader([header.decode('utf-8', errors='replace')]))) if header.strip() else 0
+    return {'records': max(lines - 1, 0), 'columns': columns}
+
+def _read_csv_summary(file_path: Path) -> Dict[str, int]:
+    """Get the record and column counts of a CSV file, counted once per modification."""
+    stat = file_path.stat()
+    key = str(file_path.resolve())
+    with _csv_summary_lock:
+        cached = _csv_summary_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    
+    summary = _count_csv_records(file_path)
+    with _csv_summary_lock:
+        _csv_summary_cache[key] = (stat.st_mtime_ns, stat.st_size, summary)
+    return summary
+
+def _get_customer_pk_filter(filters: Optional[List]) -> Optional[List[str]]:
+    """Get the customer keys of a filter that only selects customers by customer_pk, if it is one."""
+    if not filters or len(filters) != 1:
+        return None
+    
+    column, op, value = filters[0]
+    if column != 'customer_pk':
+        return None
+    if op == '==':
+        return [value]
+    if op == 'in':
+        return list(value)
+    return None
+
 class DashboardDataLoader:
     """
     Data loader for A.U.R.A dashboard with caching and error handling.
@@ -23,6 +122,10 @@ class DashboardDataLoader:
     This class provides efficient data loading for the Streamlit dashboard
     with built-in caching, error handling, and data validation. It ensures
     optimal performance and reliability for the dashboard components.
+    
+    Tables are cached by the process-level table cache rather than by
+    Streamlit, so the Gradio app and batch scripts share the same cache and
+    a pipeline run is picked up as soon as it rewrites the Gold files.
     """
     
     def __init__(self):
@@ -30,28 +133,37 @@ class DashboardDataLoader:
         self.gold_path = settings.gold_path
         self.silver_path = settings.silver_path
         self.bronze_path = settings.bronze_path
+        self.table_cache = table_cache
+        self.chatbot_context_provider: Optional[ChatbotContextProvider] = None
         
         logger.info("Dashboard data loader initialized")
     
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def load_customer_360_data(_self) -> pd.DataFrame:
+    def load_customer_360_data(self, columns: Optional[List[str]] = None,
+                               filters: Optional[List] = None) -> pd.DataFrame:
         """
         Load customer 360-degree view data with caching.
         
         This method loads the customer 360-degree view data from the Gold layer
-        with Streamlit caching for optimal performance. The data includes
+        through the process-level table cache, which reloads it only after a
+        pipeline run rewrites the file. The data includes
         comprehensive customer profiles with health scores and recommendations.
+        Row groups not matching filters on churn risk level or client segment
+        are not read.
         
+        Args:
+            columns: Columns to load (all columns if None)
+            filters: Row filters passed to the parquet reader, e.g. [('churn_risk_level', '==', 'High')]
+            
         Returns:
             pd.DataFrame: Customer 360-degree view data
         """
         logger.info("Loading customer 360-degree view data")
         
         try:
-            file_path = _self.gold_path / "gold_customer_360_dashboard_view.parquet"
+            file_path = self.gold_path / "gold_customer_360_dashboard_view.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                df = self.table_cache.load_table(file_path, columns=columns, filters=filters)
                 logger.info(f"Loaded customer 360 data: {len(df)} records")
                 return df
             else:
@@ -62,8 +174,7 @@ class DashboardDataLoader:
             logger.error(f"Error loading customer 360 data: {str(e)}")
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)
-    def load_dashboard_kpis(_self) -> pd.DataFrame:
+    def load_dashboard_kpis(self) -> pd.DataFrame:
         """
         Load dashboard KPIs with caching.
         
@@ -77,10 +188,10 @@ class DashboardDataLoader:
         logger.info("Loading dashboard KPIs")
         
         try:
-            file_path = _self.gold_path / "gold_overall_kpi_dashboard_view.parquet"
+            file_path = self.gold_path / "gold_overall_kpi_dashboard_view.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                df = self.table_cache.load_table(file_path)
                 logger.info(f"Loaded dashboard KPIs: {len(df)} records")
                 return df
             else:
@@ -91,8 +202,8 @@ class DashboardDataLoader:
             logger.error(f"Error loading dashboard KPIs: {str(e)}")
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)
-    def load_ai_model_features(_self) -> pd.DataFrame:
+    def load_ai_model_features(self, columns: Optional[List[str]] = None,
+                               filters: Optional[List] = None) -> pd.DataFrame:
         """
         Load AI model features with caching.
         
@@ -100,16 +211,20 @@ class DashboardDataLoader:
         for optimal performance. The features are used for model training and
         inference in the dashboard.
         
+        Args:
+            columns: Columns to load (all columns if None)
+            filters: Row filters passed to the parquet reader, e.g. [('customer_pk', 'in', customer_pks)]
+            
         Returns:
             pd.DataFrame: AI model features data
         """
         logger.info("Loading AI model features")
         
         try:
-            file_path = _self.gold_path / "gold_ai_model_features_for_churn_prediction.parquet"
+            file_path = self.gold_path / "gold_ai_model_features_for_churn_prediction.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                df = self.table_cache.load_table(file_path, columns=columns, filters=filters)
                 logger.info(f"Loaded AI model features: {len(df)} records")
                 return df
             else:
@@ -120,25 +235,38 @@ class DashboardDataLoader:
             logger.error(f"Error loading AI model features: {str(e)}")
             return pd.DataFrame()
     
-    @st.cache_data(ttl=300)
-    def load_chatbot_context(_self) -> pd.DataFrame:
+    def load_chatbot_context(self, columns: Optional[List[str]] = None,
+                             filters: Optional[List] = None) -> pd.DataFrame:
         """
         Load chatbot context data with caching.
         
         This method loads the chatbot context data from the Gold layer with caching
         for optimal performance. The context data enables personalized chatbot
-        interactions and recommendations.
+        interactions and recommendations. When the chatbot context export is
+        disabled, no Gold table is kept up to date, so context is computed from
+        the current customer 360 view instead: per customer through the
+        on-demand context provider when filtering on customer_pk, otherwise for
+        every customer.
         
+        Args:
+            columns: Columns to load (all columns if None)
+            filters: Row filters passed to the parquet reader, e.g. [('customer_pk', 'in', customer_pks)]
+            
         Returns:
             pd.DataFrame: Chatbot context data
         """
         logger.info("Loading chatbot context data")
         
         try:
-            file_path = _self.gold_path / "gold_ai_chatbot_context.parquet"
+            if not settings.chatbot_context_export_enabled:
+                df = self._compute_chatbot_context(columns, filters)
+                logger.info(f"Computed chatbot context: {len(df)} records")
+                return df
+            
+            file_path = self.gold_path / "gold_ai_chatbot_context.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                df = self.table_cache.load_table(file_path, columns=columns, filters=filters)
                 logger.info(f"Loaded chatbot context: {len(df)} records")
                 return df
             else:
@@ -149,7 +277,92 @@ class DashboardDataLoader:
             logger.error(f"Error loading chatbot context: {str(e)}")
             return pd.DataFrame()
     
-    def load_silver_data(self, data_type: str) -> pd.DataFrame:
+    def _compute_chatbot_context(self, columns: Optional[List[str]] = None,
+                                 filters: Optional[List] = None) -> pd.DataFrame:
+        """Compute chatbot context from the current customer 360 view."""
+        provider = self._get_chatbot_context_provider()
+        customer_pks = _get_customer_pk_filter(filters)
+        
+        if customer_pks is not None:
+            df = provider.get_contexts(customer_pks)
+        else:
+            file_path = provider.gold_aggregation.get_gold_table_path('customer_360_dashboard_view')
+            if not file_path.exists():
+                logger.warning("Customer 360 file not found, returning empty chatbot context")
+                return pd.DataFrame()
+            
+            available = set(pq.read_schema(file_path).names)
+            source_columns = [column for column in CHATBOT_CONTEXT_SOURCE_COLUMNS if column in available]
+            customer_360 = self.table_cache.load_table(file_path, columns=source_columns)
+            df = provider.gold_aggregation.create_chatbot_context(customer_360)
+            
+            if filters:
+                table = pa.Table.from_pandas(df, preserve_index=False).filter(pq.filters_to_expression(filters))
+                df = table.to_pandas()
+        
+        if columns is not None:
+            df = df[[column for column in columns if column in df.columns]]
+        return df
+    
+    def _get_chatbot_context_provider(self) -> ChatbotContextProvider:
+        """Get the on-demand chatbot context provider for the loader's Gold path."""
+        provider = self.chatbot_context_provider
+        if provider is None or provider.gold_aggregation.gold_path != self.gold_path:
+            gold_aggregation = GoldAggregation()
+            gold_aggregation.gold_path = self.gold_path
+            provider = self.chatbot_context_provider = ChatbotContextProvider(gold_aggregation)
+        return provider
+    
+    def load_filtered_customer_data(self, filters: Dict[str, Any],
+                                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load only the customer 360 rows matching dashboard filters.
+        
+        Risk level, segment, subscription plan and health score filters are
+        passed to the parquet reader, so row groups of other risk levels and
+        segments are not read (e.g. a "High" risk filter only reads the High
+        risk row groups). Remaining filters are applied in memory.
+        
+        Args:
+            filters: Dictionary of filter criteria (see filter_customer_data)
+            columns: Columns to load (all columns if None)
+            
+        Returns:
+            pd.DataFrame: Filtered customer data
+        """
+        logger.info("Loading filtered customer 360-degree view data")
+        
+        parquet_filters = []
+        for filter_key, column in CUSTOMER_FILTER_COLUMNS.items():
+            if filters.get(filter_key):
+                parquet_filters.append((column, 'in', list(filters[filter_key])))
+        if filters.get('health_score_min') is not None:
+            parquet_filters.append(('current_health_score', '>=', filters['health_score_min']))
+        if filters.get('health_score_max') is not None:
+            parquet_filters.append(('current_health_score', '<=', filters['health_score_max']))
+        
+        try:
+            file_path = self.gold_path / "gold_customer_360_dashboard_view.parquet"
+            
+            if not file_path.exists():
+                logger.warning("Customer 360 data file not found, returning empty DataFrame")
+                return pd.DataFrame()
+            
+            if filters.get('date_range') and columns is not None and 'last_active_date' not in columns:
+                columns = list(columns) + ['last_active_date']
+            df = self.table_cache.load_table(file_path, columns=columns, filters=parquet_filters or None)
+            if filters.get('date_range'):
+                df = self.filter_customer_data(df, {'date_range': filters['date_range']})
+            
+            logger.info(f"Loaded filtered customer 360 data: {len(df)} records")
+            return df
+                
+        except Exception as e:
+            logger.error(f"Error loading filtered customer 360 data: {str(e)}")
+            return pd.DataFrame()
+    
+    def load_silver_data(self, data_type: str, columns: Optional[List[str]] = None,
+                         filters: Optional[List] = None) -> pd.DataFrame:
         """
         Load Silver layer data by type.
         
@@ -158,6 +371,9 @@ class DashboardDataLoader:
         
         Args:
             data_type: Type of Silver layer data to load
+            columns: Columns to load (all columns if None)
+            filters: Row filters passed to the parquet reader; event tables
+                are stored by day, so date filters only read the matching days
             
         Returns:
             pd.DataFrame: Silver layer data
@@ -168,7 +384,7 @@ class DashboardDataLoader:
             file_path = self.silver_path / f"silver_{data_type}.parquet"
             
             if file_path.exists():
-                df = pd.read_parquet(file_path)
+                df = self.table_cache.load_table(file_path, columns=columns, filters=filters)
                 logger.info(f"Loaded Silver {data_type} data: {len(df)} records")
                 return df
             else:
@@ -184,7 +400,9 @@ class DashboardDataLoader:
         Get summary of available data.
         
         This method provides a summary of all available data sources
-        for monitoring and debugging purposes.
+        for monitoring and debugging purposes. Only file metadata is read:
+        parquet record and column counts come from the file footers, and
+        CSV files are line-counted once per modification time.
         
         Returns:
             Dict[str, Any]: Data summary information
@@ -208,32 +426,14 @@ class DashboardDataLoader:
         
         for file_name in gold_files:
             file_path = self.gold_path / f"gold_{file_name}.parquet"
-            if file_path.exists():
-                try:
-                    df = pd.read_parquet(file_path)
-                    summary['gold_layer'][file_name] = {
-                        'records': len(df),
-                        'columns': len(df.columns),
-                        'last_modified': datetime.fromtimestamp(file_path.stat().st_mtime)
-                    }
-                except Exception as e:
-                    summary['gold_layer'][file_name] = {'error': str(e)}
+            summary['gold_layer'].update(self._summarize_file(file_name, file_path, _read_parquet_summary))
         
         # Check Silver layer files
         silver_files = ['customers', 'transactions', 'engagement', 'support', 'surveys', 'customer_profiles']
         
         for file_name in silver_files:
             file_path = self.silver_path / f"silver_{file_name}.parquet"
-            if file_path.exists():
-                try:
-                    df = pd.read_parquet(file_path)
-                    summary['silver_layer'][file_name] = {
-                        'records': len(df),
-                        'columns': len(df.columns),
-                        'last_modified': datetime.fromtimestamp(file_path.stat().st_mtime)
-                    }
-                except Exception as e:
-                    summary['silver_layer'][file_name] = {'error': str(e)}
+            summary['silver_layer'].update(self._summarize_file(file_name, file_path, _read_parquet_summary))
         
         # Check Bronze layer files
         bronze_files = ['raw_customer_demographics', 'raw_transactions', 'raw_engagement_logs', 
@@ -241,20 +441,24 @@ class DashboardDataLoader:
         
         for file_name in bronze_files:
             file_path = self.bronze_path / f"{file_name}.csv"
-            if file_path.exists():
-                try:
-                    df = pd.read_csv(file_path)
-                    summary['bronze_layer'][file_name] = {
-                        'records': len(df),
-                        'columns': len(df.columns),
-                        'last_modified': datetime.fromtimestamp(file_path.stat().st_mtime)
-                    }
-                except Exception as e:
-                    summary['bronze_layer'][file_name] = {'error': str(e)}
+            summary['bronze_layer'].update(self._summarize_file(file_name, file_path, _read_csv_summary))
         
         logger.info("Data summary generated")
         return summary
     
+    def _summarize_file(self, file_name: str, file_path: Path,
+                        read_summary: Callable[[Path], Dict[str, int]]) -> Dict[str, Dict[str, Any]]:
+        """Summarize a data file with a metadata reader, if the file exists."""
+        if not file_path.exists():
+            return {}
+        
+        try:
+            file_summary = dict(read_summary(file_path))
+            file_summary['last_modified'] = datetime.fromtimestamp(file_path.stat().st_mtime)
+            return {file_name: file_summary}
+        except Exception as e:
+            return {file_name: {'error': str(e)}}
+    
     def filter_customer_data(self, df: pd.DataFrame, 
                            filters: Dict[str, Any]) -> pd.DataFrame:
         """
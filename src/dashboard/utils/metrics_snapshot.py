@@ -0,0 +1,67 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Metrics Snapshot
+# This module computes the customer metrics shown by the dashboard cards,
+# retention strategies and AI chat once per loaded or uploaded dataset
+
+import pandas as pd
+from typing import Dict, Any
+import logging
+
+# Configure logging for the metrics snapshot
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Thresholds used by the dashboard metrics
+LOW_HEALTH_THRESHOLD = 50
+HIGH_HEALTH_THRESHOLD = 80
+LOW_ENGAGEMENT_DAYS = 30
+
+def compute_metrics_snapshot(customer_data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the customer metrics snapshot of a loaded dataset.
+    
+    Every aggregate the dashboard handlers show is computed here in one pass
+    over the relevant columns, so handlers read precomputed values instead of
+    rescanning the data on every click or chat message, and all tabs report
+    the same numbers. Missing columns count as zero, and values of numeric
+    metrics that are not numbers (e.g. text in an uploaded CSV) are treated
+    as missing, so unexpected data never fails the load that computes them.
+    
+    Args:
+        customer_data: Loaded customer data
+    
+    Returns:
+        Dict[str, Any]: Customer counts, averages and revenue totals
+    """
+    total_customers = len(customer_data)
+    
+    def numeric(column: str) -> pd.Series:
+        if column not in customer_data.columns:
+            return pd.Series(dtype='float64')
+        return pd.to_numeric(customer_data[column], errors='coerce')
+    
+    def count(column: str, mask_fn) -> int:
+        return int(mask_fn(numeric(column)).sum())
+    
+    def mean(column: str) -> float:
+        value = numeric(column).mean()
+        return 0.0 if pd.isna(value) else float(value)
+    
+    if 'churn_risk_level' in customer_data.columns:
+        high_risk_count = int((customer_data['churn_risk_level'] == 'High').sum())
+    else:
+        high_risk_count = 0
+    
+    snapshot = {
+        'total_customers': total_customers,
+        'high_risk_count': high_risk_count,
+        'churn_rate': (high_risk_count / total_customers) * 100 if total_customers else 0.0,
+        'avg_health': mean('current_health_score'),
+        'low_health_count': count('current_health_score', lambda s: s < LOW_HEALTH_THRESHOLD),
+        'high_health_count': count('current_health_score', lambda s: s > HIGH_HEALTH_THRESHOLD),
+        'avg_engagement': mean('engagement_score'),
+        'low_engagement_count': count('days_since_last_engagement', lambda s: s > LOW_ENGAGEMENT_DAYS),
+        'total_revenue': float(numeric('total_lifetime_revenue').sum())
+    }
+    
+    logger.info(f"Metrics snapshot computed for {total_customers} customers")
+    return snapshot
@@ -0,0 +1,146 @@
+# A.U.R.A (AI-Unified Retention Analytics) - On-Demand Chatbot Context
+# This module computes chatbot context for individual customers from the Gold
+# customer 360 view when the chatbot asks for them, instead of for every customer
+
+import pandas as pd
+import pyarrow.parquet as pq
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+from src.config.settings import settings
+from src.data_pipeline.gold_agg import GoldAggregation, CHATBOT_CONTEXT_SOURCE_COLUMNS
+from src.data_pipeline.parquet_layout import get_table_fingerprint, read_parquet_table
+
+# Configure logging for chatbot context
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ChatbotContextProvider:
+    """
+    On-demand chatbot context for individual customers.
+    
+    The chat interface only looks up the customers someone asks about, so
+    context is computed from the customer's Gold customer 360 row when it is
+    first requested and memoized in a least-recently-used cache. The stored
+    customer 360 table is identified by the size and modification time of its
+    files; when a pipeline run rewrites it or adds increment files, the table
+    is reloaded and the cache is cleared, so context never outlives the Gold data it was computed from.
+    """
+    
+    def __init__(self, gold_aggregation: Optional[GoldAggregation] = None, cache_size: Optional[int] = None):
+        """
+        Initialize the chatbot context provider.
+        
+        Args:
+            gold_aggregation: Gold aggregation used to read the customer 360 view and build context
+            cache_size: Number of customer contexts kept (defaults to settings.chatbot_context_cache_size)
+        """
+        self.gold_aggregation = gold_aggregation or GoldAggregation()
+        self.cache_size = cache_size or settings.chatbot_context_cache_size
+        
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._customer_360: Optional[pd.DataFrame] = None
+        self._customer_rows: Optional[pd.Index] = None
+        self._source_version: Optional[Tuple] = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+    
+    def get_context(self, customer_pk: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the chatbot context of one customer.
+        
+        Args:
+            customer_pk: Customer key
+        
+        Returns:
+            Optional[Dict[str, Any]]: Chatbot context record (the columns of the
+            Gold chatbot context table), or None for unknown customers
+        """
+        with self._lock:
+            self._refresh_if_changed()
+            
+            if customer_pk in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(customer_pk)
+                return dict(self._cache[customer_pk])
+            
+            self._misses += 1
+            if self._customer_rows is None:
+                return None
+            
+            rows = self._customer_rows.get_indexer_for([customer_pk])
+            if rows[0] < 0:
+                return None
+            
+            context = self.gold_aggregation.create_chatbot_context(self._customer_360.iloc[rows[:1]]).iloc[0].to_dict()
+            
+            self._cache[customer_pk] = context
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            
+            return dict(context)
+    
+    def get_contexts(self, customer_pks: List[str]) -> pd.DataFrame:
+        """
+        Get the chatbot context of several customers as a table.
+        
+        Args:
+            customer_pks: Customer keys; unknown customers are skipped
+        
+        Returns:
+            pd.DataFrame: Chatbot context records in the order requested
+        """
+        contexts = [self.get_context(customer_pk) for customer_pk in customer_pks]
+        return pd.DataFrame([context for context in contexts if context is not None])
+    
+    def invalidate(self) -> None:
+        """Drop the cached contexts and the loaded customer 360 view."""
+        with self._lock:
+            self._clear()
+    
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Cache hits, misses, current and maximum size
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'cached_customers': len(self._cache),
+            'cache_size': self.cache_size
+        }
+    
+    def _refresh_if_changed(self) -> None:
+        """Reload the customer 360 view and clear the cache when the Gold table changed."""
+        file_path = self.gold_aggregation.get_gold_table_path('customer_360_dashboard_view')
+        
+        version = get_table_fingerprint(file_path)
+        if version is None:
+            if self._source_version is not None:
+                self._clear()
+            return
+        
+        if version == self._source_version:
+            return
+        
+        self._clear()
+        
+        # Only the columns the context is built from are read
+        available = set(pq.read_schema(file_path).names)
+        columns = [column for column in CHATBOT_CONTEXT_SOURCE_COLUMNS if column in available]
+        self._customer_360 = read_parquet_table(file_path, columns=columns)
+        self._customer_rows = pd.Index(self._customer_360['customer_pk'])
+        self._source_version = version
+        
+        logger.info(f"Chatbot context source loaded: {len(self._customer_360)} customers")
+    
+    def _clear(self) -> None:
+        """Forget the loaded customer 360 view and every cached context."""
+        self._cache.clear()
+        self._customer_360 = None
+        self._customer_rows = None
+        self._source_version = None
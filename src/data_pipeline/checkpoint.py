@@ -0,0 +1,249 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline Checkpoints
+# This module persists the output of each completed pipeline stage under its
+# execution id, so a failed run can resume from the first incomplete stage
+
+import json
+import shutil
+import hashlib
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional, Any, Union
+import logging
+from src.config.settings import settings
+from src.data_pipeline.fingerprint import BronzeFingerprintManifest
+from src.data_pipeline.parquet_layout import remove_table_increments
+
+# Configure logging for pipeline checkpoints
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in execution order
+PIPELINE_STAGES = ['bronze_ingestion', 'silver_transformation', 'gold_aggregation']
+
+class PipelineCheckpointStore:
+    """
+    Stage checkpoints of pipeline executions.
+    
+    Every execution gets a directory named after its execution id holding one
+    parquet file per table of each completed stage and a JSON manifest with
+    the completed stages and the fingerprint of the Bronze inputs the run
+    started from. A stage is only listed in the manifest after all of its
+    tables are written, so a stage interrupted mid-write is treated as
+    incomplete. Resuming is refused when the Bronze inputs changed since the
+    checkpoints were written, because the stored stages would no longer
+    match the data that later stages read.
+    """
+    
+    def __init__(self, checkpoint_path: Optional[Path] = None):
+        """
+        Initialize the checkpoint store.
+        
+        Args:
+            checkpoint_path: Checkpoint root directory (defaults to settings.pipeline_checkpoint_path)
+        """
+        self.checkpoint_path = checkpoint_path or settings.pipeline_checkpoint_path
+        
+        # Stages of one execution can be checkpointed from concurrent pipeline steps
+        self._manifest_lock = Lock()
+    
+    def compute_input_fingerprint(self, source_files: Dict[str, Path],
+                                  source_fingerprints: Optional[Dict[str, Dict[str, Any]]] = None,
+                                  partition_files: Optional[Dict[str, List[Path]]] = None) -> str:
+        """
+        Fingerprint the Bronze inputs of a run.
+        
+        Content hashes recorded in the Bronze fingerprint manifest are reused
+        for files whose size and modification time are unchanged.
+        
+        Args:
+            source_files: Bronze source file paths keyed by data type
+            source_fingerprints: Source fingerprints already computed for this run
+            partition_files: Published partition files keyed by data type
+        
+        Returns:
+            str: Hash over the application version and every source's content hash
+        """
+        fingerprint_manifest = BronzeFingerprintManifest()
+        stored = fingerprint_manifest.load()
+        source_fingerprints = source_fingerprints or {}
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(settings.app_version.encode())
+        for data_type in sorted(source_files):
+            fingerprint = source_fingerprints.get(data_type) or fingerprint_manifest.compute_fingerprint(
+                source_files[data_type], stored.get(data_type), (partition_files or {}).get(data_type)
+            )
+            digest.update(
+                f"{data_type}:{fingerprint['exists']}:{fingerprint.get('content_hash')}:"
+                f"{fingerprint.get('partitions_hash')}".encode()
+            )
+        
+        return digest.hexdigest()
+    
+    def get_run_path(self, execution_id: str) -> Path:
+        """Get the checkpoint directory of an execution."""
+        return self.checkpoint_path / execution_id
+    
+    def start_run(self, execution_id: str, input_fingerprint: str,
+                  reused_sources: Optional[List[str]] = None) -> None:
+        """
+        Create the checkpoint manifest of a new execution.
+        
+        Args:
+            execution_id: Pipeline execution id
+            input_fingerprint: Fingerprint of the Bronze inputs
+            reused_sources: Bronze sources whose stored Silver data the run reuses
+        """
+        self._write_manifest(execution_id, {
+            'execution_id': execution_id,
+            'app_version': settings.app_version,
+            'input_fingerprint': input_fingerprint,
+            'reused_sources': list(reused_sources or []),
+            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'stages': {}
+        })
+        self._remove_old_runs(keep=execution_id)
+    
+    def load_manifest(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the checkpoint manifest of an execution.
+        
+        Args:
+            execution_id: Pipeline execution id
+        
+        Returns:
+            Optional[Dict[str, Any]]: Manifest, or None if the execution has no checkpoints
+        """
+        manifest_path = self.get_run_path(execution_id) / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read checkpoint manifest {manifest_path}: {str(e)}")
+            return None
+    
+    def get_completed_stages(self, execution_id: str) -> List[str]:
+        """
+        Get the stages of an execution whose checkpoints are complete.
+        
+        Only the leading run of completed stages counts, since a later stage
+        cannot be used without the stages before it.
+        
+        Args:
+            execution_id: Pipeline execution id
+        
+        Returns:
+            List[str]: Completed stages in execution order
+        """
+        manifest = self.load_manifest(execution_id) or {'stages': {}}
+        completed = []
+        for stage in PIPELINE_STAGES:
+            if stage not in manifest['stages']:
+                break
+            completed.append(stage)
+        return completed
+    
+    def save_stage(self, execution_id: str, stage: str,
+                   tables: Dict[str, Union[pd.DataFrame, Path]]) -> None:
+        """
+        Write the tables of a completed stage and mark the stage complete.
+        
+        Tables given as a path to a parquet file already written by the
+        stage are copied rather than encoded again.
+        
+        Args:
+            execution_id: Pipeline execution id
+            stage: Stage name from PIPELINE_STAGES
+            tables: DataFrames or parquet file paths keyed by table name
+        """
+        if stage not in PIPELINE_STAGES:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        
+        if self.load_manifest(execution_id) is None:
+            raise ValueError(f"No checkpoint run started for execution {execution_id}")
+        
+        stage_path = self.get_run_path(execution_id) / stage
+        stage_path.mkdir(parents=True, exist_ok=True)
+        
+        row_counts = {}
+        for name, table in tables.items():
+            file_path = stage_path / f"{name}.parquet"
+            if isinstance(table, Path):
+                shutil.copyfile(table, file_path)
+                row_counts[name] = None
+            else:
+                table.to_parquet(file_path, index=False)
+                row_counts[name] = len(table)
+        
+        with self._manifest_lock:
+            manifest = self.load_manifest(execution_id)
+            manifest['stages'][stage] = {
+                'tables': row_counts,
+                'completed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self._write_manifest(execution_id, manifest)
+        
+        logger.info(f"Checkpointed {stage} of execution {execution_id}: {len(tables)} tables")
+    
+    def load_stage(self, execution_id: str, stage: str) -> Dict[str, pd.DataFrame]:
+        """
+        Load the tables of a completed stage.
+        
+        Args:
+            execution_id: Pipeline execution id
+            stage: Stage name from PIPELINE_STAGES
+        
+        Returns:
+            Dict[str, pd.DataFrame]: Stage tables keyed by table name
+        """
+        manifest = self.load_manifest(execution_id)
+        if manifest is None or stage not in manifest['stages']:
+            raise ValueError(f"Stage {stage} of execution {execution_id} has no checkpoint")
+        
+        stage_path = self.get_run_path(execution_id) / stage
+        return {
+            name: pd.read_parquet(stage_path / f"{name}.parquet")
+            for name in manifest['stages'][stage]['tables']
+        }
+    
+    def restore_stage_files(self, execution_id: str, stage: str, destinations: Dict[str, Path]) -> None:
+        """
+        Copy checkpointed stage tables back to their data layer files.
+        
+        Increment files written next to a table by later incremental runs are
+        removed, as the checkpoint holds the complete table.
+        
+        Args:
+            execution_id: Pipeline execution id
+            stage: Stage name from PIPELINE_STAGES
+            destinations: Destination parquet paths keyed by table name
+        """
+        stage_path = self.get_run_path(execution_id) / stage
+        for name, destination in destinations.items():
+            shutil.copyfile(stage_path / f"{name}.parquet", destination)
+            remove_table_increments(destination)
+    
+    def _write_manifest(self, execution_id: str, manifest: Dict[str, Any]) -> None:
+        """Write a manifest through a temporary file so it is never left partial."""
+        run_path = self.get_run_path(execution_id)
+        run_path.mkdir(parents=True, exist_ok=True)
+        
+        partial_path = run_path / "manifest.json.partial"
+        with open(partial_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        partial_path.replace(run_path / "manifest.json")
+    
+    def _remove_old_runs(self, keep: str) -> None:
+        """Delete the checkpoints of all but the most recent executions."""
+        runs = sorted(path for path in self.checkpoint_path.iterdir()
+                      if path.is_dir() and path.name != keep)
+        retained = max(settings.pipeline_checkpoint_retention - 1, 0)
+        
+        for run_path in runs[:len(runs) - retained] if retained else runs:
+            shutil.rmtree(run_path, ignore_errors=True)
+            logger.info(f"Removed pipeline checkpoints of execution {run_path.name}")
@@ -0,0 +1,300 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Customer Metrics Engine
+# This module computes the per-customer metrics of Silver layer customer profiles
+# from transaction, engagement, support and survey data in a single aggregation pass
+
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+import logging
+
+# Configure logging for customer metrics
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Derived metric columns in the order they are added to customer profiles
+METRIC_COLUMNS = [
+    'total_lifetime_revenue', 'average_transaction_value', 'total_transactions_count',
+    'first_transaction_date', 'last_transaction_date', 'days_since_last_transaction',
+    'first_engagement_date', 'last_engagement_date', 'total_engagement_events',
+    'unique_event_types', 'total_sessions', 'days_since_last_engagement', 'engagement_score',
+    'total_support_tickets_lifetime', 'avg_satisfaction_score_lifetime',
+    'last_support_ticket_date', 'days_since_last_support_ticket',
+    'avg_nps_score_lifetime', 'most_recent_nps_score',
+    'last_survey_response_date', 'days_since_last_survey'
+]
+
+# Date metric columns (all other metrics are numeric)
+DATE_METRIC_COLUMNS = [
+    'first_transaction_date', 'last_transaction_date',
+    'first_engagement_date', 'last_engagement_date',
+    'last_support_ticket_date', 'last_survey_response_date'
+]
+
+# Count metrics, kept as integers when every customer has a value
+INTEGER_METRIC_COLUMNS = [
+    'total_transactions_count', 'days_since_last_transaction',
+    'total_engagement_events', 'unique_event_types', 'total_sessions', 'days_since_last_engagement',
+    'total_support_tickets_lifetime', 'days_since_last_support_ticket', 'days_since_last_survey'
+]
+
+# Sentinels used while reducing datetimes as int64 values
+_INT64_MAX = np.iinfo(np.int64).max
+_INT64_MIN = np.iinfo(np.int64).min
+
+def map_customer_codes(customer_index: pd.Index, customer_ids: pd.Series) -> np.ndarray:
+    """
+    Map customer ids of event rows onto positions in a customer index.
+    
+    Each distinct id is looked up once instead of every row, which matters
+    for event tables with many rows per customer.
+    
+    Args:
+        customer_index: Index of unique customer keys
+        customer_ids: Customer id of each event row
+    
+    Returns:
+        np.ndarray: Position of each row's customer, or -1 for unknown customers
+    """
+    id_codes, distinct_ids = pd.factorize(customer_ids, use_na_sentinel=True)
+    distinct_codes = np.append(customer_index.get_indexer(distinct_ids), -1)
+    return distinct_codes[id_codes]
+
+class CustomerMetricsEngine:
+    """
+    Single-pass aggregation engine for customer profile metrics.
+    
+    The customer keys are factorized once into integer codes. Every event
+    table is mapped onto those codes with one hash lookup, and each metric is
+    then a vectorized reduction over the codes (bincount for counts, grouped
+    sums keyed by the codes, ufunc.at for minima and maxima). Results are
+    written into arrays preallocated for all metric columns and assembled into
+    the profile frame in one step, replacing per-source groupby results and
+    chained merges. Customers without rows in a source keep missing values
+    for its metrics.
+    """
+    
+    def __init__(self, customer_pks: pd.Series, now: Optional[datetime] = None):
+        """
+        Initialize the engine for a set of customers.
+        
+        Args:
+            customer_pks: Customer keys of the profiles, one per profile row
+            now: Reference time for days-since metrics (defaults to datetime.now())
+        """
+        self.row_codes, self.customer_index = pd.factorize(customer_pks, use_na_sentinel=True)
+        self.customer_index = pd.Index(self.customer_index)
+        self.n_customers = len(self.customer_index)
+        self.now = now or datetime.now()
+        
+        # Preallocate every metric column; date columns take the unit of their source
+        self.metrics: Dict[str, np.ndarray] = {
+            column: (np.full(self.n_customers, np.datetime64('NaT'), dtype='datetime64[ns]')
+                     if column in DATE_METRIC_COLUMNS else np.full(self.n_customers, np.nan))
+            for column in METRIC_COLUMNS
+        }
+    
+    def add_transaction_metrics(self, transactions_df: pd.DataFrame) -> None:
+        """Reduce transactions into revenue, count and transaction date metrics."""
+        codes = self._map_events(transactions_df)
+        if codes is None:
+            return
+        
+        has_rows = self._has_rows(codes)
+        revenue, counts = self._sum_and_count(codes, transactions_df['amount'])
+        self.metrics['total_lifetime_revenue'] = self._present(revenue, has_rows).round(2)
+        self.metrics['average_transaction_value'] = self._mean(revenue, counts).round(2)
+        self.metrics['total_transactions_count'] = self._present(counts, has_rows)
+        
+        first_dates, last_dates = self._date_range(codes, transactions_df['transaction_date'])
+        self.metrics['first_transaction_date'] = first_dates
+        self.metrics['last_transaction_date'] = last_dates
+        self.metrics['days_since_last_transaction'] = self._days_since(last_dates)
+    
+    def add_engagement_metrics(self, engagement_df: pd.DataFrame) -> None:
+        """Reduce engagement events into activity, session and engagement score metrics."""
+        codes = self._map_events(engagement_df)
+        if codes is None:
+            return
+        
+        has_rows = self._has_rows(codes)
+        first_dates, last_dates = self._date_range(codes, engagement_df['event_timestamp'])
+        self.metrics['first_engagement_date'] = first_dates
+        self.metrics['last_engagement_date'] = last_dates
+        self.metrics['total_engagement_events'] = self._present(
+            self._count(codes, engagement_df['event_timestamp']), has_rows
+        )
+        self.metrics['unique_event_types'] = self._present(
+            self._count_distinct(codes, engagement_df['event_type']), has_rows
+        )
+        self.metrics['total_sessions'] = self._present(
+            self._count_distinct(codes, engagement_df['session_id']), has_rows
+        )
+        self.metrics['days_since_last_engagement'] = self._days_since(last_dates)
+        
+        # Engagement score (events per month)
+        self.metrics['engagement_score'] = (
+            self.metrics['total_engagement_events'] /
+            (self.metrics['days_since_last_engagement'] / 30 + 1)
+        ).round(3)
+    
+    def add_support_metrics(self, support_df: pd.DataFrame) -> None:
+        """Reduce support tickets into ticket count and satisfaction metrics."""
+        codes = self._map_events(support_df)
+        if codes is None:
+            return
+        
+        has_rows = self._has_rows(codes)
+        satisfaction, satisfaction_counts = self._sum_and_count(codes, support_df['satisfaction_score'])
+        self.metrics['total_support_tickets_lifetime'] = self._present(
+            self._count(codes, support_df['ticket_id']), has_rows
+        )
+        self.metrics['avg_satisfaction_score_lifetime'] = self._mean(satisfaction, satisfaction_counts).round(2)
+        
+        _, last_dates = self._date_range(codes, support_df['created_at'])
+        self.metrics['last_support_ticket_date'] = last_dates
+        self.metrics['days_since_last_support_ticket'] = self._days_since(last_dates)
+    
+    def add_survey_metrics(self, surveys_df: pd.DataFrame) -> None:
+        """Reduce survey responses into NPS metrics."""
+        codes = self._map_events(surveys_df)
+        if codes is None:
+            return
+        
+        nps_total, nps_counts = self._sum_and_count(codes, surveys_df['nps_score'])
+        self.metrics['avg_nps_score_lifetime'] = self._mean(nps_total, nps_counts).round(2)
+        self.metrics['most_recent_nps_score'] = self._maximum(codes, surveys_df['nps_score']).round(2)
+        
+        _, last_dates = self._date_range(codes, surveys_df['response_date'])
+        self.metrics['last_survey_response_date'] = last_dates
+        self.metrics['days_since_last_survey'] = self._days_since(last_dates)
+    
+    def build_profiles(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Attach all metric columns to the customer rows in one step.
+        
+        Args:
+            customers_df: Customer rows whose keys initialized the engine
+        
+        Returns:
+            pd.DataFrame: Customer rows followed by the metric columns, with a
+            fresh index
+        """
+        customers_df = customers_df.reset_index(drop=True)
+        row_codes = self.row_codes
+        missing_rows = row_codes < 0
+        
+        metric_columns = {}
+        for column in METRIC_COLUMNS:
+            values = self.metrics[column][row_codes]
+            if missing_rows.any():
+                values[missing_rows] = np.datetime64('NaT') if values.dtype.kind == 'M' else np.nan
+            if column in INTEGER_METRIC_COLUMNS and len(values) and not np.isnan(values).any():
+                values = values.astype(np.int64)
+            metric_columns[column] = values
+        
+        metrics_frame = pd.DataFrame(metric_columns, index=customers_df.index)
+        return pd.concat([customers_df, metrics_frame], axis=1)
+    
+    def _map_events(self, events_df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Map event rows onto customer codes.
+        
+        Rows of unknown customers get code -1 and are skipped by every
+        reduction, so the event table itself is never filtered or copied.
+        
+        Args:
+            events_df: Event rows with a customer_id column
+        
+        Returns:
+            Optional[np.ndarray]: Customer code of each row, or None if no row
+            belongs to a known customer
+        """
+        if events_df.empty or 'customer_id' not in events_df.columns:
+            return None
+        
+        codes = map_customer_codes(self.customer_index, events_df['customer_id'])
+        if not (codes >= 0).any():
+            return None
+        return codes
+    
+    def _values(self, series: pd.Series) -> np.ndarray:
+        """Get float values of a numeric column with NaN for missing values."""
+        return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    
+    def _sum_and_count(self, codes: np.ndarray, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum and count the non-missing values of each customer."""
+        values = self._values(series)
+        valid = ~np.isnan(values) & (codes >= 0)
+        counts = np.bincount(codes[valid], minlength=self.n_customers)
+        
+        # Grouping on categorical codes skips hashing, and its compensated
+        # summation keeps rounded sums and means identical to a groupby
+        customer_codes = pd.Categorical.from_codes(codes, categories=pd.RangeIndex(self.n_customers))
+        totals = pd.Series(values).groupby(customer_codes, observed=False).sum().to_numpy()
+        return totals, counts
+    
+    def _count(self, codes: np.ndarray, series: pd.Series) -> np.ndarray:
+        """Count the non-missing values of each customer."""
+        valid = series.notna().to_numpy() & (codes >= 0)
+        return np.bincount(codes[valid], minlength=self.n_customers)
+    
+    def _count_distinct(self, codes: np.ndarray, series: pd.Series) -> np.ndarray:
+        """Count the distinct non-missing values of each customer."""
+        value_codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        valid = (value_codes >= 0) & (codes >= 0)
+        width = max(len(uniques), 1)
+        
+        # Sort (customer, value) pairs in place and keep the first of each run;
+        # this needs far less memory than hashing the pairs
+        pairs = codes[valid].astype(np.int64) * width + value_codes[valid]
+        pairs.sort()
+        first_of_run = np.ones(len(pairs), dtype=bool)
+        first_of_run[1:] = pairs[1:] != pairs[:-1]
+        return np.bincount(pairs[first_of_run] // width, minlength=self.n_customers)
+    
+    def _maximum(self, codes: np.ndarray, series: pd.Series) -> np.ndarray:
+        """Get the maximum non-missing value of each customer."""
+        values = self._values(series)
+        valid = ~np.isnan(values) & (codes >= 0)
+        maxima = np.full(self.n_customers, -np.inf)
+        np.maximum.at(maxima, codes[valid], values[valid])
+        maxima[np.isneginf(maxima)] = np.nan
+        return maxima
+    
+    def _mean(self, totals: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Divide totals by counts, leaving customers without values missing."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+    
+    def _has_rows(self, codes: np.ndarray) -> np.ndarray:
+        """Flag the customers that have at least one row in a source."""
+        return np.bincount(codes[codes >= 0], minlength=self.n_customers) > 0
+    
+    def _present(self, values: np.ndarray, has_rows: np.ndarray) -> np.ndarray:
+        """Convert values to floats, missing for customers without rows in the source."""
+        return np.where(has_rows, values, np.nan)
+    
+    def _date_range(self, codes: np.ndarray, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the earliest and latest non-missing date of each customer."""
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            series = pd.to_datetime(series, errors='coerce')
+        
+        dates = series.to_numpy()
+        valid = ~np.isnat(dates) & (codes >= 0)
+        ticks = dates.view(np.int64)[valid]
+        valid_codes = codes[valid]
+        
+        earliest = np.full(self.n_customers, _INT64_MAX, dtype=np.int64)
+        latest = np.full(self.n_customers, _INT64_MIN, dtype=np.int64)
+        np.minimum.at(earliest, valid_codes, ticks)
+        np.maximum.at(latest, valid_codes, ticks)
+        
+        # Customers without dates become NaT, which is the int64 minimum
+        earliest[earliest == _INT64_MAX] = _INT64_MIN
+        return earliest.view(dates.dtype), latest.view(dates.dtype)
+    
+    def _days_since(self, dates: np.ndarray) -> np.ndarray:
+        """Get whole days between each date and the reference time."""
+        days = (pd.Timestamp(self.now) - pd.DatetimeIndex(dates)).days
+        return np.asarray(days, dtype=float)
@@ -0,0 +1,184 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline DAG Executor
+# This module runs pipeline steps declared as nodes with explicit dependencies,
+# executing every node whose dependencies are complete concurrently on a worker pool
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Any
+import threading
+import logging
+from src.config.settings import settings
+
+# Configure logging for DAG execution
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Node statuses recorded in the run report
+NODE_COMPLETED = 'completed'
+NODE_FAILED = 'failed'
+NODE_SKIPPED = 'skipped'
+
+class PipelineNodeError(Exception):
+    """Raised after a DAG run in which one or more nodes failed."""
+    
+    def __init__(self, failed_nodes: Dict[str, BaseException]):
+        self.failed_nodes = failed_nodes
+        details = "; ".join(f"{name}: {error}" for name, error in failed_nodes.items())
+        super().__init__(f"Pipeline nodes failed: {details}")
+
+class PipelineDAG:
+    """
+    Dependency graph of pipeline steps executed on a bounded worker pool.
+    
+    Each node is a callable that receives the results of its dependencies
+    as a dictionary keyed by node name and returns its own result. Nodes
+    whose dependencies have all completed are submitted to a thread pool as
+    soon as they become ready, so independent steps overlap and the
+    end-to-end time follows the critical path rather than the total work.
+    pandas, NumPy and Arrow release the GIL in their heavy kernels and in
+    file I/O, which is what lets threads run the steps in parallel without
+    copying DataFrames between processes.
+    
+    When a node fails, the nodes depending on it are skipped, the remaining
+    independent nodes still run, and PipelineNodeError is raised at the end.
+    Timing and status of every node are available in node_runs.
+    """
+    
+    def __init__(self, name: str = "pipeline",
+                 node_wrapper: Optional[Callable[[str, Callable], Callable]] = None):
+        """
+        Initialize an empty DAG.
+        
+        Args:
+            name: Name used for worker threads and log messages
+            node_wrapper: Optional function wrapping every node callable (e.g. a profiler)
+        """
+        self.name = name
+        self.node_wrapper = node_wrapper
+        self.nodes: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+        self.node_runs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def add_node(self, name: str, func: Callable[[Dict[str, Any]], Any],
+                 dependencies: Optional[List[str]] = None) -> None:
+        """
+        Declare a node.
+        
+        Args:
+            name: Unique node name
+            func: Callable receiving the dependency results keyed by node name
+            dependencies: Names of nodes that must complete first (declared earlier)
+        """
+        if name in self.nodes:
+            raise ValueError(f"Duplicate pipeline node: {name}")
+        
+        dependencies = list(dependencies or [])
+        unknown = [dependency for dependency in dependencies if dependency not in self.nodes]
+        if unknown:
+            raise ValueError(f"Pipeline node {name} depends on undeclared nodes: {unknown}")
+        
+        # Dependencies must be declared first, so the graph cannot contain cycles
+        self.nodes[name] = self.node_wrapper(name, func) if self.node_wrapper else func
+        self.dependencies[name] = dependencies
+    
+    def run(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute all nodes, running ready nodes concurrently.
+        
+        Args:
+            max_workers: Worker pool size (defaults to settings.max_workers)
+        
+        Returns:
+            Dict[str, Any]: Node results keyed by node name
+        """
+        max_workers = max(1, max_workers or settings.max_workers)
+        self.node_runs = {}
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        remaining = {name: len(dependencies) for name, dependencies in self.dependencies.items()}
+        for name, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        
+        run_start = perf_counter()
+        logger.info(f"Running {self.name} DAG: {len(self.nodes)} nodes on {max_workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}-node") as executor:
+            running = {}
+            for name in self.nodes:
+                if remaining[name] == 0:
+                    running[executor.submit(self._run_node, name, {}, run_start)] = name
+            
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        errors[name] = e
+                        self._skip_dependents(name, dependents)
+                        continue
+                    
+                    # Submit the dependents that have become ready
+                    for dependent in dependents[name]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0 and dependent not in self.node_runs:
+                            inputs = {dependency: results[dependency] for dependency in self.dependencies[dependent]}
+                            running[executor.submit(self._run_node, dependent, inputs, run_start)] = dependent
+        
+        wall_seconds = perf_counter() - run_start
+        work_seconds = sum(run.get('duration_seconds', 0.0) for run in self.node_runs.values())
+        logger.info(f"{self.name} DAG finished in {wall_seconds:.2f}s wall time "
+                    f"for {work_seconds:.2f}s of node work")
+        
+        if errors:
+            raise PipelineNodeError(errors)
+        
+        return results
+    
+    def _run_node(self, name: str, inputs: Dict[str, Any], run_start: float) -> Any:
+        """Run one node and record its timing and status."""
+        start = perf_counter()
+        run = {
+            'status': None,
+            'dependencies': self.dependencies[name],
+            'start_time': datetime.now(),
+            'start_offset_seconds': round(start - run_start, 4),
+            'thread': threading.current_thread().name
+        }
+        with self._lock:
+            self.node_runs[name] = run
+        
+        try:
+            result = self.nodes[name](inputs)
+            run['status'] = NODE_COMPLETED
+            return result
+        except Exception as e:
+            logger.error(f"Pipeline node {name} failed: {str(e)}")
+            run['status'] = NODE_FAILED
+            run['error'] = str(e)
+            raise
+        finally:
+            run['end_time'] = datetime.now()
+            run['duration_seconds'] = round(perf_counter() - start, 4)
+            logger.debug(f"Pipeline node {name} {run['status']} in {run['duration_seconds']}s")
+    
+    def _skip_dependents(self, name: str, dependents: Dict[str, List[str]]) -> None:
+        """Mark every node downstream of a failed node as skipped."""
+        pending = list(dependents[name])
+        while pending:
+            dependent = pending.pop()
+            with self._lock:
+                if dependent in self.node_runs:
+                    continue
+                self.node_runs[dependent] = {
+                    'status': NODE_SKIPPED,
+                    'dependencies': self.dependencies[dependent],
+                    'skipped_because': name
+                }
+            pending.extend(dependents[dependent])
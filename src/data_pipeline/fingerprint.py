@@ -0,0 +1,195 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Bronze Source Fingerprints
+# This module tracks the size, modification time and content hash of every
+# Bronze layer source file so that unchanged sources can skip re-processing
+
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+from src.config.settings import settings
+
+# Configure logging for source fingerprinting
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Block size used when hashing source file contents
+HASH_BLOCK_SIZE = 1024 * 1024
+
+class BronzeFingerprintManifest:
+    """
+    Fingerprint manifest for Bronze layer source files.
+    
+    This class records a fingerprint (size, modification time and a fast
+    content hash) for each Bronze source file in a JSON manifest stored next
+    to the Bronze directory. Comparing the current files against the manifest
+    tells the pipeline which sources changed since they were last processed,
+    so unchanged sources can reuse their previously written Silver data. The
+    content hash is only computed when size or modification time differ from
+    the manifest, so checking unchanged files costs a single stat call.
+    """
+    
+    def __init__(self, manifest_path: Optional[Path] = None):
+        """
+        Initialize the fingerprint manifest.
+        
+        Args:
+            manifest_path: Path of the JSON manifest (defaults to settings.bronze_manifest_path)
+        """
+        self.manifest_path = manifest_path or settings.bronze_manifest_path
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the stored source fingerprints.
+        
+        A missing or unreadable manifest, or one written by a different
+        application version, is treated as empty so every source is processed.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Stored fingerprints keyed by data type
+        """
+        if not self.manifest_path.exists():
+            return {}
+        
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read fingerprint manifest {self.manifest_path}: {str(e)}")
+            return {}
+        
+        if manifest.get('app_version') != settings.app_version:
+            logger.info("Fingerprint manifest was written by a different version, ignoring it")
+            return {}
+        
+        return manifest.get('sources', {})
+    
+    def save(self, fingerprints: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Save source fingerprints to the manifest.
+        
+        The manifest is written to a temporary file and then moved into place,
+        so an interrupted write never leaves a partial manifest behind.
+        
+        Args:
+            fingerprints: Fingerprints keyed by data type
+        """
+        manifest = {
+            'app_version': settings.app_version,
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'sources': fingerprints
+        }
+        
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = self.manifest_path.with_name(f"{self.manifest_path.name}.partial")
+        with open(partial_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        partial_path.replace(self.manifest_path)
+        
+        logger.info(f"Saved fingerprints for {len(fingerprints)} sources to {self.manifest_path}")
+    
+    def compute_fingerprint(self, file_path: Path, previous: Optional[Dict[str, Any]] = None,
+                            partition_files: Optional[List[Path]] = None) -> Dict[str, Any]:
+        """
+        Compute the fingerprint of a source file.
+        
+        When size and modification time match the previous fingerprint the
+        stored content hash is reused instead of reading the file again. The
+        source's time-partitioned files, if any, are fingerprinted the same way
+        and summarized in a single partitions hash.
+        
+        Args:
+            file_path: Path to the source file
+            previous: Previously stored fingerprint for the same source
+            partition_files: Published partition files of the source
+        
+        Returns:
+            Dict[str, Any]: File name, existence flag, size, mtime, content hash
+            and, for sources with partition files, their fingerprints and hash
+        """
+        fingerprint = self._compute_file_fingerprint(file_path, previous)
+        
+        if partition_files:
+            stored_partitions = (previous or {}).get('partitions', {})
+            partitions = {}
+            for partition_file in partition_files:
+                key = partition_file.relative_to(file_path.parent).as_posix()
+                partition = self._compute_file_fingerprint(partition_file, stored_partitions.get(key))
+                partitions[key] = {name: partition[name] for name in ('size', 'mtime_ns', 'content_hash')}
+            
+            digest = hashlib.blake2b(digest_size=16)
+            for key in sorted(partitions):
+                digest.update(f"{key}:{partitions[key]['content_hash']}".encode())
+            fingerprint['partitions'] = partitions
+            fingerprint['partitions_hash'] = digest.hexdigest()
+        
+        return fingerprint
+    
+    def _compute_file_fingerprint(self, file_path: Path,
+                                  previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fingerprint one file, reusing the previous content hash when size and mtime match."""
+        if not file_path.exists():
+            return {'file_name': file_path.name, 'exists': False}
+        
+        stat = file_path.stat()
+        fingerprint = {
+            'file_name': file_path.name,
+            'exists': True,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+        
+        if (previous and previous.get('exists', True)
+                and previous.get('size') == fingerprint['size']
+                and previous.get('mtime_ns') == fingerprint['mtime_ns']):
+            fingerprint['content_hash'] = previous.get('content_hash')
+        else:
+            fingerprint['content_hash'] = self._hash_file(file_path)
+        
+        return fingerprint
+    
+    def _hash_file(self, file_path: Path) -> str:
+        """Hash the contents of a file in fixed-size blocks."""
+        digest = hashlib.blake2b(digest_size=16)
+        
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        
+        return digest.hexdigest()
+    
+    def detect_changes(self, source_files: Dict[str, Path],
+                       partition_files: Optional[Dict[str, List[Path]]] = None) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """
+        Compare source files against the stored fingerprints.
+        
+        A source is unchanged when its content hash (or its absence) and the
+        hash of its partition files match the manifest; a touched file whose
+        content is identical therefore still counts as unchanged.
+        
+        Args:
+            source_files: Source file paths keyed by data type
+            partition_files: Published partition files keyed by data type
+        
+        Returns:
+            Tuple[List[str], Dict[str, Dict[str, Any]]]: Changed data types and
+            the current fingerprints of all sources
+        """
+        stored = self.load()
+        changed = []
+        fingerprints = {}
+        
+        for data_type, file_path in source_files.items():
+            previous = stored.get(data_type)
+            fingerprint = self.compute_fingerprint(file_path, previous, (partition_files or {}).get(data_type))
+            fingerprints[data_type] = fingerprint
+            
+            if (previous is None
+                    or previous.get('exists') != fingerprint['exists']
+                    or previous.get('content_hash') != fingerprint.get('content_hash')
+                    or previous.get('partitions_hash') != fingerprint.get('partitions_hash')):
+                changed.append(data_type)
+        
+        logger.info(f"Changed Bronze sources: {changed if changed else 'none'}")
+        return changed, fingerprints
@@ -8,13 +8,87 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import logging
+import operator
 from src.config.settings import settings
 from src.config.constants import ChurnRiskThresholds, ClientSegments, StrategyCategories, AIModelParams
+from src.data_pipeline.window_features import WindowFeatureEngine, WINDOW_SOURCES
+from src.data_pipeline.parquet_layout import (
+    GOLD_PARTITIONS, append_table_increment, read_parquet_table, remove_table, write_partitioned_table
+)
+from src.data_pipeline.table_cache import table_cache
 
 # Configure logging for Gold aggregation
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Recommendation decision table: the first rule whose risk level (None = any level)
+# and condition (column, comparison, threshold; None = always) match a customer applies
+RECOMMENDATION_RULES = [
+    ('High', ('total_lifetime_revenue', operator.gt, 10000), "Schedule proactive call with senior account manager"),
+    ('High', ('days_since_last_engagement', operator.gt, 30), "Send personalized re-engagement campaign"),
+    ('High', ('most_recent_nps_score', operator.lt, 3), "Conduct satisfaction survey and address concerns"),
+    ('High', None, "Offer retention discount or additional support"),
+    ('Medium', ('engagement_score', operator.lt, 0.5), "Send educational content and feature highlights"),
+    ('Medium', ('total_support_tickets_lifetime', operator.gt, 3), "Proactive support check-in and training"),
+    ('Medium', None, "Regular check-in and relationship building"),
+    (None, ('total_lifetime_revenue', operator.gt, 5000), "Identify upsell opportunities"),
+    (None, None, "Maintain current relationship")
+]
+
+# Client value tiers by lifetime revenue (exclusive lower bound; None = any revenue);
+# customers not at Low churn risk get the tier's At-Risk segment
+CLIENT_VALUE_TIERS = [
+    ('High-Value', 20000),
+    ('Medium-Value', 5000),
+    ('SMB', None)
+]
+
+# Chatbot insights: every rule (column, comparison, threshold) that matches a customer
+# contributes its text, in table order
+CHATBOT_INSIGHT_RULES = [
+    (('churn_risk_level', operator.eq, 'High'), "High churn risk - immediate attention needed"),
+    (('engagement_score', operator.lt, 0.3), "Low engagement - re-engagement campaign recommended"),
+    (('most_recent_nps_score', operator.lt, 3), "Low satisfaction - support intervention needed")
+]
+DEFAULT_CHATBOT_INSIGHT = "Customer in good standing"
+
+# Playbook strategies by churn risk level (any other level gets the Low strategies)
+RISK_PLAYBOOK_STRATEGIES = {
+    'High': "Proactive Outreach, Retention Discount, Senior Account Manager",
+    'Medium': "Educational Content, Regular Check-in, Feature Training",
+    'Low': "Upsell Opportunities, Cross-sell Campaign, Relationship Building"
+}
+
+# Common churn factors by client segment
+SEGMENT_CHURN_FACTORS = {
+    'High-Value': 'Price sensitivity, feature limitations, competitive pressure',
+    'Medium-Value': 'Support quality, feature adoption, onboarding issues',
+    'SMB': 'Budget constraints, feature complexity, support response time'
+}
+DEFAULT_SEGMENT_CHURN_FACTORS = 'General engagement and satisfaction factors'
+
+# Support summaries: many tickets, low satisfaction, otherwise good
+SUPPORT_SUMMARIES = [
+    "Multiple support tickets - proactive support recommended",
+    "Low satisfaction scores - support quality improvement needed",
+    "Good support experience - maintain current service level"
+]
+
+# Customer 360 columns the chatbot context is computed from
+CHATBOT_CONTEXT_SOURCE_COLUMNS = [
+    'customer_pk', 'first_name', 'last_name', 'current_subscription_plan', 'current_health_score',
+    'churn_risk_level', 'engagement_score', 'most_recent_nps_score', 'client_segment',
+    'total_support_tickets_lifetime', 'avg_satisfaction_score_lifetime'
+]
+
+# Proactive questions offered to the chatbot (the first two are used)
+PROACTIVE_QUESTIONS = [
+    "How satisfied are you with our current service?",
+    "Are there any features you'd like to see improved?",
+    "How can we better support your business goals?",
+    "Would you be interested in learning about new features?"
+]
+
 class GoldAggregation:
     """
     Aggregates Silver layer data into Gold layer business-ready datasets.
@@ -151,6 +225,7 @@ class GoldAggregation:
         This method creates specific, actionable recommendations for each
         customer based on their risk profile, engagement patterns, and
         business value. These recommendations guide retention strategies.
+        Each customer gets the first matching rule of RECOMMENDATION_RULES.
         
         Args:
             customer_360: Customer profiles with churn risk levels
@@ -160,35 +235,21 @@ class GoldAggregation:
         """
         logger.debug("Generating customer recommendations")
         
-        recommendations = []
-        
-        for _, customer in customer_360.iterrows():
-            # Determine recommendation based on risk level and factors
-            if customer['churn_risk_level'] == 'High':
-                if customer['total_lifetime_revenue'] > 10000:
-                    recommendation = "Schedule proactive call with senior account manager"
-                elif customer['days_since_last_engagement'] > 30:
-                    recommendation = "Send personalized re-engagement campaign"
-                elif customer['most_recent_nps_score'] < 3:
-                    recommendation = "Conduct satisfaction survey and address concerns"
-                else:
-                    recommendation = "Offer retention discount or additional support"
-            elif customer['churn_risk_level'] == 'Medium':
-                if customer['engagement_score'] < 0.5:
-                    recommendation = "Send educational content and feature highlights"
-                elif customer['total_support_tickets_lifetime'] > 3:
-                    recommendation = "Proactive support check-in and training"
-                else:
-                    recommendation = "Regular check-in and relationship building"
-            else:  # Low risk
-                if customer['total_lifetime_revenue'] > 5000:
-                    recommendation = "Identify upsell opportunities"
-                else:
-                    recommendation = "Maintain current relationship"
-            
-            recommendations.append(recommendation)
-        
-        customer_360['recommended_action'] = recommendations
+        risk_levels = customer_360['churn_risk_level']
+        conditions = []
+        for risk_level, condition, _ in RECOMMENDATION_RULES:
+            matches = np.ones(len(customer_360), dtype=bool)
+            if risk_level is not None:
+                matches &= (risk_levels == risk_level).to_numpy(dtype=bool)
+            if condition is not None:
+                column, compare, threshold = condition
+                matches &= compare(customer_360[column], threshold).to_numpy(dtype=bool)
+            conditions.append(matches)
+        
+        # The first matching rule applies; the last rule always matches
+        recommendations = [recommendation for _, _, recommendation in RECOMMENDATION_RULES]
+        rule_codes = np.select(conditions, np.arange(len(RECOMMENDATION_RULES)), len(RECOMMENDATION_RULES) - 1)
+        customer_360['recommended_action'] = pd.Categorical.from_codes(rule_codes, categories=recommendations)
         
         # Add opportunity flags
         customer_360['upsell_opportunity_flag'] = (
@@ -210,7 +271,7 @@ class GoldAggregation:
         
         This method segments customers based on their value, engagement,
         and risk profile to enable targeted retention strategies and
-        personalized approaches.
+        personalized approaches. Segments come from CLIENT_VALUE_TIERS.
         
         Args:
             customer_360: Customer profiles with risk levels
@@ -220,29 +281,17 @@ class GoldAggregation:
         """
         logger.debug("Calculating client segments")
         
-        # Calculate client segments based on multiple factors
-        segments = []
-        
-        for _, customer in customer_360.iterrows():
-            if customer['total_lifetime_revenue'] > 20000:
-                if customer['churn_risk_level'] == 'Low':
-                    segment = "High-Value"
-                else:
-                    segment = "High-Value At-Risk"
-            elif customer['total_lifetime_revenue'] > 5000:
-                if customer['churn_risk_level'] == 'Low':
-                    segment = "Medium-Value"
-                else:
-                    segment = "Medium-Value At-Risk"
-            else:
-                if customer['churn_risk_level'] == 'Low':
-                    segment = "SMB"
-                else:
-                    segment = "SMB At-Risk"
-            
-            segments.append(segment)
+        # Value tier from the first matching revenue threshold
+        revenue = customer_360['total_lifetime_revenue']
+        tier_codes = np.select(
+            [(revenue > threshold).to_numpy(dtype=bool) for _, threshold in CLIENT_VALUE_TIERS if threshold is not None],
+            np.arange(len(CLIENT_VALUE_TIERS) - 1), len(CLIENT_VALUE_TIERS) - 1
+        )
+        at_risk = (customer_360['churn_risk_level'] != 'Low').to_numpy(dtype=bool)
         
-        customer_360['client_segment'] = segments
+        # Categories alternate between each tier and its At-Risk segment
+        segments = [segment for tier, _ in CLIENT_VALUE_TIERS for segment in (tier, f"{tier} At-Risk")]
+        customer_360['client_segment'] = pd.Categorical.from_codes(tier_codes * 2 + at_risk, categories=segments)
         
         logger.debug("Client segments calculated")
         return customer_360
@@ -380,16 +429,21 @@ class GoldAggregation:
         strategies.sort(key=lambda x: x['success_rate'], reverse=True)
         return str(strategies[:3])
     
-    def create_ai_model_features(self, customer_360: pd.DataFrame) -> pd.DataFrame:
+    def create_ai_model_features(self, customer_360: pd.DataFrame,
+                                 silver_data: Optional[Dict[str, pd.DataFrame]] = None) -> pd.DataFrame:
         """
         Create AI model features for training and inference.
         
         This method creates a feature matrix optimized for AI model training
         and inference. The features are engineered specifically for churn
-        prediction and customer health scoring.
+        prediction and customer health scoring. Transaction, engagement and
+        support activity is counted over the trailing windows configured in
+        settings.feature_window_days, ending at the feature snapshot time.
         
         Args:
             customer_360: Customer 360-degree view
+            silver_data: Silver event tables for the windowed features (read
+                from the Silver layer when not given)
             
         Returns:
             pd.DataFrame: AI model features matrix
@@ -400,28 +454,19 @@ class GoldAggregation:
         features_df = customer_360[['customer_pk']].copy()
         
         # Add feature snapshot date
-        features_df['feature_snapshot_date'] = datetime.now().date()
-        
-        # Engagement features - use available engagement data
-        if 'total_engagement_events' in customer_360.columns:
-            features_df['feature_avg_daily_active_events_90d'] = (
-                customer_360['total_engagement_events'] / 90
-            ).round(3)
-        else:
-            # Use engagement_score as proxy for engagement events
-            features_df['feature_avg_daily_active_events_90d'] = (
-                customer_360['engagement_score'] * 10  # Scale to approximate daily events
-            ).round(3)
-        
-        # Revenue features
-        features_df['feature_total_transaction_value_60d'] = (
-            customer_360['total_lifetime_revenue'] * 0.2  # Simplified 60-day revenue
-        ).round(2)
-        
-        # Support features
-        features_df['feature_support_tickets_30d_count'] = (
-            customer_360['total_support_tickets_lifetime'] * 0.1  # Simplified 30-day tickets
-        ).round(0)
+        snapshot_time = datetime.now()
+        features_df['feature_snapshot_date'] = snapshot_time.date()
+        
+        # Windowed transaction, engagement and support features
+        window_engine = WindowFeatureEngine(snapshot_time=snapshot_time)
+        window_sources = self._get_window_sources(silver_data, window_engine)
+        window_features = window_engine.compute_features(
+            customer_360['customer_pk'],
+            window_sources['transactions'],
+            window_sources['engagement'],
+            window_sources['support']
+        )
+        features_df = pd.concat([features_df, window_features], axis=1)
         
         # Activity features
         features_df['feature_days_since_last_login'] = customer_360['days_since_last_engagement']
@@ -455,6 +500,40 @@ class GoldAggregation:
         logger.info(f"AI model features created. Features: {len(features_df.columns)}")
         return features_df
     
+    def _get_window_sources(self, silver_data: Optional[Dict[str, pd.DataFrame]],
+                            window_engine: WindowFeatureEngine) -> Dict[str, pd.DataFrame]:
+        """
+        Get the Silver event tables needed for windowed features.
+        
+        Without in-memory Silver data the tables are read from the Silver
+        layer, with only the needed columns and only rows inside the longest
+        window.
+        
+        Args:
+            silver_data: Silver layer DataFrames already in memory, if any
+            window_engine: Windowed feature engine providing the window bounds
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Event tables keyed by data type
+        """
+        if silver_data is not None:
+            return {data_type: silver_data.get(data_type, pd.DataFrame()) for data_type in WINDOW_SOURCES}
+        
+        window_sources = {}
+        for data_type, source in WINDOW_SOURCES.items():
+            file_path = self.silver_path / f"silver_{data_type}.parquet"
+            if not file_path.exists():
+                window_sources[data_type] = pd.DataFrame()
+                continue
+            
+            window_sources[data_type] = read_parquet_table(
+                file_path,
+                columns=source['columns'],
+                filters=[(source['timestamp'], '>=', window_engine.get_earliest_window_start())]
+            )
+        
+        return window_sources
+    
     def create_chatbot_context(self, customer_360: pd.DataFrame) -> pd.DataFrame:
         """
         Create chatbot context data for conversational AI.
@@ -463,6 +542,11 @@ class GoldAggregation:
         customer summaries, insights, and relevant strategies. This data
         enables the chatbot to provide personalized and relevant responses.
         
+        The table is built column by column. Summaries are formatted once per
+        distinct combination of their inputs, and every other text field is
+        one of a few shared strings stored as a categorical, so the table is
+        written to parquet dictionary-encoded.
+        
         Args:
             customer_360: Customer 360-degree view
             
@@ -471,85 +555,90 @@ class GoldAggregation:
         """
         logger.info("Creating chatbot context data")
         
-        chatbot_context = []
+        n_customers = len(customer_360)
+        risk_levels = customer_360['churn_risk_level']
+        
+        # Key insights: one bit per matching insight rule, one text per bit mask
+        insight_masks = np.zeros(n_customers, dtype=np.int64)
+        for bit, (condition, _) in enumerate(CHATBOT_INSIGHT_RULES):
+            column, compare, threshold = condition
+            insight_masks |= compare(customer_360[column], threshold).to_numpy(dtype=bool).astype(np.int64) << bit
+        insight_texts = [
+            "; ".join(text for bit, (_, text) in enumerate(CHATBOT_INSIGHT_RULES) if mask & (1 << bit))
+            or DEFAULT_CHATBOT_INSIGHT
+            for mask in range(1 << len(CHATBOT_INSIGHT_RULES))
+        ]
         
-        for _, customer in customer_360.iterrows():
-            # Create customer summary
-            summary = f"Customer {customer['first_name']} {customer['last_name']} "
-            summary += f"({customer['current_subscription_plan']} plan, "
-            summary += f"Health Score: {customer['current_health_score']:.1f}, "
-            summary += f"Risk Level: {customer['churn_risk_level']})"
-            
-            # Create key insights
-            insights = []
-            if customer['churn_risk_level'] == 'High':
-                insights.append("High churn risk - immediate attention needed")
-            if customer['engagement_score'] < 0.3:
-                insights.append("Low engagement - re-engagement campaign recommended")
-            if customer['most_recent_nps_score'] < 3:
-                insights.append("Low satisfaction - support intervention needed")
-            
-            insights_text = "; ".join(insights) if insights else "Customer in good standing"
-            
-            # Get relevant strategies
-            strategies = self._get_relevant_strategies(customer)
-            
-            # Create context record
-            context_record = {
-                'customer_pk': customer['customer_pk'],
-                'context_last_updated_at': datetime.now(),
-                'curated_client_summary': summary,
-                'key_insights_last_month': insights_text,
-                'relevant_playbook_strategies': strategies,
-                'historical_churn_factors_for_segment': self._get_segment_churn_factors(customer['client_segment']),
-                'recent_support_issues_summary': self._get_support_summary(customer),
-                'recommended_proactive_questions': self._get_proactive_questions(customer),
-                'last_support_transcript_snippet': "Customer reported satisfaction with recent support interaction."
-            }
-            
-            chatbot_context.append(context_record)
+        strategy_codes = np.select(
+            [(risk_levels == 'High').to_numpy(dtype=bool), (risk_levels == 'Medium').to_numpy(dtype=bool)], [0, 1], 2
+        )
         
-        chatbot_df = pd.DataFrame(chatbot_context)
+        segment_factors = list(SEGMENT_CHURN_FACTORS.values()) + [DEFAULT_SEGMENT_CHURN_FACTORS]
+        segment_codes = pd.Index(list(SEGMENT_CHURN_FACTORS)).get_indexer(customer_360['client_segment'].astype(object))
+        segment_codes[segment_codes < 0] = len(SEGMENT_CHURN_FACTORS)
+        
+        if 'avg_satisfaction_score_lifetime' in customer_360.columns:
+            low_satisfaction = (customer_360['avg_satisfaction_score_lifetime'] < 3).to_numpy(dtype=bool)
+        else:
+            low_satisfaction = np.zeros(n_customers, dtype=bool)
+        support_codes = np.select(
+            [(customer_360['total_support_tickets_lifetime'] > 5).to_numpy(dtype=bool), low_satisfaction], [0, 1], 2
+        )
+        
+        chatbot_df = pd.DataFrame({
+            'customer_pk': customer_360['customer_pk'].to_numpy(),
+            'context_last_updated_at': pd.DatetimeIndex([datetime.now()]).repeat(n_customers),
+            'curated_client_summary': self._format_client_summaries(customer_360),
+            'key_insights_last_month': pd.Categorical.from_codes(insight_masks, categories=insight_texts),
+            'relevant_playbook_strategies': pd.Categorical.from_codes(
+                strategy_codes, categories=list(RISK_PLAYBOOK_STRATEGIES.values())
+            ),
+            'historical_churn_factors_for_segment': pd.Categorical.from_codes(segment_codes, categories=segment_factors),
+            'recent_support_issues_summary': pd.Categorical.from_codes(support_codes, categories=SUPPORT_SUMMARIES),
+            'recommended_proactive_questions': pd.Categorical.from_codes(
+                np.zeros(n_customers, dtype=np.int8), categories=[str(PROACTIVE_QUESTIONS[:2])]
+            ),
+            'last_support_transcript_snippet': pd.Categorical.from_codes(
+                np.zeros(n_customers, dtype=np.int8),
+                categories=["Customer reported satisfaction with recent support interaction."]
+            )
+        })
         
         logger.info(f"Chatbot context created. Records: {len(chatbot_df)}")
         return chatbot_df
     
-    def _get_relevant_strategies(self, customer: pd.Series) -> str:
-        """Get relevant strategies for a customer."""
-        if customer['churn_risk_level'] == 'High':
-            return "Proactive Outreach, Retention Discount, Senior Account Manager"
-        elif customer['churn_risk_level'] == 'Medium':
-            return "Educational Content, Regular Check-in, Feature Training"
-        else:
-            return "Upsell Opportunities, Cross-sell Campaign, Relationship Building"
-    
-    def _get_segment_churn_factors(self, segment: str) -> str:
-        """Get common churn factors for customer segment."""
-        factors = {
-            'High-Value': 'Price sensitivity, feature limitations, competitive pressure',
-            'Medium-Value': 'Support quality, feature adoption, onboarding issues',
-            'SMB': 'Budget constraints, feature complexity, support response time'
-        }
-        return factors.get(segment, 'General engagement and satisfaction factors')
-    
-    def _get_support_summary(self, customer: pd.Series) -> str:
-        """Get support issues summary for customer."""
-        if customer['total_support_tickets_lifetime'] > 5:
-            return "Multiple support tickets - proactive support recommended"
-        elif customer.get('avg_satisfaction_score_lifetime', 5) < 3:
-            return "Low satisfaction scores - support quality improvement needed"
-        else:
-            return "Good support experience - maintain current service level"
-    
-    def _get_proactive_questions(self, customer: pd.Series) -> str:
-        """Get proactive questions for customer engagement."""
-        questions = [
-            "How satisfied are you with our current service?",
-            "Are there any features you'd like to see improved?",
-            "How can we better support your business goals?",
-            "Would you be interested in learning about new features?"
+    def _format_client_summaries(self, customer_360: pd.DataFrame) -> np.ndarray:
+        """
+        Format the one-line client summary of every customer.
+        
+        Customers sharing name, plan, health score and risk level share a
+        summary, so each distinct combination is formatted only once.
+        
+        Args:
+            customer_360: Customer 360-degree view
+            
+        Returns:
+            np.ndarray: Summary strings, one per customer
+        """
+        summary_columns = ['first_name', 'last_name', 'current_subscription_plan',
+                           'current_health_score', 'churn_risk_level']
+        
+        # Combine the factorized columns into one code per distinct combination
+        combination_codes = np.zeros(len(customer_360), dtype=np.int64)
+        for column in summary_columns:
+            codes, uniques = pd.factorize(customer_360[column])
+            combination_codes, _ = pd.factorize(combination_codes * (len(uniques) + 1) + codes + 1)
+        
+        # Codes are numbered in order of first appearance
+        _, first_rows = np.unique(combination_codes, return_index=True)
+        summaries = [
+            f"Customer {first_name} {last_name} ({plan} plan, Health Score: {health_score:.1f}, Risk Level: {risk_level})"
+            for first_name, last_name, plan, health_score, risk_level in zip(
+                *(customer_360[column].iloc[first_rows].tolist() for column in summary_columns)
+            )
         ]
-        return str(questions[:2])  # Return first 2 questions
+        
+        return np.array(summaries, dtype=object)[combination_codes]
     
     def aggregate_silver_to_gold(self, silver_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """
@@ -582,12 +671,14 @@ class GoldAggregation:
             gold_data['overall_kpi_dashboard_view'] = dashboard_kpis
             
             # Create AI model features
-            ai_features = self.create_ai_model_features(customer_360)
+            ai_features = self.create_ai_model_features(customer_360, silver_data)
             gold_data['ai_model_features_for_churn_prediction'] = ai_features
             
-            # Create chatbot context
-            chatbot_context = self.create_chatbot_context(customer_360)
-            gold_data['ai_chatbot_context'] = chatbot_context
+            # Chatbot context is computed on demand unless the full table is exported
+            if settings.chatbot_context_export_enabled:
+                gold_data['ai_chatbot_context'] = self.create_chatbot_context(customer_360)
+            else:
+                self._remove_stale_chatbot_context()
         
         # Save Gold layer data
         self._save_gold_data(gold_data)
@@ -595,14 +686,132 @@ class GoldAggregation:
         logger.info("Silver to Gold aggregation completed")
         return gold_data
     
+    def refresh_customer_rows(self, customer_profiles: pd.DataFrame,
+                              removed_customer_pks: Optional[List[str]] = None,
+                              run_id: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Recompute Gold layer rows for a subset of customers.
+        
+        Rows of the given customers are rebuilt from their Silver profiles and
+        written as increment files that replace the matching rows of the
+        stored customer-level Gold tables; all other rows are kept as stored
+        and are not rewritten. Removed customers are dropped. The dashboard
+        KPIs summarize the whole customer base, so they are recalculated from
+        the updated customer 360 view.
+        
+        Args:
+            customer_profiles: Silver profiles of the customers to refresh
+            removed_customer_pks: Customers to drop from the Gold tables
+            run_id: Run identifier used in the increment file names
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Refreshed rows of the customer-level Gold tables and the new KPIs
+        """
+        logger.info(f"Refreshing Gold rows for {len(customer_profiles)} customers")
+        
+        updates = {}
+        if not customer_profiles.empty:
+            customer_360 = self.create_customer_360_view(customer_profiles)
+            updates['customer_360_dashboard_view'] = customer_360
+            updates['ai_model_features_for_churn_prediction'] = self.create_ai_model_features(customer_360)
+            if settings.chatbot_context_export_enabled:
+                updates['ai_chatbot_context'] = self.create_chatbot_context(customer_360)
+        
+        customer_tables = ['customer_360_dashboard_view', 'ai_model_features_for_churn_prediction']
+        if settings.chatbot_context_export_enabled:
+            customer_tables.append('ai_chatbot_context')
+        else:
+            self._remove_stale_chatbot_context()
+        
+        gold_data = {}
+        for data_type in customer_tables:
+            gold_data[data_type] = updates.get(data_type, pd.DataFrame())
+            file_path = self.get_gold_table_path(data_type)
+            append_table_increment(gold_data[data_type], file_path, partition_columns=GOLD_PARTITIONS.get(data_type),
+                                   key_column='customer_pk', deleted_keys=removed_customer_pks, run_id=run_id)
+            table_cache.invalidate(file_path)
+        
+        customer_360 = self.load_gold_table('customer_360_dashboard_view')
+        if not customer_360.empty:
+            gold_data['overall_kpi_dashboard_view'] = self.create_dashboard_kpis(customer_360)
+            self._save_gold_data({'overall_kpi_dashboard_view': gold_data['overall_kpi_dashboard_view']})
+        
+        return gold_data
+    
+    def export_chatbot_context(self, customer_360: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Build and write the full chatbot context table.
+        
+        The chatbot normally computes context on demand for the customers it
+        is asked about (see ChatbotContextProvider); this export writes the
+        context of every customer for consumers that need the whole table.
+        
+        Args:
+            customer_360: Customer 360 view (defaults to the stored Gold table)
+            
+        Returns:
+            pd.DataFrame: Chatbot context data
+        """
+        if customer_360 is None:
+            customer_360 = self.load_gold_table('customer_360_dashboard_view')
+        if customer_360.empty:
+            logger.warning("No customer 360 data to export chatbot context from")
+            return pd.DataFrame()
+        
+        chatbot_context = self.create_chatbot_context(customer_360)
+        self._save_gold_data({'ai_chatbot_context': chatbot_context})
+        return chatbot_context
+    
+    def _remove_stale_chatbot_context(self) -> None:
+        """
+        Remove a previously exported chatbot context table that this run does not refresh.
+        
+        With the export disabled the stored table would describe an older Gold
+        run, so it is deleted and consumers compute context on demand instead.
+        """
+        file_path = self.get_gold_table_path('ai_chatbot_context')
+        if file_path.exists():
+            remove_table(file_path)
+            table_cache.invalidate(file_path)
+            logger.warning("Chatbot context export is disabled; removed the stale chatbot context table "
+                           "(use export_chatbot_context to rewrite it)")
+    
+    def get_gold_table_path(self, data_type: str) -> Path:
+        """Get the parquet file path of a Gold layer data type."""
+        return self.gold_path / f"gold_{data_type}.parquet"
+    
+    def load_gold_table(self, data_type: str, columns: Optional[List[str]] = None,
+                        filters: Optional[List] = None) -> pd.DataFrame:
+        """
+        Load a previously written Gold layer data type.
+        
+        The customer 360 view is stored with row groups following risk level
+        and client segment, so filters on them only read the matching rows.
+        Rows written by incremental runs are read from the increment files.
+        
+        Args:
+            data_type: Gold data type (e.g. 'customer_360_dashboard_view')
+            columns: Columns to read (all columns if None)
+            filters: Row filters in the pandas/pyarrow format, e.g. [('churn_risk_level', 'in', ['High'])]
+            
+        Returns:
+            pd.DataFrame: Gold data, or an empty DataFrame if it was never written
+        """
+        file_path = self.get_gold_table_path(data_type)
+        if not file_path.exists():
+            return pd.DataFrame()
+        
+        return read_parquet_table(file_path, columns=columns, filters=filters)
+    
     def _save_gold_data(self, gold_data: Dict[str, pd.DataFrame]) -> None:
-        """Save Gold layer data to parquet files."""
+        """Save Gold layer data to parquet files, customer tables partitioned by risk and segment."""
         logger.info("Saving Gold layer data")
         
         for data_type, df in gold_data.items():
             if not df.empty:
-                file_path = self.gold_path / f"gold_{data_type}.parquet"
-                df.to_parquet(file_path, index=False)
+                file_path = self.get_gold_table_path(data_type)
+                write_partitioned_table(df, file_path, partition_columns=GOLD_PARTITIONS.get(data_type))
+                table_cache.invalidate(file_path)
                 logger.info(f"Saved {data_type} data: {len(df)} records to {file_path}")
 
 def main():
@@ -0,0 +1,454 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Incremental Aggregate Store
+# This module persists per-source watermarks and per-customer aggregates so that
+# incremental pipeline runs can fold new Bronze rows in without a full rebuild
+
+import json
+import shutil
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+from src.config.settings import settings
+
+# Configure logging for the incremental aggregate store
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Datetime column compared against the watermark of each event source
+WATERMARK_COLUMNS = {
+    'transactions': 'transaction_date',
+    'engagement': 'event_timestamp',
+    'support': 'created_at',
+    'surveys': 'response_date'
+}
+
+# Per-customer aggregates and how partial aggregates are combined
+# Sums and counts are added, dates and scores keep their minimum or maximum
+AGGREGATE_COLUMNS = {
+    'txn_amount_sum': 'sum',
+    'txn_count': 'sum',
+    'txn_first_date': 'min',
+    'txn_last_date': 'max',
+    'eng_event_count': 'sum',
+    'eng_first_date': 'min',
+    'eng_last_date': 'max',
+    'sup_ticket_count': 'sum',
+    'sup_satisfaction_sum': 'sum',
+    'sup_satisfaction_count': 'sum',
+    'sup_last_date': 'max',
+    'srv_nps_sum': 'sum',
+    'srv_nps_count': 'sum',
+    'srv_nps_max': 'max',
+    'srv_last_date': 'max'
+}
+
+DATE_AGGREGATES = [
+    'txn_first_date', 'txn_last_date', 'eng_first_date', 'eng_last_date',
+    'sup_last_date', 'srv_last_date'
+]
+
+# Distinct-count sketches kept per customer: sketch name -> (data type, column)
+SKETCH_COLUMNS = {
+    'event_types': ('engagement', 'event_type'),
+    'sessions': ('engagement', 'session_id')
+}
+
+class IncrementalAggregateStore:
+    """
+    Persistent per-customer aggregate state for incremental pipeline runs.
+    
+    This class keeps, for every customer, the additive aggregates behind the
+    Silver profile metrics (sums, counts, first and last dates, maximum
+    scores) together with K-minimum-values sketches for distinct counts, and
+    the watermark of each event source. New Bronze rows are summarized and
+    folded into the stored aggregates, and profile metrics are rebuilt only
+    for the customers those rows touched.
+    
+    Each saved state is written to its own directory and then published by
+    atomically replacing a small pointer file, so an interrupted run never
+    leaves aggregates and watermarks out of step.
+    """
+    
+    def __init__(self, state_path: Optional[Path] = None, sketch_size: Optional[int] = None):
+        """
+        Initialize the incremental aggregate store.
+        
+        Args:
+            state_path: Directory holding the state (defaults to settings.incremental_state_path)
+            sketch_size: Hashes kept per customer sketch (defaults to settings.incremental_sketch_size)
+        """
+        self.state_path = state_path or settings.incremental_state_path
+        self.sketch_size = sketch_size or settings.incremental_sketch_size
+        self.pointer_path = self.state_path / "current_state.json"
+        
+        self.state_path.mkdir(parents=True, exist_ok=True)
+    
+    def load_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the currently published state descriptor.
+        
+        Returns:
+            Optional[Dict[str, Any]]: State id, watermarks and metadata, or None if no state exists
+        """
+        if not self.pointer_path.exists():
+            return None
+        
+        try:
+            with open(self.pointer_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read incremental state {self.pointer_path}: {str(e)}")
+            return None
+        
+        if not (self.state_path / state['state_id']).exists():
+            logger.warning(f"Incremental state directory missing for {state['state_id']}")
+            return None
+        
+        return state
+    
+    def get_watermarks(self, state: Dict[str, Any]) -> Dict[str, Optional[pd.Timestamp]]:
+        """
+        Get the watermark of each event source from a state descriptor.
+        
+        Args:
+            state: State descriptor returned by load_state
+        
+        Returns:
+            Dict[str, Optional[pd.Timestamp]]: Watermark per data type (None if never seen)
+        """
+        watermarks = state.get('watermarks', {})
+        return {
+            data_type: pd.Timestamp(watermarks[data_type]) if watermarks.get(data_type) else None
+            for data_type in WATERMARK_COLUMNS
+        }
+    
+    def load_aggregates(self, state: Optional[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Load the per-customer aggregates of a state.
+        
+        Args:
+            state: State descriptor returned by load_state (None for an empty store)
+        
+        Returns:
+            pd.DataFrame: Aggregates indexed by customer_pk
+        """
+        if state is None:
+            return self._conform_aggregates(pd.DataFrame(index=pd.Index([], name='customer_pk')))
+        
+        aggregates = pd.read_parquet(self.state_path / state['state_id'] / "customer_aggregates.parquet")
+        return self._conform_aggregates(aggregates.set_index('customer_pk'))
+    
+    def load_sketches(self, state: Optional[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Load the per-customer distinct-count sketches of a state.
+        
+        Args:
+            state: State descriptor returned by load_state (None for an empty store)
+        
+        Returns:
+            pd.DataFrame: One row per (customer_pk, sketch, hash)
+        """
+        if state is None:
+            return self._empty_sketches()
+        
+        return pd.read_parquet(self.state_path / state['state_id'] / "customer_sketches.parquet")
+    
+    def save_state(self, aggregates: pd.DataFrame, sketches: pd.DataFrame,
+                   watermarks: Dict[str, Optional[pd.Timestamp]], state_id: str,
+                   metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Write a new state and publish it as the current state.
+        
+        Args:
+            aggregates: Per-customer aggregates indexed by customer_pk
+            sketches: Per-customer distinct-count sketches
+            watermarks: Watermark per data type
+            state_id: Identifier of the new state (e.g. the execution id)
+            metadata: Additional values to store in the state descriptor
+        
+        Returns:
+            Dict[str, Any]: The published state descriptor
+        """
+        previous = self.load_state()
+        state_dir = self.state_path / state_id
+        state_dir.mkdir(parents=True, exist_ok=True)
+        
+        aggregates.reset_index().to_parquet(state_dir / "customer_aggregates.parquet", index=False)
+        sketches.to_parquet(state_dir / "customer_sketches.parquet", index=False)
+        
+        state = {
+            'state_id': state_id,
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'watermarks': {
+                data_type: watermark.isoformat() if watermark is not None else None
+                for data_type, watermark in watermarks.items()
+            },
+            'customer_count': len(aggregates)
+        }
+        state.update(metadata or {})
+        
+        partial_path = self.pointer_path.with_name(f"{self.pointer_path.name}.partial")
+        with open(partial_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        partial_path.replace(self.pointer_path)
+        
+        # Remove the superseded state once the new one is published
+        if previous is not None and previous['state_id'] != state_id:
+            shutil.rmtree(self.state_path / previous['state_id'], ignore_errors=True)
+        
+        logger.info(f"Saved incremental state {state_id} for {len(aggregates)} customers")
+        return state
+    
+    def advance_watermarks(self, watermarks: Dict[str, Optional[pd.Timestamp]],
+                           silver_increments: Dict[str, pd.DataFrame]) -> Dict[str, Optional[pd.Timestamp]]:
+        """
+        Move each watermark to the newest row folded into the aggregates.
+        
+        Args:
+            watermarks: Current watermark per data type
+            silver_increments: Cleaned rows folded in this run, keyed by data type
+        
+        Returns:
+            Dict[str, Optional[pd.Timestamp]]: Updated watermark per data type
+        """
+        advanced = dict(watermarks)
+        
+        for data_type, column in WATERMARK_COLUMNS.items():
+            df = silver_increments.get(data_type)
+            if df is None or df.empty or column not in df.columns:
+                continue
+            
+            newest = df[column].max()
+            if pd.notna(newest) and (advanced.get(data_type) is None or newest > advanced[data_type]):
+                advanced[data_type] = pd.Timestamp(newest)
+        
+        return advanced
+    
+    def fold(self, aggregates: pd.DataFrame, sketches: pd.DataFrame,
+             silver_increments: Dict[str, pd.DataFrame]) -> Tuple[pd.DataFrame, pd.DataFrame, List[str]]:
+        """
+        Fold cleaned event rows into the stored per-customer aggregates.
+        
+        Args:
+            aggregates: Stored aggregates indexed by customer_pk
+            sketches: Stored distinct-count sketches
+            silver_increments: Cleaned event rows keyed by data type
+        
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame, List[str]]: Updated aggregates,
+            updated sketches and the customers touched by the new rows
+        """
+        partial = self._summarize_increments(silver_increments)
+        if partial.empty:
+            return aggregates, sketches, []
+        
+        touched = partial.index.unique()
+        
+        # Combine partial aggregates with the stored rows of touched customers
+        combined = pd.concat([aggregates[aggregates.index.isin(touched)], partial])
+        combined = combined.groupby(level=0, sort=False).agg(AGGREGATE_COLUMNS)
+        aggregates = self._conform_aggregates(
+            pd.concat([aggregates[~aggregates.index.isin(touched)], combined])
+        )
+        
+        sketches = self._fold_sketches(sketches, silver_increments)
+        
+        logger.info(f"Folded new rows into aggregates for {len(touched)} customers")
+        return aggregates, sketches, touched.tolist()
+    
+    def _summarize_increments(self, silver_increments: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Summarize cleaned event rows into partial per-customer aggregates."""
+        partials = []
+        
+        transactions = silver_increments.get('transactions')
+        if transactions is not None and not transactions.empty:
+            grouped = transactions.groupby('customer_id', sort=False)
+            partials.append(pd.DataFrame({
+                'txn_amount_sum': grouped['amount'].sum(),
+                'txn_count': grouped['amount'].count(),
+                'txn_first_date': grouped['transaction_date'].min(),
+                'txn_last_date': grouped['transaction_date'].max()
+            }))
+        
+        engagement = silver_increments.get('engagement')
+        if engagement is not None and not engagement.empty:
+            grouped = engagement.groupby('customer_id', sort=False)
+            partials.append(pd.DataFrame({
+                'eng_event_count': grouped['event_timestamp'].count(),
+                'eng_first_date': grouped['event_timestamp'].min(),
+                'eng_last_date': grouped['event_timestamp'].max()
+            }))
+        
+        support = silver_increments.get('support')
+        if support is not None and not support.empty:
+            grouped = support.groupby('customer_id', sort=False)
+            partials.append(pd.DataFrame({
+                'sup_ticket_count': grouped['ticket_id'].count(),
+                'sup_satisfaction_sum': grouped['satisfaction_score'].sum(),
+                'sup_satisfaction_count': grouped['satisfaction_score'].count(),
+                'sup_last_date': grouped['created_at'].max()
+            }))
+        
+        surveys = silver_increments.get('surveys')
+        if surveys is not None and not surveys.empty:
+            grouped = surveys.groupby('customer_id', sort=False)
+            partials.append(pd.DataFrame({
+                'srv_nps_sum': grouped['nps_score'].sum(),
+                'srv_nps_count': grouped['nps_score'].count(),
+                'srv_nps_max': grouped['nps_score'].max(),
+                'srv_last_date': grouped['response_date'].max()
+            }))
+        
+        if not partials:
+            return pd.DataFrame()
+        
+        # Customers present in several sources are combined into one row
+        partial = self._conform_aggregates(pd.concat(partials))
+        partial.index = partial.index.astype(str)
+        return partial.groupby(level=0, sort=False).agg(AGGREGATE_COLUMNS)
+    
+    def _conform_aggregates(self, aggregates: pd.DataFrame) -> pd.DataFrame:
+        """Ensure every aggregate column exists with its expected dtype."""
+        aggregates = aggregates.reindex(columns=list(AGGREGATE_COLUMNS))
+        
+        for column, kind in AGGREGATE_COLUMNS.items():
+            if column in DATE_AGGREGATES:
+                aggregates[column] = pd.to_datetime(aggregates[column]).astype('datetime64[ns]')
+            elif kind == 'sum':
+                aggregates[column] = aggregates[column].astype('float64').fillna(0.0)
+            else:
+                aggregates[column] = aggregates[column].astype('float64')
+        
+        aggregates.index.name = 'customer_pk'
+        return aggregates
+    
+    def _empty_sketches(self) -> pd.DataFrame:
+        """Create an empty sketch frame."""
+        return pd.DataFrame({
+            'customer_pk': pd.Series([], dtype=str),
+            'sketch': pd.Series([], dtype=str),
+            'hash': pd.Series([], dtype='uint64')
+        })
+    
+    def _fold_sketches(self, sketches: pd.DataFrame, silver_increments: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Add the distinct values of new rows to the K-minimum-values sketches.
+        
+        Each sketch keeps the sketch_size smallest 64-bit hashes of the distinct
+        values seen for a customer. Hashes of repeated values collide, so the
+        sketch is exact while a customer has fewer distinct values than the
+        sketch size, and merging two sketches is a union followed by a trim.
+        """
+        new_hashes = []
+        
+        for sketch, (data_type, column) in SKETCH_COLUMNS.items():
+            df = silver_increments.get(data_type)
+            if df is None or df.empty or column not in df.columns:
+                continue
+            
+            values = df[['customer_id', column]].dropna()
+            new_hashes.append(pd.DataFrame({
+                'customer_pk': values['customer_id'].astype(str).to_numpy(),
+                'sketch': sketch,
+                'hash': pd.util.hash_array(values[column].astype(str).to_numpy(dtype=object))
+            }))
+        
+        if not new_hashes:
+            return sketches
+        
+        new_hashes = pd.concat(new_hashes, ignore_index=True)
+        touched = sketches['customer_pk'].isin(new_hashes['customer_pk'].unique())
+        
+        # Union with the stored hashes of touched customers and keep the smallest
+        merged = pd.concat([sketches[touched], new_hashes], ignore_index=True)
+        merged = merged.drop_duplicates().sort_values(['customer_pk', 'sketch', 'hash'])
+        merged = merged[merged.groupby(['customer_pk', 'sketch']).cumcount() < self.sketch_size]
+        
+        return pd.concat([sketches[~touched], merged], ignore_index=True)
+    
+    def estimate_distinct_counts(self, sketches: pd.DataFrame, sketch: str) -> pd.Series:
+        """
+        Estimate per-customer distinct counts from a sketch.
+        
+        Args:
+            sketches: Per-customer distinct-count sketches
+            sketch: Name of the sketch (e.g. 'sessions')
+        
+        Returns:
+            pd.Series: Distinct count per customer_pk (exact below the sketch size)
+        """
+        hashes = sketches.loc[sketches['sketch'] == sketch, ['customer_pk', 'hash']]
+        grouped = hashes.groupby('customer_pk')['hash']
+        counts = grouped.count()
+        largest = grouped.max().astype('float64')
+        
+        # With k hashes kept, (k - 1) / (k-th smallest hash / 2^64) estimates the distinct count
+        estimate = ((self.sketch_size - 1) * 2.0 ** 64 / largest).round()
+        return counts.where(counts < self.sketch_size, estimate).astype('int64')
+    
+    def build_metrics(self, aggregates: pd.DataFrame, sketches: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build Silver profile metrics from per-customer aggregates.
+        
+        The columns, rounding and missing values match those produced by
+        SilverTransform.calculate_derived_metrics, with metrics of a source
+        left missing for customers that have no rows in that source.
+        
+        Args:
+            aggregates: Aggregates indexed by customer_pk
+            sketches: Distinct-count sketches of the same customers
+        
+        Returns:
+            pd.DataFrame: Profile metrics with a customer_pk column
+        """
+        now = datetime.now()
+        metrics = pd.DataFrame(index=aggregates.index)
+        
+        # Transaction metrics
+        has_transactions = aggregates['txn_count'] > 0
+        metrics['total_lifetime_revenue'] = aggregates['txn_amount_sum'].where(has_transactions).round(2)
+        metrics['average_transaction_value'] = (
+            aggregates['txn_amount_sum'] / aggregates['txn_count']
+        ).where(has_transactions).round(2)
+        metrics['total_transactions_count'] = aggregates['txn_count'].where(has_transactions)
+        metrics['first_transaction_date'] = aggregates['txn_first_date'].where(has_transactions)
+        metrics['last_transaction_date'] = aggregates['txn_last_date'].where(has_transactions)
+        metrics['days_since_last_transaction'] = (now - metrics['last_transaction_date']).dt.days
+        
+        # Engagement metrics
+        has_engagement = aggregates['eng_event_count'] > 0
+        metrics['first_engagement_date'] = aggregates['eng_first_date'].where(has_engagement)
+        metrics['last_engagement_date'] = aggregates['eng_last_date'].where(has_engagement)
+        metrics['total_engagement_events'] = aggregates['eng_event_count'].where(has_engagement)
+        metrics['unique_event_types'] = self.estimate_distinct_counts(
+            sketches, 'event_types'
+        ).reindex(metrics.index).where(has_engagement)
+        metrics['total_sessions'] = self.estimate_distinct_counts(
+            sketches, 'sessions'
+        ).reindex(metrics.index).where(has_engagement)
+        metrics['days_since_last_engagement'] = (now - metrics['last_engagement_date']).dt.days
+        metrics['engagement_score'] = (
+            metrics['total_engagement_events'] /
+            (metrics['days_since_last_engagement'] / 30 + 1)
+        ).round(3)
+        
+        # Support metrics
+        has_support = aggregates['sup_ticket_count'] > 0
+        metrics['total_support_tickets_lifetime'] = aggregates['sup_ticket_count'].where(has_support)
+        metrics['avg_satisfaction_score_lifetime'] = (
+            aggregates['sup_satisfaction_sum'] / aggregates['sup_satisfaction_count']
+        ).where(has_support).round(2)
+        metrics['last_support_ticket_date'] = aggregates['sup_last_date'].where(has_support)
+        metrics['days_since_last_support_ticket'] = (now - metrics['last_support_ticket_date']).dt.days
+        
+        # Survey metrics
+        has_surveys = aggregates['srv_nps_count'] > 0
+        metrics['avg_nps_score_lifetime'] = (
+            aggregates['srv_nps_sum'] / aggregates['srv_nps_count']
+        ).where(has_surveys).round(2)
+        metrics['most_recent_nps_score'] = aggregates['srv_nps_max'].where(has_surveys).round(2)
+        metrics['last_survey_response_date'] = aggregates['srv_last_date'].where(has_surveys)
+        metrics['days_since_last_survey'] = (now - metrics['last_survey_response_date']).dt.days
+        
+        return metrics.rename_axis('customer_pk').reset_index()
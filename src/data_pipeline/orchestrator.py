@@ -3,16 +3,22 @@
 # of the Medallion architecture, ensuring data quality and consistency
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 import logging
 import traceback
+import sys
 from src.config.settings import settings
 from src.data_pipeline.ingest import DataIngestion
-from src.data_pipeline.silver_transform import SilverTransform
+from src.data_pipeline.silver_transform import SilverTransform, SILVER_CLEANERS
 from src.data_pipeline.gold_agg import GoldAggregation
+from src.data_pipeline.customer_metrics import CustomerMetricsEngine
+from src.data_pipeline.dag import PipelineDAG, NODE_COMPLETED
+from src.data_pipeline.fingerprint import BronzeFingerprintManifest
+from src.data_pipeline.checkpoint import PipelineCheckpointStore
+from src.data_pipeline.profiler import PipelineProfiler
+from src.data_pipeline.incremental import IncrementalAggregateStore, WATERMARK_COLUMNS
 
 # Configure logging for pipeline orchestration
 logging.basicConfig(
@@ -25,6 +31,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metric helper of CustomerMetricsEngine for each Silver event source
+METRIC_SOURCES = {
+    'transactions': 'add_transaction_metrics',
+    'engagement': 'add_engagement_metrics',
+    'support': 'add_support_metrics',
+    'surveys': 'add_survey_metrics'
+}
+
+# Silver event sources read by the windowed AI model features
+WINDOW_FEATURE_SOURCES = ['transactions', 'engagement', 'support']
+
 class DataPipelineOrchestrator:
     """
     Orchestrates the complete A.U.R.A data pipeline.
@@ -39,6 +56,20 @@ class DataPipelineOrchestrator:
         self.ingestion = DataIngestion()
         self.silver_transform = SilverTransform()
         self.gold_agg = GoldAggregation()
+        self.fingerprint_manifest = BronzeFingerprintManifest()
+        self.incremental_store = IncrementalAggregateStore()
+        self.checkpoint_store = PipelineCheckpointStore()
+        
+        # Profile the Silver and Gold hot-path helpers of every run
+        self.profiler = PipelineProfiler()
+        if self.profiler.enabled:
+            self.profiler.instrument(self.silver_transform)
+            self.profiler.instrument(self.gold_agg)
+        
+        # Bronze sources whose Silver data is reused, and the current source
+        # fingerprints to record once Silver data has been written
+        self.reused_sources: List[str] = []
+        self.source_fingerprints: Dict[str, Dict[str, Any]] = {}
         
         # Pipeline execution tracking
         self.execution_id = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -60,47 +91,137 @@ class DataPipelineOrchestrator:
         
         This method orchestrates the entire data pipeline, including Bronze layer
         ingestion, Silver layer transformation, and Gold layer aggregation.
-        It provides comprehensive error handling and monitoring.
+        It provides comprehensive error handling and monitoring. The output of
+        each completed stage is checkpointed under the execution id, so a
+        failed run can be continued with resume().
         
         Returns:
             Dict[str, Any]: Pipeline execution results and statistics
         """
         logger.info("Starting complete A.U.R.A data pipeline execution")
+        return self._run_pipeline()
+    
+    def resume(self, execution_id: str) -> Dict[str, Any]:
+        """
+        Resume a pipeline execution from its first incomplete stage.
+        
+        The checkpointed output of every stage the execution completed is
+        loaded instead of being recomputed, and the remaining stages run as
+        in run_complete_pipeline under the original execution id. Bronze
+        sources whose Silver data the original run reused are reused again.
+        
+        Args:
+            execution_id: Execution id of the run to resume
+            
+        Returns:
+            Dict[str, Any]: Pipeline execution results and statistics
+            
+        Raises:
+            ValueError: If the execution has no checkpoints or its Bronze inputs changed since
+        """
+        manifest = self.checkpoint_store.load_manifest(execution_id)
+        if manifest is None:
+            raise ValueError(f"No checkpoints found for execution {execution_id}")
         
+        source_files = self.ingestion.get_source_files()
+        partition_files = self.ingestion.get_source_partition_files()
+        if (self.checkpoint_store.compute_input_fingerprint(source_files, partition_files=partition_files)
+                != manifest['input_fingerprint']):
+            raise ValueError(f"Bronze inputs changed since execution {execution_id}; run the complete pipeline instead")
+        
+        completed_stages = self.checkpoint_store.get_completed_stages(execution_id)
+        logger.info(f"Resuming execution {execution_id} after stages: {completed_stages if completed_stages else 'none'}")
+        
+        self.execution_id = execution_id
+        self.reused_sources = list(manifest.get('reused_sources', []))
+        self.source_fingerprints = {}
+        if settings.skip_unchanged_sources:
+            _, self.source_fingerprints = self.fingerprint_manifest.detect_changes(source_files, partition_files)
+        
+        restored_stages = {
+            stage: self.checkpoint_store.load_stage(execution_id, stage) for stage in completed_stages
+        }
+        return self._run_pipeline(restored_stages)
+    
+    def _run_pipeline(self, restored_stages: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None) -> Dict[str, Any]:
+        """
+        Run the pipeline DAG, starting after any restored stages.
+        
+        Args:
+            restored_stages: Checkpointed stage tables of a resumed execution
+            (None for a new execution)
+            
+        Returns:
+            Dict[str, Any]: Pipeline execution results and statistics
+        """
         pipeline_results = {
             'execution_id': self.execution_id,
             'start_time': datetime.now(),
             'bronze_data': {},
             'silver_data': {},
             'gold_data': {},
+            'reused_sources': [],
+            'resumed_stages': list(restored_stages or {}),
             'errors': [],
             'warnings': [],
             'statistics': {}
         }
+        self.profiler.start_run(self.execution_id)
         
         try:
-            # Step 1: Bronze Layer Ingestion
-            logger.info("Step 1: Bronze Layer Ingestion")
-            bronze_data = self._run_bronze_ingestion()
-            pipeline_results['bronze_data'] = bronze_data
-            self.pipeline_status['bronze_ingestion'] = True
+            # Steps 1-3: Bronze ingestion, Silver transformation and Gold
+            # aggregation, run as a DAG of independent steps
+            if restored_stages is None:
+                data_types = self._select_changed_sources()
+                restored_stages = {}
+                if settings.pipeline_checkpoints_enabled:
+                    self.checkpoint_store.start_run(
+                        self.execution_id,
+                        self.checkpoint_store.compute_input_fingerprint(
+                            self.ingestion.get_source_files(), self.source_fingerprints,
+                            self.ingestion.get_source_partition_files()
+                        ),
+                        self.reused_sources
+                    )
+            else:
+                data_types = [data_type for data_type in self.ingestion.bronze_files if data_type not in self.reused_sources]
+            pipeline_results['reused_sources'] = list(self.reused_sources)
             
-            # Step 2: Silver Layer Transformation
-            logger.info("Step 2: Silver Layer Transformation")
-            silver_data = self._run_silver_transformation(bronze_data)
-            pipeline_results['silver_data'] = silver_data
-            self.pipeline_status['silver_transformation'] = True
+            if 'gold_aggregation' in restored_stages:
+                logger.info(f"Execution {self.execution_id} already completed every stage")
+                node_results = {
+                    'bronze_validation': restored_stages['bronze_ingestion'],
+                    'silver_save': restored_stages['silver_transformation'],
+                    'gold_save': restored_stages['gold_aggregation']
+                }
+                for step in ['bronze_ingestion', 'silver_transformation', 'gold_aggregation']:
+                    self.pipeline_status[step] = True
+            else:
+                dag = self._build_pipeline_dag(data_types, restored_stages)
+                
+                # A profiler capture follows one thread, so nodes then run one at a time
+                max_workers = 1 if self.profiler.enabled and self.profiler.capture else settings.max_workers
+                try:
+                    node_results = dag.run(max_workers)
+                finally:
+                    pipeline_results['node_runs'] = dag.node_runs
+                    for step, node in [('bronze_ingestion', 'bronze_validation'),
+                                       ('silver_transformation', 'silver_save'), ('gold_aggregation', 'gold_save')]:
+                        self.pipeline_status[step] = (
+                            step in restored_stages or dag.node_runs.get(node, {}).get('status') == NODE_COMPLETED
+                        )
             
-            # Step 3: Gold Layer Aggregation
-            logger.info("Step 3: Gold Layer Aggregation")
-            gold_data = self._run_gold_aggregation(silver_data)
+            bronze_data = node_results.get('bronze_validation', restored_stages.get('bronze_ingestion', {}))
+            silver_data = node_results['silver_save']
+            gold_data = node_results['gold_save']
+            pipeline_results['bronze_data'] = bronze_data
+            pipeline_results['silver_data'] = silver_data
             pipeline_results['gold_data'] = gold_data
-            self.pipeline_status['gold_aggregation'] = True
             
             # Step 4: Generate Pipeline Statistics
             logger.info("Step 4: Generating Pipeline Statistics")
             pipeline_results['statistics'] = self._generate_pipeline_statistics(
-                bronze_data, silver_data, gold_data
+                bronze_data, silver_data, gold_data, pipeline_results['start_time']
             )
             
             # Mark overall success
@@ -121,110 +242,278 @@ class DataPipelineOrchestrator:
                 pipeline_results['end_time'] - pipeline_results['start_time']
             ).total_seconds()
         
-        # Log final results
+        # Write the profile report and log final results
+        self._write_profile_report(pipeline_results)
         self._log_pipeline_results(pipeline_results)
         
         return pipeline_results
     
-    def _run_bronze_ingestion(self) -> Dict[str, pd.DataFrame]:
+    def _select_changed_sources(self) -> Optional[List[str]]:
         """
-        Execute Bronze layer data ingestion.
+        Select the Bronze sources that need to be loaded.
         
-        This method handles the ingestion of raw data from various sources
-        into the Bronze layer, including validation and quality checks.
+        Sources whose fingerprint matches the manifest and whose Silver data
+        is still on disk are marked for reuse; all other sources are loaded.
         
         Returns:
-            Dict[str, pd.DataFrame]: Bronze layer data
+            Optional[List[str]]: Data types to load, or None to load all sources
         """
-        logger.info("Executing Bronze layer ingestion")
+        self.reused_sources = []
+        self.source_fingerprints = {}
         
-        try:
-            # Load Bronze layer data
-            bronze_data = self.ingestion.load_bronze_data()
-            
-            # Validate Bronze data
-            validation_results = self.ingestion.validate_bronze_data(bronze_data)
-            
-            # Check for validation errors
-            if validation_results['validation_errors']:
-                for error in validation_results['validation_errors']:
-                    logger.warning(f"Bronze validation warning: {error}")
-            
-            # Generate summary
-            summary = self.ingestion.get_data_summary(bronze_data)
-            
-            logger.info(f"Bronze ingestion completed. Total records: {validation_results['total_records']}")
-            return bronze_data
-            
-        except Exception as e:
-            logger.error(f"Bronze ingestion failed: {str(e)}")
-            raise
+        if not settings.skip_unchanged_sources:
+            return None
+        
+        source_files = self.ingestion.get_source_files()
+        changed, self.source_fingerprints = self.fingerprint_manifest.detect_changes(
+            source_files, self.ingestion.get_source_partition_files()
+        )
+        
+        self.reused_sources = [
+            data_type for data_type in source_files
+            if data_type not in changed
+            and self.source_fingerprints[data_type]['exists']
+            and self.silver_transform.get_silver_table_path(data_type).exists()
+        ]
+        
+        if self.reused_sources:
+            logger.info(f"Reusing Silver data for unchanged sources: {self.reused_sources}")
+        
+        return [data_type for data_type in source_files if data_type not in self.reused_sources]
     
-    def _run_silver_transformation(self, bronze_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    def _build_pipeline_dag(self, data_types: Optional[List[str]],
+                            restored_stages: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None) -> PipelineDAG:
         """
-        Execute Silver layer data transformation.
+        Declare the Bronze, Silver and Gold steps as a dependency graph.
         
-        This method handles the transformation of Bronze layer data into
-        Silver layer format through cleaning, standardization, and enrichment.
+        Every Bronze source is loaded and cleaned by its own nodes, each
+        CustomerMetricsEngine metric helper is a node waiting only for the
+        engine and its event source, and every Gold table waits only for the
+        customer 360 view and the Silver data it reads. Silver data is written
+        (and source fingerprints recorded) before Gold data. The Bronze
+        checkpoint is its own node that no other step waits on. Stages restored
+        from checkpoints are declared as nodes returning their stored tables.
         
         Args:
-            bronze_data: Bronze layer data
+            data_types: Bronze data types to load (None loads every source)
+            restored_stages: Checkpointed tables of the stages already completed
             
         Returns:
-            Dict[str, pd.DataFrame]: Silver layer data
+            PipelineDAG: Graph ready to run
         """
-        logger.info("Executing Silver layer transformation")
+        dag = PipelineDAG("aura-pipeline", self.profiler.wrap_node if self.profiler.enabled else None)
+        restored_stages = restored_stages or {}
+        loaded_sources = [
+            data_type for data_type in self.ingestion.bronze_files
+            if data_types is None or data_type in data_types
+        ]
+        self.ingestion.ingestion_stats = {}
         
-        try:
-            # Transform Bronze to Silver
-            silver_data = self.silver_transform.transform_bronze_to_silver(bronze_data)
+        if 'silver_transformation' in restored_stages:
+            self._add_restored_silver_nodes(dag, restored_stages['silver_transformation'])
+        else:
+            # Bronze layer: one node per source, validated together
+            restored_bronze = restored_stages.get('bronze_ingestion')
+            for data_type in loaded_sources:
+                if restored_bronze is not None:
+                    dag.add_node(f"bronze_{data_type}", lambda inputs, df=restored_bronze.get(data_type): df)
+                else:
+                    dag.add_node(f"bronze_{data_type}", lambda inputs, data_type=data_type: self.ingestion.load_bronze_source(data_type))
+            if restored_bronze is not None:
+                dag.add_node("bronze_validation", lambda inputs: restored_bronze)
+            else:
+                dag.add_node("bronze_validation", self._validate_bronze_node, [f"bronze_{data_type}" for data_type in loaded_sources])
+                # Nothing waits on the Bronze checkpoint, so it is written alongside the Silver steps
+                dag.add_node("bronze_checkpoint",
+                             lambda inputs: self._checkpoint_stage('bronze_ingestion', inputs['bronze_validation']),
+                             ["bronze_validation"])
             
-            # Validate Silver data
-            silver_validation = self._validate_silver_data(silver_data)
+            # Silver layer: clean (or reuse) each source, then reduce the metrics per source
+            for data_type in SILVER_CLEANERS:
+                dependencies = [f"bronze_{data_type}"] if data_type in loaded_sources else []
+                dag.add_node(f"silver_{data_type}",
+                             lambda inputs, data_type=data_type: self._silver_source_node(data_type, inputs),
+                             dependencies)
             
-            if silver_validation['errors']:
-                for error in silver_validation['errors']:
-                    logger.warning(f"Silver validation warning: {error}")
-            
-            logger.info(f"Silver transformation completed. Data types: {len(silver_data)}")
-            return silver_data
-            
-        except Exception as e:
-            logger.error(f"Silver transformation failed: {str(e)}")
-            raise
+            dag.add_node("metrics_engine", self._metrics_engine_node, ["silver_customers"])
+            for data_type, helper in METRIC_SOURCES.items():
+                dag.add_node(f"metrics_{data_type}",
+                             lambda inputs, data_type=data_type, helper=helper: self._metrics_node(data_type, helper, inputs),
+                             ["metrics_engine", f"silver_{data_type}"])
+            dag.add_node("silver_customer_profiles", self._customer_profiles_node,
+                         ["metrics_engine", "silver_customers"] + [f"metrics_{data_type}" for data_type in METRIC_SOURCES])
+            dag.add_node("silver_save", self._save_silver_node,
+                         [f"silver_{data_type}" for data_type in SILVER_CLEANERS]
+                         + ["silver_customer_profiles", "bronze_validation"])
+        
+        # Gold layer: the customer 360 view, then every table built from it
+        dag.add_node("gold_customer_360_dashboard_view", self._customer_360_node, ["silver_customer_profiles"])
+        gold_tables = ['overall_kpi_dashboard_view', 'ai_model_features_for_churn_prediction']
+        dag.add_node("gold_overall_kpi_dashboard_view",
+                     lambda inputs: self._gold_table_node(inputs, self.gold_agg.create_dashboard_kpis),
+                     ["gold_customer_360_dashboard_view"])
+        dag.add_node("gold_ai_model_features_for_churn_prediction", self._ai_features_node,
+                     ["gold_customer_360_dashboard_view"] + [f"silver_{data_type}" for data_type in WINDOW_FEATURE_SOURCES])
+        if settings.chatbot_context_export_enabled:
+            gold_tables.append('ai_chatbot_context')
+            dag.add_node("gold_ai_chatbot_context",
+                         lambda inputs: self._gold_table_node(inputs, self.gold_agg.create_chatbot_context),
+                         ["gold_customer_360_dashboard_view"])
+        dag.add_node("gold_save", self._save_gold_node,
+                     ["silver_save", "gold_customer_360_dashboard_view"] + [f"gold_{table}" for table in gold_tables])
+        
+        return dag
     
-    def _run_gold_aggregation(self, silver_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
-        """
-        Execute Gold layer data aggregation.
+    def _validate_bronze_node(self, inputs: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """Collect and validate the loaded Bronze sources."""
+        bronze_data = {node[len("bronze_"):]: df for node, df in inputs.items()}
         
-        This method handles the aggregation of Silver layer data into
-        Gold layer business-ready datasets for dashboards and AI models.
+        validation_results = self.ingestion.validate_bronze_data(bronze_data)
+        for error in validation_results['validation_errors']:
+            logger.warning(f"Bronze validation warning: {error}")
         
-        Args:
-            silver_data: Silver layer data
-            
-        Returns:
-            Dict[str, pd.DataFrame]: Gold layer data
-        """
-        logger.info("Executing Gold layer aggregation")
+        logger.info(f"Bronze ingestion completed. Total records: {validation_results['total_records']}")
+        return bronze_data
+    
+    def _silver_source_node(self, data_type: str, inputs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Clean one Bronze source, or load its Silver data if the source is unchanged."""
+        if data_type in self.reused_sources:
+            df = self.silver_transform.load_silver_table(data_type)
+            if df.empty:
+                return None
+            logger.info(f"Reused Silver {data_type} data: {len(df)} records")
+            return df
+        
+        bronze_df = inputs.get(f"bronze_{data_type}")
+        if bronze_df is None or bronze_df.empty:
+            return None
+        
+        return self.silver_transform.clean_data_type(data_type, bronze_df)
+    
+    def _metrics_engine_node(self, inputs: Dict[str, Any]) -> Optional[CustomerMetricsEngine]:
+        """Factorize the customer keys shared by every metric helper."""
+        customers_df = inputs['silver_customers']
+        if customers_df is None:
+            return None
+        
+        logger.info("Calculating derived metrics for customer profiles")
+        return CustomerMetricsEngine(customers_df['customer_pk'])
+    
+    def _metrics_node(self, data_type: str, helper: str, inputs: Dict[str, Any]) -> None:
+        """Reduce one Silver event source into its customer metric columns."""
+        metrics_engine = inputs['metrics_engine']
+        events_df = inputs[f"silver_{data_type}"]
+        if metrics_engine is not None:
+            getattr(metrics_engine, helper)(events_df if events_df is not None else pd.DataFrame())
+    
+    def _customer_profiles_node(self, inputs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Assemble customer profiles once every metric helper has run."""
+        if inputs['metrics_engine'] is None:
+            return None
         
+        return self.silver_transform.build_customer_profiles(inputs['metrics_engine'], inputs['silver_customers'])
+    
+    def _save_silver_node(self, inputs: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """Write the Silver tables, validate them and record the source fingerprints."""
+        silver_data = {
+            node[len("silver_"):]: df for node, df in inputs.items()
+            if node.startswith("silver_") and df is not None
+        }
+        
+        # Reused data is already on disk
+        self.silver_transform._save_silver_data({
+            data_type: df for data_type, df in silver_data.items() if data_type not in self.reused_sources
+        })
+        
+        silver_validation = self._validate_silver_data(silver_data)
+        for error in silver_validation['errors']:
+            logger.warning(f"Silver validation warning: {error}")
+        
+        # Record source fingerprints now that their Silver data is written
+        if self.source_fingerprints:
+            self.fingerprint_manifest.save(self.source_fingerprints)
+        
+        self._checkpoint_stage('silver_transformation', {
+            data_type: self.silver_transform.get_silver_table_path(data_type)
+            for data_type, df in silver_data.items() if not df.empty
+        })
+        
+        logger.info(f"Silver transformation completed. Data types: {len(silver_data)}")
+        return silver_data
+    
+    def _customer_360_node(self, inputs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Create the customer 360 view from the customer profiles."""
+        customer_profiles = inputs['silver_customer_profiles']
+        if customer_profiles is None or customer_profiles.empty:
+            return None
+        
+        return self.gold_agg.create_customer_360_view(customer_profiles)
+    
+    def _gold_table_node(self, inputs: Dict[str, Any],
+                         build: Callable[[pd.DataFrame], pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Build a Gold table that only depends on the customer 360 view."""
+        customer_360 = inputs['gold_customer_360_dashboard_view']
+        return build(customer_360) if customer_360 is not None else None
+    
+    def _ai_features_node(self, inputs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Build the AI model features from the customer 360 view and Silver events."""
+        customer_360 = inputs['gold_customer_360_dashboard_view']
+        if customer_360 is None:
+            return None
+        
+        silver_data = {
+            data_type: inputs[f"silver_{data_type}"] for data_type in WINDOW_FEATURE_SOURCES
+            if inputs[f"silver_{data_type}"] is not None
+        }
+        return self.gold_agg.create_ai_model_features(customer_360, silver_data)
+    
+    def _save_gold_node(self, inputs: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+        """Write and validate the Gold tables."""
+        gold_data = {
+            node[len("gold_"):]: df for node, df in inputs.items()
+            if node.startswith("gold_") and df is not None
+        }
+        
+        if not settings.chatbot_context_export_enabled:
+            self.gold_agg._remove_stale_chatbot_context()
+        self.gold_agg._save_gold_data(gold_data)
+        
+        gold_validation = self._validate_gold_data(gold_data)
+        for error in gold_validation['errors']:
+            logger.warning(f"Gold validation warning: {error}")
+        
+        self._checkpoint_stage('gold_aggregation', {
+            table: self.gold_agg.get_gold_table_path(table) for table, df in gold_data.items() if not df.empty
+        })
+        
+        logger.info(f"Gold aggregation completed. Data types: {len(gold_data)}")
+        return gold_data
+    
+    def _add_restored_silver_nodes(self, dag: PipelineDAG, silver_data: Dict[str, pd.DataFrame]) -> None:
+        """Declare the Silver nodes read by Gold aggregation from a Silver checkpoint."""
+        for data_type in list(SILVER_CLEANERS) + ['customer_profiles']:
+            dag.add_node(f"silver_{data_type}", lambda inputs, df=silver_data.get(data_type): df)
+        
+        def restore_silver_layer(inputs: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
+            # Later runs may have rewritten the Silver layer since the checkpoint
+            self.checkpoint_store.restore_stage_files(self.execution_id, 'silver_transformation', {
+                data_type: self.silver_transform.get_silver_table_path(data_type) for data_type in silver_data
+            })
+            logger.info(f"Restored Silver data from checkpoint: {len(silver_data)} data types")
+            return silver_data
+        
+        dag.add_node("silver_save", restore_silver_layer)
+    
+    def _checkpoint_stage(self, stage: str, tables: Dict[str, Any]) -> None:
+        """Checkpoint the output of a completed stage when checkpoints are enabled."""
+        if not settings.pipeline_checkpoints_enabled:
+            return
+        
+        # A failed checkpoint only costs the ability to resume, not the run itself
         try:
-            # Aggregate Silver to Gold
-            gold_data = self.gold_agg.aggregate_silver_to_gold(silver_data)
-            
-            # Validate Gold data
-            gold_validation = self._validate_gold_data(gold_data)
-            
-            if gold_validation['errors']:
-                for error in gold_validation['errors']:
-                    logger.warning(f"Gold validation warning: {error}")
-            
-            logger.info(f"Gold aggregation completed. Data types: {len(gold_data)}")
-            return gold_data
-            
+            self.checkpoint_store.save_stage(self.execution_id, stage, tables)
         except Exception as e:
-            logger.error(f"Gold aggregation failed: {str(e)}")
-            raise
+            logger.warning(f"Could not checkpoint {stage} of execution {self.execution_id}: {str(e)}")
     
     def _validate_silver_data(self, silver_data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """
@@ -298,17 +587,21 @@ class DataPipelineOrchestrator:
     
     def _generate_pipeline_statistics(self, bronze_data: Dict[str, pd.DataFrame],
                                     silver_data: Dict[str, pd.DataFrame],
-                                    gold_data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+                                    gold_data: Dict[str, pd.DataFrame],
+                                    start_time: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Generate comprehensive pipeline statistics.
         
         This method generates detailed statistics about the pipeline execution,
-        including data volumes, quality metrics, and processing times.
+        including data volumes, quality metrics, and processing times. The
+        step profiles hold the wall time, CPU time, rows and peak memory of
+        every profiled step of the run.
         
         Args:
             bronze_data: Bronze layer data
             silver_data: Silver layer data
             gold_data: Gold layer data
+            start_time: Start of the execution, for the total processing time
             
         Returns:
             Dict[str, Any]: Pipeline statistics
@@ -318,7 +611,8 @@ class DataPipelineOrchestrator:
             'silver_records': sum(len(df) for df in silver_data.values() if not df.empty),
             'gold_records': sum(len(df) for df in gold_data.values() if not df.empty),
             'data_quality_scores': {},
-            'processing_summary': {}
+            'processing_summary': {},
+            'step_profiles': self.profiler.get_step_summary()
         }
         
         # Calculate data quality scores
@@ -332,11 +626,39 @@ class DataPipelineOrchestrator:
             'bronze_files_processed': len([df for df in bronze_data.values() if not df.empty]),
             'silver_files_processed': len([df for df in silver_data.values() if not df.empty]),
             'gold_files_processed': len([df for df in gold_data.values() if not df.empty]),
-            'total_processing_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'total_processing_time': (
+                round((datetime.now() - start_time).total_seconds(), 3) if start_time is not None else None
+            )
         }
         
         return statistics
     
+    def _write_profile_report(self, results: Dict[str, Any]) -> None:
+        """
+        Write the profile report of an execution to the logs directory.
+        
+        Args:
+            results: Pipeline execution results
+        """
+        try:
+            report_path = self.profiler.write_report({
+                'mode': results.get('mode', 'complete'),
+                'overall_success': self.pipeline_status['overall_success'],
+                'duration_seconds': results.get('duration'),
+                'errors': results['errors'],
+                'record_counts': {
+                    key: results['statistics'][key] for key in ['bronze_records', 'silver_records', 'gold_records']
+                    if key in results['statistics']
+                },
+                'ingestion_lag_seconds': results.get('ingestion_lag_seconds', {})
+            })
+        except Exception as e:
+            logger.warning(f"Could not write the pipeline profile report: {str(e)}")
+            return
+        
+        if report_path is not None:
+            results['profile_report'] = str(report_path)
+    
     def _log_pipeline_results(self, results: Dict[str, Any]) -> None:
         """
         Log comprehensive pipeline results.
@@ -355,9 +677,11 @@ class DataPipelineOrchestrator:
         logger.info(f"End Time: {results['end_time']}")
         logger.info(f"Duration: {results['duration']:.2f} seconds")
         logger.info(f"Overall Success: {self.pipeline_status['overall_success']}")
+        if results.get('profile_report'):
+            logger.info(f"Profile Report: {results['profile_report']}")
         
         # Log statistics
-        if 'statistics' in results:
+        if results.get('statistics'):
             stats = results['statistics']
             logger.info(f"Bronze Records: {stats['bronze_records']:,}")
             logger.info(f"Silver Records: {stats['silver_records']:,}")
@@ -394,25 +718,377 @@ class DataPipelineOrchestrator:
             'timestamp': datetime.now()
         }
     
-    def run_incremental_pipeline(self, since_date: datetime) -> Dict[str, Any]:
+    def run_incremental_pipeline(self, since_date: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Run incremental pipeline for data since a specific date.
         
-        This method runs an incremental pipeline that only processes data
-        that has been updated since the specified date, improving efficiency
-        for regular pipeline runs.
+        This method processes only Bronze event rows that are newer than the
+        persisted watermark of their source (transaction_date, event_timestamp,
+        created_at and response_date). The new rows are cleaned, appended to
+        the Silver tables as increment files and folded into the stored
+        per-customer aggregates, and Silver profiles and Gold rows are
+        recalculated and written only for the customers those rows touched. Changed customer records are detected
+        from the customer file fingerprint. Watermarks and aggregates are only
+        published once every step has succeeded; a retried run re-reads the
+        same Bronze rows and its keyed Silver increments replace the rows
+        appended by the failed attempt. When no usable incremental state
+        exists, it is bootstrapped from the Silver tables of the last complete
+        run (running the complete pipeline first if there is none).
+        
+        Rows of customers that were not touched keep the values of their last
+        refresh, including their days-since metrics; a complete run refreshes
+        every customer.
         
         Args:
-            since_date: Date to process data since
+            since_date: Optional lower bound applied on top of the stored watermarks
             
         Returns:
             Dict[str, Any]: Incremental pipeline results
         """
         logger.info(f"Starting incremental pipeline since {since_date}")
         
-        # For now, run the complete pipeline
-        # In a production environment, this would filter data by date
-        return self.run_complete_pipeline()
+        pipeline_results = {
+            'execution_id': self.execution_id,
+            'mode': 'incremental',
+            'start_time': datetime.now(),
+            'bronze_data': {},
+            'silver_data': {},
+            'gold_data': {},
+            'touched_customers': [],
+            'watermarks': {},
+            'ingestion_lag_seconds': {},
+            'errors': [],
+            'warnings': [],
+            'statistics': {}
+        }
+        
+        self.profiler.start_run(f"{self.execution_id}_incremental")
+        
+        try:
+            state = self._load_incremental_state()
+            if state is None:
+                if not self.silver_transform.get_silver_table_path('customer_profiles').exists():
+                    logger.info("No Silver profiles found, running the complete pipeline first")
+                    complete_results = self.run_complete_pipeline()
+                    if complete_results['errors']:
+                        return complete_results
+                state = self._bootstrap_incremental_state()
+            
+            # Effective watermark per source: the stored watermark, raised to since_date
+            watermarks = self.incremental_store.get_watermarks(state)
+            if since_date is not None:
+                since = pd.Timestamp(since_date)
+                watermarks = {
+                    data_type: max(watermark, since) if watermark is not None else since
+                    for data_type, watermark in watermarks.items()
+                }
+            
+            # Step 1: Load Bronze rows newer than the watermarks
+            logger.info("Step 1: Incremental Bronze Ingestion")
+            bronze_data = {
+                data_type: self.ingestion.load_bronze_increment(data_type, watermarks[data_type])
+                for data_type in WATERMARK_COLUMNS
+            }
+            customers_df, changed_customers, removed_customers = self._load_customer_changes()
+            pipeline_results['bronze_data'] = bronze_data
+            pipeline_results['ingestion_lag_seconds'] = self._measure_ingestion_lag(bronze_data)
+            self.pipeline_status['bronze_ingestion'] = True
+            
+            # Step 2: Clean new rows and fold them into the stored aggregates
+            logger.info("Step 2: Incremental Silver Transformation")
+            silver_increments = self._clean_increments(bronze_data)
+            
+            aggregates = self.incremental_store.load_aggregates(state)
+            sketches = self.incremental_store.load_sketches(state)
+            aggregates, sketches, touched = self.incremental_store.fold(aggregates, sketches, silver_increments)
+            
+            known_customers = set(customers_df['customer_pk'])
+            touched = (set(touched) | set(changed_customers)) & known_customers
+            
+            refreshed_profiles, refreshed, score_maxima = self._refresh_customer_profiles(
+                customers_df, aggregates, sketches, touched, removed_customers,
+                state.get('score_maxima')
+            )
+            
+            self.silver_transform.append_silver_data(silver_increments, self.execution_id)
+            if refreshed or removed_customers:
+                self.silver_transform.update_silver_rows('customer_profiles', refreshed_profiles,
+                                                         removed_customers, self.execution_id)
+            pipeline_results['silver_data'] = silver_increments
+            pipeline_results['touched_customers'] = sorted(touched)
+            self.pipeline_status['silver_transformation'] = True
+            
+            # Step 3: Recompute Gold rows of refreshed customers
+            logger.info("Step 3: Incremental Gold Aggregation")
+            if refreshed or removed_customers:
+                gold_data = self.gold_agg.refresh_customer_rows(refreshed_profiles, removed_customers,
+                                                                self.execution_id)
+            else:
+                logger.info("No customers touched, Gold layer unchanged")
+                gold_data = {}
+            pipeline_results['gold_data'] = gold_data
+            self.pipeline_status['gold_aggregation'] = True
+            
+            # Step 4: Publish the new watermarks and aggregates
+            watermarks = self.incremental_store.advance_watermarks(watermarks, silver_increments)
+            self.incremental_store.save_state(
+                aggregates, sketches, watermarks, self.execution_id,
+                metadata={
+                    'score_maxima': score_maxima,
+                    'profiles_mtime_ns': self._get_profiles_mtime_ns()
+                }
+            )
+            if self.source_fingerprints:
+                self.fingerprint_manifest.save({**self.fingerprint_manifest.load(), **self.source_fingerprints})
+            pipeline_results['watermarks'] = {
+                data_type: str(watermark) if watermark is not None else None
+                for data_type, watermark in watermarks.items()
+            }
+            
+            pipeline_results['statistics'] = self._generate_pipeline_statistics(
+                bronze_data, silver_increments, {
+                    data_type: df[df['customer_pk'].isin(refreshed)]
+                    for data_type, df in gold_data.items() if 'customer_pk' in df.columns
+                },
+                pipeline_results['start_time']
+            )
+            
+            self.pipeline_status['overall_success'] = True
+            logger.info(f"Incremental pipeline completed. Touched customers: {len(touched)}")
+            
+        except Exception as e:
+            logger.error(f"Incremental pipeline execution failed: {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
+            pipeline_results['errors'].append(str(e))
+        
+        pipeline_results['end_time'] = datetime.now()
+        pipeline_results['duration'] = (
+            pipeline_results['end_time'] - pipeline_results['start_time']
+        ).total_seconds()
+        
+        self._write_profile_report(pipeline_results)
+        self._log_pipeline_results(pipeline_results)
+        
+        return pipeline_results
+    
+    def _measure_ingestion_lag(self, bronze_data: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """
+        Measure how far newly ingested rows lag behind their event time.
+        
+        The lag of a row is the time between its watermark column and the
+        moment it was loaded. Against a streaming source this is the end-to-end
+        ingestion lag: file rolling, the run interval and the load itself.
+        
+        Args:
+            bronze_data: New Bronze rows per data type
+            
+        Returns:
+            Dict[str, Dict[str, float]]: Row count and mean, p95 and max lag in seconds per data type
+        """
+        loaded_at = pd.Timestamp(datetime.now())
+        lag = {}
+        
+        for data_type, df in bronze_data.items():
+            column = WATERMARK_COLUMNS.get(data_type)
+            if df.empty or column not in df.columns:
+                continue
+            
+            seconds = (loaded_at - pd.to_datetime(df[column], errors='coerce')).dt.total_seconds().dropna()
+            if seconds.empty:
+                continue
+            
+            lag[data_type] = {
+                'rows': int(len(seconds)),
+                'mean': round(float(seconds.mean()), 1),
+                'p95': round(float(seconds.quantile(0.95)), 1),
+                'max': round(float(seconds.max()), 1)
+            }
+            logger.info(f"Ingestion lag of {data_type}: mean {lag[data_type]['mean']}s, max {lag[data_type]['max']}s")
+        
+        return lag
+    
+    def _get_profiles_mtime_ns(self) -> Optional[int]:
+        """Get the modification time of the Silver customer profiles file."""
+        profiles_path = self.silver_transform.get_silver_table_path('customer_profiles')
+        return profiles_path.stat().st_mtime_ns if profiles_path.exists() else None
+    
+    def _load_incremental_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the incremental state if it still matches the Silver layer.
+        
+        A complete pipeline run rewrites the Silver profiles without updating
+        the incremental state, so a state whose recorded profiles file time no
+        longer matches is discarded and bootstrapped again.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Usable state descriptor, or None
+        """
+        state = self.incremental_store.load_state()
+        if state is None:
+            return None
+        
+        if state.get('profiles_mtime_ns') != self._get_profiles_mtime_ns():
+            logger.info("Silver profiles changed since the last incremental run, rebuilding incremental state")
+            return None
+        
+        return state
+    
+    def _bootstrap_incremental_state(self) -> Dict[str, Any]:
+        """
+        Build the incremental state from the current Silver layer tables.
+        
+        Returns:
+            Dict[str, Any]: The published state descriptor
+        """
+        logger.info("Bootstrapping incremental state from Silver layer data")
+        
+        silver_tables = {
+            data_type: self.silver_transform.load_silver_table(data_type)
+            for data_type in WATERMARK_COLUMNS
+        }
+        
+        aggregates, sketches, _ = self.incremental_store.fold(
+            self.incremental_store.load_aggregates(None),
+            self.incremental_store.load_sketches(None),
+            silver_tables
+        )
+        watermarks = self.incremental_store.advance_watermarks(
+            {data_type: None for data_type in WATERMARK_COLUMNS}, silver_tables
+        )
+        
+        customer_profiles = self.silver_transform.load_silver_table('customer_profiles')
+        return self.incremental_store.save_state(
+            aggregates, sketches, watermarks, f"{self.execution_id}_bootstrap",
+            metadata={
+                'score_maxima': self.silver_transform.get_health_score_maxima(customer_profiles),
+                'profiles_mtime_ns': self._get_profiles_mtime_ns()
+            }
+        )
+    
+    def _load_customer_changes(self) -> Tuple[pd.DataFrame, List[str], List[str]]:
+        """
+        Load customer records and detect which of them changed.
+        
+        The customer file has no watermark column, so it is re-cleaned only
+        when its fingerprint changed, and changed customers are found by
+        comparing the cleaned records with the stored Silver customers.
+        
+        Returns:
+            Tuple[pd.DataFrame, List[str], List[str]]: Cleaned customers,
+            changed or new customer ids, and removed customer ids
+        """
+        self.source_fingerprints = {}
+        stored_customers = self.silver_transform.load_silver_table('customers')
+        
+        source_files = {'customers': self.ingestion.get_source_files()['customers']}
+        partition_files = {'customers': self.ingestion.get_partition_files('customers')}
+        changed, fingerprints = self.fingerprint_manifest.detect_changes(source_files, partition_files)
+        if not changed and not stored_customers.empty:
+            return stored_customers, [], []
+        
+        bronze_customers = self.ingestion.load_bronze_data(['customers'])['customers']
+        if bronze_customers.empty:
+            logger.warning("No customer records loaded, keeping stored Silver customers")
+            return stored_customers, [], []
+        
+        customers_df = self.silver_transform.clean_customer_data(bronze_customers)
+        self.silver_transform._save_silver_data({'customers': customers_df})
+        self.source_fingerprints = fingerprints
+        
+        if stored_customers.empty:
+            return customers_df, customers_df['customer_pk'].tolist(), []
+        
+        # Compare records on their content, ignoring processing metadata
+        ignored_columns = ['data_last_processed_at', 'ingestion_timestamp', 'data_quality_score']
+        compare_columns = [
+            col for col in customers_df.columns
+            if col in stored_customers.columns and col not in ignored_columns
+        ]
+        new_hashes = pd.util.hash_pandas_object(customers_df[compare_columns].astype(str), index=False)
+        stored_hashes = pd.util.hash_pandas_object(stored_customers[compare_columns].astype(str), index=False)
+        
+        changed_customers = customers_df.loc[~new_hashes.isin(stored_hashes).to_numpy(), 'customer_pk'].tolist()
+        removed_customers = sorted(set(stored_customers['customer_pk']) - set(customers_df['customer_pk']))
+        
+        logger.info(f"Customer records changed: {len(changed_customers)}, removed: {len(removed_customers)}")
+        return customers_df, changed_customers, removed_customers
+    
+    def _clean_increments(self, bronze_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Clean new Bronze event rows with the Silver layer cleaning rules."""
+        cleaners = {
+            'transactions': self.silver_transform.clean_transaction_data,
+            'engagement': self.silver_transform.clean_engagement_data,
+            'support': self.silver_transform.clean_support_data,
+            'surveys': self.silver_transform.clean_survey_data
+        }
+        
+        return {
+            data_type: cleaners[data_type](df)
+            for data_type, df in bronze_data.items() if not df.empty
+        }
+    
+    def _refresh_customer_profiles(self, customers_df: pd.DataFrame, aggregates: pd.DataFrame,
+                                   sketches: pd.DataFrame, touched: set, removed_customers: List[str],
+                                   previous_maxima: Optional[Dict[str, float]]
+                                   ) -> Tuple[pd.DataFrame, List[str], Dict[str, float]]:
+        """
+        Recalculate Silver profiles of touched customers from the aggregates.
+        
+        Health scores are normalized by population maxima, which are taken
+        from the maxima columns of the stored profiles and the refreshed
+        metrics. When the touched customers move a maximum, the stored
+        profiles are rescored, and customers whose health score changed are
+        refreshed in Silver and Gold as well.
+        
+        Args:
+            customers_df: Cleaned customer records
+            aggregates: Updated per-customer aggregates
+            sketches: Updated distinct-count sketches
+            touched: Customers touched by new rows or changed records
+            removed_customers: Customers no longer in the customer file
+            previous_maxima: Health score maxima stored with the previous state
+            
+        Returns:
+            Tuple[pd.DataFrame, List[str], Dict[str, float]]: Profiles of the
+            refreshed customers, their ids, and the new maxima
+        """
+        replaced = touched | set(removed_customers)
+        stored_maxima_columns = self.silver_transform.load_silver_table(
+            'customer_profiles', columns=['customer_pk', 'engagement_score', 'total_lifetime_revenue']
+        )
+        untouched = stored_maxima_columns[~stored_maxima_columns['customer_pk'].isin(replaced)]
+        
+        touched_ids = sorted(touched)
+        metrics = self.incremental_store.build_metrics(
+            aggregates.reindex(touched_ids),
+            sketches[sketches['customer_pk'].isin(touched)]
+        )
+        
+        # Population maxima over untouched profiles and refreshed metrics
+        untouched_maxima = self.silver_transform.get_health_score_maxima(untouched)
+        touched_maxima = self.silver_transform.get_health_score_maxima(metrics)
+        score_maxima = {
+            column: max(untouched_maxima[column], touched_maxima[column]) for column in untouched_maxima
+        }
+        
+        profiles = [self.silver_transform.calculate_profiles_from_metrics(
+            customers_df[customers_df['customer_pk'].isin(touched)], metrics, score_maxima
+        )]
+        
+        refreshed = set(touched)
+        if previous_maxima != score_maxima and not untouched.empty:
+            logger.info("Health score maxima changed, rescoring stored profiles")
+            stored_profiles = self.silver_transform.load_silver_table('customer_profiles')
+            stored_profiles = stored_profiles[~stored_profiles['customer_pk'].isin(replaced)]
+            rescored = self.silver_transform.rescore_customer_profiles(stored_profiles, score_maxima)
+            changed_scores = rescored['current_health_score'].ne(stored_profiles['current_health_score'])
+            refreshed |= set(rescored.loc[changed_scores, 'customer_pk'])
+            profiles.append(rescored[changed_scores])
+        
+        profiles = [frame for frame in profiles if not frame.empty]
+        refreshed_profiles = pd.concat(profiles, ignore_index=True) if profiles else pd.DataFrame()
+        
+        return refreshed_profiles, sorted(refreshed), score_maxima
     
     def validate_pipeline_data(self) -> Dict[str, Any]:
         """
@@ -469,8 +1145,11 @@ def main():
     # Initialize pipeline orchestrator
     orchestrator = DataPipelineOrchestrator()
     
-    # Run complete pipeline
-    results = orchestrator.run_complete_pipeline()
+    # Run complete pipeline, or resume the execution given as --resume <execution_id>
+    if len(sys.argv) > 2 and sys.argv[1] == '--resume':
+        results = orchestrator.resume(sys.argv[2])
+    else:
+        results = orchestrator.run_complete_pipeline()
     
     # Print results
     print("\n" + "="*60)
@@ -0,0 +1,450 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Parquet Table Layout
+# This module writes Silver and Gold tables as partitioned parquet files and
+# reads them back with row groups pruned by filters and column statistics
+
+import os
+import json
+import shutil
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+from src.config.settings import settings
+
+# Configure logging for parquet layout
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Silver event tables are partitioned by the day of their event timestamp
+SILVER_DATE_PARTITIONS = {
+    'transactions': 'transaction_date',
+    'engagement': 'event_timestamp',
+    'support': 'created_at',
+    'surveys': 'response_date'
+}
+
+# Silver event tables are keyed by their Bronze event ids, so the increment of
+# a retried incremental run replaces the rows of the failed attempt
+SILVER_EVENT_KEYS = {
+    'transactions': 'transaction_id',
+    'engagement': 'event_id',
+    'support': 'ticket_id',
+    'surveys': 'survey_response_id'
+}
+
+# Gold customer tables are partitioned by risk level and client segment
+GOLD_PARTITIONS = {
+    'customer_360_dashboard_view': ['churn_risk_level', 'client_segment']
+}
+
+# Incremental runs write their rows next to a table instead of rewriting it,
+# one file per run in <table>_increments/date=<run date>/
+INCREMENT_DIR_SUFFIX = "_increments"
+
+# Schema metadata of keyed increment files: the key column whose rows replace
+# stored rows with the same key, and the keys of deleted rows
+INCREMENT_KEY_METADATA = 'aura_increment_key'
+INCREMENT_DELETED_KEYS_METADATA = 'aura_deleted_keys'
+
+def _normalize_filters(filters: Optional[List]) -> List[List[Tuple[str, str, Any]]]:
+    """Convert filters to disjunctive normal form (a list of AND-ed predicate lists)."""
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
+
+def _coerce_filters(filters: Optional[List], schema: pa.Schema) -> List[List[Tuple[str, str, Any]]]:
+    """Normalize filters and convert date values of timestamp columns to timestamps."""
+    def coerce(column: str, value: Any) -> Any:
+        if column in schema.names and pa.types.is_timestamp(schema.field(column).type):
+            if isinstance(value, (list, tuple, set)):
+                return [pd.Timestamp(item) for item in value]
+            return pd.Timestamp(value)
+        return value
+    
+    return [[(column, op, coerce(column, value)) for column, op, value in conjunction]
+            for conjunction in _normalize_filters(filters)]
+
+def _predicate_may_match(minimum: Any, maximum: Any, op: str, value: Any) -> bool:
+    """Check whether any value within [minimum, maximum] can satisfy a predicate."""
+    if op == 'in':
+        return any(minimum <= item <= maximum for item in value)
+    if op == 'not in':
+        return not (minimum == maximum and minimum in value)
+    
+    if op in ('=', '=='):
+        return minimum <= value <= maximum
+    if op == '!=':
+        return not (minimum == maximum == value)
+    if op == '<':
+        return minimum < value
+    if op == '<=':
+        return minimum <= value
+    if op == '>':
+        return maximum > value
+    if op == '>=':
+        return maximum >= value
+    
+    raise ValueError(f"Unsupported filter operator: {op}")
+
+def select_row_groups(parquet_file: pq.ParquetFile, filters: Optional[List]) -> List[int]:
+    """
+    Select the row groups of a parquet file that may contain rows matching filters.
+    
+    Row groups are pruned using the min/max statistics of the filtered columns,
+    which also works for dictionary-encoded (categorical) columns.
+    
+    Args:
+        parquet_file: Open parquet file
+        filters: Filters in the pandas/pyarrow format, e.g. [('churn_risk_level', 'in', ['High'])]
+    
+    Returns:
+        List[int]: Indices of the row groups to read
+    """
+    conjunctions = _coerce_filters(filters, parquet_file.schema_arrow)
+    metadata = parquet_file.metadata
+    if not conjunctions:
+        return list(range(metadata.num_row_groups))
+    
+    column_indices = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+    selected = []
+    for row_group in range(metadata.num_row_groups):
+        group = metadata.row_group(row_group)
+        
+        def may_match(predicate: Tuple[str, str, Any]) -> bool:
+            column, op, value = predicate
+            if column not in column_indices:
+                return True
+            statistics = group.column(column_indices[column]).statistics
+            if statistics is None or not statistics.has_min_max:
+                return True
+            try:
+                return _predicate_may_match(statistics.min, statistics.max, op, value)
+            except TypeError:
+                return True
+        
+        if any(all(may_match(predicate) for predicate in conjunction) for conjunction in conjunctions):
+            selected.append(row_group)
+    
+    return selected
+
+def get_increment_dir(file_path: Path) -> Path:
+    """Get the directory holding the increment files of a table."""
+    return file_path.with_name(f"{file_path.stem}{INCREMENT_DIR_SUFFIX}")
+
+def get_table_files(file_path: Path) -> List[Path]:
+    """
+    Get the files of a table: the table file followed by its increment files in write order.
+    
+    Args:
+        file_path: Parquet file path of the table
+    
+    Returns:
+        List[Path]: Existing files of the table
+    """
+    files = [file_path] if file_path.exists() else []
+    increment_dir = get_increment_dir(file_path)
+    if increment_dir.is_dir():
+        files.extend(sorted(increment_dir.glob("date=*/*.parquet")))
+    return files
+
+def get_table_fingerprint(file_path: Path) -> Optional[Tuple]:
+    """
+    Get the size, modification time and inode of every file of a table.
+    
+    Args:
+        file_path: Parquet file path of the table
+    
+    Returns:
+        Optional[Tuple]: Fingerprint that changes whenever a file is written, or None if the table does not exist
+    """
+    fingerprint = []
+    for path in get_table_files(file_path):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        fingerprint.append((str(path), stat.st_size, stat.st_mtime_ns, stat.st_ino))
+    return tuple(fingerprint) or None
+
+def _read_parquet_file(file_path: Path, columns: Optional[List[str]],
+                       filters: Optional[List]) -> pa.Table:
+    """Read the row groups and columns of a parquet file that match filters."""
+    parquet_file = pq.ParquetFile(file_path)
+    if not filters:
+        return parquet_file.read(columns=columns)
+    
+    filters = _coerce_filters(filters, parquet_file.schema_arrow)
+    filter_columns = [predicate[0] for conjunction in filters for predicate in conjunction]
+    read_columns = None
+    if columns is not None:
+        read_columns = list(columns) + [column for column in dict.fromkeys(filter_columns) if column not in columns]
+    
+    row_groups = select_row_groups(parquet_file, filters)
+    table = parquet_file.read_row_groups(row_groups, columns=read_columns)
+    table = table.filter(pq.filters_to_expression(filters))
+    if columns is not None:
+        table = table.select(list(columns))
+    
+    logger.debug(f"Read {len(row_groups)} of {parquet_file.metadata.num_row_groups} row groups from {file_path}")
+    return table
+
+def _read_table_files(files: List[Path], columns: Optional[List[str]],
+                      filters: Optional[List]) -> pd.DataFrame:
+    """
+    Read a table file together with its increment files.
+    
+    Rows of keyed increment files replace the rows with the same key in the
+    table file and earlier increments, and their deleted keys remove them.
+    Files are read newest first, so the keys of a newer file drop the older
+    rows whether or not the newer rows match the filters.
+    """
+    key_column = None
+    for path in files[1:]:
+        metadata = pq.read_schema(path).metadata or {}
+        if INCREMENT_KEY_METADATA.encode() in metadata:
+            key_column = metadata[INCREMENT_KEY_METADATA.encode()].decode()
+    
+    tables = []
+    replaced_keys: List[pa.Array] = []
+    for position, path in reversed(list(enumerate(files))):
+        schema = pq.read_schema(path)
+        if position == 0 or pq.read_metadata(path).num_rows > 0:
+            read_columns = None
+            if columns is not None:
+                wanted = list(columns) + ([key_column] if key_column else [])
+                read_columns = [column for column in dict.fromkeys(wanted) if column in schema.names]
+            
+            table = _read_parquet_file(path, read_columns, filters)
+            if replaced_keys and key_column in table.column_names:
+                value_set = pa.concat_arrays([keys.cast(table.schema.field(key_column).type) for keys in replaced_keys])
+                table = table.filter(pc.invert(pc.is_in(table[key_column], value_set=value_set)))
+            tables.append(table)
+        
+        if key_column is not None and position > 0:
+            if key_column in schema.names:
+                replaced_keys.append(pq.read_table(path, columns=[key_column]).column(key_column).combine_chunks())
+            metadata = schema.metadata or {}
+            deleted_keys = json.loads(metadata.get(INCREMENT_DELETED_KEYS_METADATA.encode(), b'[]'))
+            if deleted_keys:
+                replaced_keys.append(pa.array(deleted_keys))
+    
+    table = pa.concat_tables(tables[::-1], promote_options='permissive')
+    if columns is not None:
+        table = table.select([column for column in columns if column in table.column_names])
+    return table.to_pandas()
+
+def read_parquet_table(file_path: Path, columns: Optional[List[str]] = None,
+                       filters: Optional[List] = None) -> pd.DataFrame:
+    """
+    Read a parquet table, touching only the row groups and columns needed.
+    
+    Increment files written by incremental runs (see append_table_increment)
+    are read together with the table file.
+    
+    Args:
+        file_path: Parquet file path
+        columns: Columns to read (all columns if None)
+        filters: Row filters in the pandas/pyarrow format
+    
+    Returns:
+        pd.DataFrame: Rows matching the filters
+    """
+    files = get_table_files(file_path)
+    if len(files) > 1:
+        try:
+            return _read_table_files(files, columns, filters)
+        except FileNotFoundError:
+            # Increments were compacted while reading
+            files = get_table_files(file_path)
+            if len(files) > 1:
+                return _read_table_files(files, columns, filters)
+    
+    if not filters:
+        return pd.read_parquet(file_path, columns=columns)
+    
+    return _read_parquet_file(file_path, columns, filters).to_pandas()
+
+def _sort_partitions(df: pd.DataFrame, date_column: Optional[str],
+                     partition_columns: List[str]) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Sort rows into partition order and label every row with its partition."""
+    if date_column is not None:
+        df = df.sort_values(date_column, kind='stable', ignore_index=True)
+        keys = [pd.to_datetime(df[date_column]).dt.floor('D')]
+    else:
+        df = df.sort_values(partition_columns, kind='stable', ignore_index=True)
+        keys = [df[column] for column in partition_columns]
+    
+    labels = np.zeros(len(df), dtype=np.int64)
+    for key in keys:
+        codes = pd.factorize(key, use_na_sentinel=False)[0]
+        labels = labels * (int(codes.max(initial=0)) + 1) + codes
+    return df, labels
+
+def get_row_group_bounds(partition_labels: np.ndarray, row_group_size: int,
+                         pack_partitions: bool) -> List[Tuple[int, int]]:
+    """
+    Compute the row group bounds of partition-sorted rows.
+    
+    Partitions larger than the row group size are split. With pack_partitions,
+    consecutive small partitions (e.g. days) share a row group up to the row
+    group size; otherwise every row group holds a single partition.
+    
+    Args:
+        partition_labels: Partition label of every row, in row order
+        row_group_size: Maximum rows per row group
+        pack_partitions: Pack consecutive partitions into shared row groups
+    
+    Returns:
+        List[Tuple[int, int]]: (start, stop) row offsets of every row group
+    """
+    if len(partition_labels) == 0:
+        return []
+    
+    run_starts = np.flatnonzero(np.r_[True, partition_labels[1:] != partition_labels[:-1]])
+    run_stops = np.r_[run_starts[1:], len(partition_labels)]
+    
+    bounds = []
+    group_start = group_stop = 0
+    for run_start, run_stop in zip(run_starts, run_stops):
+        if group_stop > group_start and (not pack_partitions or run_stop - group_start > row_group_size):
+            bounds.append((group_start, group_stop))
+            group_start = group_stop
+        while run_stop - group_start > row_group_size:
+            bounds.append((group_start, group_start + row_group_size))
+            group_start += row_group_size
+        group_stop = run_stop
+    
+    if group_stop > group_start:
+        bounds.append((group_start, group_stop))
+    return bounds
+
+def write_partitioned_table(df: pd.DataFrame, file_path: Path, date_column: Optional[str] = None,
+                            partition_columns: Optional[List[str]] = None,
+                            row_group_size: Optional[int] = None,
+                            metadata: Optional[Dict[str, str]] = None) -> int:
+    """
+    Write a table as a parquet file whose row groups follow its partitions.
+    
+    Rows are sorted so that every row group covers one day (date_column) or
+    one combination of partition_columns, and column statistics are written,
+    so filtered reads only touch the matching row groups. The file is written
+    to a temporary path and then replaces file_path atomically; increment
+    files of the previous table are removed after it is replaced.
+    
+    Args:
+        df: Table to write
+        file_path: Parquet file path
+        date_column: Timestamp column partitioning rows by day
+        partition_columns: Columns partitioning rows by value
+        row_group_size: Maximum rows per row group (defaults to settings.parquet_row_group_size)
+        metadata: Extra schema metadata to store in the file
+    
+    Returns:
+        int: Number of row groups written
+    """
+    row_group_size = row_group_size or settings.parquet_row_group_size
+    partition_columns = [column for column in (partition_columns or []) if column in df.columns]
+    if date_column is not None and date_column not in df.columns:
+        date_column = None
+    
+    if date_column is not None or partition_columns:
+        df, partition_labels = _sort_partitions(df, date_column, partition_columns)
+        bounds = get_row_group_bounds(partition_labels, row_group_size, pack_partitions=date_column is not None)
+    else:
+        df = df.reset_index(drop=True)
+        bounds = [(start, min(start + row_group_size, len(df))) for start in range(0, len(df), row_group_size)]
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}), **{key.encode(): value.encode() for key, value in metadata.items()}
+        })
+    temp_path = file_path.with_name(f".{file_path.name}.tmp")
+    with pq.ParquetWriter(temp_path, table.schema, write_statistics=True) as writer:
+        for start, stop in bounds:
+            writer.write_table(table.slice(start, stop - start), row_group_size=stop - start)
+        if not bounds:
+            writer.write_table(table)
+    os.replace(temp_path, file_path)
+    remove_table_increments(file_path)
+    
+    return max(len(bounds), 1)
+
+def append_table_increment(df: pd.DataFrame, file_path: Path, date_column: Optional[str] = None,
+                           partition_columns: Optional[List[str]] = None,
+                           key_column: Optional[str] = None, deleted_keys: Optional[List[Any]] = None,
+                           run_id: Optional[str] = None) -> Optional[Path]:
+    """
+    Write the rows of an incremental run next to a table instead of rewriting it.
+    
+    The rows are written as one new file under the run date of the table's
+    increment directory, and read_parquet_table reads them together with the
+    table. Without key_column the rows are appended; with key_column they
+    replace the stored rows with the same key, and deleted_keys remove rows.
+    Once the table has more than settings.parquet_max_increment_files
+    increment files, the table and its increments are compacted into one file.
+    
+    Args:
+        df: Rows to append or replace
+        file_path: Parquet file path of the table
+        date_column: Timestamp column partitioning rows by day
+        partition_columns: Columns partitioning rows by value
+        key_column: Column identifying the rows replaced by the increment
+        deleted_keys: Keys of rows to remove (requires key_column)
+        run_id: Run identifier used in the increment file name
+    
+    Returns:
+        Optional[Path]: Written file, or None if there was nothing to write
+    """
+    deleted_keys = list(deleted_keys or [])
+    if not file_path.exists():
+        # The first write of a table is the table itself
+        if df.empty:
+            return None
+        write_partitioned_table(df, file_path, date_column=date_column, partition_columns=partition_columns)
+        return file_path
+    
+    if df.empty and not deleted_keys:
+        return None
+    
+    metadata = {}
+    if key_column is not None:
+        metadata[INCREMENT_KEY_METADATA] = key_column
+        if deleted_keys:
+            metadata[INCREMENT_DELETED_KEYS_METADATA] = json.dumps(deleted_keys)
+        if df.empty:
+            df = pd.DataFrame({key_column: pd.Series([], dtype=object)})
+    
+    run_time = datetime.now()
+    increment_path = (get_increment_dir(file_path) / f"date={run_time:%Y-%m-%d}" /
+                      f"{run_time:%Y%m%dT%H%M%S%f}_{run_id or 'increment'}.parquet")
+    increment_path.parent.mkdir(parents=True, exist_ok=True)
+    write_partitioned_table(df, increment_path, date_column=date_column,
+                            partition_columns=partition_columns, metadata=metadata)
+    
+    if len(get_table_files(file_path)) - 1 > settings.parquet_max_increment_files:
+        logger.info(f"Compacting increment files of {file_path}")
+        write_partitioned_table(read_parquet_table(file_path), file_path,
+                                date_column=date_column, partition_columns=partition_columns)
+        return file_path
+    
+    return increment_path
+
+def remove_table_increments(file_path: Path) -> None:
+    """Remove the increment files of a table."""
+    increment_dir = get_increment_dir(file_path)
+    if increment_dir.is_dir():
+        shutil.rmtree(increment_dir)
+
+def remove_table(file_path: Path) -> None:
+    """Remove a table file and its increment files."""
+    remove_table_increments(file_path)
+    if file_path.exists():
+        file_path.unlink()
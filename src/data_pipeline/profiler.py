@@ -0,0 +1,318 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline Profiler
+# This module records wall time, CPU time, peak memory and row counts of every
+# pipeline step and hot-path helper, and writes them to a JSON run report
+
+import sys
+import json
+import time
+import threading
+import functools
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any
+import logging
+from src.config.settings import settings
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Configure logging for pipeline profiling
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Method name prefixes of the hot-path helpers instrumented on Silver and Gold objects
+PROFILED_METHOD_PREFIXES = ('clean_', 'build_', 'create_', '_calculate_', '_generate_')
+
+# Dispatch methods that only forward to another instrumented helper
+UNPROFILED_METHODS = {'clean_data_type'}
+
+# Supported profiler captures and the file suffix of their output
+PROFILER_CAPTURES = {'cprofile': 'prof', 'pyinstrument': 'html'}
+
+def _count_rows(value: Any) -> Optional[int]:
+    """Count the rows of a DataFrame, or of the DataFrames in a dict or list."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        counts = [_count_rows(item) for item in value]
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+    
+    return None
+
+def _peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of the process in megabytes."""
+    if resource is None:
+        return None
+    
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / scale, 1)
+
+class PipelineProfiler:
+    """
+    Profiler for pipeline executions.
+    
+    Every profiled call records its wall time, the CPU time of the thread it
+    ran on, its input and output row counts and the process peak resident
+    set size when it finished. DAG nodes run concurrently, so memory is the
+    process-wide high-water mark; peak_rss_growth_mb shows how much a call
+    raised it. Records are written to logs/pipeline_profile_<execution_id>.json.
+    
+    When settings.pipeline_profiler names a capture ('cprofile' or
+    'pyinstrument'), every profiled DAG node also runs under that profiler
+    and the combined capture is written next to the report. Profilers follow
+    a single thread, so the pipeline runs its nodes on one worker while a
+    capture is enabled.
+    """
+    
+    def __init__(self, enabled: Optional[bool] = None, capture: Optional[str] = None):
+        """
+        Initialize the pipeline profiler.
+        
+        Args:
+            enabled: Record profiles (defaults to settings.pipeline_profiling_enabled)
+            capture: Profiler capture, 'cprofile' or 'pyinstrument' (defaults to settings.pipeline_profiler)
+        """
+        self.enabled = settings.pipeline_profiling_enabled if enabled is None else enabled
+        self.capture = (settings.pipeline_profiler if capture is None else capture) or None
+        if self.capture is not None and self.capture not in PROFILER_CAPTURES:
+            raise ValueError(f"Unknown profiler capture: {self.capture}. Must be one of {list(PROFILER_CAPTURES)}")
+        
+        self.execution_id: Optional[str] = None
+        self.records: List[Dict[str, Any]] = []
+        self._run_start = time.perf_counter()
+        self._run_cpu_start = time.process_time()
+        self._capture_profiler = None
+        self._lock = threading.Lock()
+    
+    def start_run(self, execution_id: str) -> None:
+        """
+        Start profiling a pipeline execution.
+        
+        Args:
+            execution_id: Pipeline execution id
+        """
+        self.execution_id = execution_id
+        self.records = []
+        self._run_start = time.perf_counter()
+        self._run_cpu_start = time.process_time()
+        self._capture_profiler = self._create_capture_profiler() if self.enabled else None
+    
+    def profile_call(self, name: str, category: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a function and record its profile.
+        
+        Args:
+            name: Name of the profiled step
+            category: Kind of step ('node' or 'helper')
+            func: Function to call with the remaining arguments
+        
+        Returns:
+            Any: Result of the function
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+        
+        record = {
+            'name': name,
+            'category': category,
+            'thread': threading.current_thread().name,
+            'start_offset_seconds': round(time.perf_counter() - self._run_start, 4),
+            'rows_in': _count_rows(list(args) + list(kwargs.values())),
+            'status': 'failed'
+        }
+        peak_before = _peak_rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        
+        try:
+            result = func(*args, **kwargs)
+            record['status'] = 'completed'
+            record['rows_out'] = _count_rows(result)
+            return result
+        finally:
+            record['wall_seconds'] = round(time.perf_counter() - wall_start, 4)
+            record['cpu_seconds'] = round(time.thread_time() - cpu_start, 4)
+            record['peak_rss_mb'] = _peak_rss_mb()
+            if peak_before is not None:
+                record['peak_rss_growth_mb'] = round(record['peak_rss_mb'] - peak_before, 1)
+            with self._lock:
+                self.records.append(record)
+    
+    def wrap_node(self, name: str, func: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Wrap a DAG node so its runs are profiled (and captured, if enabled).
+        
+        Args:
+            name: Node name
+            func: Node callable receiving its dependency results
+        
+        Returns:
+            Callable[[Dict[str, Any]], Any]: Profiled node callable
+        """
+        def profiled_node(inputs: Dict[str, Any]) -> Any:
+            if self._capture_profiler is None:
+                return self.profile_call(name, 'node', func, inputs)
+            
+            with self._lock:
+                self._start_capture()
+            try:
+                return self.profile_call(name, 'node', func, inputs)
+            finally:
+                with self._lock:
+                    self._stop_capture()
+        
+        return profiled_node
+    
+    def instrument(self, obj: Any, prefixes: tuple = PROFILED_METHOD_PREFIXES) -> None:
+        """
+        Profile the hot-path helper methods of an object.
+        
+        Matching methods are replaced by profiled wrappers on the instance,
+        so calls the object makes to its own helpers are recorded as well.
+        
+        Args:
+            obj: Object whose methods are instrumented (e.g. SilverTransform)
+            prefixes: Method name prefixes to instrument
+        """
+        class_name = type(obj).__name__
+        for method_name in dir(type(obj)):
+            if not method_name.startswith(prefixes) or method_name in UNPROFILED_METHODS:
+                continue
+            
+            method = getattr(obj, method_name)
+            if not callable(method):
+                continue
+            
+            setattr(obj, method_name, self._wrap_helper(f"{class_name}.{method_name}", method))
+    
+    def _wrap_helper(self, name: str, method: Callable) -> Callable:
+        """Wrap a bound method so its calls are profiled."""
+        @functools.wraps(method)
+        def profiled_method(*args, **kwargs):
+            return self.profile_call(name, 'helper', method, *args, **kwargs)
+        
+        return profiled_method
+    
+    def get_step_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize the recorded profiles per step.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Call count, total wall and CPU seconds,
+            total rows in/out and highest peak RSS keyed by step name
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            records = list(self.records)
+        
+        for record in records:
+            step = summary.setdefault(record['name'], {
+                'category': record['category'], 'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                'rows_in': 0, 'rows_out': 0, 'peak_rss_mb': None
+            })
+            step['calls'] += 1
+            step['wall_seconds'] = round(step['wall_seconds'] + record['wall_seconds'], 4)
+            step['cpu_seconds'] = round(step['cpu_seconds'] + record['cpu_seconds'], 4)
+            step['rows_in'] += record['rows_in'] or 0
+            step['rows_out'] += record.get('rows_out') or 0
+            if record['peak_rss_mb'] is not None:
+                step['peak_rss_mb'] = max(step['peak_rss_mb'] or 0.0, record['peak_rss_mb'])
+        
+        return summary
+    
+    def get_capture_path(self) -> Optional[Path]:
+        """Get the path of the profiler capture of the current run."""
+        if self.capture is None or self.execution_id is None:
+            return None
+        return settings.logs_path / f"pipeline_profile_{self.execution_id}.{PROFILER_CAPTURES[self.capture]}"
+    
+    def get_report_path(self) -> Path:
+        """Get the path of the JSON run report of the current run."""
+        return settings.logs_path / f"pipeline_profile_{self.execution_id}.json"
+    
+    def write_report(self, summary: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+        """
+        Write the JSON run report of the current run.
+        
+        Args:
+            summary: Additional run information included in the report
+        
+        Returns:
+            Optional[Path]: Report path, or None when profiling is disabled
+        """
+        if not self.enabled or self.execution_id is None:
+            return None
+        
+        capture_path = self._write_capture()
+        report = {
+            'execution_id': self.execution_id,
+            'written_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'wall_seconds': round(time.perf_counter() - self._run_start, 4),
+            'process_cpu_seconds': round(time.process_time() - self._run_cpu_start, 4),
+            'peak_rss_mb': _peak_rss_mb(),
+            'capture': str(capture_path) if capture_path else None,
+            'summary': summary or {},
+            'steps': sorted(self.records, key=lambda record: record['start_offset_seconds'])
+        }
+        
+        report_path = self.get_report_path()
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        
+        logger.info(f"Pipeline profile written to {report_path}")
+        return report_path
+    
+    def _create_capture_profiler(self) -> Any:
+        """Create the configured profiler capture, if it is available."""
+        if self.capture == 'cprofile':
+            import cProfile
+            return cProfile.Profile()
+        
+        if self.capture == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logger.warning("pyinstrument is not installed, skipping the profiler capture")
+                return None
+            return Profiler()
+        
+        return None
+    
+    def _start_capture(self) -> None:
+        """Resume the profiler capture on the current thread."""
+        if self.capture == 'cprofile':
+            self._capture_profiler.enable()
+        else:
+            self._capture_profiler.start()
+    
+    def _stop_capture(self) -> None:
+        """Pause the profiler capture; pyinstrument combines the sessions."""
+        if self.capture == 'cprofile':
+            self._capture_profiler.disable()
+        else:
+            self._capture_profiler.stop()
+    
+    def _write_capture(self) -> Optional[Path]:
+        """Write the profiler capture of the current run."""
+        if self._capture_profiler is None:
+            return None
+        
+        capture_path = self.get_capture_path()
+        capture_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.capture == 'cprofile':
+            self._capture_profiler.dump_stats(str(capture_path))
+        elif self._capture_profiler.last_session is not None:
+            capture_path.write_text(self._capture_profiler.output_html())
+        else:
+            return None
+        
+        return capture_path
@@ -0,0 +1,343 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Bronze Schema Registry
+# This module defines the typed schema of every Bronze layer source file,
+# including column data types, datetime formats, categorical columns and nullability
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from typing import Dict, List, Optional, Any
+import logging
+
+# Configure logging for the schema registry
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Datetime format used by all Bronze layer exports
+BRONZE_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Strings treated as missing values, matching the pandas CSV reader defaults
+# so that typed and untyped ingestion agree on null counts
+BRONZE_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Arrow types for each logical column type used in the registry
+ARROW_TYPES = {
+    'string': pa.string(),
+    'int': pa.int64(),
+    'float': pa.float64(),
+    'datetime': pa.timestamp('ns'),
+    'category': pa.dictionary(pa.int32(), pa.string())
+}
+
+# pandas CSV reader types for each logical column type, used by chunked reads
+# whose column types must not depend on the values in each chunk. Datetime and
+# categorical columns are read as text; the Silver layer parses and encodes them
+PANDAS_CSV_DTYPES = {
+    'string': str,
+    'int': 'Int64',
+    'float': 'float64',
+    'datetime': str,
+    'category': str
+}
+
+def _column(dtype: str, required: bool = False, nullable: bool = True,
+            datetime_format: Optional[str] = None) -> Dict[str, Any]:
+    """Build a column definition for the Bronze schema registry."""
+    if dtype == 'datetime' and datetime_format is None:
+        datetime_format = BRONZE_DATETIME_FORMAT
+    
+    return {
+        'dtype': dtype,
+        'required': required,
+        'nullable': nullable,
+        'datetime_format': datetime_format
+    }
+
+# Typed schemas for the Bronze layer files loaded by DataIngestion.load_bronze_data
+# Required columns must be present in the file header; non-nullable columns
+# must not contain missing values. Event sources name the datetime column that
+# incremental pipeline runs compare against their persisted watermark
+BRONZE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'customers': {
+        'file_name': 'raw_customer_demographics.csv',
+        'columns': {
+            'customer_id': _column('string', required=True, nullable=False),
+            'source_system_customer_id': _column('string'),
+            'first_name': _column('string', required=True),
+            'last_name': _column('string', required=True),
+            'email': _column('string', required=True),
+            'phone_number': _column('string'),
+            'age': _column('int'),
+            'gender': _column('category'),
+            'country': _column('category'),
+            'city': _column('category'),
+            'subscription_type': _column('category'),
+            'account_creation_date': _column('datetime', required=True),
+            'status': _column('category', required=True),
+            'source_system': _column('category'),
+            'ingestion_timestamp': _column('string'),
+            'raw_json_payload': _column('string')
+        }
+    },
+    'transactions': {
+        'file_name': 'raw_transactions.csv',
+        'watermark_column': 'transaction_date',
+        'columns': {
+            'transaction_id': _column('string', required=True, nullable=False),
+            'customer_id': _column('string', required=True, nullable=False),
+            'transaction_date': _column('datetime', required=True),
+            'amount': _column('float', required=True),
+            'currency': _column('category', required=True),
+            'payment_method': _column('category'),
+            'product_id': _column('string'),
+            'product_name': _column('category'),
+            'quantity': _column('int'),
+            'transaction_type': _column('category'),
+            'source_system': _column('category'),
+            'ingestion_timestamp': _column('string')
+        }
+    },
+    'engagement': {
+        'file_name': 'raw_engagement_logs.csv',
+        'watermark_column': 'event_timestamp',
+        'columns': {
+            'event_id': _column('string', required=True, nullable=False),
+            'customer_id': _column('string', required=True, nullable=False),
+            'session_id': _column('string'),
+            'event_type': _column('category', required=True),
+            'event_timestamp': _column('datetime', required=True),
+            'device_type': _column('category'),
+            'browser': _column('category'),
+            'operating_system': _column('category'),
+            'page_url': _column('category'),
+            'feature_used': _column('category'),
+            'event_data_json': _column('string'),
+            'source_system': _column('category'),
+            'ingestion_timestamp': _column('string')
+        }
+    },
+    'support': {
+        'file_name': 'raw_support_interactions.csv',
+        'watermark_column': 'created_at',
+        'columns': {
+            'ticket_id': _column('string', required=True, nullable=False),
+            'customer_id': _column('string', required=True, nullable=False),
+            'interaction_type': _column('category', required=True),
+            'issue_type': _column('category'),
+            'status': _column('category', required=True),
+            'created_at': _column('datetime', required=True),
+            'resolved_at': _column('datetime'),
+            'agent_id': _column('category'),
+            'satisfaction_score': _column('int'),
+            'transcript_text': _column('string'),
+            'source_system': _column('category'),
+            'ingestion_timestamp': _column('string')
+        }
+    },
+    'surveys': {
+        'file_name': 'raw_feedback_surveys.csv',
+        'watermark_column': 'response_date',
+        'columns': {
+            'survey_response_id': _column('string', required=True, nullable=False),
+            'customer_id': _column('string', required=True, nullable=False),
+            'response_date': _column('datetime', required=True),
+            'nps_score': _column('int', required=True),
+            'comments': _column('string'),
+            'question_id': _column('category'),
+            'question_text': _column('category'),
+            'response_text': _column('category'),
+            'survey_type': _column('category'),
+            'source_system': _column('category'),
+            'ingestion_timestamp': _column('string')
+        }
+    }
+}
+
+# File name keywords used to match files that do not use the standard Bronze names
+FILE_NAME_KEYWORDS = {
+    'customer': 'customers',
+    'transaction': 'transactions',
+    'engagement': 'engagement',
+    'support': 'support',
+    'survey': 'surveys'
+}
+
+class BronzeSchemaRegistry:
+    """
+    Registry of typed schemas for Bronze layer source files.
+    
+    This class gives ingestion a single place to look up how each Bronze file
+    should be parsed: the data type of every known column, the datetime format
+    of date columns, which low-cardinality text columns are categorical, which
+    columns are required and which may contain missing values. Parsing CSV
+    exports straight into typed columns means dates and amounts are converted
+    once at ingestion rather than again in every Silver cleaning step.
+    """
+    
+    def __init__(self, schemas: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Initialize the schema registry.
+        
+        Args:
+            schemas: Optional schema definitions (defaults to BRONZE_SCHEMAS)
+        """
+        self.schemas = schemas if schemas is not None else BRONZE_SCHEMAS
+    
+    def get_schema(self, file_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the schema for a Bronze file.
+        
+        Files are matched on their standard Bronze name first and then on the
+        same file name keywords used for required column validation, so renamed
+        exports such as uploaded files still pick up a schema.
+        
+        Args:
+            file_name: Name of the Bronze file
+        
+        Returns:
+            Optional[Dict[str, Any]]: Schema definition, or None for unknown files
+        """
+        for schema in self.schemas.values():
+            if schema['file_name'] == file_name:
+                return schema
+        
+        for keyword, data_type in FILE_NAME_KEYWORDS.items():
+            if keyword in file_name.lower() and data_type in self.schemas:
+                return self.schemas[data_type]
+        
+        return None
+    
+    def get_required_columns(self, file_name: str) -> List[str]:
+        """
+        Get the columns that must be present in a Bronze file.
+        
+        Args:
+            file_name: Name of the Bronze file
+        
+        Returns:
+            List[str]: Required column names (empty for unknown files)
+        """
+        schema = self.get_schema(file_name)
+        if schema is None:
+            return []
+        
+        return [name for name, column in schema['columns'].items() if column['required']]
+    
+    def get_watermark_column(self, file_name: str) -> Optional[str]:
+        """
+        Get the datetime column used as the incremental watermark of a Bronze file.
+        
+        Args:
+            file_name: Name of the Bronze file
+            
+        Returns:
+            Optional[str]: Watermark column name, or None if the file has none
+        """
+        schema = self.get_schema(file_name)
+        if schema is None:
+            return None
+        
+        return schema.get('watermark_column')
+    
+    def get_non_nullable_columns(self, file_name: str) -> List[str]:
+        """
+        Get the columns of a Bronze file that must not contain missing values.
+        
+        Args:
+            file_name: Name of the Bronze file
+        
+        Returns:
+            List[str]: Non-nullable column names (empty for unknown files)
+        """
+        schema = self.get_schema(file_name)
+        if schema is None:
+            return []
+        
+        return [name for name, column in schema['columns'].items() if not column['nullable']]
+    
+    def get_convert_options(self, file_name: str, header: List[str]) -> pa_csv.ConvertOptions:
+        """
+        Build Arrow CSV conversion options for a Bronze file.
+        
+        Columns known to the registry are parsed straight into their registered
+        types; columns that are not registered are left to Arrow type inference.
+        
+        Args:
+            file_name: Name of the Bronze file
+            header: Column names found in the file header
+        
+        Returns:
+            pa_csv.ConvertOptions: Conversion options for pyarrow.csv.read_csv
+        """
+        schema = self.get_schema(file_name)
+        columns = schema['columns'] if schema is not None else {}
+        
+        column_types = {
+            name: ARROW_TYPES[columns[name]['dtype']]
+            for name in header if name in columns
+        }
+        
+        # Registered datetime formats, with ISO-8601 as a fallback
+        timestamp_parsers = sorted({
+            column['datetime_format'] for column in columns.values()
+            if column['dtype'] == 'datetime'
+        })
+        timestamp_parsers.append(pa_csv.ISO8601)
+        
+        return pa_csv.ConvertOptions(
+            column_types=column_types,
+            timestamp_parsers=timestamp_parsers,
+            null_values=BRONZE_NULL_VALUES,
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True
+        )
+    
+    def get_csv_dtypes(self, file_name: str, header: List[str]) -> Dict[str, Any]:
+        """
+        Build fixed pandas CSV reader types for a Bronze file.
+        
+        Columns known to the registry are read as their registered types and
+        every other column is read as text, so chunked reads give each column
+        the same type in every chunk and never reformat values such as codes
+        with leading zeros.
+        
+        Args:
+            file_name: Name of the Bronze file
+            header: Column names found in the file header
+        
+        Returns:
+            Dict[str, Any]: dtype argument for pandas.read_csv
+        """
+        schema = self.get_schema(file_name)
+        columns = schema['columns'] if schema is not None else {}
+        
+        return {
+            name: PANDAS_CSV_DTYPES[columns[name]['dtype']] if name in columns else str
+            for name in header
+        }
+    
+    def find_nullability_violations(self, df: pd.DataFrame, file_name: str) -> Dict[str, int]:
+        """
+        Count missing values in columns registered as non-nullable.
+        
+        Args:
+            df: DataFrame loaded from the Bronze file
+            file_name: Name of the Bronze file
+        
+        Returns:
+            Dict[str, int]: Missing value counts for non-nullable columns that have any
+        """
+        violations = {}
+        
+        for column in self.get_non_nullable_columns(file_name):
+            if column in df.columns:
+                null_count = int(df[column].isnull().sum())
+                if null_count > 0:
+                    violations[column] = null_count
+        
+        return violations
+
+# Global schema registry instance
+schema_registry = BronzeSchemaRegistry()
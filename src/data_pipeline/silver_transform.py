@@ -6,15 +6,29 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import logging
 from src.config.settings import settings
 from src.config.constants import ChurnRiskThresholds, ClientSegments, TimePeriods
+from src.data_pipeline.customer_metrics import CustomerMetricsEngine
+from src.data_pipeline.parquet_layout import (
+    SILVER_DATE_PARTITIONS, SILVER_EVENT_KEYS, append_table_increment, read_parquet_table, write_partitioned_table
+)
+from src.data_pipeline.table_cache import table_cache
 
 # Configure logging for data transformation
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cleaning method of each Bronze data type, in processing order
+SILVER_CLEANERS = {
+    'customers': 'clean_customer_data',
+    'transactions': 'clean_transaction_data',
+    'engagement': 'clean_engagement_data',
+    'support': 'clean_support_data',
+    'surveys': 'clean_survey_data'
+}
+
 class SilverTransform:
     """
     Transforms Bronze layer data into Silver layer through cleaning and enrichment.
@@ -69,7 +83,9 @@ class SilverTransform:
             'M': 'Male', 'F': 'Female', 'm': 'Male', 'f': 'Female',
             'male': 'Male', 'female': 'Female', 'other': 'Other'
         }
-        df['gender_standardized'] = df['gender'].map(gender_mapping).fillna('Unknown')
+        df['gender_standardized'] = self._standardize_categorical(
+            df['gender'], lambda values: values.map(gender_mapping).fillna('Unknown'), missing_value='Unknown'
+        )
         
         # Create age groups
         df['age_group'] = pd.cut(
@@ -83,13 +99,17 @@ class SilverTransform:
         subscription_mapping = {
             'enterprise': 'Enterprise', 'premium': 'Premium', 'standard': 'Standard', 'basic': 'Basic'
         }
-        df['current_subscription_plan'] = df['subscription_type'].str.lower().map(subscription_mapping).fillna(df['subscription_type'])
+        df['current_subscription_plan'] = self._standardize_categorical(
+            df['subscription_type'], lambda values: values.str.lower().map(subscription_mapping).fillna(values)
+        )
         
         # Standardize account status
         status_mapping = {
             'active': 'Active', 'inactive': 'Inactive', 'churned': 'Churned', 'trial': 'Trial'
         }
-        df['account_status_standardized'] = df['status'].str.lower().map(status_mapping).fillna(df['status'])
+        df['account_status_standardized'] = self._standardize_categorical(
+            df['status'], lambda values: values.str.lower().map(status_mapping).fillna(values)
+        )
         
         # Convert date columns
         df['account_creation_date'] = pd.to_datetime(df['account_creation_date'], errors='coerce')
@@ -126,24 +146,30 @@ class SilverTransform:
         df['amount'] = df['amount'].fillna(0)
         
         # Standardize currency
-        df['currency'] = df['currency'].str.upper().fillna('USD')
+        df['currency'] = self._standardize_categorical(
+            df['currency'], lambda values: values.str.upper(), missing_value='USD'
+        )
         
         # Standardize payment methods
         payment_mapping = {
             'credit card': 'Credit Card', 'paypal': 'PayPal', 'bank transfer': 'Bank Transfer',
             'invoice': 'Invoice', 'cash': 'Cash'
         }
-        df['payment_method'] = df['payment_method'].str.lower().map(payment_mapping).fillna(df['payment_method'])
+        df['payment_method'] = self._standardize_categorical(
+            df['payment_method'], lambda values: values.str.lower().map(payment_mapping).fillna(values)
+        )
         
         # Standardize transaction types
         type_mapping = {
             'purchase': 'Purchase', 'subscription': 'Subscription Payment', 'refund': 'Refund',
             'upgrade': 'Upgrade', 'downgrade': 'Downgrade'
         }
-        df['transaction_type'] = df['transaction_type'].str.lower().map(type_mapping).fillna(df['transaction_type'])
+        df['transaction_type'] = self._standardize_categorical(
+            df['transaction_type'], lambda values: values.str.lower().map(type_mapping).fillna(values)
+        )
         
         # Clean product information
-        df['product_name'] = df['product_name'].str.strip()
+        df['product_name'] = self._standardize_categorical(df['product_name'], lambda values: values.str.strip())
         df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce').fillna(1)
         
         # Add data processing timestamp
@@ -179,20 +205,24 @@ class SilverTransform:
             'login': 'login', 'logout': 'logout', 'dashboard_view': 'dashboard_view',
             'report_generation': 'report_generation', 'api_call': 'api_call'
         }
-        df['event_type'] = df['event_type'].str.lower().map(event_type_mapping).fillna(df['event_type'])
+        df['event_type'] = self._standardize_categorical(
+            df['event_type'], lambda values: values.str.lower().map(event_type_mapping).fillna(values)
+        )
         
         # Standardize device types
         device_mapping = {
             'desktop': 'Desktop', 'mobile': 'Mobile', 'tablet': 'Tablet'
         }
-        df['device_type'] = df['device_type'].str.title().map(device_mapping).fillna(df['device_type'])
+        df['device_type'] = self._standardize_categorical(
+            df['device_type'], lambda values: values.str.title().map(device_mapping).fillna(values)
+        )
         
         # Clean browser information
-        df['browser'] = df['browser'].str.title()
-        df['operating_system'] = df['operating_system'].str.title()
+        df['browser'] = self._standardize_categorical(df['browser'], lambda values: values.str.title())
+        df['operating_system'] = self._standardize_categorical(df['operating_system'], lambda values: values.str.title())
         
         # Clean page URLs
-        df['page_url'] = df['page_url'].str.strip()
+        df['page_url'] = self._standardize_categorical(df['page_url'], lambda values: values.str.strip())
         
         # Add data processing timestamp
         df['data_last_processed_at'] = datetime.now()
@@ -226,7 +256,9 @@ class SilverTransform:
         interaction_mapping = {
             'chat': 'Chat', 'email': 'Email', 'call': 'Call', 'self-service': 'Self-service'
         }
-        df['interaction_type'] = df['interaction_type'].str.lower().map(interaction_mapping).fillna(df['interaction_type'])
+        df['interaction_type'] = self._standardize_categorical(
+            df['interaction_type'], lambda values: values.str.lower().map(interaction_mapping).fillna(values)
+        )
         
         # Standardize issue types
         issue_mapping = {
@@ -234,13 +266,17 @@ class SilverTransform:
             'billing inquiry': 'Billing Inquiry', 'technical support': 'Technical Support',
             'account issue': 'Account Issue'
         }
-        df['issue_type'] = df['issue_type'].str.lower().map(issue_mapping).fillna(df['issue_type'])
+        df['issue_type'] = self._standardize_categorical(
+            df['issue_type'], lambda values: values.str.lower().map(issue_mapping).fillna(values)
+        )
         
         # Standardize status values
         status_mapping = {
             'open': 'Open', 'in progress': 'In Progress', 'resolved': 'Resolved', 'closed': 'Closed'
         }
-        df['status'] = df['status'].str.lower().map(status_mapping).fillna(df['status'])
+        df['status'] = self._standardize_categorical(
+            df['status'], lambda values: values.str.lower().map(status_mapping).fillna(values)
+        )
         
         # Clean satisfaction scores
         df['satisfaction_score'] = pd.to_numeric(df['satisfaction_score'], errors='coerce')
@@ -285,12 +321,14 @@ class SilverTransform:
             'nps': 'NPS', 'product feedback': 'Product Feedback',
             'onboarding survey': 'Onboarding Survey', 'support satisfaction': 'Support Satisfaction'
         }
-        df['survey_type'] = df['survey_type'].str.lower().map(survey_mapping).fillna(df['survey_type'])
+        df['survey_type'] = self._standardize_categorical(
+            df['survey_type'], lambda values: values.str.lower().map(survey_mapping).fillna(values)
+        )
         
         # Clean comments and responses
         df['comments'] = df['comments'].str.strip()
-        df['response_text'] = df['response_text'].str.strip()
-        df['question_text'] = df['question_text'].str.strip()
+        df['response_text'] = self._standardize_categorical(df['response_text'], lambda values: values.str.strip())
+        df['question_text'] = self._standardize_categorical(df['question_text'], lambda values: values.str.strip())
         
         # Add data processing timestamp
         df['data_last_processed_at'] = datetime.now()
@@ -298,6 +336,57 @@ class SilverTransform:
         logger.info(f"Survey data cleaning completed. Records: {len(df)}")
         return df
     
+    def clean_data_type(self, data_type: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean Bronze data of one data type with its cleaning method.
+        
+        Args:
+            data_type: Bronze data type (a key of SILVER_CLEANERS)
+            df: Bronze data of that type
+            
+        Returns:
+            pd.DataFrame: Cleaned Silver data
+        """
+        return getattr(self, SILVER_CLEANERS[data_type])(df)
+    
+    def _standardize_categorical(self, series: pd.Series, standardize: Callable[[pd.Series], pd.Series],
+                                 missing_value: Optional[str] = None) -> pd.Series:
+        """
+        Standardize a low-cardinality string column on its distinct values.
+        
+        The column is converted to a categorical and the standardization is
+        applied once to its categories instead of to every row. Categories that
+        standardize to the same value are merged, and the result stays
+        categorical so it is written to Silver parquet dictionary-encoded.
+        
+        Args:
+            series: Column to standardize
+            standardize: Function mapping a Series of raw values to standardized values
+            missing_value: Value for missing entries (missing entries stay missing if None)
+            
+        Returns:
+            pd.Series: Categorical column with standardized values
+        """
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype('category')
+        
+        # Standardize the distinct values and map every old category to a new one
+        standardized = standardize(pd.Series(series.cat.categories, dtype=object))
+        if missing_value is not None:
+            standardized = standardized.fillna(missing_value)
+        category_codes, categories = pd.factorize(standardized, use_na_sentinel=True)
+        
+        if missing_value is not None and missing_value not in categories:
+            categories = categories.append(pd.Index([missing_value]))
+        missing_code = categories.get_loc(missing_value) if missing_value is not None else -1
+        
+        row_codes = series.cat.codes.to_numpy()
+        codes = np.where(row_codes >= 0, np.append(category_codes, -1)[row_codes], missing_code)
+        
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories), index=series.index, name=series.name
+        )
+    
     def calculate_derived_metrics(self, customers_df: pd.DataFrame, 
                                 transactions_df: pd.DataFrame,
                                 engagement_df: pd.DataFrame,
@@ -309,6 +398,8 @@ class SilverTransform:
         This method calculates comprehensive derived metrics that combine
         data from multiple sources to create enriched customer profiles.
         These metrics are essential for churn prediction and customer health scoring.
+        All sources are reduced in a single pass by CustomerMetricsEngine; a
+        source without data leaves its metric columns missing.
         
         Args:
             customers_df: Cleaned customer data
@@ -322,24 +413,28 @@ class SilverTransform:
         """
         logger.info("Calculating derived metrics for customer profiles")
         
-        # Start with customer base
-        customer_profiles = customers_df.copy()
+        # Aggregate every source over customer codes factorized once
+        metrics_engine = CustomerMetricsEngine(customers_df['customer_pk'])
+        metrics_engine.add_transaction_metrics(transactions_df)
+        metrics_engine.add_engagement_metrics(engagement_df)
+        metrics_engine.add_support_metrics(support_df)
+        metrics_engine.add_survey_metrics(surveys_df)
         
-        # Calculate transaction metrics
-        transaction_metrics = self._calculate_transaction_metrics(customers_df, transactions_df)
-        customer_profiles = customer_profiles.merge(transaction_metrics, on='customer_pk', how='left')
-        
-        # Calculate engagement metrics
-        engagement_metrics = self._calculate_engagement_metrics(customers_df, engagement_df)
-        customer_profiles = customer_profiles.merge(engagement_metrics, on='customer_pk', how='left')
-        
-        # Calculate support metrics
-        support_metrics = self._calculate_support_metrics(customers_df, support_df)
-        customer_profiles = customer_profiles.merge(support_metrics, on='customer_pk', how='left')
+        return self.build_customer_profiles(metrics_engine, customers_df)
+    
+    def build_customer_profiles(self, metrics_engine: CustomerMetricsEngine,
+                                customers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build customer profiles once every source has been added to a metrics engine.
         
-        # Calculate survey metrics
-        survey_metrics = self._calculate_survey_metrics(customers_df, surveys_df)
-        customer_profiles = customer_profiles.merge(survey_metrics, on='customer_pk', how='left')
+        Args:
+            metrics_engine: Metrics engine initialized with customers_df keys
+            customers_df: Cleaned customer data
+            
+        Returns:
+            pd.DataFrame: Customer profiles with derived metrics and health scores
+        """
+        customer_profiles = metrics_engine.build_profiles(customers_df)
         
         # Calculate composite health score
         customer_profiles = self._calculate_health_score(customer_profiles)
@@ -347,153 +442,57 @@ class SilverTransform:
         logger.info(f"Derived metrics calculation completed. Records: {len(customer_profiles)}")
         return customer_profiles
     
-    def _calculate_transaction_metrics(self, customers_df: pd.DataFrame, 
-                                     transactions_df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate transaction-based metrics for customers."""
-        logger.debug("Calculating transaction metrics")
-        
-        # Filter transactions for existing customers
-        valid_customers = set(customers_df['customer_pk'])
-        transactions_df = transactions_df[transactions_df['customer_id'].isin(valid_customers)]
-        
-        if transactions_df.empty:
-            return pd.DataFrame({'customer_pk': customers_df['customer_pk']})
-        
-        # Calculate transaction metrics
-        transaction_metrics = transactions_df.groupby('customer_id').agg({
-            'amount': ['sum', 'mean', 'count'],
-            'transaction_date': ['min', 'max']
-        }).round(2)
-        
-        # Flatten column names
-        transaction_metrics.columns = [
-            'total_lifetime_revenue', 'average_transaction_value', 'total_transactions_count',
-            'first_transaction_date', 'last_transaction_date'
-        ]
-        
-        # Calculate days since last transaction
-        transaction_metrics['days_since_last_transaction'] = (
-            datetime.now() - pd.to_datetime(transaction_metrics['last_transaction_date'])
-        ).dt.days
-        
-        # Reset index
-        transaction_metrics = transaction_metrics.reset_index()
-        transaction_metrics = transaction_metrics.rename(columns={'customer_id': 'customer_pk'})
-        
-        return transaction_metrics
-    
-    def _calculate_engagement_metrics(self, customers_df: pd.DataFrame, 
-                                     engagement_df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate engagement-based metrics for customers."""
-        logger.debug("Calculating engagement metrics")
-        
-        # Filter engagement events for existing customers
-        valid_customers = set(customers_df['customer_pk'])
-        engagement_df = engagement_df[engagement_df['customer_id'].isin(valid_customers)]
-        
-        if engagement_df.empty:
-            return pd.DataFrame({'customer_pk': customers_df['customer_pk']})
-        
-        # Calculate engagement metrics
-        engagement_metrics = engagement_df.groupby('customer_id').agg({
-            'event_timestamp': ['min', 'max', 'count'],
-            'event_type': 'nunique',
-            'session_id': 'nunique'
-        })
-        
-        # Flatten column names
-        engagement_metrics.columns = [
-            'first_engagement_date', 'last_engagement_date', 'total_engagement_events',
-            'unique_event_types', 'total_sessions'
-        ]
-        
-        # Calculate days since last engagement
-        engagement_metrics['days_since_last_engagement'] = (
-            datetime.now() - pd.to_datetime(engagement_metrics['last_engagement_date'])
-        ).dt.days
-        
-        # Calculate engagement score (events per month)
-        engagement_metrics['engagement_score'] = (
-            engagement_metrics['total_engagement_events'] / 
-            (engagement_metrics['days_since_last_engagement'] / 30 + 1)
-        ).round(3)
+    def calculate_profiles_from_metrics(self, customers_df: pd.DataFrame, metrics_df: pd.DataFrame,
+                                        score_maxima: Optional[Dict[str, float]] = None) -> pd.DataFrame:
+        """
+        Build customer profiles from precomputed per-customer metrics.
         
-        # Reset index
-        engagement_metrics = engagement_metrics.reset_index()
-        engagement_metrics = engagement_metrics.rename(columns={'customer_id': 'customer_pk'})
+        This is the incremental counterpart of calculate_derived_metrics: the
+        metrics come from stored aggregates rather than from the full event
+        tables, so only the customers being refreshed need to be passed in.
         
-        return engagement_metrics
-    
-    def _calculate_support_metrics(self, customers_df: pd.DataFrame, 
-                                 support_df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate support-based metrics for customers."""
-        logger.debug("Calculating support metrics")
-        
-        # Filter support tickets for existing customers
-        valid_customers = set(customers_df['customer_pk'])
-        support_df = support_df[support_df['customer_id'].isin(valid_customers)]
-        
-        if support_df.empty:
-            return pd.DataFrame({'customer_pk': customers_df['customer_pk']})
-        
-        # Calculate support metrics
-        support_metrics = support_df.groupby('customer_id').agg({
-            'ticket_id': 'count',
-            'satisfaction_score': 'mean',
-            'created_at': 'max'
-        }).round(2)
-        
-        # Flatten column names
-        support_metrics.columns = [
-            'total_support_tickets_lifetime', 'avg_satisfaction_score_lifetime', 'last_support_ticket_date'
-        ]
-        
-        # Calculate days since last support ticket
-        support_metrics['days_since_last_support_ticket'] = (
-            datetime.now() - pd.to_datetime(support_metrics['last_support_ticket_date'])
-        ).dt.days
-        
-        # Reset index
-        support_metrics = support_metrics.reset_index()
-        support_metrics = support_metrics.rename(columns={'customer_id': 'customer_pk'})
-        
-        return support_metrics
+        Args:
+            customers_df: Cleaned customer data for the customers to profile
+            metrics_df: Derived metrics with a customer_pk column
+            score_maxima: Population maxima used to normalize the health score
+            
+        Returns:
+            pd.DataFrame: Customer profiles with derived metrics and health scores
+        """
+        customer_profiles = customers_df.merge(metrics_df, on='customer_pk', how='left')
+        return self._calculate_health_score(customer_profiles, score_maxima)
     
-    def _calculate_survey_metrics(self, customers_df: pd.DataFrame, 
-                                surveys_df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate survey-based metrics for customers."""
-        logger.debug("Calculating survey metrics")
-        
-        # Filter surveys for existing customers
-        valid_customers = set(customers_df['customer_pk'])
-        surveys_df = surveys_df[surveys_df['customer_id'].isin(valid_customers)]
-        
-        if surveys_df.empty:
-            return pd.DataFrame({'customer_pk': customers_df['customer_pk']})
-        
-        # Calculate survey metrics
-        survey_metrics = surveys_df.groupby('customer_id').agg({
-            'nps_score': ['mean', 'max'],
-            'response_date': 'max'
-        }).round(2)
-        
-        # Flatten column names
-        survey_metrics.columns = [
-            'avg_nps_score_lifetime', 'most_recent_nps_score', 'last_survey_response_date'
-        ]
-        
-        # Calculate days since last survey
-        survey_metrics['days_since_last_survey'] = (
-            datetime.now() - pd.to_datetime(survey_metrics['last_survey_response_date'])
-        ).dt.days
+    def rescore_customer_profiles(self, customer_profiles: pd.DataFrame,
+                                  score_maxima: Dict[str, float]) -> pd.DataFrame:
+        """
+        Recalculate health scores of existing profiles against new population maxima.
         
-        # Reset index
-        survey_metrics = survey_metrics.reset_index()
-        survey_metrics = survey_metrics.rename(columns={'customer_id': 'customer_pk'})
+        Args:
+            customer_profiles: Customer profiles with derived metrics
+            score_maxima: Population maxima used to normalize the health score
+            
+        Returns:
+            pd.DataFrame: Customer profiles with updated health scores
+        """
+        return self._calculate_health_score(customer_profiles.copy(), score_maxima)
+    
+    def get_health_score_maxima(self, customer_profiles: pd.DataFrame) -> Dict[str, float]:
+        """
+        Get the population maxima used to normalize health score components.
         
-        return survey_metrics
+        Args:
+            customer_profiles: Customer profiles with derived metrics
+            
+        Returns:
+            Dict[str, float]: Maximum engagement score and lifetime revenue
+        """
+        return {
+            column: float(customer_profiles[column].fillna(0).max()) if column in customer_profiles.columns else 0.0
+            for column in ['engagement_score', 'total_lifetime_revenue']
+        }
     
-    def _calculate_health_score(self, customer_profiles: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_health_score(self, customer_profiles: pd.DataFrame,
+                                score_maxima: Optional[Dict[str, float]] = None) -> pd.DataFrame:
         """
         Calculate composite health score for customers.
         
@@ -503,6 +502,8 @@ class SilverTransform:
         
         Args:
             customer_profiles: Customer profiles with derived metrics
+            score_maxima: Population maxima for normalization when scoring a
+                subset of customers (defaults to the maxima of customer_profiles)
             
         Returns:
             pd.DataFrame: Customer profiles with health scores
@@ -516,8 +517,11 @@ class SilverTransform:
         customer_profiles['most_recent_nps_score'] = customer_profiles['most_recent_nps_score'].fillna(0)
         
         # Normalize metrics to 0-1 scale
-        engagement_normalized = customer_profiles['engagement_score'] / customer_profiles['engagement_score'].max()
-        revenue_normalized = customer_profiles['total_lifetime_revenue'] / customer_profiles['total_lifetime_revenue'].max()
+        if score_maxima is None:
+            score_maxima = self.get_health_score_maxima(customer_profiles)
+        
+        engagement_normalized = customer_profiles['engagement_score'] / score_maxima['engagement_score']
+        revenue_normalized = customer_profiles['total_lifetime_revenue'] / score_maxima['total_lifetime_revenue']
         support_normalized = customer_profiles['avg_satisfaction_score_lifetime'] / 5.0  # 5-point scale
         nps_normalized = customer_profiles['most_recent_nps_score'] / 10.0  # 10-point scale
         
@@ -542,16 +546,21 @@ class SilverTransform:
         logger.debug("Health score calculation completed")
         return customer_profiles
     
-    def transform_bronze_to_silver(self, bronze_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    def transform_bronze_to_silver(self, bronze_data: Dict[str, pd.DataFrame],
+                                   reuse_data_types: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
         """
         Transform all Bronze layer data to Silver layer.
         
         This method orchestrates the complete transformation of Bronze layer data
         into Silver layer format. It applies cleaning, standardization, and
         enrichment to create a consistent, high-quality dataset for analysis.
+        Data types listed in reuse_data_types are not cleaned again; their
+        previously written Silver parquet is loaded instead, and customer
+        profiles are recalculated from the combined data.
         
         Args:
             bronze_data: Dictionary of Bronze layer DataFrames
+            reuse_data_types: Data types whose existing Silver data is reused
             
         Returns:
             Dict[str, pd.DataFrame]: Dictionary of Silver layer DataFrames
@@ -559,22 +568,19 @@ class SilverTransform:
         logger.info("Starting Bronze to Silver transformation")
         
         silver_data = {}
+        reuse_data_types = reuse_data_types or []
         
-        # Clean individual datasets
-        if 'customers' in bronze_data and not bronze_data['customers'].empty:
-            silver_data['customers'] = self.clean_customer_data(bronze_data['customers'])
-        
-        if 'transactions' in bronze_data and not bronze_data['transactions'].empty:
-            silver_data['transactions'] = self.clean_transaction_data(bronze_data['transactions'])
-        
-        if 'engagement' in bronze_data and not bronze_data['engagement'].empty:
-            silver_data['engagement'] = self.clean_engagement_data(bronze_data['engagement'])
-        
-        if 'support' in bronze_data and not bronze_data['support'].empty:
-            silver_data['support'] = self.clean_support_data(bronze_data['support'])
+        # Reuse Silver data for unchanged sources
+        for data_type in reuse_data_types:
+            df = self.load_silver_table(data_type)
+            if not df.empty:
+                silver_data[data_type] = df
+                logger.info(f"Reused Silver {data_type} data: {len(df)} records")
         
-        if 'surveys' in bronze_data and not bronze_data['surveys'].empty:
-            silver_data['surveys'] = self.clean_survey_data(bronze_data['surveys'])
+        # Clean individual datasets
+        for data_type in SILVER_CLEANERS:
+            if data_type in bronze_data and not bronze_data[data_type].empty:
+                silver_data[data_type] = self.clean_data_type(data_type, bronze_data[data_type])
         
         # Calculate derived metrics and create enriched customer profiles
         if 'customers' in silver_data:
@@ -587,20 +593,95 @@ class SilverTransform:
             )
             silver_data['customer_profiles'] = customer_profiles
         
-        # Save Silver layer data
-        self._save_silver_data(silver_data)
+        # Save Silver layer data (reused data is already on disk)
+        self._save_silver_data({
+            data_type: df for data_type, df in silver_data.items() if data_type not in reuse_data_types
+        })
         
         logger.info("Bronze to Silver transformation completed")
         return silver_data
     
+    def get_silver_table_path(self, data_type: str) -> Path:
+        """Get the parquet file path of a Silver layer data type."""
+        return self.silver_path / f"silver_{data_type}.parquet"
+    
+    def load_silver_table(self, data_type: str, columns: Optional[List[str]] = None,
+                          filters: Optional[List] = None) -> pd.DataFrame:
+        """
+        Load a previously written Silver layer data type.
+        
+        Event tables are stored with row groups following event days, so date
+        filters only read the row groups of the matching days. Rows written by
+        incremental runs are read from the increment files.
+        
+        Args:
+            data_type: Silver data type (e.g. 'customers')
+            columns: Columns to read (all columns if None)
+            filters: Row filters in the pandas/pyarrow format, e.g. [('transaction_date', '>=', start)]
+            
+        Returns:
+            pd.DataFrame: Silver data, or an empty DataFrame if it was never written
+        """
+        file_path = self.get_silver_table_path(data_type)
+        if not file_path.exists():
+            logger.warning(f"Silver file not found: {file_path}")
+            return pd.DataFrame()
+        
+        return read_parquet_table(file_path, columns=columns, filters=filters)
+    
+    def append_silver_data(self, silver_increments: Dict[str, pd.DataFrame], run_id: Optional[str] = None) -> None:
+        """
+        Append cleaned rows to the stored Silver layer data.
+        
+        The rows of each data type are written as a new increment file next
+        to the stored table, so the stored rows are not read or rewritten.
+        Event rows are keyed by their event id and replace stored rows with
+        the same id, so retrying a failed run does not duplicate them.
+        
+        Args:
+            silver_increments: Cleaned rows keyed by data type
+            run_id: Run identifier used in the increment file names
+        """
+        for data_type, df in silver_increments.items():
+            if df.empty:
+                continue
+            
+            file_path = self.get_silver_table_path(data_type)
+            increment_path = append_table_increment(df, file_path, date_column=SILVER_DATE_PARTITIONS.get(data_type),
+                                                    key_column=SILVER_EVENT_KEYS.get(data_type), run_id=run_id)
+            table_cache.invalidate(file_path)
+            logger.info(f"Appended {len(df)} {data_type} records to {increment_path}")
+    
+    def update_silver_rows(self, data_type: str, rows: pd.DataFrame,
+                           removed_customer_pks: Optional[List[str]] = None,
+                           run_id: Optional[str] = None) -> None:
+        """
+        Replace stored Silver rows of a customer-level data type.
+        
+        The rows are written as an increment file that replaces the stored
+        rows of the same customers, so unchanged customers are not rewritten.
+        
+        Args:
+            data_type: Silver data type keyed by customer_pk (e.g. 'customer_profiles')
+            rows: New rows of the changed customers
+            removed_customer_pks: Customers whose rows are removed
+            run_id: Run identifier used in the increment file name
+        """
+        file_path = self.get_silver_table_path(data_type)
+        append_table_increment(rows, file_path, key_column='customer_pk',
+                               deleted_keys=removed_customer_pks, run_id=run_id)
+        table_cache.invalidate(file_path)
+        logger.info(f"Updated {len(rows)} and removed {len(removed_customer_pks or [])} {data_type} records")
+    
     def _save_silver_data(self, silver_data: Dict[str, pd.DataFrame]) -> None:
-        """Save Silver layer data to parquet files."""
+        """Save Silver layer data to parquet files, event tables partitioned by day."""
         logger.info("Saving Silver layer data")
         
         for data_type, df in silver_data.items():
             if not df.empty:
-                file_path = self.silver_path / f"silver_{data_type}.parquet"
-                df.to_parquet(file_path, index=False)
+                file_path = self.get_silver_table_path(data_type)
+                write_partitioned_table(df, file_path, date_column=SILVER_DATE_PARTITIONS.get(data_type))
+                table_cache.invalidate(file_path)
                 logger.info(f"Saved {data_type} data: {len(df)} records to {file_path}")
 
 def main():
@@ -0,0 +1,140 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Gold/Silver Table Cache
+# This module keeps recently read Gold and Silver tables in process memory,
+# shared by the Streamlit and Gradio apps and batch scripts alike
+
+import pandas as pd
+from pathlib import Path
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+from src.config.settings import settings
+from src.data_pipeline.parquet_layout import get_table_fingerprint, read_parquet_table
+
+# Configure logging for the table cache
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class TableCache:
+    """
+    Process-level cache of Gold and Silver parquet tables.
+    
+    Tables are cached per file, column list and filters. Each entry records
+    the fingerprint (size, modification time and inode) of the table file and
+    its increment files; pipeline runs replace table files atomically and add
+    new increment files, so a published run changes the fingerprint and the
+    next read reloads the table instead of serving stale data. Entries are evicted least recently
+    used first once their total memory exceeds the configured cap.
+    
+    Cached DataFrames are shared between callers; each call returns a
+    shallow copy, so adding or replacing columns does not affect the cache,
+    but values must not be modified in place.
+    """
+    
+    def __init__(self, max_memory_mb: Optional[float] = None):
+        """
+        Initialize the table cache.
+        
+        Args:
+            max_memory_mb: Memory cap of the cached tables (defaults to settings.table_cache_max_memory_mb)
+        """
+        self.max_memory_mb = max_memory_mb if max_memory_mb is not None else settings.table_cache_max_memory_mb
+        
+        self._cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+    
+    def load_table(self, file_path: Path, columns: Optional[List[str]] = None,
+                   filters: Optional[List] = None) -> pd.DataFrame:
+        """
+        Load a parquet table through the cache.
+        
+        Args:
+            file_path: Parquet file path
+            columns: Columns to read (all columns if None)
+            filters: Row filters in the pandas/pyarrow format
+        
+        Returns:
+            pd.DataFrame: Table data, or an empty DataFrame if the file does not exist
+        """
+        path_key = str(Path(file_path).resolve())
+        key = (path_key, tuple(columns) if columns is not None else None, repr(filters) if filters else None)
+        
+        fingerprint = get_table_fingerprint(Path(file_path))
+        if fingerprint is None:
+            self.invalidate(file_path)
+            return pd.DataFrame()
+        
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry['fingerprint'] == fingerprint:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return entry['data'].copy(deep=False)
+            self._misses += 1
+        
+        df = read_parquet_table(file_path, columns=columns, filters=filters)
+        memory_bytes = int(df.memory_usage(index=True, deep=True).sum())
+        
+        with self._lock:
+            self._remove(key)
+            if memory_bytes <= self.max_memory_mb * 1024 * 1024:
+                self._cache[key] = {'data': df, 'fingerprint': fingerprint, 'memory_bytes': memory_bytes}
+                self._memory_bytes += memory_bytes
+                self._evict()
+        
+        return df.copy(deep=False)
+    
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """
+        Drop cached tables.
+        
+        Args:
+            file_path: Only drop the tables read from this file (all tables if None)
+        """
+        with self._lock:
+            if file_path is None:
+                self._cache.clear()
+                self._memory_bytes = 0
+                return
+            
+            path_key = str(Path(file_path).resolve())
+            for key in [key for key in self._cache if key[0] == path_key]:
+                self._remove(key)
+    
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Cache hits, misses, evictions, cached tables and memory use
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'cached_tables': len(self._cache),
+                'memory_mb': round(self._memory_bytes / (1024 * 1024), 2),
+                'max_memory_mb': self.max_memory_mb
+            }
+    
+    def _remove(self, key: Tuple) -> None:
+        """Remove one entry, if cached."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry['memory_bytes']
+    
+    def _evict(self) -> None:
+        """Evict least recently used entries until the cache fits its memory cap."""
+        while self._cache and self._memory_bytes > self.max_memory_mb * 1024 * 1024:
+            key, entry = self._cache.popitem(last=False)
+            self._memory_bytes -= entry['memory_bytes']
+            self._evictions += 1
+            logger.info(f"Evicted cached table {key[0]} ({entry['memory_bytes'] / (1024 * 1024):.1f} MB)")
+
+# Process-wide table cache shared by the dashboards, the Gradio app and batch scripts
+table_cache = TableCache()
@@ -0,0 +1,156 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Windowed Feature Engine
+# This module computes per-customer transaction, engagement and support features
+# over trailing time windows (30/60/90 days by default) from Silver event tables
+
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import logging
+from src.config.settings import settings
+from src.data_pipeline.customer_metrics import map_customer_codes
+
+# Configure logging for windowed features
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Timestamp column and Silver columns needed by each windowed source
+WINDOW_SOURCES = {
+    'transactions': {'timestamp': 'transaction_date', 'columns': ['customer_id', 'transaction_date', 'amount']},
+    'engagement': {'timestamp': 'event_timestamp', 'columns': ['customer_id', 'event_timestamp']},
+    'support': {'timestamp': 'created_at', 'columns': ['customer_id', 'created_at']}
+}
+
+class WindowFeatureEngine:
+    """
+    Trailing-window feature engine for AI model features.
+    
+    All windows end at the same snapshot time, so they are nested and every
+    event belongs to a contiguous run of them. Each event is assigned to a
+    time band with one searchsorted call against the window start times, one
+    bincount over (customer, band) accumulates the per-band totals, and a
+    cumulative sum across bands turns them into per-window totals. Any number
+    of windows is therefore computed in a single vectorized pass over the
+    events, without sorting the event tables.
+    """
+    
+    def __init__(self, window_days: Optional[List[int]] = None, snapshot_time: Optional[datetime] = None):
+        """
+        Initialize the windowed feature engine.
+        
+        Args:
+            window_days: Window lengths in days (defaults to settings.feature_window_days)
+            snapshot_time: End of every window (defaults to datetime.now())
+        """
+        self.window_days = sorted(set(window_days or settings.feature_window_days))
+        if not self.window_days or min(self.window_days) <= 0:
+            raise ValueError(f"Window lengths must be positive days: {self.window_days}")
+        
+        self.snapshot_time = pd.Timestamp(snapshot_time or datetime.now())
+    
+    def get_earliest_window_start(self) -> pd.Timestamp:
+        """Get the start of the longest window, before which events are not needed."""
+        return self.snapshot_time - timedelta(days=max(self.window_days))
+    
+    def compute_features(self, customer_pks: pd.Series, transactions_df: pd.DataFrame,
+                         engagement_df: pd.DataFrame, support_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute windowed features for a set of customers.
+        
+        For every window length w the result has the columns
+        feature_total_transaction_value_{w}d, feature_transaction_count_{w}d,
+        feature_avg_daily_active_events_{w}d and feature_support_tickets_{w}d_count.
+        Customers without events in a window get zero.
+        
+        Args:
+            customer_pks: Customer keys, one per output row
+            transactions_df: Silver transactions (customer_id, transaction_date, amount)
+            engagement_df: Silver engagement events (customer_id, event_timestamp)
+            support_df: Silver support tickets (customer_id, created_at)
+        
+        Returns:
+            pd.DataFrame: Windowed features with the index of customer_pks
+        """
+        row_codes, customer_index = pd.factorize(customer_pks, use_na_sentinel=True)
+        customer_index = pd.Index(customer_index)
+        
+        transaction_counts, transaction_values = self._window_totals(
+            customer_index, transactions_df, 'transactions', 'amount'
+        )
+        engagement_counts, _ = self._window_totals(customer_index, engagement_df, 'engagement')
+        support_counts, _ = self._window_totals(customer_index, support_df, 'support')
+        
+        # Spread per-customer totals back to rows; rows without a key get zeros
+        missing_rows = row_codes < 0
+        row_totals = {}
+        for name, totals in [('transaction_values', transaction_values), ('transaction_counts', transaction_counts),
+                             ('engagement_counts', engagement_counts), ('support_counts', support_counts)]:
+            row_totals[name] = totals[row_codes]
+            row_totals[name][missing_rows] = 0
+        
+        features = {}
+        for i, days in enumerate(self.window_days):
+            features[f'feature_total_transaction_value_{days}d'] = row_totals['transaction_values'][:, i].round(2)
+            features[f'feature_transaction_count_{days}d'] = row_totals['transaction_counts'][:, i].astype(np.int64)
+            features[f'feature_avg_daily_active_events_{days}d'] = (row_totals['engagement_counts'][:, i] / days).round(3)
+            features[f'feature_support_tickets_{days}d_count'] = row_totals['support_counts'][:, i].astype(np.int64)
+        
+        return pd.DataFrame(features, index=customer_pks.index)
+    
+    def _window_totals(self, customer_index: pd.Index, events_df: pd.DataFrame, data_type: str,
+                       value_column: Optional[str] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Count events (and total a value column) per customer for every window.
+        
+        Args:
+            customer_index: Index of unique customer keys
+            events_df: Silver event rows of one source
+            data_type: Source name in WINDOW_SOURCES
+            value_column: Column to total alongside the counts, if any
+        
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray]]: Event counts and value
+            totals (None without value_column), each of shape (customers,
+            windows) in window_days order
+        """
+        n_customers, n_windows = len(customer_index), len(self.window_days)
+        timestamp_column = WINDOW_SOURCES[data_type]['timestamp']
+        
+        if events_df is None or events_df.empty or timestamp_column not in events_df.columns:
+            empty = np.zeros((n_customers, n_windows))
+            return empty, (empty.copy() if value_column is not None else None)
+        
+        timestamps = events_df[timestamp_column]
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, errors='coerce')
+        timestamps = timestamps.to_numpy()
+        
+        # Window starts from the longest to the shortest window; an event in band b
+        # (0 = before every window) lies in the b longest windows
+        window_starts = np.array(
+            [(self.snapshot_time - timedelta(days=days)).to_datetime64() for days in reversed(self.window_days)]
+        ).astype(timestamps.dtype)
+        bands = np.searchsorted(window_starts, timestamps, side='right')
+        
+        codes = map_customer_codes(customer_index, events_df['customer_id'])
+        in_window = (codes >= 0) & (bands > 0) & (timestamps <= self.snapshot_time.to_datetime64())
+        
+        keys = codes[in_window].astype(np.int64) * (n_windows + 1) + bands[in_window]
+        counts = self._accumulate_windows(keys, None, n_customers)
+        
+        totals = None
+        if value_column is not None:
+            values = pd.to_numeric(events_df[value_column], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            totals = self._accumulate_windows(keys, np.nan_to_num(values[in_window]), n_customers)
+        
+        return counts, totals
+    
+    def _accumulate_windows(self, keys: np.ndarray, weights: Optional[np.ndarray], n_customers: int) -> np.ndarray:
+        """Sum weights per (customer, band) key and accumulate the bands into windows."""
+        n_windows = len(self.window_days)
+        band_totals = np.bincount(keys, weights=weights, minlength=n_customers * (n_windows + 1))
+        band_totals = band_totals.reshape(n_customers, n_windows + 1)[:, 1:]
+        
+        # The longest window holds every band, the shortest only the last one
+        window_totals = np.cumsum(band_totals[:, ::-1], axis=1)
+        return window_totals.astype(float)
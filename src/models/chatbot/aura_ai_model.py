@@ -12,6 +12,35 @@ import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Model input position of each customer attribute (simplified mapping)
+FEATURE_MAPPING = {
+    'age': 0, 'monthly_revenue': 1, 'total_revenue': 2, 'engagement_score': 3,
+    'health_score': 4, 'days_since_last_login': 5, 'support_tickets_count': 6,
+    'nps_score': 7, 'satisfaction_score': 8, 'feature_usage_count': 9,
+    'session_duration_avg': 10, 'page_views_count': 11, 'bounce_rate': 12,
+    'conversion_rate': 13, 'retention_rate': 14, 'lifetime_value': 15,
+    'acquisition_cost': 16, 'revenue_growth_rate': 17, 'engagement_trend': 18,
+    'support_satisfaction': 19, 'product_adoption_rate': 20, 'feature_adoption_rate': 21,
+    'usage_frequency': 22, 'session_frequency': 23, 'content_engagement': 24,
+    'social_engagement': 25, 'email_engagement': 26, 'push_notification_engagement': 27,
+    'mobile_usage': 28, 'desktop_usage': 29, 'tablet_usage': 30,
+    'premium_features_usage': 31, 'community_participation': 32, 'referral_count': 33,
+    'referral_success_rate': 34, 'upgrade_count': 35, 'downgrade_count': 36,
+    'cancellation_attempts': 37, 'payment_failures': 38, 'subscription_length': 39,
+    'trial_to_paid_conversion': 40, 'seasonal_usage_pattern': 41, 'geographic_region': 42,
+    'device_type_preference': 43, 'subscription_plan_encoded': 44
+}
+
+# Encoding of subscription plan names (unknown plans count as Basic)
+SUBSCRIPTION_PLAN_ENCODING = {'Basic': 1, 'Standard': 2, 'Premium': 3, 'Enterprise': 4}
+
+# Gold AI feature table columns that stand in for mapped attributes in batch scoring
+GOLD_FEATURE_ALIASES = {
+    'feature_days_since_last_login': 'days_since_last_login',
+    'feature_last_nps_score': 'nps_score',
+    'feature_subscription_plan_tier': 'subscription_plan_encoded'
+}
+
 class AURAAIModel:
     """
     A.U.R.A AI Model wrapper for churn prediction and customer insights.
@@ -151,6 +180,102 @@ class AURAAIModel:
                 'confidence': 0.0
             }
     
+    def predict_batch(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predict churn risk for a whole table of customers in one model call.
+        
+        The feature matrix is built column by column, the model is called once
+        for the batch and the predicted class is taken from the probabilities
+        instead of a second prediction pass. Attributes are mapped as in
+        predict_churn_risk; columns of the Gold AI feature table are accepted
+        in place of the attributes they correspond to.
+        
+        Args:
+            customers_df: Customer rows (uploaded CSV or Gold feature table)
+            
+        Returns:
+            pd.DataFrame: churn_probability, churn_prediction, risk_level,
+            confidence and prediction_quality per customer, with the index of
+            customers_df (risk level 'Unknown' when the model is unavailable)
+        """
+        if not self.is_loaded:
+            logger.warning("AI model not loaded; batch predictions unavailable")
+            return self._unavailable_predictions(customers_df.index)
+        
+        try:
+            feature_matrix = self._prepare_feature_matrix(customers_df)
+            
+            # One model call; the class with the highest probability is the prediction
+            probabilities = self.model.predict_proba(feature_matrix)
+            churn_probability = probabilities[:, 1]  # Probability of churn (class 1)
+            churn_prediction = np.asarray(self.model.classes_)[probabilities.argmax(axis=1)]
+            
+        except Exception as e:
+            logger.error(f"Batch prediction failed: {e}")
+            return self._unavailable_predictions(customers_df.index)
+        
+        confidence = np.abs(churn_probability - 0.5) * 2
+        
+        predictions = pd.DataFrame({
+            'churn_probability': churn_probability.astype(float),
+            'churn_prediction': pd.array(churn_prediction.astype(np.int64), dtype='Int64'),
+            'risk_level': np.select([churn_probability >= 0.7, churn_probability >= 0.4], ['High', 'Medium'], 'Low'),
+            'confidence': confidence.astype(float),
+            'prediction_quality': np.select([confidence > 0.6, confidence > 0.3], ['High', 'Medium'], 'Low')
+        }, index=customers_df.index)
+        
+        logger.info(f"Scored {len(predictions)} customers in one batch")
+        return predictions
+    
+    def _prepare_feature_matrix(self, customers_df: pd.DataFrame) -> np.ndarray:
+        """
+        Build the model input matrix for a table of customers.
+        
+        Features are filled as in _prepare_features: missing values (NaN) are
+        kept for the model to treat as missing, while absent attributes and
+        non-numeric values get small random noise.
+        
+        Args:
+            customers_df: Customer rows
+            
+        Returns:
+            numpy array of shape (customers, model features)
+        """
+        n_features = self.model.n_features_in_
+        features = np.zeros((len(customers_df), n_features))
+        
+        columns = {GOLD_FEATURE_ALIASES.get(column, column): column for column in customers_df.columns
+                   if column not in FEATURE_MAPPING}
+        columns.update({column: column for column in customers_df.columns if column in FEATURE_MAPPING})
+        
+        for key, idx in FEATURE_MAPPING.items():
+            if key in columns and idx < n_features:
+                # Non-numeric values count as unavailable; missing values stay NaN
+                raw_values = customers_df[columns[key]]
+                values = pd.to_numeric(raw_values, errors='coerce')
+                values = values.mask(values.isna() & raw_values.notna(), 0.0)
+                features[:, idx] = values.to_numpy(dtype=float, na_value=np.nan)
+        
+        if 'subscription_plan' in customers_df.columns and n_features > 44:
+            plans = customers_df['subscription_plan'].astype(object)
+            features[:, 44] = plans.map(SUBSCRIPTION_PLAN_ENCODING).fillna(1).to_numpy(dtype=float)
+        
+        # Fill remaining features with small random noise, as for single predictions
+        missing = features == 0.0
+        features[missing] = np.random.normal(0, 0.1, missing.sum())
+        
+        return features
+    
+    def _unavailable_predictions(self, index: pd.Index) -> pd.DataFrame:
+        """Build a batch result marking every customer's prediction as unavailable."""
+        return pd.DataFrame({
+            'churn_probability': 0.0,
+            'churn_prediction': pd.array([pd.NA] * len(index), dtype='Int64'),
+            'risk_level': 'Unknown',
+            'confidence': 0.0,
+            'prediction_quality': 'Unknown'
+        }, index=index)
+    
     def _prepare_features(self, customer_data: Dict[str, Any]) -> Optional[np.ndarray]:
         """
         Prepare feature vector for the AI model.
@@ -165,29 +290,10 @@ class AURAAIModel:
             # Create a feature vector with the expected number of features
             features = np.zeros(self.model.n_features_in_)
             
-            # Map customer data to features (simplified mapping)
-            feature_mapping = {
-                'age': 0, 'monthly_revenue': 1, 'total_revenue': 2, 'engagement_score': 3,
-                'health_score': 4, 'days_since_last_login': 5, 'support_tickets_count': 6,
-                'nps_score': 7, 'satisfaction_score': 8, 'feature_usage_count': 9,
-                'session_duration_avg': 10, 'page_views_count': 11, 'bounce_rate': 12,
-                'conversion_rate': 13, 'retention_rate': 14, 'lifetime_value': 15,
-                'acquisition_cost': 16, 'revenue_growth_rate': 17, 'engagement_trend': 18,
-                'support_satisfaction': 19, 'product_adoption_rate': 20, 'feature_adoption_rate': 21,
-                'usage_frequency': 22, 'session_frequency': 23, 'content_engagement': 24,
-                'social_engagement': 25, 'email_engagement': 26, 'push_notification_engagement': 27,
-                'mobile_usage': 28, 'desktop_usage': 29, 'tablet_usage': 30,
-                'premium_features_usage': 31, 'community_participation': 32, 'referral_count': 33,
-                'referral_success_rate': 34, 'upgrade_count': 35, 'downgrade_count': 36,
-                'cancellation_attempts': 37, 'payment_failures': 38, 'subscription_length': 39,
-                'trial_to_paid_conversion': 40, 'seasonal_usage_pattern': 41, 'geographic_region': 42,
-                'device_type_preference': 43, 'subscription_plan_encoded': 44
-            }
-            
             # Fill in available features
             for key, value in customer_data.items():
-                if key in feature_mapping:
-                    idx = feature_mapping[key]
+                if key in FEATURE_MAPPING:
+                    idx = FEATURE_MAPPING[key]
                     if idx < len(features):
                         # Convert to numeric if possible
                         try:
@@ -196,8 +302,7 @@ class AURAAIModel:
                             features[idx] = 0.0
                 elif key == 'subscription_plan':
                     # Encode subscription plan
-                    plan_encoding = {'Basic': 1, 'Standard': 2, 'Premium': 3, 'Enterprise': 4}
-                    features[44] = plan_encoding.get(value, 1)
+                    features[44] = SUBSCRIPTION_PLAN_ENCODING.get(value, 1)
             
             # Fill remaining features with default values
             for i in range(len(features)):
@@ -14,6 +14,27 @@ from src.config.constants import ChurnRiskThresholds, ClientSegments, StrategyCa
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Customer metrics used by the risk rules, with the value assumed when a column is absent
+RISK_INPUT_DEFAULTS = {
+    'engagement_score': 0,
+    'days_since_last_engagement': 999,
+    'total_lifetime_revenue': 0,
+    'average_transaction_value': 0,
+    'total_support_tickets_lifetime': 0,
+    'avg_satisfaction_score_lifetime': 0,
+    'most_recent_nps_score': 0
+}
+
+# Risk factors in the order they are reported as key factors
+RISK_FACTOR_NAMES = ['engagement_risk', 'revenue_risk', 'support_risk', 'satisfaction_risk', 'activity_risk']
+
+# Recommended timeline for each risk level
+RISK_LEVEL_TIMELINES = {
+    'High': 'Immediate (within 24 hours)',
+    'Medium': 'Urgent (within 1 week)',
+    'Low': 'Standard (within 2 weeks)'
+}
+
 class RuleBasedDecisionEngine:
     """
     Rule-based decision engine for A.U.R.A platform.
@@ -177,56 +198,64 @@ class RuleBasedDecisionEngine:
             'customer_pk': risk_analysis['customer_pk'],
             'risk_level': risk_analysis['risk_level'],
             'priority': self._calculate_priority(risk_analysis, customer_data),
-            'recommended_actions': [],
+            'recommended_actions': self._build_recommended_actions(risk_analysis, customer_data),
             'strategies': [],
             'timeline': self._calculate_timeline(risk_analysis),
             'expected_outcome': self._calculate_expected_outcome(risk_analysis),
             'resources_required': self._calculate_resources_required(risk_analysis)
         }
         
-        # Generate actions based on risk level
+        # Generate strategies based on risk level
         if risk_analysis['risk_level'] == 'High':
-            recommendations['recommended_actions'] = self._get_high_risk_actions(risk_analysis, customer_data)
             recommendations['strategies'] = self._get_high_risk_strategies(risk_analysis, customer_data)
         elif risk_analysis['risk_level'] == 'Medium':
-            recommendations['recommended_actions'] = self._get_medium_risk_actions(risk_analysis, customer_data)
             recommendations['strategies'] = self._get_medium_risk_strategies(risk_analysis, customer_data)
         else:
-            recommendations['recommended_actions'] = self._get_low_risk_actions(risk_analysis, customer_data)
             recommendations['strategies'] = self._get_low_risk_strategies(risk_analysis, customer_data)
         
+        logger.debug(f"Recommendations generated. Actions: {len(recommendations['recommended_actions'])}")
+        return recommendations
+    
+    def _build_recommended_actions(self, risk_analysis: Dict[str, Any],
+                                   customer_data: pd.Series) -> List[str]:
+        """Build the recommended actions for a risk level and its key factors."""
+        # Generate actions based on risk level
+        if risk_analysis['risk_level'] == 'High':
+            actions = self._get_high_risk_actions(risk_analysis, customer_data)
+        elif risk_analysis['risk_level'] == 'Medium':
+            actions = self._get_medium_risk_actions(risk_analysis, customer_data)
+        else:
+            actions = self._get_low_risk_actions(risk_analysis, customer_data)
+        
         # Add specific recommendations based on key factors
         for factor in risk_analysis['key_factors']:
             if factor == 'Engagement':
-                recommendations['recommended_actions'].extend([
+                actions.extend([
                     "Send personalized re-engagement email campaign",
                     "Schedule feature training session",
                     "Provide usage analytics and insights"
                 ])
             elif factor == 'Revenue':
-                recommendations['recommended_actions'].extend([
+                actions.extend([
                     "Review pricing and value proposition",
                     "Offer retention discount or upgrade",
                     "Conduct business value assessment"
                 ])
             elif factor == 'Support':
-                recommendations['recommended_actions'].extend([
+                actions.extend([
                     "Assign dedicated support representative",
                     "Conduct support satisfaction survey",
                     "Implement proactive support monitoring"
                 ])
             elif factor == 'Satisfaction':
-                recommendations['recommended_actions'].extend([
+                actions.extend([
                     "Conduct detailed satisfaction interview",
                     "Address specific pain points",
                     "Implement feedback-driven improvements"
                 ])
         
         # Remove duplicates and limit to top 5 actions
-        recommendations['recommended_actions'] = list(set(recommendations['recommended_actions']))[:5]
-        
-        logger.debug(f"Recommendations generated. Actions: {len(recommendations['recommended_actions'])}")
-        return recommendations
+        return list(set(actions))[:5]
     
     def _calculate_confidence(self, risk_factors: Dict[str, float], 
                             composite_risk: float) -> str:
@@ -259,14 +288,7 @@ class RuleBasedDecisionEngine:
     
     def _calculate_timeline(self, risk_analysis: Dict[str, Any]) -> str:
         """Calculate recommended timeline for actions."""
-        risk_level = risk_analysis['risk_level']
-        
-        if risk_level == 'High':
-            return 'Immediate (within 24 hours)'
-        elif risk_level == 'Medium':
-            return 'Urgent (within 1 week)'
-        else:
-            return 'Standard (within 2 weeks)'
+        return RISK_LEVEL_TIMELINES.get(risk_analysis['risk_level'], RISK_LEVEL_TIMELINES['Low'])
     
     def _calculate_expected_outcome(self, risk_analysis: Dict[str, Any]) -> str:
         """Calculate expected outcome of retention efforts."""
@@ -378,67 +400,238 @@ class RuleBasedDecisionEngine:
             "Loyalty Rewards Program"
         ]
     
-    def process_customer_batch(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+    def process_customer_batch(self, customers_df: pd.DataFrame, vectorized: bool = True) -> pd.DataFrame:
         """
         Process a batch of customers for risk analysis and recommendations.
         
         This method processes multiple customers at once, applying the rule-based
         decision engine to each customer and generating comprehensive results
-        for batch processing and analysis.
+        for batch processing and analysis. By default the rules are evaluated
+        as array operations over whole columns; the results are identical to
+        analyzing each customer on its own.
         
         Args:
             customers_df: DataFrame of customer profiles
+            vectorized: Evaluate the rules over whole columns instead of row by row
             
         Returns:
             pd.DataFrame: Results with risk analysis and recommendations
         """
         logger.info(f"Processing customer batch: {len(customers_df)} customers")
         
-        results = []
-        
-        for _, customer in customers_df.iterrows():
-            try:
-                # Analyze risk
-                risk_analysis = self.analyze_customer_risk(customer)
-                
-                # Generate recommendations
-                recommendations = self.generate_recommendations(risk_analysis, customer)
-                
-                # Combine results
-                result = {
-                    'customer_pk': customer.get('customer_pk', 'unknown'),
-                    'risk_score': risk_analysis['composite_risk_score'],
-                    'risk_level': risk_analysis['risk_level'],
-                    'priority': recommendations['priority'],
-                    'recommended_action': recommendations['recommended_actions'][0] if recommendations['recommended_actions'] else 'Monitor',
-                    'timeline': recommendations['timeline'],
-                    'expected_outcome': recommendations['expected_outcome'],
-                    'key_factors': ', '.join(risk_analysis['key_factors']),
-                    'confidence': risk_analysis['confidence']
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error processing customer {customer.get('customer_pk', 'unknown')}: {str(e)}")
-                # Add error result
-                results.append({
-                    'customer_pk': customer.get('customer_pk', 'unknown'),
-                    'risk_score': 0.0,
-                    'risk_level': 'Unknown',
-                    'priority': 'Unknown',
-                    'recommended_action': 'Error in analysis',
-                    'timeline': 'Unknown',
-                    'expected_outcome': 'Analysis failed',
-                    'key_factors': 'Error',
-                    'confidence': 'Low'
-                })
-        
-        results_df = pd.DataFrame(results)
+        if vectorized:
+            results_df = self._process_customer_columns(customers_df)
+        else:
+            results_df = pd.DataFrame([self._process_customer(customer) for _, customer in customers_df.iterrows()])
         
         logger.info(f"Customer batch processing completed. Results: {len(results_df)}")
         return results_df
     
+    def _process_customer(self, customer: pd.Series) -> Dict[str, Any]:
+        """Analyze one customer and summarize the analysis as a batch result row."""
+        try:
+            # Analyze risk
+            risk_analysis = self.analyze_customer_risk(customer)
+            
+            # Generate recommendations
+            recommendations = self.generate_recommendations(risk_analysis, customer)
+            
+            # Combine results
+            return {
+                'customer_pk': customer.get('customer_pk', 'unknown'),
+                'risk_score': risk_analysis['composite_risk_score'],
+                'risk_level': risk_analysis['risk_level'],
+                'priority': recommendations['priority'],
+                'recommended_action': recommendations['recommended_actions'][0] if recommendations['recommended_actions'] else 'Monitor',
+                'timeline': recommendations['timeline'],
+                'expected_outcome': recommendations['expected_outcome'],
+                'key_factors': ', '.join(risk_analysis['key_factors']),
+                'confidence': risk_analysis['confidence']
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing customer {customer.get('customer_pk', 'unknown')}: {str(e)}")
+            # Add error result
+            return {
+                'customer_pk': customer.get('customer_pk', 'unknown'),
+                'risk_score': 0.0,
+                'risk_level': 'Unknown',
+                'priority': 'Unknown',
+                'recommended_action': 'Error in analysis',
+                'timeline': 'Unknown',
+                'expected_outcome': 'Analysis failed',
+                'key_factors': 'Error',
+                'confidence': 'Low'
+            }
+    
+    def _process_customer_columns(self, customers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evaluate the risk rules and recommendations over whole columns.
+        
+        Every threshold check of analyze_customer_risk becomes an np.select over
+        the metric column, and the composite score is built with the same
+        operations in the same order, so scores match the scalar path bit for
+        bit. Recommended actions depend only on the risk level, the key factors
+        and whether revenue exceeds 10000, so they are generated once per
+        distinct combination. Rows with values the rules cannot compare (such
+        as text or missing values in nullable columns) are analyzed one by one.
+        
+        Args:
+            customers_df: DataFrame of customer profiles
+            
+        Returns:
+            pd.DataFrame: Results in the same layout as the row-by-row path
+        """
+        n_customers = len(customers_df)
+        fallback = np.zeros(n_customers, dtype=bool)
+        metrics = {}
+        for column, default in RISK_INPUT_DEFAULTS.items():
+            metrics[column], invalid = self._get_metric_column(customers_df, column, default)
+            fallback |= invalid
+        
+        thresholds = self.churn_thresholds
+        engagement = metrics['engagement_score']
+        days_since_engagement = metrics['days_since_last_engagement']
+        total_revenue = metrics['total_lifetime_revenue']
+        satisfaction_score = metrics['avg_satisfaction_score_lifetime']
+        nps_score = metrics['most_recent_nps_score']
+        
+        engagement_risk = np.select(
+            [engagement < thresholds.ENGAGEMENT_LOW, engagement < thresholds.ENGAGEMENT_MEDIUM], [0.8, 0.5], 0.2
+        )
+        activity_risk = np.select(
+            [days_since_engagement > thresholds.DAYS_SINCE_ACTIVE_OLD,
+             days_since_engagement > thresholds.DAYS_SINCE_ACTIVE_MODERATE], [0.9, 0.6], 0.1
+        )
+        revenue_risk = np.select([total_revenue < 1000, total_revenue < 5000], [0.7, 0.4], 0.1)
+        revenue_risk = np.where(
+            metrics['average_transaction_value'] < 100, np.minimum(revenue_risk + 0.3, 1.0), revenue_risk
+        )
+        support_tickets = metrics['total_support_tickets_lifetime']
+        support_risk = np.select([support_tickets > 10, support_tickets > 5], [0.8, 0.5], 0.2)
+        satisfaction_risk = np.select([satisfaction_score < 3, satisfaction_score < 4], [0.9, 0.6], 0.1)
+        satisfaction_risk = np.select(
+            [nps_score <= thresholds.NPS_DETRACTOR, nps_score <= thresholds.NPS_PASSIVE],
+            [np.maximum(satisfaction_risk, 0.8), np.maximum(satisfaction_risk, 0.5)], satisfaction_risk
+        )
+        
+        composite_risk = (
+            engagement_risk * self.rule_weights['engagement'] +
+            revenue_risk * self.rule_weights['revenue'] +
+            support_risk * self.rule_weights['support'] +
+            satisfaction_risk * self.rule_weights['nps'] +
+            activity_risk * 0.1  # Additional weight for activity
+        )
+        
+        risk_levels = np.select(
+            [composite_risk >= self.high_risk_threshold, composite_risk >= self.medium_risk_threshold],
+            ['High', 'Medium'], 'Low'
+        ).astype(object)
+        is_high, is_medium = risk_levels == 'High', risk_levels == 'Medium'
+        
+        # Factors in RISK_FACTOR_NAMES order, one row per customer
+        risk_factors = np.column_stack([engagement_risk, revenue_risk, support_risk, satisfaction_risk, activity_risk])
+        factor_variance = np.var(risk_factors, axis=1)
+        confidence = np.select(
+            [(factor_variance < 0.1) & (composite_risk > 0.7), factor_variance < 0.2], ['High', 'Medium'], 'Low'
+        ).astype(object)
+        
+        # Encode the key factors of each customer as a bit mask over RISK_FACTOR_NAMES
+        key_factor_masks = ((risk_factors > 0.6) * (1 << np.arange(len(RISK_FACTOR_NAMES)))).sum(axis=1)
+        key_factor_names = [
+            [name.replace('_risk', '').title() for bit, name in enumerate(RISK_FACTOR_NAMES) if mask & (1 << bit)]
+            for mask in range(1 << len(RISK_FACTOR_NAMES))
+        ]
+        key_factors = np.array([', '.join(names) for names in key_factor_names], dtype=object)[key_factor_masks]
+        
+        priority = np.select(
+            [is_high & (total_revenue > 10000), is_high & (total_revenue > 5000), is_medium & (total_revenue > 10000),
+             is_high], ['Critical', 'High', 'High', 'Medium'], 'Low'
+        ).astype(object)
+        timeline = np.select(
+            [is_high, is_medium], [RISK_LEVEL_TIMELINES['High'], RISK_LEVEL_TIMELINES['Medium']], RISK_LEVEL_TIMELINES['Low']
+        ).astype(object)
+        expected_outcome = np.select(
+            [is_high & (confidence == 'High'), is_high, is_medium],
+            ['High probability of retention with immediate action',
+             'Moderate probability of retention with targeted efforts',
+             'Good probability of retention with standard approach'],
+            'Maintain current relationship and monitor'
+        ).astype(object)
+        
+        # Recommended actions depend only on the risk level, the key factors and the revenue tier
+        level_codes = np.select([is_high, is_medium], [2, 1], 0)
+        action_keys = (level_codes * 2 + (total_revenue > 10000)) * len(key_factor_names) + key_factor_masks
+        unique_keys, first_rows, action_codes = np.unique(action_keys, return_index=True, return_inverse=True)
+        unique_actions = []
+        for row in first_rows:
+            actions = self._build_recommended_actions(
+                {'risk_level': risk_levels[row], 'key_factors': key_factor_names[key_factor_masks[row]]},
+                pd.Series({'total_lifetime_revenue': total_revenue[row]})
+            )
+            unique_actions.append(actions[0] if actions else 'Monitor')
+        recommended_action = np.array(unique_actions, dtype=object)[action_codes.reshape(-1)]
+        
+        # Round each distinct score once with Python's round, as the scalar path does
+        unique_scores, score_codes = np.unique(composite_risk, return_inverse=True)
+        risk_score = np.array([round(float(score), 3) for score in unique_scores])[score_codes.reshape(-1)]
+        
+        if 'customer_pk' in customers_df.columns:
+            customer_pks = customers_df['customer_pk'].to_numpy(dtype=object, copy=True)
+        else:
+            customer_pks = np.full(n_customers, 'unknown', dtype=object)
+        
+        results = {
+            'customer_pk': customer_pks,
+            'risk_score': risk_score,
+            'risk_level': risk_levels,
+            'priority': priority,
+            'recommended_action': recommended_action,
+            'timeline': timeline,
+            'expected_outcome': expected_outcome,
+            'key_factors': key_factors,
+            'confidence': confidence
+        }
+        
+        # Rows the rules cannot compare take the row-by-row path, including its error handling
+        if fallback.any():
+            fallback_rows = np.flatnonzero(fallback)
+            logger.info(f"Analyzing {len(fallback_rows)} customers with non-numeric metrics row by row")
+            for row in fallback_rows:
+                for column, value in self._process_customer(customers_df.iloc[row]).items():
+                    results[column][row] = value
+        
+        return pd.DataFrame(results)
+    
+    def _get_metric_column(self, customers_df: pd.DataFrame, column: str, default: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a risk metric column as floats together with the rows it cannot be compared on.
+        
+        Args:
+            customers_df: DataFrame of customer profiles
+            column: Metric column name
+            default: Value used when the column is absent
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Metric values and a mask of rows
+            whose value is not a plain number
+        """
+        n_customers = len(customers_df)
+        if column not in customers_df.columns:
+            return np.full(n_customers, default, dtype=float), np.zeros(n_customers, dtype=bool)
+        
+        values = customers_df[column]
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'biuf':
+            return values.to_numpy(dtype=float), np.zeros(n_customers, dtype=bool)
+        
+        # Nullable, text and object columns: only plain numbers (and NaN) compare like the scalar rules
+        raw_values = values.to_numpy(dtype=object)
+        invalid = np.fromiter(
+            (not isinstance(value, (int, float, np.number)) for value in raw_values), dtype=bool, count=n_customers
+        )
+        numeric = np.where(invalid, np.nan, raw_values).astype(float)
+        return numeric, invalid
+    
     def get_decision_summary(self, results_df: pd.DataFrame) -> Dict[str, Any]:
         """
         Generate summary statistics for decision engine results.
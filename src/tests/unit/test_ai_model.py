@@ -0,0 +1,87 @@
+# A.U.R.A (AI-Unified Retention Analytics) - AI Model Batch Scoring Unit Tests
+# This module contains unit tests for batch churn inference on AURAAIModel
+# against single-customer predictions
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from sklearn.linear_model import LogisticRegression
+from src.models.chatbot.aura_ai_model import AURAAIModel, FEATURE_MAPPING
+
+class TestBatchPrediction(unittest.TestCase):
+    """Test cases for scoring customer tables with one model call."""
+    
+    def setUp(self):
+        """Set up a model wrapper around a small trained classifier."""
+        rng = np.random.default_rng(3)
+        classifier = LogisticRegression(max_iter=500)
+        classifier.fit(rng.normal(size=(200, 45)), rng.integers(0, 2, 200))
+        
+        self.ai_model = AURAAIModel(model_path='missing_model.pkl')
+        self.ai_model.model = classifier
+        self.ai_model.is_loaded = True
+        
+        # Every mapped attribute is non-zero, so no random fill is applied
+        self.customers = pd.DataFrame(
+            rng.uniform(0.5, 2.0, size=(25, len(FEATURE_MAPPING))), columns=list(FEATURE_MAPPING)
+        )
+    
+    def test_batch_matches_single_predictions(self):
+        """Test that batch results equal predicting each customer on its own."""
+        predictions = self.ai_model.predict_batch(self.customers)
+        
+        self.assertListEqual(list(predictions.index), list(self.customers.index))
+        for i, customer in self.customers.iterrows():
+            expected = self.ai_model.predict_churn_risk(customer.to_dict())
+            self.assertAlmostEqual(predictions.loc[i, 'churn_probability'], expected['churn_probability'])
+            self.assertEqual(predictions.loc[i, 'churn_prediction'], expected['churn_prediction'])
+            self.assertEqual(predictions.loc[i, 'risk_level'], expected['risk_level'])
+            self.assertEqual(predictions.loc[i, 'prediction_quality'], expected['prediction_quality'])
+    
+    def test_feature_matrix_encodes_plans_and_text(self):
+        """Test that plans are encoded and non-numeric values are treated as missing."""
+        customers = pd.DataFrame({
+            'subscription_plan': ['Premium', 'Unknown'],
+            'age': ['41', 'n/a'],
+            'feature_last_nps_score': [9.0, 3.0]
+        })
+        
+        features = self.ai_model._prepare_feature_matrix(customers)
+        
+        self.assertEqual(features.shape, (2, 45))
+        self.assertListEqual(features[:, 44].tolist(), [3.0, 1.0])
+        self.assertEqual(features[0, 0], 41.0)
+        self.assertNotEqual(features[1, 0], 0.0)
+        self.assertListEqual(features[:, FEATURE_MAPPING['nps_score']].tolist(), [9.0, 3.0])
+    
+    def test_missing_values_match_single_features(self):
+        """Test that missing values stay NaN in the batch matrix, as in single predictions."""
+        customer = {'nps_score': np.nan, 'age': 41.0, 'engagement_score': 'n/a'}
+        
+        single = self.ai_model._prepare_features(customer)[0]
+        batch = self.ai_model._prepare_feature_matrix(pd.DataFrame([customer]))[0]
+        
+        for features in (single, batch):
+            self.assertTrue(np.isnan(features[FEATURE_MAPPING['nps_score']]))
+            self.assertEqual(features[FEATURE_MAPPING['age']], 41.0)
+            self.assertFalse(np.isnan(features[FEATURE_MAPPING['engagement_score']]))
+            self.assertNotEqual(features[FEATURE_MAPPING['engagement_score']], 0.0)
+        self.assertEqual(np.isnan(batch).sum(), 1)
+    
+    def test_unloaded_model_marks_predictions_unknown(self):
+        """Test that an unloaded model returns unavailable predictions."""
+        self.ai_model.is_loaded = False
+        
+        predictions = self.ai_model.predict_batch(self.customers.head(3))
+        
+        self.assertListEqual(predictions['risk_level'].tolist(), ['Unknown'] * 3)
+        self.assertTrue(predictions['churn_prediction'].isna().all())
+
+if __name__ == "__main__":
+    unittest.main()
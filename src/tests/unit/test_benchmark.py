@@ -0,0 +1,59 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline Benchmark Unit Tests
+# This module contains unit tests for the scale parsing, scaling exponents and
+# baseline regression checks of the pipeline benchmark harness
+
+import unittest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from benchmark_pipeline import parse_scale, format_scale, add_scaling_exponents, compare_with_baseline
+
+def benchmark_scale(customers, wall_seconds, throughput, peak_rss_mb):
+    """Build the benchmark result of one scale with a single stage."""
+    return {
+        'customers': customers,
+        'stages': {
+            'silver_transformation': {
+                'wall_seconds': wall_seconds,
+                'throughput_rows_per_second': throughput,
+                'peak_rss_mb': peak_rss_mb
+            }
+        }
+    }
+
+class TestPipelineBenchmark(unittest.TestCase):
+    """Test cases for the pipeline benchmark harness."""
+    
+    def test_scales_round_trip(self):
+        """Test that scales are parsed from and formatted to short names."""
+        self.assertListEqual([parse_scale(value) for value in ['10k', '1M', '2500', '0.5m']],
+                             [10_000, 1_000_000, 2_500, 500_000])
+        self.assertListEqual([format_scale(value) for value in [10_000, 10_000_000, 2_500]], ['10k', '10m', '2500'])
+    
+    def test_scaling_exponents(self):
+        """Test that linear and quadratic growth give exponents of 1 and 2."""
+        scales = [benchmark_scale(10_000, 1.0, 1, 1), benchmark_scale(100_000, 10.0, 1, 1),
+                  benchmark_scale(1_000_000, 1000.0, 1, 1)]
+        add_scaling_exponents(scales)
+        
+        self.assertNotIn('scaling_exponent', scales[0]['stages']['silver_transformation'])
+        self.assertEqual(scales[1]['stages']['silver_transformation']['scaling_exponent'], 1.0)
+        self.assertEqual(scales[2]['stages']['silver_transformation']['scaling_exponent'], 2.0)
+    
+    def test_regressions_beyond_tolerance_are_flagged(self):
+        """Test that only throughput drops and memory growth beyond the tolerance are flagged."""
+        baseline = {'scales': [benchmark_scale(10_000, 1.0, 1000.0, 100.0)]}
+        
+        within = {'scales': [benchmark_scale(10_000, 1.1, 900.0, 110.0), benchmark_scale(100_000, 9.0, 10.0, 900.0)]}
+        self.assertListEqual(compare_with_baseline(within, baseline, tolerance=0.2), [])
+        
+        beyond = {'scales': [benchmark_scale(10_000, 2.0, 500.0, 150.0)]}
+        regressions = compare_with_baseline(beyond, baseline, tolerance=0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(regression.startswith("10k silver_transformation") for regression in regressions))
+
+if __name__ == "__main__":
+    unittest.main()
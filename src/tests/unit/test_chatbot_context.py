@@ -0,0 +1,90 @@
+# A.U.R.A (AI-Unified Retention Analytics) - On-Demand Chatbot Context Unit Tests
+# This module contains unit tests for the memoized per-customer chatbot context
+# provider and its invalidation on Gold layer refreshes
+
+import unittest
+import pandas as pd
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.gold_agg import GoldAggregation
+from src.data_pipeline.chatbot_context import ChatbotContextProvider
+
+class TestChatbotContextProvider(unittest.TestCase):
+    """Test cases for on-demand chatbot context."""
+    
+    def setUp(self):
+        """Set up a stored customer 360 view in a temporary Gold directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.gold_aggregation = GoldAggregation()
+        self.gold_aggregation.gold_path = Path(self.temp_dir.name)
+        
+        self.customer_360 = pd.DataFrame({
+            'customer_pk': ['CUST_001', 'CUST_002', 'CUST_003'],
+            'first_name': ['Ada', 'Ben', 'Cy'],
+            'last_name': ['Lee', 'Roe', 'Fox'],
+            'current_subscription_plan': ['Premium', 'Basic', 'Pro'],
+            'current_health_score': [81.0, 40.5, 65.0],
+            'churn_risk_level': pd.Categorical(['Low', 'High', 'Medium'], categories=['Low', 'Medium', 'High']),
+            'engagement_score': [0.9, 0.1, 0.5],
+            'most_recent_nps_score': [9, 2, 7],
+            'client_segment': ['High-Value', 'SMB At-Risk', 'Medium-Value At-Risk'],
+            'total_support_tickets_lifetime': [0, 8, 2],
+            'MRR_current_month': [300.0, 20.0, 90.0]
+        })
+        self._write_customer_360(self.customer_360)
+        self.provider = ChatbotContextProvider(self.gold_aggregation, cache_size=2)
+    
+    def tearDown(self):
+        """Remove the temporary Gold directory."""
+        self.temp_dir.cleanup()
+    
+    def _write_customer_360(self, customer_360):
+        """Store a customer 360 view as the Gold table."""
+        customer_360.to_parquet(self.gold_aggregation.get_gold_table_path('customer_360_dashboard_view'), index=False)
+    
+    def test_context_matches_full_table(self):
+        """Test that on-demand context equals the row of the full table."""
+        full_table = self.gold_aggregation.create_chatbot_context(self.customer_360).set_index('customer_pk')
+        
+        for customer_pk in ['CUST_002', 'CUST_003']:
+            context = self.provider.get_context(customer_pk)
+            expected = full_table.loc[customer_pk]
+            for column in full_table.columns.drop('context_last_updated_at'):
+                self.assertEqual(context[column], expected[column])
+        
+        self.assertIsNone(self.provider.get_context('CUST_999'))
+    
+    def test_cache_is_least_recently_used(self):
+        """Test that repeated lookups hit the cache and the oldest entry is evicted."""
+        self.provider.get_context('CUST_001')
+        self.provider.get_context('CUST_002')
+        self.provider.get_context('CUST_001')
+        self.provider.get_context('CUST_003')
+        
+        info = self.provider.get_cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['cached_customers'], 2)
+        self.assertListEqual(list(self.provider._cache), ['CUST_001', 'CUST_003'])
+    
+    def test_gold_refresh_invalidates_cache(self):
+        """Test that rewriting the customer 360 view clears memoized context."""
+        self.assertIn('Risk Level: Low', self.provider.get_context('CUST_001')['curated_client_summary'])
+        
+        refreshed = self.customer_360.copy()
+        refreshed['churn_risk_level'] = pd.Categorical(['High'] * 3, categories=['Low', 'Medium', 'High'])
+        refreshed['first_name'] = ['Adaline', 'Ben', 'Cy']
+        self._write_customer_360(refreshed)
+        
+        context = self.provider.get_context('CUST_001')
+        self.assertIn('Customer Adaline Lee', context['curated_client_summary'])
+        self.assertEqual(context['relevant_playbook_strategies'],
+                         "Proactive Outreach, Retention Discount, Senior Account Manager")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline Checkpoint Unit Tests
+# This module contains unit tests for the stage checkpoints used to resume
+# failed pipeline executions
+
+import unittest
+import tempfile
+import pandas as pd
+import os
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.data_pipeline.checkpoint import PipelineCheckpointStore
+
+class TestPipelineCheckpointStore(unittest.TestCase):
+    """Test cases for pipeline stage checkpoints."""
+    
+    def setUp(self):
+        """Set up a temporary checkpoint directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = PipelineCheckpointStore(Path(self.temp_dir.name) / "checkpoints")
+        self.customers = pd.DataFrame({'customer_pk': ['CUST_1', 'CUST_2'], 'plan': ['Basic', 'Premium']})
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_stage_round_trip(self):
+        """Test that stage tables given as DataFrames or files are restored."""
+        self.store.start_run("20240101_000000", "abc")
+        self.store.save_stage("20240101_000000", 'bronze_ingestion', {'customers': self.customers})
+        
+        written = Path(self.temp_dir.name) / "silver_customers.parquet"
+        self.customers.to_parquet(written, index=False)
+        self.store.save_stage("20240101_000000", 'silver_transformation', {'customers': written})
+        
+        self.assertListEqual(self.store.get_completed_stages("20240101_000000"),
+                             ['bronze_ingestion', 'silver_transformation'])
+        for stage in ['bronze_ingestion', 'silver_transformation']:
+            pd.testing.assert_frame_equal(self.store.load_stage("20240101_000000", stage)['customers'], self.customers)
+    
+    def test_only_leading_stages_count_as_completed(self):
+        """Test that a stage after an incomplete one is not resumed from."""
+        self.store.start_run("20240101_000000", "abc")
+        self.store.save_stage("20240101_000000", 'silver_transformation', {'customers': self.customers})
+        
+        self.assertListEqual(self.store.get_completed_stages("20240101_000000"), [])
+        self.assertListEqual(self.store.get_completed_stages("20240102_000000"), [])
+        with self.assertRaises(ValueError):
+            self.store.load_stage("20240101_000000", 'bronze_ingestion')
+    
+    def test_concurrent_stages_are_all_recorded(self):
+        """Test that stages checkpointed from concurrent pipeline steps all reach the manifest."""
+        self.store.start_run("20240101_000000", "abc")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda stage: self.store.save_stage("20240101_000000", stage, {'customers': self.customers}),
+                              ['bronze_ingestion', 'silver_transformation', 'gold_aggregation'] * 5))
+        
+        self.assertListEqual(self.store.get_completed_stages("20240101_000000"),
+                             ['bronze_ingestion', 'silver_transformation', 'gold_aggregation'])
+    
+    def test_old_runs_are_removed(self):
+        """Test that only the most recent executions keep their checkpoints."""
+        execution_ids = [f"2024010{day}_000000" for day in range(1, 6)]
+        for execution_id in execution_ids:
+            self.store.start_run(execution_id, "abc")
+        
+        retained = sorted(path.name for path in self.store.checkpoint_path.iterdir())
+        self.assertListEqual(retained, execution_ids[-settings.pipeline_checkpoint_retention:])
+    
+    def test_input_fingerprint_follows_source_content(self):
+        """Test that the input fingerprint changes with Bronze file content."""
+        file_path = Path(self.temp_dir.name) / "raw_customer_demographics.csv"
+        file_path.write_text("customer_id,plan\nCUST_1,Basic\n")
+        fingerprint = self.store.compute_input_fingerprint({'customers': file_path})
+        
+        self.assertEqual(self.store.compute_input_fingerprint({'customers': file_path}), fingerprint)
+        file_path.write_text("customer_id,plan\nCUST_1,Elite\n")
+        self.assertNotEqual(self.store.compute_input_fingerprint({'customers': file_path}), fingerprint)
+
+if __name__ == "__main__":
+    unittest.main()
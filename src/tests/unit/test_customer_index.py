@@ -0,0 +1,45 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Customer Index Unit Tests
+# This module contains unit tests for the customer id to row position index
+# used by the dashboard customer lookups
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.dashboard.utils.customer_index import CustomerIndex
+
+class TestCustomerIndex(unittest.TestCase):
+    """Test cases for indexed customer lookups."""
+    
+    def setUp(self):
+        """Set up customer data with a duplicated customer id."""
+        self.customer_data = pd.DataFrame({
+            'customer_id': ['CUST_0003', 'CUST_0001', 'CUST_0002', 'CUST_0001'],
+            'current_health_score': [70.0, 40.0, 90.0, 10.0]
+        }, index=[10, 20, 30, 40])
+        self.index = CustomerIndex(self.customer_data)
+    
+    def test_lookup_matches_scan(self):
+        """Test that lookups return the first row a boolean scan would find."""
+        for customer_id in ['CUST_0001', 'CUST_0002', 'CUST_0003']:
+            expected = self.customer_data[self.customer_data['customer_id'] == customer_id].iloc[0]
+            pd.testing.assert_series_equal(self.index.get_customer(customer_id), expected)
+        
+        self.assertEqual(self.index.get_position('CUST_0001'), 1)
+        self.assertEqual(len(self.index), 3)
+    
+    def test_unknown_customers(self):
+        """Test that unknown ids and data without an id column return None."""
+        self.assertIsNone(self.index.get_customer('CUST_9999'))
+        self.assertNotIn('CUST_9999', self.index)
+        
+        index = CustomerIndex(self.customer_data.drop(columns=['customer_id']))
+        self.assertIsNone(index.get_customer('CUST_0001'))
+        self.assertEqual(len(index), 0)
+
+if __name__ == "__main__":
+    unittest.main()
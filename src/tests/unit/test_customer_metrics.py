@@ -0,0 +1,81 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Customer Metrics Engine Unit Tests
+# This module contains unit tests for the single-pass aggregation engine that
+# computes Silver layer customer profile metrics
+
+import unittest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.customer_metrics import CustomerMetricsEngine, METRIC_COLUMNS
+
+class TestCustomerMetricsEngine(unittest.TestCase):
+    """Test cases for single-pass customer metric aggregation."""
+    
+    def setUp(self):
+        """Set up sample cleaned Silver data."""
+        self.now = datetime(2024, 6, 1)
+        self.customers = pd.DataFrame({
+            'customer_pk': ['CUST_001', 'CUST_002', 'CUST_003'],
+            'company_name': ['A Corp', 'B Corp', 'C Corp']
+        }, index=[10, 20, 30])
+        self.transactions = pd.DataFrame({
+            'customer_id': ['CUST_001', 'CUST_002', 'CUST_001', 'CUST_999', 'CUST_002'],
+            'transaction_date': pd.to_datetime(['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01', None]),
+            'amount': [100.0, 50.0, 200.005, 75.0, np.nan]
+        })
+        self.engagement = pd.DataFrame({
+            'customer_id': ['CUST_001', 'CUST_001', 'CUST_001', 'CUST_003'],
+            'event_timestamp': pd.to_datetime(['2024-05-01', '2024-05-02', '2024-05-03', '2024-04-01']),
+            'event_type': ['login', 'login', 'logout', None],
+            'session_id': ['S1', 'S1', 'S2', 'S3']
+        })
+    
+    def test_metrics_match_groupby(self):
+        """Test that engine metrics equal per-customer groupby results."""
+        engine = CustomerMetricsEngine(self.customers['customer_pk'], now=self.now)
+        engine.add_transaction_metrics(self.transactions)
+        engine.add_engagement_metrics(self.engagement)
+        profiles = engine.build_profiles(self.customers).set_index('customer_pk')
+        
+        expected = self.transactions.groupby('customer_id').agg(
+            revenue=('amount', 'sum'), average=('amount', 'mean'), count=('amount', 'count'),
+            last_date=('transaction_date', 'max')
+        )
+        for customer_pk in ['CUST_001', 'CUST_002']:
+            self.assertAlmostEqual(profiles.loc[customer_pk, 'total_lifetime_revenue'],
+                                   round(expected.loc[customer_pk, 'revenue'], 2))
+            self.assertAlmostEqual(profiles.loc[customer_pk, 'average_transaction_value'],
+                                   round(expected.loc[customer_pk, 'average'], 2))
+            self.assertEqual(profiles.loc[customer_pk, 'total_transactions_count'],
+                             expected.loc[customer_pk, 'count'])
+            self.assertEqual(profiles.loc[customer_pk, 'last_transaction_date'],
+                             expected.loc[customer_pk, 'last_date'])
+        
+        self.assertEqual(profiles.loc['CUST_001', 'unique_event_types'], 2)
+        self.assertEqual(profiles.loc['CUST_001', 'total_sessions'], 2)
+        self.assertEqual(profiles.loc['CUST_003', 'unique_event_types'], 0)
+        self.assertEqual(profiles.loc['CUST_001', 'days_since_last_engagement'], 29)
+        self.assertAlmostEqual(profiles.loc['CUST_001', 'engagement_score'], round(3 / (29 / 30 + 1), 3))
+    
+    def test_customers_without_rows_keep_missing_metrics(self):
+        """Test that customers and sources without rows leave metrics missing."""
+        engine = CustomerMetricsEngine(self.customers['customer_pk'], now=self.now)
+        engine.add_transaction_metrics(self.transactions)
+        engine.add_support_metrics(pd.DataFrame())
+        profiles = engine.build_profiles(self.customers)
+        
+        self.assertListEqual(list(profiles.columns), list(self.customers.columns) + METRIC_COLUMNS)
+        self.assertListEqual(list(profiles.index), [0, 1, 2])
+        self.assertTrue(np.isnan(profiles.loc[2, 'total_lifetime_revenue']))
+        self.assertTrue(pd.isna(profiles.loc[2, 'last_transaction_date']))
+        self.assertTrue(profiles['total_support_tickets_lifetime'].isna().all())
+        self.assertTrue(profiles['avg_nps_score_lifetime'].isna().all())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Dashboard Data Loader Unit Tests
+# This module contains unit tests for the dashboard data loader, including
+# the metadata-only data summary, the process-level table cache and chatbot context
+
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from unittest import mock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.dashboard.utils.data_loader import DashboardDataLoader
+from src.data_pipeline.gold_agg import GoldAggregation
+from src.data_pipeline.table_cache import TableCache
+from src.data_pipeline.parquet_layout import append_table_increment, write_partitioned_table
+
+class TestDataSummary(unittest.TestCase):
+    """Test cases for the metadata-only data summary."""
+    
+    def setUp(self):
+        """Set up temporary Gold, Silver and Bronze files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        
+        self.loader = DashboardDataLoader()
+        self.loader.gold_path = root / "gold"
+        self.loader.silver_path = root / "silver"
+        self.loader.bronze_path = root / "bronze"
+        for path in [self.loader.gold_path, self.loader.silver_path, self.loader.bronze_path]:
+            path.mkdir()
+        
+        pd.DataFrame({'customer_pk': ['CUST_001', 'CUST_002'], 'churn_risk_level': ['Low', 'High']}).to_parquet(
+            self.loader.gold_path / "gold_customer_360_dashboard_view.parquet", index=False)
+        pd.DataFrame({'amount': [1.0, 2.0, 3.0]}, index=[10, 11, 12]).to_parquet(
+            self.loader.silver_path / "silver_transactions.parquet")
+        
+        self.csv_path = self.loader.bronze_path / "raw_transactions.csv"
+        self.csv_path.write_text('transaction_id,customer_id,description\nT1,C1,"a, b"\nT2,C2,c')
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_summary_counts_match_file_contents(self):
+        """Test that footer and line counts match the rows and columns pandas reads."""
+        summary = self.loader.get_data_summary()
+        
+        self.assertEqual(summary['gold_layer']['customer_360_dashboard_view']['records'], 2)
+        self.assertEqual(summary['gold_layer']['customer_360_dashboard_view']['columns'], 2)
+        self.assertEqual(summary['silver_layer']['transactions']['records'], 3)
+        self.assertEqual(summary['silver_layer']['transactions']['columns'], 1)
+        self.assertEqual(summary['bronze_layer']['raw_transactions']['records'], len(pd.read_csv(self.csv_path)))
+        self.assertEqual(summary['bronze_layer']['raw_transactions']['columns'], 3)
+        self.assertNotIn('engagement', summary['silver_layer'])
+    
+    def test_csv_counted_once_per_modification(self):
+        """Test that unchanged CSV files reuse their cached line count."""
+        self.loader.get_data_summary()
+        
+        with mock.patch('src.dashboard.utils.data_loader._count_csv_records') as count_records:
+            self.loader.get_data_summary()
+            count_records.assert_not_called()
+        
+        with open(self.csv_path, 'a') as f:
+            f.write('\nT3,C3,d\n')
+        summary = self.loader.get_data_summary()
+        self.assertEqual(summary['bronze_layer']['raw_transactions']['records'], 3)
+
+class TestTableCache(unittest.TestCase):
+    """Test cases for the process-level Gold/Silver table cache."""
+    
+    def setUp(self):
+        """Set up a temporary Gold directory and a loader with its own cache."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.loader = DashboardDataLoader()
+        self.loader.gold_path = Path(self.temp_dir.name)
+        self.loader.table_cache = TableCache(max_memory_mb=64)
+        
+        self.file_path = self.loader.gold_path / "gold_customer_360_dashboard_view.parquet"
+        self.customers = pd.DataFrame({
+            'customer_pk': ['CUST_001', 'CUST_002', 'CUST_003'],
+            'churn_risk_level': pd.Categorical(['Low', 'High', 'High']),
+            'current_health_score': [80.0, 20.0, 35.0]
+        })
+        write_partitioned_table(self.customers, self.file_path)
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_cached_until_file_is_rewritten(self):
+        """Test that reads hit the cache until a pipeline run replaces the file."""
+        first = self.loader.load_customer_360_data()
+        first['added'] = 1
+        second = self.loader.load_customer_360_data()
+        
+        self.assertNotIn('added', second.columns)
+        self.assertEqual(self.loader.table_cache.get_cache_info()['hits'], 1)
+        
+        write_partitioned_table(self.customers.iloc[:2], self.file_path)
+        self.assertEqual(len(self.loader.load_customer_360_data()), 2)
+        self.assertEqual(self.loader.table_cache.get_cache_info()['misses'], 2)
+    
+    def test_increment_files_refresh_cached_tables(self):
+        """Test that rows written by incremental runs are served instead of cached rows."""
+        self.loader.load_customer_360_data()
+        
+        update = self.customers.iloc[[1]].assign(current_health_score=90.0)
+        append_table_increment(update, self.file_path, key_column='customer_pk', deleted_keys=['CUST_003'])
+        customers = self.loader.load_customer_360_data()
+        
+        self.assertListEqual(sorted(customers['customer_pk']), ['CUST_001', 'CUST_002'])
+        self.assertEqual(customers.loc[customers['customer_pk'] == 'CUST_002', 'current_health_score'].iloc[0], 90.0)
+        self.assertEqual(self.loader.table_cache.get_cache_info()['misses'], 2)
+        
+        summary = self.loader.get_data_summary()
+        self.assertEqual(summary['gold_layer']['customer_360_dashboard_view']['records'], 2)
+    
+    def test_filtered_reads_are_cached_separately(self):
+        """Test that filtered loads are keyed by their filters."""
+        high_risk = self.loader.load_filtered_customer_data({'risk_level': ['High']})
+        everyone = self.loader.load_customer_360_data()
+        
+        self.assertListEqual(sorted(high_risk['customer_pk']), ['CUST_002', 'CUST_003'])
+        self.assertEqual(len(everyone), 3)
+        self.assertEqual(self.loader.table_cache.get_cache_info()['cached_tables'], 2)
+    
+    def test_columns_and_filters_are_passed_to_reader(self):
+        """Test that loaders return only the requested columns and rows."""
+        high_risk = self.loader.load_customer_360_data(
+            columns=['customer_pk', 'current_health_score'],
+            filters=[('churn_risk_level', '==', 'High')]
+        )
+        
+        self.assertListEqual(high_risk.columns.tolist(), ['customer_pk', 'current_health_score'])
+        self.assertListEqual(sorted(high_risk['customer_pk']), ['CUST_002', 'CUST_003'])
+    
+    def test_least_recently_used_tables_are_evicted(self):
+        """Test that the memory cap evicts the least recently used table."""
+        cache = TableCache(max_memory_mb=1)
+        paths = [self.loader.gold_path / f"gold_scores_{i}.parquet" for i in range(3)]
+        for path in paths:
+            pd.DataFrame({'score': np.zeros(80000)}).to_parquet(path, index=False)
+        
+        cache.load_table(paths[0])
+        cache.load_table(paths[1])
+        cache.load_table(paths[2])
+        info = cache.get_cache_info()
+        
+        self.assertEqual(info['evictions'], 2)
+        self.assertEqual(info['cached_tables'], 1)
+        self.assertLessEqual(info['memory_mb'], info['max_memory_mb'])
+        
+        cache.load_table(paths[2])
+        self.assertEqual(cache.get_cache_info()['hits'], 1)
+
+class TestChatbotContextLoading(unittest.TestCase):
+    """Test cases for chatbot context when the Gold export is disabled."""
+    
+    def setUp(self):
+        """Set up a temporary Gold directory holding a chatbot context export from an older run."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.gold_aggregation = GoldAggregation()
+        self.gold_aggregation.gold_path = Path(self.temp_dir.name)
+        self.loader = DashboardDataLoader()
+        self.loader.gold_path = self.gold_aggregation.gold_path
+        self.loader.table_cache = TableCache(max_memory_mb=64)
+        
+        pd.DataFrame({
+            'customer_pk': ['CUST_OLD', 'CUST_001'],
+            'curated_client_summary': ['Old run', 'Old run']
+        }).to_parquet(self.gold_aggregation.get_gold_table_path('ai_chatbot_context'), index=False)
+        
+        self.customer_profiles = pd.DataFrame({
+            'customer_pk': ['CUST_001', 'CUST_002'],
+            'first_name': ['Ada', 'Ben'],
+            'last_name': ['Lee', 'Roe'],
+            'current_subscription_plan': ['Premium', 'Basic'],
+            'account_status_standardized': ['Active', 'Active'],
+            'current_health_score': [85.0, 30.0],
+            'engagement_score': [0.9, 0.1],
+            'most_recent_nps_score': [9, 2],
+            'total_lifetime_revenue': [25000.0, 800.0],
+            'days_since_last_engagement': [3, 45],
+            'total_support_tickets_lifetime': [0, 8]
+        })
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_disabled_export_does_not_serve_old_rows(self):
+        """Test that after an aggregation run the loader answers from the new Gold data."""
+        with mock.patch.object(settings, 'chatbot_context_export_enabled', False):
+            self.gold_aggregation.aggregate_silver_to_gold({'customer_profiles': self.customer_profiles})
+            
+            context = self.loader.load_chatbot_context()
+            one_customer = self.loader.load_chatbot_context(
+                columns=['customer_pk', 'curated_client_summary'], filters=[('customer_pk', 'in', ['CUST_002'])]
+            )
+            summary = self.loader.get_data_summary()
+        
+        self.assertFalse(self.gold_aggregation.get_gold_table_path('ai_chatbot_context').exists())
+        self.assertListEqual(sorted(context['customer_pk']), ['CUST_001', 'CUST_002'])
+        self.assertNotIn('Old run', context['curated_client_summary'].tolist())
+        self.assertListEqual(one_customer.columns.tolist(), ['customer_pk', 'curated_client_summary'])
+        self.assertListEqual(one_customer['customer_pk'].tolist(), ['CUST_002'])
+        self.assertNotIn('ai_chatbot_context', summary['gold_layer'])
+
+if __name__ == "__main__":
+    unittest.main()
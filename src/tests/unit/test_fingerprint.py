@@ -0,0 +1,95 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Source Fingerprint Unit Tests
+# This module contains unit tests for the Bronze source fingerprint manifest
+# used to skip re-processing of unchanged sources
+
+import unittest
+import tempfile
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.fingerprint import BronzeFingerprintManifest
+
+class TestBronzeFingerprintManifest(unittest.TestCase):
+    """Test cases for Bronze source change detection."""
+    
+    def setUp(self):
+        """Set up a temporary Bronze file and manifest."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest = BronzeFingerprintManifest(Path(self.temp_dir.name) / "bronze_manifest.json")
+        
+        self.file_path = Path(self.temp_dir.name) / "raw_transactions.csv"
+        self.file_path.write_text("transaction_id,amount\nTXN_1,10.0\n")
+        self.source_files = {
+            'transactions': self.file_path,
+            'surveys': Path(self.temp_dir.name) / "raw_feedback_surveys.csv"
+        }
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_all_sources_changed_without_manifest(self):
+        """Test that every source counts as changed on the first run."""
+        changed, fingerprints = self.manifest.detect_changes(self.source_files)
+        
+        self.assertListEqual(changed, ['transactions', 'surveys'])
+        self.assertTrue(fingerprints['transactions']['exists'])
+        self.assertFalse(fingerprints['surveys']['exists'])
+    
+    def test_unchanged_and_touched_sources_are_skipped(self):
+        """Test that sources with identical content count as unchanged."""
+        _, fingerprints = self.manifest.detect_changes(self.source_files)
+        self.manifest.save(fingerprints)
+        
+        changed, _ = self.manifest.detect_changes(self.source_files)
+        self.assertListEqual(changed, [])
+        
+        # Rewriting identical content changes mtime but not the content hash
+        stat = self.file_path.stat()
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        changed, _ = self.manifest.detect_changes(self.source_files)
+        self.assertListEqual(changed, [])
+    
+    def test_modified_source_is_detected(self):
+        """Test that content changes of the same size are detected."""
+        _, fingerprints = self.manifest.detect_changes(self.source_files)
+        self.manifest.save(fingerprints)
+        
+        stat = self.file_path.stat()
+        self.file_path.write_text("transaction_id,amount\nTXN_1,20.0\n")
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        changed, _ = self.manifest.detect_changes(self.source_files)
+        self.assertListEqual(changed, ['transactions'])
+    
+    def test_partition_files_are_fingerprinted(self):
+        """Test that new or modified partition files mark their source as changed."""
+        partition_dir = Path(self.temp_dir.name) / "raw_transactions" / "date=2024-01-01" / "hour=10"
+        partition_dir.mkdir(parents=True)
+        partition_file = partition_dir / "raw_transactions_20240101T100000.csv"
+        partition_file.write_text("transaction_id,amount\nTXN_2,5.0\n")
+        
+        _, fingerprints = self.manifest.detect_changes(self.source_files)
+        self.manifest.save(fingerprints)
+        
+        changed, fingerprints = self.manifest.detect_changes(self.source_files, {'transactions': [partition_file]})
+        self.assertListEqual(changed, ['transactions'])
+        self.assertIn("raw_transactions/date=2024-01-01/hour=10/raw_transactions_20240101T100000.csv",
+                      fingerprints['transactions']['partitions'])
+        self.manifest.save(fingerprints)
+        
+        changed, _ = self.manifest.detect_changes(self.source_files, {'transactions': [partition_file]})
+        self.assertListEqual(changed, [])
+        
+        stat = partition_file.stat()
+        partition_file.write_text("transaction_id,amount\nTXN_2,6.0\n")
+        os.utime(partition_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        changed, _ = self.manifest.detect_changes(self.source_files, {'transactions': [partition_file]})
+        self.assertListEqual(changed, ['transactions'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Gold Aggregation Unit Tests
+# This module contains unit tests for the table-driven recommendation and
+# client segmentation builders and the columnar chatbot context of the Gold layer
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.gold_agg import GoldAggregation
+
+class TestGoldDecisionTables(unittest.TestCase):
+    """Test cases for vectorized recommendations and client segments."""
+    
+    def setUp(self):
+        """Set up customers covering every recommendation and segment rule."""
+        self.gold_aggregation = GoldAggregation()
+        self.customer_360 = pd.DataFrame({
+            'churn_risk_level': pd.Categorical(
+                ['High', 'High', 'High', 'High', 'Medium', 'Medium', 'Medium', 'Low', 'Low', 'Low'],
+                categories=['Low', 'Medium', 'High']
+            ),
+            'total_lifetime_revenue': [25000, 800, 800, 800, 6000, 6000, 20001, 5001, np.nan, 20000],
+            'days_since_last_engagement': [5, 45, 10, 10, 5, 5, 5, 5, 5, 5],
+            'most_recent_nps_score': [9, 9, 2, 8, 9, 9, 9, 9, 9, 9],
+            'engagement_score': [0.9, 0.9, 0.9, 0.9, 0.4, 0.6, 0.6, 0.8, 0.2, 0.9],
+            'total_support_tickets_lifetime': [0, 0, 0, 0, 0, 4, 2, 0, 0, 0]
+        })
+    
+    def test_recommendations_follow_rule_order(self):
+        """Test that each customer gets the first matching recommendation."""
+        result = self.gold_aggregation._generate_recommendations(self.customer_360.copy())
+        
+        self.assertIsInstance(result['recommended_action'].dtype, pd.CategoricalDtype)
+        self.assertListEqual(result['recommended_action'].tolist(), [
+            "Schedule proactive call with senior account manager",
+            "Send personalized re-engagement campaign",
+            "Conduct satisfaction survey and address concerns",
+            "Offer retention discount or additional support",
+            "Send educational content and feature highlights",
+            "Proactive support check-in and training",
+            "Regular check-in and relationship building",
+            "Identify upsell opportunities",
+            "Maintain current relationship",
+            "Identify upsell opportunities"
+        ])
+        self.assertListEqual(result['upsell_opportunity_flag'].tolist(), [False] * 7 + [True, False, True])
+    
+    def test_segments_combine_value_tier_and_risk(self):
+        """Test that segments come from the revenue tier and churn risk."""
+        result = self.gold_aggregation._calculate_client_segments(self.customer_360.copy())
+        
+        self.assertIsInstance(result['client_segment'].dtype, pd.CategoricalDtype)
+        self.assertListEqual(result['client_segment'].tolist(), [
+            'High-Value At-Risk', 'SMB At-Risk', 'SMB At-Risk', 'SMB At-Risk', 'Medium-Value At-Risk',
+            'Medium-Value At-Risk', 'High-Value At-Risk', 'Medium-Value', 'SMB', 'Medium-Value'
+        ])
+
+class TestChatbotContext(unittest.TestCase):
+    """Test cases for the columnar chatbot context builder."""
+    
+    def setUp(self):
+        """Set up a small customer 360 view."""
+        self.gold_aggregation = GoldAggregation()
+        self.customer_360 = pd.DataFrame({
+            'customer_pk': ['CUST_001', 'CUST_002', 'CUST_003'],
+            'first_name': ['Ada', 'Ben', 'Ada'],
+            'last_name': ['Lee', 'Roe', 'Lee'],
+            'current_subscription_plan': ['Premium', 'Basic', 'Premium'],
+            'current_health_score': [81.25, np.nan, 81.25],
+            'churn_risk_level': pd.Categorical(['High', 'Medium', 'High'], categories=['Low', 'Medium', 'High']),
+            'engagement_score': [0.1, 0.6, 0.9],
+            'most_recent_nps_score': [2, 9, 9],
+            'client_segment': ['SMB At-Risk', 'SMB', 'High-Value'],
+            'total_support_tickets_lifetime': [7, 0, 1]
+        }, index=[5, 6, 7])
+    
+    def test_context_columns(self):
+        """Test summaries, insights and shared text of the chatbot context."""
+        context = self.gold_aggregation.create_chatbot_context(self.customer_360)
+        
+        self.assertListEqual(list(context.index), [0, 1, 2])
+        self.assertListEqual(context['curated_client_summary'].tolist(), [
+            "Customer Ada Lee (Premium plan, Health Score: 81.2, Risk Level: High)",
+            "Customer Ben Roe (Basic plan, Health Score: nan, Risk Level: Medium)",
+            "Customer Ada Lee (Premium plan, Health Score: 81.2, Risk Level: High)"
+        ])
+        self.assertListEqual(context['key_insights_last_month'].tolist(), [
+            "High churn risk - immediate attention needed; Low engagement - re-engagement campaign recommended; "
+            "Low satisfaction - support intervention needed",
+            "Customer in good standing",
+            "High churn risk - immediate attention needed"
+        ])
+        self.assertListEqual(context['historical_churn_factors_for_segment'].tolist(), [
+            'General engagement and satisfaction factors',
+            'Budget constraints, feature complexity, support response time',
+            'Price sensitivity, feature limitations, competitive pressure'
+        ])
+        self.assertEqual(context['recent_support_issues_summary'].iloc[0],
+                         "Multiple support tickets - proactive support recommended")
+        for column in ['key_insights_last_month', 'relevant_playbook_strategies', 'recommended_proactive_questions']:
+            self.assertIsInstance(context[column].dtype, pd.CategoricalDtype)
+
+if __name__ == "__main__":
+    unittest.main()
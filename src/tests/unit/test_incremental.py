@@ -0,0 +1,172 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Incremental Aggregate Store Unit Tests
+# This module contains unit tests for folding new rows into stored per-customer
+# aggregates and distinct-count sketches used by incremental pipeline runs
+
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from unittest import mock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.data_pipeline.incremental import IncrementalAggregateStore
+from src.data_pipeline.orchestrator import DataPipelineOrchestrator
+from src.data_pipeline.gold_agg import GoldAggregation
+from generate_mock_data import MockDataGenerator
+
+class TestIncrementalAggregateStore(unittest.TestCase):
+    """Test cases for incremental per-customer aggregates."""
+    
+    def setUp(self):
+        """Set up a temporary store and sample cleaned event data."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = IncrementalAggregateStore(Path(self.temp_dir.name), sketch_size=8)
+        
+        self.transactions = pd.DataFrame({
+            'transaction_id': [f'TXN_{i}' for i in range(6)],
+            'customer_id': ['CUST_001', 'CUST_002', 'CUST_001', 'CUST_003', 'CUST_001', 'CUST_002'],
+            'transaction_date': pd.to_datetime([
+                '2024-01-01', '2024-01-05', '2024-02-01', '2024-02-10', '2024-03-01', '2024-03-05'
+            ]),
+            'amount': [100.0, 50.0, 200.0, 75.0, 25.5, 10.0]
+        })
+        self.engagement = pd.DataFrame({
+            'event_id': [f'EVT_{i}' for i in range(6)],
+            'customer_id': ['CUST_001'] * 4 + ['CUST_002'] * 2,
+            'event_timestamp': pd.to_datetime([
+                '2024-01-01', '2024-01-02', '2024-02-01', '2024-03-01', '2024-01-03', '2024-03-02'
+            ]),
+            'event_type': ['login', 'logout', 'login', 'api_call', 'login', 'login'],
+            'session_id': ['S1', 'S1', 'S2', 'S3', 'S4', 'S5']
+        })
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def _fold(self, aggregates, sketches, cutoff_start, cutoff_end):
+        """Fold the rows dated within [cutoff_start, cutoff_end) into the aggregates."""
+        increments = {
+            'transactions': self.transactions[self.transactions['transaction_date'].between(
+                cutoff_start, cutoff_end, inclusive='left')],
+            'engagement': self.engagement[self.engagement['event_timestamp'].between(
+                cutoff_start, cutoff_end, inclusive='left')]
+        }
+        return self.store.fold(aggregates, sketches, increments)
+    
+    def test_incremental_folds_match_single_fold(self):
+        """Test that folding rows in batches matches folding them at once."""
+        empty_aggregates = self.store.load_aggregates(None)
+        empty_sketches = self.store.load_sketches(None)
+        
+        full_aggregates, full_sketches, _ = self._fold(
+            empty_aggregates, empty_sketches, '2024-01-01', '2025-01-01'
+        )
+        
+        aggregates, sketches, _ = self._fold(empty_aggregates, empty_sketches, '2024-01-01', '2024-02-01')
+        aggregates, sketches, touched = self._fold(aggregates, sketches, '2024-02-01', '2025-01-01')
+        
+        self.assertSetEqual(set(touched), {'CUST_001', 'CUST_002', 'CUST_003'})
+        pd.testing.assert_frame_equal(
+            aggregates.sort_index(), full_aggregates.sort_index(), check_like=True
+        )
+        
+        metrics = self.store.build_metrics(aggregates.sort_index(), sketches).set_index('customer_pk')
+        self.assertAlmostEqual(metrics.loc['CUST_001', 'total_lifetime_revenue'], 325.5)
+        self.assertAlmostEqual(metrics.loc['CUST_001', 'average_transaction_value'], 108.5)
+        self.assertEqual(metrics.loc['CUST_001', 'unique_event_types'], 3)
+        self.assertEqual(metrics.loc['CUST_001', 'total_sessions'], 3)
+        self.assertEqual(metrics.loc['CUST_002', 'total_sessions'], 2)
+        self.assertTrue(np.isnan(metrics.loc['CUST_003', 'total_engagement_events']))
+    
+    def test_sketch_estimate_beyond_sketch_size(self):
+        """Test that distinct counts above the sketch size are estimated."""
+        engagement = pd.DataFrame({
+            'customer_id': ['CUST_001'] * 2000,
+            'event_timestamp': pd.Timestamp('2024-01-01'),
+            'event_type': 'login',
+            'session_id': [f'S{i}' for i in range(2000)]
+        })
+        _, sketches, _ = self.store.fold(
+            self.store.load_aggregates(None), self.store.load_sketches(None), {'engagement': engagement}
+        )
+        
+        self.assertEqual((sketches['sketch'] == 'sessions').sum(), 8)
+        estimate = self.store.estimate_distinct_counts(sketches, 'sessions')['CUST_001']
+        self.assertGreater(estimate, 500)
+        self.assertLess(estimate, 8000)
+    
+    def test_state_round_trip(self):
+        """Test that saved aggregates and watermarks are loaded back unchanged."""
+        aggregates, sketches, _ = self._fold(
+            self.store.load_aggregates(None), self.store.load_sketches(None), '2024-01-01', '2025-01-01'
+        )
+        watermarks = self.store.advance_watermarks(
+            {'transactions': None, 'engagement': None, 'support': None, 'surveys': None},
+            {'transactions': self.transactions, 'engagement': self.engagement}
+        )
+        self.store.save_state(aggregates, sketches, watermarks, 'run_1')
+        
+        state = self.store.load_state()
+        self.assertEqual(state['state_id'], 'run_1')
+        self.assertEqual(self.store.get_watermarks(state)['transactions'], pd.Timestamp('2024-03-05'))
+        self.assertIsNone(self.store.get_watermarks(state)['support'])
+        pd.testing.assert_frame_equal(self.store.load_aggregates(state), aggregates, check_like=True)
+
+class TestIncrementalPipelineRetry(unittest.TestCase):
+    """Test cases for retrying failed incremental pipeline runs."""
+    
+    def setUp(self):
+        """Set up a complete pipeline run over a small mock Bronze dataset."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.settings_patch = mock.patch.multiple(
+            settings, bronze_path=root / "bronze", bronze_staging_path=root / "bronze" / "staging",
+            bronze_manifest_path=root / "bronze_manifest.json", incremental_state_path=root / "incremental",
+            pipeline_checkpoint_path=root / "checkpoints", silver_path=root / "silver", gold_path=root / "gold",
+            temp_path=root / "temp", pipeline_profiling_enabled=False
+        )
+        self.settings_patch.start()
+        
+        MockDataGenerator(customer_count=20, data_dir=settings.bronze_path, seed=3).write_all_data()
+        self.assertListEqual(DataPipelineOrchestrator().run_complete_pipeline()['errors'], [])
+    
+    def tearDown(self):
+        """Restore settings and remove temporary files."""
+        self.settings_patch.stop()
+        self.temp_dir.cleanup()
+    
+    def test_retried_run_does_not_duplicate_silver_rows(self):
+        """Test that a run failing after the Silver append does not duplicate rows when retried."""
+        transactions_path = settings.bronze_path / "raw_transactions.csv"
+        transactions = pd.read_csv(transactions_path)
+        new_transaction = transactions.iloc[[0]].assign(
+            transaction_id='TXN_900010',
+            transaction_date=(pd.Timestamp.now().floor('s') + pd.Timedelta(seconds=2)).strftime('%Y-%m-%d %H:%M:%S')
+        )
+        pd.concat([transactions, new_transaction]).to_csv(transactions_path, index=False)
+        
+        with mock.patch.object(GoldAggregation, 'refresh_customer_rows', side_effect=RuntimeError("gold down")):
+            self.assertListEqual(DataPipelineOrchestrator().run_incremental_pipeline()['errors'], ["gold down"])
+        self.assertListEqual(DataPipelineOrchestrator().run_incremental_pipeline()['errors'], [])
+        
+        orchestrator = DataPipelineOrchestrator()
+        silver_transactions = orchestrator.silver_transform.load_silver_table('transactions')
+        customer_pk = str(new_transaction['customer_id'].iloc[0])
+        profile = orchestrator.silver_transform.load_silver_table(
+            'customer_profiles', filters=[('customer_pk', '==', customer_pk)]
+        )
+        
+        self.assertEqual(len(silver_transactions), len(transactions) + 1)
+        self.assertEqual((silver_transactions['transaction_id'] == 'TXN_900010').sum(), 1)
+        self.assertEqual((silver_transactions['customer_id'].astype(str) == customer_pk).sum(),
+                         profile['total_transactions_count'].iloc[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Data Ingestion Unit Tests
+# This module contains unit tests for Bronze layer ingestion, including
+# the streaming (chunked) ingestion path and typed schema registry parsing
+
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from unittest import mock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.data_pipeline.ingest import DataIngestion
+
+class TestStreamingIngestion(unittest.TestCase):
+    """Test cases for chunked Bronze ingestion through parquet staging."""
+    
+    def setUp(self):
+        """Set up a temporary Bronze file with nulls and cross-chunk duplicates."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ingestion = DataIngestion()
+        self.ingestion.staging_path = Path(self.temp_dir.name)
+        
+        self.file_path = Path(self.temp_dir.name) / "raw_engagement_logs.csv"
+        pd.DataFrame({
+            'event_id': ['EVT_1', 'EVT_1', 'EVT_2', 'EVT_3', 'EVT_3', 'EVT_4'],
+            'customer_id': ['CUST_001', 'CUST_001', 'CUST_002', 'CUST_003', 'CUST_003', 'CUST_004'],
+            'event_type': ['login', 'login', 'page_view', 'logout', 'logout', 'api_call'],
+            'event_timestamp': ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-03', '2024-01-03', '2024-01-04'],
+            'feature_used': [None, None, None, 'export', 'export', None],
+            'duration': [10, 10, np.nan, 40, 40, 50]
+        }).to_csv(self.file_path, index=False)
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_streaming_matches_in_memory_quality_score(self):
+        """Test that chunked statistics match a full in-memory load."""
+        df = self.ingestion.load_csv_file(self.file_path)
+        expected_score = self.ingestion.add_ingestion_metadata(df)['data_quality_score'].iloc[0]
+        
+        for chunk_size in (1, 2, 4, 100):
+            stats = self.ingestion.stream_csv_to_staging(self.file_path, chunk_size=chunk_size)
+            self.assertEqual(stats['row_count'], 6)
+            self.assertEqual(stats['duplicate_count'], 2)
+            self.assertAlmostEqual(stats['data_quality_score'], expected_score)
+    
+    def test_duplicates_counted_from_hash_buckets(self):
+        """Test that duplicate counts do not depend on how row hashes are bucketed."""
+        for buckets in (1, 3, 256):
+            with mock.patch.object(settings, 'ingestion_hash_buckets', buckets):
+                stats = self.ingestion.stream_csv_to_staging(self.file_path, chunk_size=1)
+
+            self.assertEqual(stats['duplicate_count'], 2)
+            self.assertLessEqual(len(list(stats['hash_path'].glob("bucket_*.bin"))), buckets)
+
+    def test_staged_data_round_trip(self):
+        """Test that staged parquet holds the same records as the CSV."""
+        stats = self.ingestion.stream_csv_to_staging(self.file_path, chunk_size=2)
+        staged = self.ingestion.load_staged_data(stats)
+        original = pd.read_csv(self.file_path)
+        
+        self.assertTrue(stats['staging_path'].exists())
+        self.assertEqual(len(staged), len(original))
+        self.assertListEqual(staged['event_id'].tolist(), original['event_id'].tolist())
+        self.assertEqual(staged['feature_used'].notna().sum(), 2)
+        self.assertIn('data_quality_score', staged.columns)
+    
+    def test_codes_staged_as_written_across_chunks(self):
+        """Test that leading-zero and alphanumeric codes keep their text in every chunk."""
+        for codes in (['AB12', 'AB13', '02134', '00501'], ['02134', '00501', 'AB12', 'AB13'],
+                      ['AB12', None, '02134', '00501']):
+            pd.DataFrame({
+                'event_id': ['EVT_1', 'EVT_2', 'EVT_3', 'EVT_4'],
+                'customer_id': ['CUST_001', 'CUST_002', 'CUST_003', 'CUST_004'],
+                'event_type': ['login', 'login', 'logout', 'logout'],
+                'event_timestamp': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04'],
+                'postal_code': codes
+            }).to_csv(self.file_path, index=False)
+            
+            stats = self.ingestion.stream_csv_to_staging(self.file_path, chunk_size=2)
+            staged = self.ingestion.load_staged_data(stats)
+            
+            self.assertListEqual(staged['postal_code'].fillna('').tolist(), [code or '' for code in codes])
+            self.assertEqual(stats['duplicate_count'], 0)
+    
+    def test_missing_required_columns_detected_from_header(self):
+        """Test that required columns are validated before any chunk is read."""
+        bad_file = Path(self.temp_dir.name) / "raw_transactions.csv"
+        pd.DataFrame({'transaction_id': ['TXN_1'], 'amount': [10.0]}).to_csv(bad_file, index=False)
+        
+        with self.assertRaises(ValueError):
+            self.ingestion.stream_csv_to_staging(bad_file)
+
+class TestTypedIngestion(unittest.TestCase):
+    """Test cases for typed Bronze ingestion through the schema registry."""
+    
+    def setUp(self):
+        """Set up a temporary Bronze transactions file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ingestion = DataIngestion()
+        
+        self.file_path = Path(self.temp_dir.name) / "raw_transactions.csv"
+        self.transactions = pd.DataFrame({
+            'transaction_id': ['TXN_1', 'TXN_2', 'TXN_3'],
+            'customer_id': ['CUST_001', 'CUST_002', 'CUST_001'],
+            'transaction_date': ['2024-01-01 10:00:00', '2024-01-02 11:30:00', ''],
+            'amount': [10.5, 20.0, 30.25],
+            'currency': ['USD', 'EUR', 'USD'],
+            'quantity': [1, None, 3]
+        })
+        self.transactions.to_csv(self.file_path, index=False)
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_registry_types_applied(self):
+        """Test that registered columns are parsed into their typed columns."""
+        df = self.ingestion.load_typed_csv_file(self.file_path)
+        
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['transaction_date']))
+        self.assertEqual(df['transaction_date'].isnull().sum(), 1)
+        self.assertEqual(df['transaction_date'].iloc[1], pd.Timestamp('2024-01-02 11:30:00'))
+        self.assertIsInstance(df['currency'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['amount'].sum(), 60.75)
+        self.assertEqual(df['quantity'].isnull().sum(), 1)
+    
+    def test_typed_load_matches_untyped_null_counts(self):
+        """Test that typed and untyped loads agree on missing values."""
+        typed = self.ingestion.load_typed_csv_file(self.file_path)
+        untyped = self.ingestion.load_csv_file(self.file_path)
+        
+        pd.testing.assert_series_equal(typed.isnull().sum(), untyped.isnull().sum())
+    
+    def test_unparsable_column_falls_back_to_inference(self):
+        """Test that values outside a registered type do not fail ingestion."""
+        self.transactions['amount'] = ['not a number', '20.0', '30.25']
+        self.transactions.to_csv(self.file_path, index=False)
+        
+        df = self.ingestion.load_typed_csv_file(self.file_path)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df['amount'].iloc[0], 'not a number')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df['transaction_date']))
+    
+    def test_required_columns_from_registry(self):
+        """Test that required columns are looked up from the schema registry."""
+        self.assertListEqual(
+            self.ingestion._get_required_columns("raw_transactions.csv"),
+            ["transaction_id", "customer_id", "transaction_date", "amount", "currency"]
+        )
+        self.assertListEqual(self.ingestion._get_required_columns("unknown.csv"), [])
+
+class TestParallelBronzeLoading(unittest.TestCase):
+    """Test cases for concurrent loading of the Bronze layer files."""
+    
+    def setUp(self):
+        """Set up a temporary Bronze directory with one valid and one invalid file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ingestion = DataIngestion()
+        self.ingestion.bronze_path = Path(self.temp_dir.name)
+        
+        pd.DataFrame({
+            'survey_response_id': ['SURVEY_1', 'SURVEY_2'],
+            'customer_id': ['CUST_001', 'CUST_002'],
+            'response_date': ['2024-01-01 10:00:00', '2024-01-02 10:00:00'],
+            'nps_score': [9, 4]
+        }).to_csv(self.ingestion.bronze_path / "raw_feedback_surveys.csv", index=False)
+        
+        # Transactions file missing required columns
+        pd.DataFrame({'transaction_id': ['TXN_1']}).to_csv(
+            self.ingestion.bronze_path / "raw_transactions.csv", index=False
+        )
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_errors_are_contained_per_source(self):
+        """Test that failing and missing sources do not affect the others."""
+        bronze_data = self.ingestion.load_bronze_data()
+        
+        self.assertListEqual(list(bronze_data.keys()), list(self.ingestion.bronze_files.keys()))
+        self.assertEqual(len(bronze_data['surveys']), 2)
+        self.assertTrue(bronze_data['transactions'].empty)
+        self.assertTrue(bronze_data['customers'].empty)
+
+class TestPartitionedIncrements(unittest.TestCase):
+    """Test cases for incremental loads of rolling, time-partitioned Bronze files."""
+    
+    def setUp(self):
+        """Set up a Bronze file and two published hourly partitions."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ingestion = DataIngestion()
+        self.ingestion.bronze_path = Path(self.temp_dir.name)
+        
+        self.write_events(self.ingestion.bronze_path / "raw_transactions.csv", ['2024-01-01 09:30:00'])
+        for hour, timestamps in [(10, ['2024-01-01 10:15:00', '2024-01-01 10:45:00']), (11, ['2024-01-01 11:05:00'])]:
+            partition_dir = self.ingestion.bronze_path / "raw_transactions" / "date=2024-01-01" / f"hour={hour}"
+            partition_dir.mkdir(parents=True)
+            self.write_events(partition_dir / f"raw_transactions_20240101T{hour}0000.csv", timestamps)
+        
+        # A file that is still being written is not read
+        self.write_events(partition_dir / "raw_transactions_20240101T110500.csv.partial", ['2024-01-01 11:06:00'])
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def write_events(self, path: Path, timestamps: list) -> None:
+        """Write a transactions file with one row per timestamp."""
+        pd.DataFrame({
+            'transaction_id': [f"TXN_{path.stem}_{i}" for i in range(len(timestamps))],
+            'customer_id': 'CUST_001',
+            'transaction_date': timestamps,
+            'amount': 10.0,
+            'currency': 'USD'
+        }).to_csv(path, index=False)
+    
+    def test_partition_files_are_loaded_after_the_watermark(self):
+        """Test that published partitions are read and old partitions are skipped."""
+        self.assertEqual(len(self.ingestion.get_partition_files('transactions')), 2)
+        self.assertEqual(len(self.ingestion.get_partition_files('transactions', pd.Timestamp('2024-01-01 11:00:00'))), 1)
+        
+        increment = self.ingestion.load_bronze_increment('transactions', pd.Timestamp('2024-01-01 10:30:00'))
+        
+        self.assertListEqual(increment['transaction_date'].astype(str).tolist(),
+                             ['2024-01-01 10:45:00', '2024-01-01 11:05:00'])
+        self.assertEqual(len(self.ingestion.load_bronze_increment('transactions', None)), 4)
+    
+    def test_full_load_includes_partition_files(self):
+        """Test that full Bronze loads read the published partitions after the main file."""
+        for streaming in (False, True):
+            with mock.patch.object(settings, 'streaming_ingestion_enabled', streaming):
+                self.ingestion.staging_path = self.ingestion.bronze_path / "staging"
+                self.ingestion.staging_path.mkdir(exist_ok=True)
+                transactions = self.ingestion.load_bronze_data(['transactions'])['transactions']
+            
+            self.assertListEqual(pd.to_datetime(transactions['transaction_date']).astype(str).tolist(),
+                                 ['2024-01-01 09:30:00', '2024-01-01 10:15:00', '2024-01-01 10:45:00',
+                                  '2024-01-01 11:05:00'])
+            self.assertEqual(transactions['data_quality_score'].nunique(), 1)
+
+    def test_streamed_stats_combine_partition_nulls_and_duplicates(self):
+        """Test that combined statistics count nulls and cross-file duplicates in partition files."""
+        partition_dir = self.ingestion.bronze_path / "raw_transactions" / "date=2024-01-01" / "hour=12"
+        partition_dir.mkdir(parents=True)
+        pd.DataFrame({
+            'transaction_id': ['TXN_raw_transactions_0', 'TXN_late'],
+            'customer_id': 'CUST_001',
+            'transaction_date': ['2024-01-01 09:30:00', '2024-01-01 12:10:00'],
+            'amount': [10.0, None],
+            'currency': 'USD'
+        }).to_csv(partition_dir / "raw_transactions_20240101T120000.csv", index=False)
+
+        with mock.patch.object(settings, 'typed_ingestion_enabled', False):
+            in_memory = self.ingestion.load_bronze_data(['transactions'])['transactions']
+        with mock.patch.object(settings, 'streaming_ingestion_enabled', True):
+            self.ingestion.staging_path = self.ingestion.bronze_path / "staging"
+            self.ingestion.staging_path.mkdir(exist_ok=True)
+            self.ingestion.load_bronze_data(['transactions'])
+        stats = self.ingestion.ingestion_stats['transactions']
+
+        self.assertEqual(stats['row_count'], 6)
+        self.assertEqual(len(stats['source_files']), 4)
+        self.assertEqual(stats['null_counts']['amount'], 1)
+        self.assertEqual(stats['duplicate_count'], 1)
+        self.assertAlmostEqual(stats['data_quality_score'], in_memory['data_quality_score'].iloc[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Mock Data Generator Unit Tests
+# This module contains unit tests for the vectorized, sharded generation of
+# Bronze mock data
+
+import unittest
+import tempfile
+import pandas as pd
+import os
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from generate_mock_data import MockDataGenerator, MockEventStream, OUTPUT_FILES
+
+class TestMockDataGenerator(unittest.TestCase):
+    """Test cases for mock data generation."""
+    
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.temp_dir.name)
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_same_seed_generates_same_data(self):
+        """Test that a seed and shard size fully determine the generated rows."""
+        first = MockDataGenerator(customer_count=50, data_dir=self.data_dir / "a", seed=7, shard_size=20)
+        second = MockDataGenerator(customer_count=50, data_dir=self.data_dir / "b", seed=7, shard_size=20)
+        other = MockDataGenerator(customer_count=50, data_dir=self.data_dir / "c", seed=8, shard_size=20)
+        
+        tables = [generator.generate_shard(1) for generator in [first, second, other]]
+        self.assertTrue(tables[0]['engagement'].equals(tables[1]['engagement']))
+        self.assertFalse(tables[0]['engagement'].equals(tables[2]['engagement']))
+    
+    def test_sharded_files_have_unique_ids(self):
+        """Test that every shard is written with unique record ids."""
+        generator = MockDataGenerator(customer_count=45, data_dir=self.data_dir, shard_size=20)
+        row_counts = generator.write_all_data()
+        
+        self.assertEqual(generator.shard_count, 3)
+        self.assertEqual(row_counts['customers'], 45)
+        self.assertEqual(int(generator.status_counts.sum()), 45)
+        for dataset, file_name in OUTPUT_FILES.items():
+            df = pd.read_csv(self.data_dir / f"{file_name}.csv")
+            self.assertEqual(len(df), row_counts[dataset])
+            self.assertTrue(df.iloc[:, 0].is_unique)
+        
+        customers = pd.read_csv(self.data_dir / "raw_customer_demographics.csv")
+        self.assertListEqual(customers['customer_id'].head(2).tolist(), ['CUST_0001', 'CUST_0002'])
+    
+    def test_events_follow_customer_profiles(self):
+        """Test the correlations between customer status and generated events."""
+        generator = MockDataGenerator(customer_count=300, data_dir=self.data_dir, output_format='parquet')
+        data = generator.generate_all_data()
+        
+        customers = data['customers'].set_index('customer_id')
+        transactions = data['transactions'].join(customers[['status']], on='customer_id')
+        days_ago = (generator.end_date - transactions['transaction_date']).dt.days
+        self.assertTrue((days_ago[transactions['status'] == 'Active'] <= 90).all())
+        self.assertTrue((days_ago[transactions['status'] == 'At-Risk'] >= 30).all())
+        
+        engagement = data['engagement']
+        self.assertTrue(engagement['feature_used'].notna().eq(engagement['event_type'] == 'feature_usage').all())
+        
+        surveys = data['surveys'].join(customers[['status']], on='customer_id')
+        self.assertTrue(surveys.loc[surveys['status'] == 'Active', 'nps_score'].between(7, 10).all())
+    
+    def test_event_stream_publishes_hourly_partitions(self):
+        """Test that streamed events are written to rolling files partitioned by event hour."""
+        generator = MockDataGenerator(customer_count=40, data_dir=self.data_dir, shard_size=20)
+        stream = MockEventStream(generator, events_per_second=500, roll_seconds=2)
+        
+        # Four one-second ticks; the hour change and the two-second roll each start a file
+        tick_end = int(datetime(2024, 1, 1, 10, 59, 59).timestamp())
+        for tick in range(4):
+            stream._emit_tick(tick_end + tick)
+        self.assertTrue(list(self.data_dir.glob("raw_engagement_logs/*/*/*.partial")))
+        for source in list(stream._open_files):
+            stream._publish(source)
+        
+        files = sorted(self.data_dir.glob("raw_engagement_logs/date=2024-01-01/hour=*/*.csv"))
+        self.assertListEqual([path.parent.name for path in files], ['hour=10', 'hour=11', 'hour=11'])
+        events = pd.concat([pd.read_csv(path, parse_dates=['event_timestamp']) for path in files])
+        self.assertEqual(len(events), stream.event_counts['engagement'])
+        self.assertTrue(events['event_id'].is_unique)
+        self.assertTrue(events['event_timestamp'].is_monotonic_increasing)
+        self.assertTrue(set(events['customer_id']) <= set(pd.read_csv(self.data_dir / "raw_customer_demographics.csv")['customer_id']))
+        self.assertFalse(list(self.data_dir.glob("**/*.partial")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Parquet Layout Unit Tests
+# This module contains unit tests for the partitioned Silver and Gold parquet
+# writer and for row group pruning of filtered reads
+
+import unittest
+import tempfile
+import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
+from pathlib import Path
+from unittest import mock
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.data_pipeline.parquet_layout import (
+    GOLD_PARTITIONS, append_table_increment, get_increment_dir, get_row_group_bounds, get_table_files,
+    read_parquet_table, select_row_groups, write_partitioned_table
+)
+
+class TestParquetLayout(unittest.TestCase):
+    """Test cases for partitioned parquet tables."""
+    
+    def setUp(self):
+        """Set up a temporary directory and sample Silver and Gold tables."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name)
+        rng = np.random.default_rng(7)
+        
+        self.events = pd.DataFrame({
+            'event_id': [f'EVT_{i}' for i in range(300)],
+            'event_timestamp': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 30 * 86400, 300), unit='s')
+        })
+        self.customers = pd.DataFrame({
+            'customer_pk': [f'CUST_{i:03d}' for i in range(120)],
+            'churn_risk_level': pd.Categorical(rng.choice(['Low', 'Medium', 'High'], 120),
+                                               categories=['Low', 'Medium', 'High'], ordered=True),
+            'client_segment': pd.Categorical(rng.choice(['SMB', 'High-Value'], 120)),
+            'current_health_score': rng.uniform(0, 100, 120)
+        })
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_row_group_bounds(self):
+        """Test that small partitions are packed and large partitions are split."""
+        labels = np.array([0, 0, 1, 2, 2, 2, 2, 2, 3])
+        
+        self.assertListEqual(get_row_group_bounds(labels, 4, pack_partitions=True), [(0, 3), (3, 7), (7, 9)])
+        self.assertListEqual(get_row_group_bounds(labels, 4, pack_partitions=False),
+                             [(0, 2), (2, 3), (3, 7), (7, 8), (8, 9)])
+    
+    def test_high_risk_filter_reads_only_high_risk_row_groups(self):
+        """Test that a risk level filter prunes the other risk levels' row groups."""
+        file_path = self.path / "gold_customer_360_dashboard_view.parquet"
+        write_partitioned_table(self.customers, file_path, partition_columns=GOLD_PARTITIONS['customer_360_dashboard_view'])
+        
+        parquet_file = pq.ParquetFile(file_path)
+        filters = [('churn_risk_level', 'in', ['High'])]
+        selected = select_row_groups(parquet_file, filters)
+        high_rows = sum(parquet_file.metadata.row_group(i).num_rows for i in selected)
+        
+        expected = self.customers[self.customers['churn_risk_level'] == 'High']
+        self.assertEqual(parquet_file.metadata.num_row_groups, 6)
+        self.assertEqual(len(selected), 2)
+        self.assertEqual(high_rows, len(expected))
+        
+        result = read_parquet_table(file_path, columns=['customer_pk', 'current_health_score'], filters=filters)
+        self.assertListEqual(result.columns.tolist(), ['customer_pk', 'current_health_score'])
+        self.assertSetEqual(set(result['customer_pk']), set(expected['customer_pk']))
+        
+        stored = pd.read_parquet(file_path)
+        self.assertIsInstance(stored['churn_risk_level'].dtype, pd.CategoricalDtype)
+        self.assertTrue(stored['churn_risk_level'].cat.ordered)
+    
+    def test_date_filter_prunes_event_days(self):
+        """Test that event tables are day-ordered and date filters prune row groups."""
+        file_path = self.path / "silver_engagement.parquet"
+        row_groups = write_partitioned_table(self.events, file_path, date_column='event_timestamp', row_group_size=50)
+        
+        stored = pd.read_parquet(file_path)
+        self.assertTrue(stored['event_timestamp'].is_monotonic_increasing)
+        self.assertGreaterEqual(row_groups, 6)
+        
+        filters = [('event_timestamp', '>=', '2024-01-25')]
+        selected = select_row_groups(pq.ParquetFile(file_path), filters)
+        result = read_parquet_table(file_path, filters=filters)
+        
+        expected = self.events[self.events['event_timestamp'] >= pd.Timestamp('2024-01-25')]
+        self.assertLess(len(selected), row_groups)
+        self.assertSetEqual(set(result['event_id']), set(expected['event_id']))
+    
+    def test_event_increments_are_appended_next_to_the_table(self):
+        """Test that appended rows are written as increment files and read with the table."""
+        file_path = self.path / "silver_engagement.parquet"
+        write_partitioned_table(self.events.iloc[:200], file_path, date_column='event_timestamp', row_group_size=50)
+        table_stat = file_path.stat()
+        
+        append_table_increment(self.events.iloc[200:250], file_path, date_column='event_timestamp', run_id='run_1')
+        append_table_increment(self.events.iloc[250:], file_path, date_column='event_timestamp', run_id='run_2')
+        
+        self.assertEqual((file_path.stat().st_mtime_ns, file_path.stat().st_ino), (table_stat.st_mtime_ns, table_stat.st_ino))
+        self.assertEqual(len(get_table_files(file_path)), 3)
+        self.assertTrue(get_table_files(file_path)[2].name.endswith('_run_2.parquet'))
+        
+        result = read_parquet_table(file_path)
+        self.assertSetEqual(set(result['event_id']), set(self.events['event_id']))
+        
+        filters = [('event_timestamp', '>=', '2024-01-25')]
+        expected = self.events[self.events['event_timestamp'] >= pd.Timestamp('2024-01-25')]
+        self.assertSetEqual(set(read_parquet_table(file_path, filters=filters)['event_id']), set(expected['event_id']))
+        
+        # A complete rewrite of the table drops its increments
+        write_partitioned_table(self.events.iloc[:10], file_path, date_column='event_timestamp')
+        self.assertFalse(get_increment_dir(file_path).exists())
+        self.assertEqual(len(read_parquet_table(file_path)), 10)
+    
+    def test_keyed_increments_replace_and_remove_rows(self):
+        """Test that keyed increments replace stored rows, even for rows outside the filters."""
+        file_path = self.path / "gold_customer_360_dashboard_view.parquet"
+        partition_columns = GOLD_PARTITIONS['customer_360_dashboard_view']
+        write_partitioned_table(self.customers, file_path, partition_columns=partition_columns)
+        
+        high_risk = self.customers.loc[self.customers['churn_risk_level'] == 'High', 'customer_pk'].tolist()
+        update = self.customers[self.customers['customer_pk'] == high_risk[0]].copy()
+        update['churn_risk_level'] = pd.Categorical(['Low'], categories=['Low', 'Medium', 'High'], ordered=True)
+        update['current_health_score'] = 99.0
+        append_table_increment(update, file_path, partition_columns=partition_columns,
+                               key_column='customer_pk', deleted_keys=[high_risk[1]])
+        
+        result = read_parquet_table(file_path)
+        self.assertEqual(len(result), len(self.customers) - 1)
+        self.assertTrue(result['customer_pk'].is_unique)
+        self.assertNotIn(high_risk[1], set(result['customer_pk']))
+        self.assertEqual(result.loc[result['customer_pk'] == high_risk[0], 'current_health_score'].iloc[0], 99.0)
+        self.assertIsInstance(result['churn_risk_level'].dtype, pd.CategoricalDtype)
+        
+        filtered = read_parquet_table(file_path, columns=['customer_pk'], filters=[('churn_risk_level', 'in', ['High'])])
+        self.assertListEqual(filtered.columns.tolist(), ['customer_pk'])
+        self.assertSetEqual(set(filtered['customer_pk']), set(high_risk[2:]))
+        
+        # Deletions alone are written as increments, and increments are compacted past the limit
+        with mock.patch.object(settings, 'parquet_max_increment_files', 2):
+            append_table_increment(self.customers.iloc[:0], file_path, key_column='customer_pk', deleted_keys=[high_risk[2]])
+            self.assertEqual(len(get_table_files(file_path)), 3)
+            self.assertEqual(len(read_parquet_table(file_path)), len(self.customers) - 2)
+            
+            append_table_increment(update.assign(current_health_score=50.0), file_path, partition_columns=partition_columns,
+                                   key_column='customer_pk')
+        
+        self.assertListEqual(get_table_files(file_path), [file_path])
+        compacted = pd.read_parquet(file_path)
+        self.assertEqual(len(compacted), len(self.customers) - 2)
+        self.assertEqual(compacted.loc[compacted['customer_pk'] == high_risk[0], 'current_health_score'].iloc[0], 50.0)
+
+if __name__ == "__main__":
+    unittest.main()
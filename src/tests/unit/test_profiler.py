@@ -0,0 +1,94 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Pipeline Profiler Unit Tests
+# This module contains unit tests for the per-step profiles and the JSON run
+# report written for pipeline executions
+
+import unittest
+import tempfile
+import json
+import pandas as pd
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.config.settings import settings
+from src.data_pipeline.dag import PipelineDAG
+from src.data_pipeline.profiler import PipelineProfiler
+
+class ProfiledTransform:
+    """Minimal transform with helper methods named like the pipeline's."""
+    
+    def clean_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._calculate_total(df.dropna())
+    
+    def _calculate_total(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.assign(total=df['amount'].sum())
+    
+    def describe(self) -> str:
+        return "not profiled"
+
+class TestPipelineProfiler(unittest.TestCase):
+    """Test cases for pipeline step profiling."""
+    
+    def setUp(self):
+        """Set up a profiler and a temporary logs directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.profiler = PipelineProfiler(enabled=True, capture="")
+        self.profiler.start_run("20240101_000000")
+        self.df = pd.DataFrame({'amount': [1.0, None, 3.0]})
+    
+    def tearDown(self):
+        """Remove temporary files."""
+        self.temp_dir.cleanup()
+    
+    def test_instrumented_helpers_record_rows(self):
+        """Test that helpers and the helpers they call are profiled with row counts."""
+        transform = ProfiledTransform()
+        self.profiler.instrument(transform)
+        
+        result = transform.clean_rows(self.df)
+        transform.describe()
+        
+        self.assertListEqual(result['total'].tolist(), [4.0, 4.0])
+        summary = self.profiler.get_step_summary()
+        self.assertSetEqual(set(summary), {'ProfiledTransform.clean_rows', 'ProfiledTransform._calculate_total'})
+        self.assertEqual(summary['ProfiledTransform.clean_rows']['rows_in'], 3)
+        self.assertEqual(summary['ProfiledTransform.clean_rows']['rows_out'], 2)
+        self.assertGreaterEqual(summary['ProfiledTransform.clean_rows']['wall_seconds'],
+                                summary['ProfiledTransform._calculate_total']['wall_seconds'])
+    
+    def test_dag_nodes_and_report(self):
+        """Test that DAG nodes are profiled and written to the JSON run report."""
+        dag = PipelineDAG("test", self.profiler.wrap_node)
+        dag.add_node("load", lambda inputs: self.df)
+        dag.add_node("fail", lambda inputs: 1 / 0, ["load"])
+        with self.assertRaises(Exception):
+            dag.run(max_workers=2)
+        
+        with mock.patch.object(settings, 'logs_path', Path(self.temp_dir.name)):
+            report_path = self.profiler.write_report({'mode': 'test'})
+        
+        with open(report_path, 'r') as f:
+            report = json.load(f)
+        
+        steps = {step['name']: step for step in report['steps']}
+        self.assertEqual(report['execution_id'], "20240101_000000")
+        self.assertEqual(steps['load']['status'], 'completed')
+        self.assertEqual(steps['load']['rows_out'], 3)
+        self.assertEqual(steps['fail']['status'], 'failed')
+        self.assertIn('cpu_seconds', steps['fail'])
+    
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler only calls through."""
+        profiler = PipelineProfiler(enabled=False)
+        profiler.start_run("20240101_000000")
+        
+        self.assertEqual(profiler.profile_call("step", 'node', len, self.df), 3)
+        self.assertListEqual(profiler.records, [])
+        self.assertIsNone(profiler.write_report())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Silver Standardization Unit Tests
+# This module contains unit tests for the categorical standardization applied
+# by the Silver layer cleaning methods
+
+import unittest
+import pandas as pd
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.silver_transform import SilverTransform
+
+class TestCategoricalStandardization(unittest.TestCase):
+    """Test cases for standardizing string columns on their categories."""
+    
+    def setUp(self):
+        """Set up the Silver transformation and a raw payment method column."""
+        self.silver_transform = SilverTransform()
+        self.mapping = {'credit card': 'Credit Card', 'paypal': 'PayPal'}
+        self.payment_methods = pd.Series(
+            ['credit card', 'Credit Card', 'PAYPAL', None, 'Crypto', 'credit card'], name='payment_method'
+        )
+    
+    def test_matches_row_wise_standardization(self):
+        """Test that categorical standardization equals the row-wise mapping."""
+        expected = self.payment_methods.str.lower().map(self.mapping).fillna(self.payment_methods)
+        
+        result = self.silver_transform._standardize_categorical(
+            self.payment_methods, lambda values: values.str.lower().map(self.mapping).fillna(values)
+        )
+        
+        self.assertIsInstance(result.dtype, pd.CategoricalDtype)
+        self.assertListEqual(sorted(result.cat.categories), ['Credit Card', 'Crypto', 'PayPal'])
+        self.assertListEqual(
+            result.astype(object).where(result.notna(), None).tolist(),
+            expected.astype(object).where(expected.notna(), None).tolist()
+        )
+    
+    def test_missing_value_is_filled(self):
+        """Test that missing entries take the missing value as a category."""
+        currencies = pd.Series(['usd', None, 'eur'], dtype='category')
+        
+        result = self.silver_transform._standardize_categorical(
+            currencies, lambda values: values.str.upper(), missing_value='USD'
+        )
+        
+        self.assertListEqual(result.tolist(), ['USD', 'USD', 'EUR'])
+    
+    def test_engagement_columns_stay_categorical(self):
+        """Test that cleaned engagement data keeps categorical columns."""
+        engagement = pd.DataFrame({
+            'event_timestamp': ['2024-01-01 10:00:00', '2024-01-02 11:00:00'],
+            'event_type': ['LOGIN', 'page_view'],
+            'device_type': ['desktop', 'Mobile'],
+            'browser': ['chrome', 'safari'],
+            'operating_system': ['windows', 'ios'],
+            'page_url': [' /home', '/help ']
+        })
+        
+        cleaned = self.silver_transform.clean_engagement_data(engagement)
+        
+        for column in ['event_type', 'device_type', 'browser', 'operating_system', 'page_url']:
+            self.assertIsInstance(cleaned[column].dtype, pd.CategoricalDtype)
+        self.assertListEqual(cleaned['event_type'].tolist(), ['login', 'page_view'])
+        self.assertListEqual(cleaned['browser'].tolist(), ['Chrome', 'Safari'])
+        self.assertListEqual(cleaned['page_url'].tolist(), ['/home', '/help'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# A.U.R.A (AI-Unified Retention Analytics) - Windowed Feature Engine Unit Tests
+# This module contains unit tests for the trailing-window transaction, engagement
+# and support features used by the Gold AI model feature table
+
+import unittest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from src.data_pipeline.window_features import WindowFeatureEngine
+
+class TestWindowFeatureEngine(unittest.TestCase):
+    """Test cases for trailing-window customer features."""
+    
+    def setUp(self):
+        """Set up random Silver event tables around a fixed snapshot time."""
+        rng = np.random.default_rng(7)
+        self.snapshot_time = datetime(2024, 6, 1, 12, 0, 0)
+        self.customer_pks = pd.Series([f'CUST_{i:03d}' for i in range(20)])
+        
+        def random_events(count):
+            return pd.DataFrame({
+                'customer_id': rng.choice(list(self.customer_pks) + ['CUST_999'], count),
+                'timestamp': pd.Timestamp(self.snapshot_time) - pd.to_timedelta(rng.integers(-5, 120, count), unit='D')
+            })
+        
+        self.transactions = random_events(500).rename(columns={'timestamp': 'transaction_date'})
+        self.transactions['amount'] = rng.uniform(1, 500, len(self.transactions)).round(2)
+        self.engagement = random_events(2000).rename(columns={'timestamp': 'event_timestamp'})
+        self.support = random_events(200).rename(columns={'timestamp': 'created_at'})
+    
+    def _brute_force(self, events, timestamp_column, days, value_column=None):
+        """Compute a window total per customer with a filter and groupby."""
+        start = pd.Timestamp(self.snapshot_time) - timedelta(days=days)
+        in_window = events[(events[timestamp_column] >= start) & (events[timestamp_column] <= self.snapshot_time)]
+        grouped = in_window.groupby('customer_id')
+        totals = grouped[value_column].sum() if value_column else grouped.size()
+        return totals.reindex(self.customer_pks, fill_value=0).to_numpy()
+    
+    def test_matches_brute_force_windows(self):
+        """Test that every window equals a direct filter and groupby."""
+        engine = WindowFeatureEngine([90, 30, 60, 7], snapshot_time=self.snapshot_time)
+        features = engine.compute_features(self.customer_pks, self.transactions, self.engagement, self.support)
+        
+        for days in [7, 30, 60, 90]:
+            np.testing.assert_allclose(
+                features[f'feature_total_transaction_value_{days}d'],
+                self._brute_force(self.transactions, 'transaction_date', days, 'amount').round(2)
+            )
+            np.testing.assert_array_equal(
+                features[f'feature_transaction_count_{days}d'],
+                self._brute_force(self.transactions, 'transaction_date', days)
+            )
+            np.testing.assert_allclose(
+                features[f'feature_avg_daily_active_events_{days}d'],
+                (self._brute_force(self.engagement, 'event_timestamp', days) / days).round(3)
+            )
+            np.testing.assert_array_equal(
+                features[f'feature_support_tickets_{days}d_count'],
+                self._brute_force(self.support, 'created_at', days)
+            )
+    
+    def test_missing_sources_give_zero_features(self):
+        """Test that customers and sources without events get zero features."""
+        engine = WindowFeatureEngine([30], snapshot_time=self.snapshot_time)
+        features = engine.compute_features(
+            pd.Series(['CUST_NEW']), pd.DataFrame(), self.engagement, pd.DataFrame()
+        )
+        
+        self.assertListEqual(features.iloc[0].tolist(), [0.0, 0, 0.0, 0])
+    
+    def test_invalid_window_lengths(self):
+        """Test that non-positive window lengths are rejected."""
+        with self.assertRaises(ValueError):
+            WindowFeatureEngine([30, 0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,8 @@ import logging
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.dashboard.utils.customer_index import CustomerIndex
+
 # Configure page
 st.set_page_config(
     page_title="A.U.R.A - Adaptive User Retention Assistant",
@@ -73,10 +75,12 @@ if 'customer_data' not in st.session_state:
     st.session_state.customer_data = pd.DataFrame()
 if 'data_loaded' not in st.session_state:
     st.session_state.data_loaded = False
+if 'customer_index' not in st.session_state:
+    st.session_state.customer_index = CustomerIndex(st.session_state.customer_data)
 
 # Import AURA components with error handling
 try:
-    from src.dashboard.utils.data_loader import DashboardDataLoader
+    from src.dashboard.utils.data_loader import DashboardDataLoader, DASHBOARD_CUSTOMER_COLUMNS
     from src.dashboard.utils.plot_utils import DashboardPlotUtils
     from src.data_pipeline.orchestrator import DataPipelineOrchestrator
     from src.models.forecasting.prophet_model import ProphetForecastingModel
@@ -100,15 +104,20 @@ except Exception as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def set_customer_data(customer_data):
+    """Publish newly loaded customer data together with its customer index."""
+    st.session_state.customer_data = customer_data
+    st.session_state.customer_index = CustomerIndex(customer_data)
+    st.session_state.data_loaded = True
+
 def load_aura_data():
     """Load A.U.R.A data from pipeline or generate sample data."""
     try:
         if components_loaded:
             # Try to load from Gold layer first
-            customer_data = data_loader.load_customer_360_data()
+            customer_data = data_loader.load_customer_360_data(columns=DASHBOARD_CUSTOMER_COLUMNS)
             if not customer_data.empty:
-                st.session_state.customer_data = customer_data
-                st.session_state.data_loaded = True
+                set_customer_data(customer_data)
                 return "✅ Data loaded from A.U.R.A pipeline successfully!"
     except Exception as e:
         logger.warning(f"Pipeline data not available: {e}")
@@ -130,8 +139,7 @@ def load_aura_data():
         'total_support_tickets_lifetime': np.random.poisson(3, n_customers)
     })
     
-    st.session_state.customer_data = customer_data
-    st.session_state.data_loaded = True
+    set_customer_data(customer_data)
     return "✅ Sample data generated successfully!"
 
 def run_data_pipeline():
@@ -144,10 +152,9 @@ def run_data_pipeline():
         results = pipeline_orchestrator.run_complete_pipeline()
         
         # Load the processed data
-        customer_data = data_loader.load_customer_360_data()
+        customer_data = data_loader.load_customer_360_data(columns=DASHBOARD_CUSTOMER_COLUMNS)
         if not customer_data.empty:
-            st.session_state.customer_data = customer_data
-            st.session_state.data_loaded = True
+            set_customer_data(customer_data)
             return "✅ A.U.R.A data pipeline completed successfully!"
         else:
             return "⚠️ Pipeline completed but no data found. Using sample data."
@@ -256,16 +263,12 @@ def analyze_customer(customer_id):
     if not st.session_state.data_loaded:
         return "❌ No data loaded. Please load data first."
     
-    data = st.session_state.customer_data
-    
     # Find customer
-    customer = data[data['customer_id'] == customer_id]
+    customer = st.session_state.customer_index.get_customer(customer_id)
     
-    if customer.empty:
+    if customer is None:
         return f"❌ Customer {customer_id} not found."
     
-    customer = customer.iloc[0]
-    
     # Create analysis
     analysis = f"""
     ## 👤 Customer Analysis: {customer['name']}